@@ -7,7 +7,7 @@ from sqlalchemy import engine_from_config, pool
 
 sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from backend.app.core.config import settings_core
+from backend.app.core.config import get_settings
 from backend.app.db.base import Base
 from backend.app.models.answer_choices import AnswerChoiceModel
 from backend.app.models.associations import (DisciplineToSubjectAssociation,
@@ -26,18 +26,25 @@ from backend.app.models.associations import (DisciplineToSubjectAssociation,
                                              TopicToSubtopicAssociation,
                                              UserToGroupAssociation)
 from backend.app.models.authentication import RevokedTokenModel
+from backend.app.models.bootstrap_markers import BootstrapMarkerModel
 from backend.app.models.concepts import ConceptModel
 from backend.app.models.disciplines import DisciplineModel
 from backend.app.models.domains import DomainModel
 from backend.app.models.groups import GroupModel
 from backend.app.models.leaderboard import LeaderboardModel
 from backend.app.models.permissions import PermissionModel
+from backend.app.models.question_changes import QuestionChangeModel
+from backend.app.models.question_search import question_search_table
 from backend.app.models.question_sets import QuestionSetModel
 from backend.app.models.question_tags import QuestionTagModel
 from backend.app.models.questions import QuestionModel
+from backend.app.models.quiz_sessions import (QuizSessionModel,
+                                              QuizSessionQuestionModel)
+from backend.app.models.resource_versions import ResourceVersionModel
 from backend.app.models.roles import RoleModel
 from backend.app.models.subjects import SubjectModel
 from backend.app.models.subtopics import SubtopicModel
+from backend.app.models.taxonomy_closure import TaxonomyClosureModel
 from backend.app.models.time_period import TimePeriodModel
 from backend.app.models.topics import TopicModel
 from backend.app.models.user_responses import UserResponseModel
@@ -60,7 +67,7 @@ target_metadata = Base.metadata
 
 def run_migrations_online() -> None:
     configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = settings_core.DATABASE_URL  # Use DATABASE_URL from settings
+    configuration["sqlalchemy.url"] = get_settings().DATABASE_URL  # Use DATABASE_URL from settings
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
@@ -0,0 +1,55 @@
+"""Added full-text search index for questions
+
+Creates the question_search FTS5 table and its sync triggers on SQLite and
+fills it from the existing questions, or FULLTEXT indexes on MariaDB/MySQL.
+
+Revision ID: c41d7e9a5b20
+Revises: 8d2e4b6f1a93
+Create Date: 2026-10-19 15:27:08.391554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from backend.app.models.question_search import (MYSQL_SEARCH_DDL,
+                                                QUESTION_SEARCH_TABLE,
+                                                SQLITE_SEARCH_BACKFILL_SQL,
+                                                SQLITE_SEARCH_DDL)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e9a5b20'
+down_revision: Union[str, None] = '8d2e4b6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_TRIGGERS = [
+    'questions_search_ai',
+    'questions_search_au',
+    'questions_search_ad',
+    'question_answers_search_ai',
+    'question_answers_search_ad',
+    'answer_choices_search_au',
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_SEARCH_DDL + SQLITE_SEARCH_BACKFILL_SQL:
+            op.execute(statement)
+    elif dialect in ('mysql', 'mariadb'):
+        for statement in MYSQL_SEARCH_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for trigger in SQLITE_TRIGGERS:
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute(f'DROP TABLE IF EXISTS {QUESTION_SEARCH_TABLE}')
+    elif dialect in ('mysql', 'mariadb'):
+        op.drop_index('ft_answer_choices_text', table_name='answer_choices')
+        op.drop_index('ft_questions_text', table_name='questions')
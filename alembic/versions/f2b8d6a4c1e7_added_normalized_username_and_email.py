@@ -0,0 +1,44 @@
+"""Added username_lower and email_lower columns to users
+
+Backfills both columns from the existing rows before making them NOT NULL
+and unique. The upgrade fails if two existing users have emails that differ
+only in case; merge or rename those accounts first.
+
+Revision ID: f2b8d6a4c1e7
+Revises: e5a7c3f19d42
+Create Date: 2026-10-19 18:05:13.774920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d6a4c1e7'
+down_revision: Union[str, None] = 'e5a7c3f19d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('username_lower', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('email_lower', sa.String(), nullable=True))
+
+    op.execute('UPDATE users SET username_lower = lower(username), email_lower = lower(email)')
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('username_lower', existing_type=sa.String(), nullable=False)
+        batch_op.alter_column('email_lower', existing_type=sa.String(), nullable=False)
+        batch_op.create_index(batch_op.f('ix_users_username_lower'), ['username_lower'], unique=True)
+        batch_op.create_index(batch_op.f('ix_users_email_lower'), ['email_lower'], unique=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_email_lower'))
+        batch_op.drop_index(batch_op.f('ix_users_username_lower'))
+        batch_op.drop_column('email_lower')
+        batch_op.drop_column('username_lower')
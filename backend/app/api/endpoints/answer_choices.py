@@ -23,8 +23,10 @@ which is handled by the check_auth_status and get_current_user_or_error function
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.crud.crud_answer_choices import (
     create_answer_choice_in_db, create_question_to_answer_association_in_db,
     delete_answer_choice_from_db, read_answer_choice_from_db,
@@ -40,6 +42,8 @@ from backend.app.services.logging_service import logger
 
 router = APIRouter()
 
+answer_choices_adapter = TypeAdapter(List[AnswerChoiceSchema])
+
 
 @router.post(
     "/answer-choices/",
@@ -140,7 +144,7 @@ def get_answer_choices(
     get_current_user_or_error(request)
 
     answer_choices = read_answer_choices_from_db(db, skip=skip, limit=limit)
-    return [AnswerChoiceSchema.model_validate(ac) for ac in answer_choices]
+    return validated_response(answer_choices_adapter, answer_choices)
 
 
 @router.get("/answer-choices/{answer_choice_id}", response_model=AnswerChoiceSchema)
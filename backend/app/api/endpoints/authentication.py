@@ -20,10 +20,11 @@ which is handled by the get_current_user dependency for the logout endpoints.
 
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from backend.app.core.jwt import create_access_token, decode_access_token
+from backend.app.core.security import PasswordHashingBusyError
 from backend.app.crud.authentication import is_token_revoked, revoke_token
 from backend.app.crud.crud_user import (
     read_user_by_username_from_db,
@@ -40,15 +41,21 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=TokenSchema)
-async def login_endpoint(form_data: LoginFormSchema, db: Session = Depends(get_db)):
+async def login_endpoint(
+    form_data: LoginFormSchema,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     """
     Authenticate a user and return an access token.
 
     This endpoint allows users to login by providing their username and password.
     If credentials are valid, returns an access token for use in subsequent authenticated requests.
+    A password hash made with an outdated bcrypt cost is upgraded after the response is sent.
 
     Args:
         form_data (LoginFormSchema): The login form data containing username, password, and remember_me flag.
+        background_tasks (BackgroundTasks): Runs the password hash upgrade after the response.
         db (Session): The database session.
 
     Returns:
@@ -57,12 +64,26 @@ async def login_endpoint(form_data: LoginFormSchema, db: Session = Depends(get_d
     Raises:
         HTTPException:
             - 401 Unauthorized: If the provided credentials are invalid or the user is inactive.
+            - 503 Service Unavailable: If too many logins are already waiting for password verification.
     """
     logger.debug("Login attempt for user: %s", form_data.username)
-    user = authenticate_user(db, form_data.username, form_data.password)
+    try:
+        user = await authenticate_user(
+            db, form_data.username, form_data.password, background_tasks
+        )
+    except PasswordHashingBusyError:
+        logger.warning(
+            "Login deferred for user: %s. Hash pool full.", form_data.username
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress. Please try again shortly.",
+            headers={"Retry-After": "1"},
+        )
     if not user or not user.is_active:
         logger.warning(
-            f"Login failed for user: {form_data.username}. User not found or inactive."
+            "Login failed for user: %s. User not found or inactive.",
+            form_data.username,
         )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -76,11 +97,13 @@ async def login_endpoint(form_data: LoginFormSchema, db: Session = Depends(get_d
     current_time = datetime.now(timezone.utc)
     if user.token_blacklist_date:
         logger.debug(
-            f"User {user.username} has token_blacklist_date: {user.token_blacklist_date}"
+            "User %s has token_blacklist_date: %s",
+            user.username,
+            user.token_blacklist_date,
         )
         if user.token_blacklist_date > current_time:
             logger.warning(
-                f"Login attempt for user with active token blacklist: {user.username}"
+                "Login attempt for user with active token blacklist: %s", user.username
             )
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -88,7 +111,7 @@ async def login_endpoint(form_data: LoginFormSchema, db: Session = Depends(get_d
                 headers={"WWW-Authenticate": "Bearer"},
             )
         else:
-            logger.debug(f"Clearing token_blacklist_date for user: {user.username}")
+            logger.debug("Clearing token_blacklist_date for user: %s", user.username)
             update_user_token_blacklist_date(db, user.id, None)
 
     # Set expiration time based on remember_me flag
@@ -104,9 +127,7 @@ async def login_endpoint(form_data: LoginFormSchema, db: Session = Depends(get_d
         user.username,
         form_data.remember_me,
     )
-    response = {"access_token": access_token, "token_type": "bearer"}
-    logger.debug("Login response: %s", response)
-    return response
+    return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.post("/logout", status_code=status.HTTP_200_OK)
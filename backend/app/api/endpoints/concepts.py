@@ -23,8 +23,10 @@ which is handled by the check_auth_status and get_current_user_or_error function
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.crud.crud_concepts import (
     create_concept_in_db,
     delete_concept_from_db,
@@ -42,6 +44,8 @@ from backend.app.services.auth_utils import check_auth_status, get_current_user_
 
 router = APIRouter()
 
+concepts_adapter = TypeAdapter(List[ConceptSchema])
+
 
 @router.post("/concepts/", response_model=ConceptSchema, status_code=201)
 def post_concept(
@@ -98,7 +102,7 @@ def get_concepts(
     get_current_user_or_error(request)
 
     concepts = read_concepts_from_db(db, skip=skip, limit=limit)
-    return [ConceptSchema.model_validate(c) for c in concepts]
+    return validated_response(concepts_adapter, concepts)
 
 
 @router.get("/concepts/{concept_id}", response_model=ConceptSchema)
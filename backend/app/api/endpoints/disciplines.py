@@ -23,8 +23,10 @@ which is handled by the check_auth_status and get_current_user_or_error function
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.crud.crud_disciplines import (
     create_discipline_in_db,
     delete_discipline_from_db,
@@ -42,6 +44,8 @@ from backend.app.services.auth_utils import check_auth_status, get_current_user_
 
 router = APIRouter()
 
+disciplines_adapter = TypeAdapter(List[DisciplineSchema])
+
 
 @router.post("/disciplines/", response_model=DisciplineSchema, status_code=201)
 def post_discipline(
@@ -98,7 +102,7 @@ def get_disciplines(
     get_current_user_or_error(request)
 
     disciplines = read_disciplines_from_db(db, skip=skip, limit=limit)
-    return [DisciplineSchema.model_validate(d) for d in disciplines]
+    return validated_response(disciplines_adapter, disciplines)
 
 
 @router.get("/disciplines/{discipline_id}", response_model=DisciplineSchema)
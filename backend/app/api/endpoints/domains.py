@@ -23,8 +23,10 @@ which is handled by the check_auth_status and get_current_user_or_error function
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.crud.crud_domains import (
     create_domain_in_db,
     delete_domain_from_db,
@@ -42,6 +44,8 @@ from backend.app.services.auth_utils import check_auth_status, get_current_user_
 
 router = APIRouter()
 
+domains_adapter = TypeAdapter(List[DomainSchema])
+
 
 @router.post("/domains/", response_model=DomainSchema, status_code=201)
 def post_domain(
@@ -98,7 +102,7 @@ def get_domains(
     get_current_user_or_error(request)
 
     domains = read_domains_from_db(db, skip=skip, limit=limit)
-    return [DomainSchema.model_validate(d) for d in domains]
+    return validated_response(domains_adapter, domains)
 
 
 @router.get("/domains/{domain_id}", response_model=DomainSchema)
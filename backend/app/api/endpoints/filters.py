@@ -4,34 +4,55 @@
 Filters API
 
 This module provides API endpoints for filtering questions in the quiz application.
-It includes an operation for retrieving filtered questions based on various criteria.
+It includes operations for retrieving filtered questions based on various criteria
+and for counting the filtered questions per facet value.
 
 The module uses FastAPI for defining the API endpoints and Pydantic for data validation.
 It interacts with the database through CRUD operations defined in the crud_filters module.
 
 Endpoints:
 - GET /questions/filter: Retrieve a list of filtered questions
+- GET /questions/facets: Count the filtered questions per difficulty, subject, topic and tag
 
-The endpoint requires appropriate authentication and authorization,
+The endpoints require appropriate authentication and authorization,
 which is handled by the check_auth_status and get_current_user_or_error functions.
 """
 
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.core.config import DifficultyLevel
+from backend.app.crud.crud_facets import (
+    DEFAULT_FACET_LIMIT,
+    read_question_facets_from_db,
+)
 from backend.app.crud.crud_filters import read_filtered_questions_from_db
 from backend.app.db.session import get_db
-from backend.app.schemas.filters import FilterParamsSchema
+from backend.app.schemas.filters import FilterParamsSchema, QuestionFacetsSchema
 from backend.app.schemas.questions import QuestionSchema
 from backend.app.services.auth_utils import check_auth_status, get_current_user_or_error
 
 router = APIRouter()
 
+questions_adapter = TypeAdapter(List[QuestionSchema])
 
-async def forbid_extra_params(request: Request):
+
+FILTER_PARAMS = {
+    "subject",
+    "topic",
+    "subtopic",
+    "difficulty",
+    "question_tags",
+    "ancestor_level",
+    "ancestor_id",
+}
+
+
+async def forbid_extra_params(request: Request, allowed_params=None):
     """
     Check for unexpected query parameters in the request.
 
@@ -39,19 +60,14 @@ async def forbid_extra_params(request: Request):
 
     Args:
         request (Request): The incoming request object.
+        allowed_params (Optional[Set[str]]): The allowed parameters. Defaults to
+            the filter parameters plus skip and limit.
 
     Raises:
         HTTPException: If unexpected parameters are found in the request.
     """
-    allowed_params = {
-        "subject",
-        "topic",
-        "subtopic",
-        "difficulty",
-        "question_tags",
-        "skip",
-        "limit",
-    }
+    if allowed_params is None:
+        allowed_params = FILTER_PARAMS | {"skip", "limit"}
     actual_params = set(request.query_params.keys())
     extra_params = actual_params - allowed_params
     if extra_params:
@@ -60,14 +76,68 @@ async def forbid_extra_params(request: Request):
         )
 
 
-@router.get("/questions/filter", response_model=List[QuestionSchema], status_code=200)
-async def filter_questions(
-    request: Request,
+def build_filter_params(
     subject: Optional[str] = Query(None),
     topic: Optional[str] = Query(None),
     subtopic: Optional[str] = Query(None),
     difficulty: Optional[str] = Query(None),
     question_tags: Optional[List[str]] = Query(None),
+    ancestor_level: Optional[str] = Query(None),
+    ancestor_id: Optional[int] = Query(None),
+) -> FilterParamsSchema:
+    """
+    Validate the filter query parameters.
+
+    Used as a dependency by every endpoint that accepts the /questions/filter
+    filters, so they are declared and validated in one place.
+
+    Args:
+        subject (Optional[str]): The subject to filter by.
+        topic (Optional[str]): The topic to filter by.
+        subtopic (Optional[str]): The subtopic to filter by.
+        difficulty (Optional[str]): The difficulty level to filter by.
+        question_tags (Optional[List[str]]): A list of tags to filter by.
+        ancestor_level (Optional[str]): The taxonomy level of ancestor_id, e.g. "disciplines".
+        ancestor_id (Optional[int]): The ID of the taxonomy node to filter under.
+
+    Returns:
+        FilterParamsSchema: The validated filters.
+
+    Raises:
+        HTTPException:
+            - 400: If the difficulty level is invalid.
+            - 422: If the other filters are invalid.
+    """
+    # Convert difficulty string to DifficultyLevel enum
+    difficulty_enum = None
+    if difficulty:
+        try:
+            difficulty_enum = DifficultyLevel[difficulty.upper()]
+        except KeyError:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid difficulty level: {difficulty}"
+            )
+
+    try:
+        return FilterParamsSchema(
+            subject=subject,
+            topic=topic,
+            subtopic=subtopic,
+            difficulty=difficulty_enum,
+            question_tags=question_tags,
+            ancestor_level=ancestor_level,
+            ancestor_id=ancestor_id,
+        )
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=422, detail=exc.errors()[0]["msg"]
+        ) from exc
+
+
+@router.get("/questions/filter", response_model=List[QuestionSchema], status_code=200)
+async def filter_questions(
+    request: Request,
+    filters: FilterParamsSchema = Depends(build_filter_params),
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
@@ -77,14 +147,12 @@ async def filter_questions(
 
     This endpoint allows authenticated users to retrieve a list of questions
     filtered by various criteria such as subject, topic, subtopic, difficulty, and tags.
+    Passing ancestor_level and ancestor_id selects the questions anywhere under
+    that taxonomy node, e.g. every question under a discipline.
 
     Args:
         request (Request): The incoming request object.
-        subject (Optional[str]): The subject to filter by.
-        topic (Optional[str]): The topic to filter by.
-        subtopic (Optional[str]): The subtopic to filter by.
-        difficulty (Optional[str]): The difficulty level to filter by.
-        question_tags (Optional[List[str]]): A list of tags to filter by.
+        filters (FilterParamsSchema): The validated filter query parameters.
         db (Session): The database session.
         skip (int): The number of questions to skip (for pagination).
         limit (int): The maximum number of questions to return (for pagination).
@@ -101,26 +169,45 @@ async def filter_questions(
 
     await forbid_extra_params(request)
 
-    # Convert difficulty string to DifficultyLevel enum
-    difficulty_enum = None
-    if difficulty:
-        try:
-            difficulty_enum = DifficultyLevel[difficulty.upper()]
-        except KeyError:
-            raise HTTPException(
-                status_code=400, detail=f"Invalid difficulty level: {difficulty}"
-            )
-
-    filters = FilterParamsSchema(
-        subject=subject,
-        topic=topic,
-        subtopic=subtopic,
-        difficulty=difficulty_enum,
-        question_tags=question_tags,
-    )
-
     questions = read_filtered_questions_from_db(
         db=db, filters=filters.model_dump(), skip=skip, limit=limit
     )
 
-    return [QuestionSchema.model_validate(q) for q in questions] if questions else []
+    return validated_response(questions_adapter, questions)
+
+
+@router.get("/questions/facets", response_model=QuestionFacetsSchema, status_code=200)
+async def get_question_facets(
+    request: Request,
+    filters: FilterParamsSchema = Depends(build_filter_params),
+    facet_limit: int = Query(DEFAULT_FACET_LIMIT, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    Count the filtered questions per difficulty, subject, topic and tag.
+
+    This endpoint accepts the same filters as /questions/filter and returns,
+    in one response, how many of the matching questions fall under each
+    facet value, so a browsing UI does not need one request per value.
+
+    Args:
+        request (Request): The incoming request object.
+        filters (FilterParamsSchema): The validated filter query parameters.
+        facet_limit (int): The maximum number of values returned per facet.
+        db (Session): The database session.
+
+    Returns:
+        QuestionFacetsSchema: The total and the counts per facet value,
+            largest counts first.
+
+    Raises:
+        HTTPException: If unexpected parameters are provided in the request, if an invalid difficulty level is specified,
+                       or if the user is not authenticated.
+    """
+    check_auth_status(request)
+    get_current_user_or_error(request)
+
+    await forbid_extra_params(request, FILTER_PARAMS | {"facet_limit"})
+
+    facets = read_question_facets_from_db(db, filters.model_dump(), facet_limit)
+    return QuestionFacetsSchema(**facets)
@@ -1,11 +1,14 @@
 # filename: backend/app/api/endpoints/leaderboard.py
 
+import time
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from pydantic import TypeAdapter
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.core.config import TimePeriod
 from backend.app.crud.crud_groups import read_group_from_db
 from backend.app.crud.crud_leaderboard import (
@@ -26,13 +29,17 @@ from backend.app.schemas.leaderboard import (
 )
 from backend.app.services.auth_utils import check_auth_status, get_current_user_or_error
 from backend.app.services.logging_service import logger
+from backend.app.services.metrics_service import metrics
 from backend.app.services.scoring_service import (
     calculate_leaderboard_scores,
     time_period_to_schema,
 )
+from backend.app.services.tracing_service import span
 
 router = APIRouter()
 
+leaderboard_adapter = TypeAdapter(List[LeaderboardSchema])
+
 
 @router.get("/leaderboard/", response_model=List[LeaderboardSchema])
 def get_leaderboard(
@@ -68,46 +75,55 @@ def get_leaderboard(
         if not time_period_model:
             raise HTTPException(status_code=400, detail="Invalid time period")
 
+        refresh_started_at = time.perf_counter()
         leaderboard_scores = calculate_leaderboard_scores(
             db, time_period_model, group_id
         )
 
-        for user_id, score in leaderboard_scores.items():
-            entries = read_leaderboard_entries_from_db(
-                db,
-                time_period_id=time_period_model.id,
-                user_id=user_id,
-                group_id=group_id,
-            )
-            if entries:
-                entry = entries[0]
-                update_leaderboard_entry_in_db(db, entry.id, {"score": score})
-            else:
-                create_leaderboard_entry_in_db(
+        with span("leaderboard.upsert_entries", {"entries": len(leaderboard_scores)}):
+            for user_id, score in leaderboard_scores.items():
+                entries = read_leaderboard_entries_from_db(
                     db,
-                    {
-                        "user_id": user_id,
-                        "score": score,
-                        "time_period_id": time_period_model.id,
-                        "group_id": group_id,
-                    },
+                    time_period_id=time_period_model.id,
+                    user_id=user_id,
+                    group_id=group_id,
                 )
+                if entries:
+                    entry = entries[0]
+                    update_leaderboard_entry_in_db(db, entry.id, {"score": score})
+                else:
+                    create_leaderboard_entry_in_db(
+                        db,
+                        {
+                            "user_id": user_id,
+                            "score": score,
+                            "time_period_id": time_period_model.id,
+                            "group_id": group_id,
+                        },
+                    )
+        metrics.observe(
+            "leaderboard_refresh_seconds", (), time.perf_counter() - refresh_started_at
+        )
 
         leaderboard_entries = read_leaderboard_entries_from_db(
             db, time_period_id=time_period_model.id, group_id=group_id, limit=limit
         )
 
-        return [
-            LeaderboardSchema(
-                id=entry.id,
-                user_id=entry.user_id,
-                score=entry.score,
-                time_period_id=entry.time_period_id,
-                time_period=time_period_to_schema(time_period_model),
-                group_id=entry.group_id,
+        with span("leaderboard.build_response"):
+            return validated_response(
+                leaderboard_adapter,
+                [
+                    LeaderboardSchema(
+                        id=entry.id,
+                        user_id=entry.user_id,
+                        score=entry.score,
+                        time_period_id=entry.time_period_id,
+                        time_period=time_period_to_schema(time_period_model),
+                        group_id=entry.group_id,
+                    )
+                    for entry in leaderboard_entries
+                ],
             )
-            for entry in leaderboard_entries
-        ]
     except SQLAlchemyError as e:
         logger.error(f"Database error in get_leaderboard: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -152,7 +168,7 @@ def get_user_leaderboard(
         entries = read_leaderboard_entries_for_user_from_db(db, user_id)
 
         # Return an empty list if there are no leaderboard entries
-        return [LeaderboardSchema.model_validate(entry) for entry in entries] or []
+        return validated_response(leaderboard_adapter, entries)
     except SQLAlchemyError as e:
         logger.error(f"Database error in get_user_leaderboard: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -197,9 +213,7 @@ def get_group_leaderboard(
         )
 
         # Return an empty list if there are no leaderboard entries
-        return [
-            LeaderboardSchema.model_validate(entry) for entry in db_leaderboard_entries
-        ] or []
+        return validated_response(leaderboard_adapter, db_leaderboard_entries)
     except SQLAlchemyError as e:
         logger.error(f"Database error in get_group_leaderboard: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -0,0 +1,21 @@
+# filename: backend/app/api/endpoints/metrics.py
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.app.services.metrics_service import render_metrics
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """
+    Return the runtime metrics of every worker in the Prometheus text format.
+
+    The endpoint is listed in UNPROTECTED_ENDPOINTS so scrapers need no
+    token; restrict access to it at the proxy.
+    """
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,157 @@
+# filename: backend/app/api/endpoints/profiling.py
+
+"""
+This module provides admin endpoints for profiling a running worker.
+
+Profiles are collapsed-stack files, ready for flamegraph.pl or speedscope.
+Each request profiles the worker process that serves it; the worker's pid
+is returned with every profile.
+
+Endpoints:
+- POST /admin/profile: Samples the worker for a number of seconds
+- GET /admin/profile/requests: Shows the per-request capture state and captures
+- POST /admin/profile/requests: Arms per-request capture for a path pattern
+- DELETE /admin/profile/requests: Disarms per-request capture
+- GET /admin/profile/requests/{capture_id}: Downloads one request's profile
+
+Usage example:
+    curl -X POST -H "Authorization: Bearer $TOKEN" \\
+        "http://localhost:8000/admin/profile?seconds=30" -o worker.collapsed
+"""
+
+import os
+import re
+import time
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import PlainTextResponse
+
+from backend.app.services.auth_utils import get_current_admin_or_error
+from backend.app.services.profiler_service import (
+    DEFAULT_INTERVAL_SECONDS,
+    MAX_PROFILE_SECONDS,
+    ProfilerBusyError,
+    profile_process,
+    request_profiler,
+)
+
+router = APIRouter()
+
+
+def collapsed_response(collapsed: str, filename: str) -> PlainTextResponse:
+    return PlainTextResponse(
+        collapsed,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/admin/profile")
+def profile_worker(
+    request: Request,
+    seconds: float = Query(30, gt=0, le=MAX_PROFILE_SECONDS),
+    interval_ms: float = Query(DEFAULT_INTERVAL_SECONDS * 1000, ge=1, le=1000),
+):
+    """
+    Sample the stacks of every thread in this worker for a number of seconds.
+
+    The response is sent once sampling ends. The application keeps serving
+    other requests meanwhile, and they are what the profile shows.
+
+    Args:
+        request (Request): The FastAPI request object.
+        seconds (float): How long to sample (default: 30, max: 300).
+        interval_ms (float): Milliseconds between samples (default: 10).
+
+    Returns:
+        PlainTextResponse: The profile in the collapsed-stack format.
+
+    Raises:
+        HTTPException:
+            - 403: If the user is not an admin.
+            - 409: If another profile is running in this worker.
+    """
+    get_current_admin_or_error(request)
+    try:
+        collapsed = profile_process(seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return collapsed_response(
+        collapsed, f"profile-{os.getpid()}-{int(time.time())}.collapsed"
+    )
+
+
+@router.get("/admin/profile/requests")
+def read_request_profiles(request: Request):
+    """
+    Return the per-request capture state and the kept captures, newest first.
+
+    Raises:
+        HTTPException: 403 if the user is not an admin.
+    """
+    get_current_admin_or_error(request)
+    return {**request_profiler.status(), "captures": request_profiler.list_captures()}
+
+
+@router.post("/admin/profile/requests")
+def arm_request_profiles(
+    request: Request,
+    pattern: str = Query(..., min_length=1, description="Regular expression matched against request paths"),
+    max_requests: int = Query(10, ge=1, le=100),
+    interval_ms: float = Query(DEFAULT_INTERVAL_SECONDS * 1000, ge=1, le=1000),
+):
+    """
+    Profile the next max_requests requests whose path matches pattern.
+
+    Args:
+        request (Request): The FastAPI request object.
+        pattern (str): A regular expression searched for in the request path.
+        max_requests (int): How many matching requests to capture (default: 10).
+        interval_ms (float): Milliseconds between samples (default: 10).
+
+    Returns:
+        dict: The capture state.
+
+    Raises:
+        HTTPException:
+            - 403: If the user is not an admin.
+            - 400: If the pattern is not a valid regular expression.
+    """
+    get_current_admin_or_error(request)
+    try:
+        request_profiler.arm(pattern, max_requests, interval_ms / 1000)
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"Invalid pattern: {e}")
+    return request_profiler.status()
+
+
+@router.delete("/admin/profile/requests")
+def disarm_request_profiles(request: Request):
+    """
+    Stop capturing request profiles; kept captures remain available.
+
+    Raises:
+        HTTPException: 403 if the user is not an admin.
+    """
+    get_current_admin_or_error(request)
+    request_profiler.disarm()
+    return request_profiler.status()
+
+
+@router.get("/admin/profile/requests/{capture_id}")
+def read_request_profile(request: Request, capture_id: int):
+    """
+    Download the profile captured for one request.
+
+    Raises:
+        HTTPException:
+            - 403: If the user is not an admin.
+            - 404: If this worker holds no capture with that ID.
+    """
+    get_current_admin_or_error(request)
+    capture = request_profiler.get_capture(capture_id)
+    if capture is None:
+        raise HTTPException(status_code=404, detail="Request profile not found")
+    return collapsed_response(
+        capture["collapsed"],
+        f"request-{capture['pid']}-{capture['id']}.collapsed",
+    )
@@ -11,7 +11,7 @@ The module uses FastAPI for defining the API endpoints and Pydantic for data val
 It interacts with the database through CRUD operations defined in the crud_question_sets module.
 
 Endpoints:
-- POST /upload-questions/: Upload a question set from a file
+- POST /upload-questions/: Upload a question set from a file, reporting near-duplicates
 - GET /question-sets/: Retrieve a list of question sets
 - POST /question-sets/: Create a new question set
 - GET /question-sets/{question_set_id}: Retrieve a specific question set by ID
@@ -36,8 +36,10 @@ from fastapi import (
     UploadFile,
     status,
 )
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.crud.crud_question_sets import (
     create_question_set_in_db,
     delete_question_set_from_db,
@@ -46,6 +48,7 @@ from backend.app.crud.crud_question_sets import (
     update_question_set_in_db,
 )
 from backend.app.crud.crud_questions import create_question_in_db
+from backend.app.crud.crud_similarity import build_duplicate_report
 from backend.app.db.session import get_db
 from backend.app.schemas.question_sets import (
     QuestionSetBaseSchema,
@@ -58,27 +61,36 @@ from backend.app.services.auth_utils import check_auth_status, get_current_user_
 
 router = APIRouter()
 
+question_sets_adapter = TypeAdapter(List[QuestionSetSchema])
+
 
 @router.post("/upload-questions/")
 async def upload_question_set(
     request: Request,
     file: UploadFile = File(...),
     question_set_name: str = Form(...),
+    skip_duplicates: bool = Form(False),
     db: Session = Depends(get_db),
 ):
     """
     Upload a question set from a file.
 
     This endpoint allows admin users to upload a question set from a JSON file.
+    Every uploaded question is checked against the existing questions and the
+    questions before it in the file for near-duplicate text.
 
     Args:
         request (Request): The FastAPI request object.
         file (UploadFile): The JSON file containing the question set data.
         question_set_name (str): The name for the new question set.
+        skip_duplicates (bool): Whether to leave out the flagged questions
+            instead of importing them anyway.
         db (Session): The database session.
 
     Returns:
-        dict: A message indicating successful upload.
+        dict: A message indicating successful upload, the duplicate report
+            ("duplicates", as returned by build_duplicate_report) and the
+            positions of the questions that were skipped.
 
     Raises:
         HTTPException:
@@ -102,16 +114,30 @@ async def upload_question_set(
         for question in question_data:
             QuestionCreateSchema(**question)
 
+        duplicates = build_duplicate_report(
+            db, [question.get("text") for question in question_data]
+        )
+        skipped = (
+            [duplicate["index"] for duplicate in duplicates] if skip_duplicates else []
+        )
+
         question_set = QuestionSetCreateSchema(
             name=question_set_name, creator_id=current_user.id
         )
         question_set_created = create_question_set_in_db(db, question_set.model_dump())
 
-        for question in question_data:
+        skipped_positions = set(skipped)
+        for position, question in enumerate(question_data):
+            if position in skipped_positions:
+                continue
             question["question_set_id"] = question_set_created.id
             create_question_in_db(db, QuestionCreateSchema(**question).model_dump())
 
-        return {"message": "Question set uploaded successfully"}
+        return {
+            "message": "Question set uploaded successfully",
+            "duplicates": duplicates,
+            "skipped": skipped,
+        }
 
     except (json.JSONDecodeError, ValueError) as exc:
         raise HTTPException(
@@ -150,7 +176,7 @@ def get_question_sets(
     get_current_user_or_error(request)
 
     question_sets = read_question_sets_from_db(db, skip=skip, limit=limit)
-    return [QuestionSetSchema.model_validate(qs) for qs in question_sets]
+    return validated_response(question_sets_adapter, question_sets)
 
 
 @router.post("/question-sets/", response_model=QuestionSetSchema, status_code=201)
@@ -23,9 +23,11 @@ which is handled by the check_auth_status and get_current_user_or_error function
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.crud.crud_question_tags import (
     create_question_tag_in_db,
     delete_question_tag_from_db,
@@ -43,6 +45,8 @@ from backend.app.services.auth_utils import check_auth_status, get_current_user_
 
 router = APIRouter()
 
+question_tags_adapter = TypeAdapter(List[QuestionTagSchema])
+
 
 @router.post(
     "/question-tags/",
@@ -114,7 +118,7 @@ def get_question_tags(
     get_current_user_or_error(request)
 
     question_tags = read_question_tags_from_db(db, skip=skip, limit=limit)
-    return [QuestionTagSchema.model_validate(tag) for tag in question_tags]
+    return validated_response(question_tags_adapter, question_tags)
 
 
 @router.get("/question-tags/{tag_id}", response_model=QuestionTagSchema)
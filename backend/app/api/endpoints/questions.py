@@ -13,8 +13,11 @@ It interacts with the database through CRUD operations defined in the crud_quest
 Endpoints:
 - POST /questions/: Create a new question
 - POST /questions/with-answers/: Create a new question with associated answers
+- POST /questions/bulk: Create many questions in one transaction
+- PATCH /questions/bulk: Update many questions in one transaction
 - GET /questions/: Retrieve a list of questions
 - GET /questions/{question_id}: Retrieve a specific question by ID
+- GET /questions/{question_id}/similar: Retrieve near-duplicates of a question
 - PUT /questions/{question_id}: Update a specific question
 - DELETE /questions/{question_id}: Delete a specific question
 
@@ -24,30 +27,49 @@ which is handled by the check_auth_status and get_current_user_or_error function
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
+from backend.app.crud.crud_question_projections import (
+    read_question_projection_page_from_db,
+    read_question_projections_from_db,
+)
 from backend.app.crud.crud_questions import (
     create_question_in_db,
+    create_questions_in_db,
     delete_question_from_db,
     read_question_from_db,
-    read_questions_from_db,
     read_full_question_from_db,
     replace_question_in_db,
     update_question_in_db,
+    update_questions_in_db,
 )
+from backend.app.crud.crud_similarity import read_similar_questions_from_db
 from backend.app.db.session import get_db
 from backend.app.schemas.questions import (
     DetailedQuestionSchema,
+    QuestionBulkCreateSchema,
+    QuestionBulkResultSchema,
+    QuestionBulkUpdateSchema,
     QuestionCreateSchema,
     QuestionUpdateSchema,
     QuestionWithAnswersCreateSchema,
     QuestionWithAnswersReplaceSchema,
 )
+from backend.app.schemas.similarity import SimilarQuestionSchema
 from backend.app.services.auth_utils import check_auth_status, get_current_user_or_error
+from backend.app.services.question_similarity_service import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    MIN_SIMILARITY_THRESHOLD,
+)
 
 router = APIRouter()
 
+detailed_question_adapter = TypeAdapter(DetailedQuestionSchema)
+detailed_questions_adapter = TypeAdapter(List[DetailedQuestionSchema])
+
 
 @router.post(
     "/questions/",
@@ -150,6 +172,111 @@ async def post_question_with_answers(
         ) from e
 
 
+@router.post(
+    "/questions/bulk",
+    response_model=QuestionBulkResultSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def post_questions_bulk(
+    request: Request,
+    questions: List[QuestionBulkCreateSchema],
+    lenient: bool = False,
+    db: Session = Depends(get_db),
+) -> QuestionBulkResultSchema:
+    """
+    Create many questions in a single transaction.
+
+    All referenced ids are resolved once for the whole batch and the questions,
+    answer choices and associations are written with batched statements.
+
+    Args:
+        request (Request): The FastAPI request object.
+        questions (List[QuestionBulkCreateSchema]): The questions to create.
+        lenient (bool): If True, failing items are reported in "errors" and the
+            other items are still created. Defaults to False.
+        db (Session): The database session.
+
+    Returns:
+        QuestionBulkResultSchema: The created questions and any per-item errors.
+
+    Raises:
+        HTTPException:
+            - 401 Unauthorized: If the user is not authenticated.
+            - 422 Unprocessable Entity: If an item is invalid and lenient is False.
+            - 500 Internal Server Error: If an unexpected error occurs during creation.
+    """
+    check_auth_status(request)
+    get_current_user_or_error(request)
+
+    try:
+        questions_data = [question.model_dump() for question in questions]
+        created, errors = create_questions_in_db(db, questions_data, lenient=lenient)
+        return QuestionBulkResultSchema(
+            questions=[DetailedQuestionSchema.model_validate(q) for q in created],
+            errors=errors,
+        )
+    except ValueError as ve:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
+        ) from ve
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred while creating questions: {str(e)}",
+        ) from e
+
+
+@router.patch("/questions/bulk", response_model=QuestionBulkResultSchema)
+async def patch_questions_bulk(
+    request: Request,
+    questions: List[QuestionBulkUpdateSchema],
+    lenient: bool = False,
+    db: Session = Depends(get_db),
+) -> QuestionBulkResultSchema:
+    """
+    Partially update many questions in a single transaction.
+
+    Each item carries the question ID and the fields to update, with the same
+    semantics as PATCH /questions/{question_id}.
+
+    Args:
+        request (Request): The FastAPI request object.
+        questions (List[QuestionBulkUpdateSchema]): The partial updates to apply.
+        lenient (bool): If True, failing items are reported in "errors" and the
+            other items are still updated. Defaults to False.
+        db (Session): The database session.
+
+    Returns:
+        QuestionBulkResultSchema: The updated questions and any per-item errors.
+
+    Raises:
+        HTTPException:
+            - 401 Unauthorized: If the user is not authenticated.
+            - 422 Unprocessable Entity: If an item is invalid or refers to a missing
+              question and lenient is False.
+            - 500 Internal Server Error: If an unexpected error occurs during the update.
+    """
+    check_auth_status(request)
+    get_current_user_or_error(request)
+
+    try:
+        updates = [question.model_dump(exclude_unset=True) for question in questions]
+        updated, errors = update_questions_in_db(db, updates, lenient=lenient)
+        return QuestionBulkResultSchema(
+            questions=[DetailedQuestionSchema.model_validate(q) for q in updated],
+            errors=errors,
+        )
+    except ValueError as ve:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
+        ) from ve
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred while updating questions: {str(e)}",
+        ) from e
+
+
 @router.get("/questions/", response_model=List[DetailedQuestionSchema])
 async def get_questions(
     request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
@@ -178,14 +305,10 @@ async def get_questions(
     get_current_user_or_error(request)
 
     try:
-        questions = read_questions_from_db(db, skip=skip, limit=limit)
-        # Load full question data for each question to ensure proper serialization
-        detailed_questions = []
-        for q in questions:
-            full_question = read_full_question_from_db(db=db, question_id=q.id)
-            if full_question:
-                detailed_questions.append(DetailedQuestionSchema.model_validate(full_question))
-        return detailed_questions
+        return validated_response(
+            detailed_questions_adapter,
+            read_question_projection_page_from_db(db, skip=skip, limit=limit),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -220,12 +343,12 @@ async def get_question(
     get_current_user_or_error(request)
 
     try:
-        db_question = read_full_question_from_db(db, question_id=question_id)
-        if db_question is None:
+        projections = read_question_projections_from_db(db, [question_id])
+        if not projections:
             raise HTTPException(
                 status_code=404, detail=f"Question with ID {question_id} not found"
             )
-        return DetailedQuestionSchema.model_validate(db_question)
+        return validated_response(detailed_question_adapter, projections[0])
     except HTTPException:
         raise
     except Exception as e:
@@ -235,6 +358,63 @@ async def get_question(
         ) from e
 
 
+@router.get(
+    "/questions/{question_id}/similar", response_model=List[SimilarQuestionSchema]
+)
+async def get_similar_questions(
+    request: Request,
+    question_id: int,
+    threshold: float = Query(
+        DEFAULT_SIMILARITY_THRESHOLD, ge=MIN_SIMILARITY_THRESHOLD, le=1.0
+    ),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+) -> List[SimilarQuestionSchema]:
+    """
+    Retrieve the questions whose text is nearly the same as a question's text.
+
+    Candidates come from the MinHash/LSH similarity index, so the lookup does
+    not compare the question against the whole question bank.
+
+    Args:
+        request (Request): The FastAPI request object.
+        question_id (int): The ID of the question.
+        threshold (float): The minimum estimated similarity, between 0.3 and 1.
+        limit (int): The maximum number of questions to return.
+        db (Session): The database session.
+
+    Returns:
+        List[SimilarQuestionSchema]: The similar questions, most similar first.
+
+    Raises:
+        HTTPException:
+            - 401 Unauthorized: If the user is not authenticated.
+            - 404 Not Found: If the question with the given ID does not exist.
+            - 500 Internal Server Error: If an unexpected error occurs during retrieval.
+    """
+    check_auth_status(request)
+    get_current_user_or_error(request)
+
+    try:
+        similar = read_similar_questions_from_db(db, question_id, threshold, limit)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while retrieving similar questions",
+        ) from e
+    if similar is None:
+        raise HTTPException(
+            status_code=404, detail=f"Question with ID {question_id} not found"
+        )
+    return [
+        SimilarQuestionSchema(
+            question=DetailedQuestionSchema.model_validate(question),
+            similarity=similarity,
+        )
+        for question, similarity in similar
+    ]
+
+
 @router.put("/questions/{question_id}", response_model=DetailedQuestionSchema)
 async def put_question(
     request: Request,
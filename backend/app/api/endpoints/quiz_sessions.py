@@ -0,0 +1,217 @@
+# filename: backend/app/api/endpoints/quiz_sessions.py
+
+"""
+Quiz Sessions API
+
+This module provides API endpoints for delivering randomized quizzes.
+A quiz session draws a reproducible, difficulty-stratified sample of questions
+from a question set or a filter, stores the drawn order, and serves the
+questions page by page from that order.
+
+The module uses FastAPI for defining the API endpoints and Pydantic for data validation.
+It interacts with the database through CRUD operations defined in the crud_quiz_sessions module.
+
+Endpoints:
+- POST /quiz-sessions/: Create a new quiz session
+- GET /quiz-sessions/{quiz_session_id}: Retrieve a specific quiz session by ID
+- GET /quiz-sessions/{quiz_session_id}/questions: Retrieve a page of the session's questions
+- DELETE /quiz-sessions/{quiz_session_id}: Delete a specific quiz session
+
+Each endpoint requires authentication. Users can only access their own quiz sessions.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session
+
+from backend.app.crud.crud_quiz_sessions import (
+    create_quiz_session_in_db,
+    delete_quiz_session_from_db,
+    read_quiz_session_from_db,
+    read_quiz_session_questions_from_db,
+)
+from backend.app.db.session import get_db
+from backend.app.models.quiz_sessions import QuizSessionModel
+from backend.app.schemas.questions import DetailedQuestionSchema
+from backend.app.schemas.quiz_sessions import (
+    QuizSessionCreateSchema,
+    QuizSessionPageSchema,
+    QuizSessionSchema,
+)
+from backend.app.services.auth_utils import check_auth_status, get_current_user_or_error
+from backend.app.services.randomization_service import randomize_answer_choices
+
+router = APIRouter()
+
+
+def _get_own_quiz_session(
+    db: Session, quiz_session_id: int, user_id: int
+) -> QuizSessionModel:
+    quiz_session = read_quiz_session_from_db(db, quiz_session_id)
+    if quiz_session is None or quiz_session.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Quiz session with ID {quiz_session_id} not found",
+        )
+    return quiz_session
+
+
+@router.post(
+    "/quiz-sessions/",
+    response_model=QuizSessionSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+def post_quiz_session(
+    request: Request,
+    quiz_session: QuizSessionCreateSchema,
+    db: Session = Depends(get_db),
+):
+    """
+    Create a new quiz session.
+
+    This endpoint draws question_count questions matching the given question set
+    and filters. Passing the same seed and filters again reproduces the draw.
+
+    Args:
+        request (Request): The FastAPI request object.
+        quiz_session (QuizSessionCreateSchema): The draw settings.
+        db (Session): The database session.
+
+    Returns:
+        QuizSessionSchema: The created quiz session, including the seed used.
+
+    Raises:
+        HTTPException:
+            - 404: If the question set does not exist.
+            - 422: If no question matches the filters.
+            - 500: If there's an error creating the quiz session.
+    """
+    check_auth_status(request)
+    current_user = get_current_user_or_error(request)
+
+    quiz_session_data = quiz_session.model_dump()
+    quiz_session_data["user_id"] = current_user.id
+    try:
+        created_quiz_session = create_quiz_session_in_db(db, quiz_session_data)
+        return QuizSessionSchema.model_validate(created_quiz_session)
+    except ValueError as exc:
+        error_status = (
+            status.HTTP_404_NOT_FOUND
+            if "not found" in str(exc)
+            else status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        raise HTTPException(status_code=error_status, detail=str(exc)) from exc
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred while creating the quiz session: {str(exc)}",
+        ) from exc
+
+
+@router.get("/quiz-sessions/{quiz_session_id}", response_model=QuizSessionSchema)
+def get_quiz_session(
+    request: Request, quiz_session_id: int, db: Session = Depends(get_db)
+):
+    """
+    Retrieve a specific quiz session by ID.
+
+    Args:
+        request (Request): The FastAPI request object.
+        quiz_session_id (int): The ID of the quiz session to retrieve.
+        db (Session): The database session.
+
+    Returns:
+        QuizSessionSchema: The quiz session data.
+
+    Raises:
+        HTTPException: If the quiz session is not found or belongs to another user.
+    """
+    check_auth_status(request)
+    current_user = get_current_user_or_error(request)
+
+    quiz_session = _get_own_quiz_session(db, quiz_session_id, current_user.id)
+    return QuizSessionSchema.model_validate(quiz_session)
+
+
+@router.get(
+    "/quiz-sessions/{quiz_session_id}/questions",
+    response_model=QuizSessionPageSchema,
+)
+def get_quiz_session_questions(
+    request: Request,
+    quiz_session_id: int,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve one page of a quiz session's questions.
+
+    Questions are returned in the order drawn when the session was created.
+    The answer choices of each question are shuffled with a seed derived from
+    the session seed, so a question always shows its choices in the same order
+    within a session.
+
+    Args:
+        request (Request): The FastAPI request object.
+        quiz_session_id (int): The ID of the quiz session.
+        page (int): The 1-based page number.
+        page_size (int): The number of questions per page.
+        db (Session): The database session.
+
+    Returns:
+        QuizSessionPageSchema: The questions on the requested page.
+
+    Raises:
+        HTTPException: If the quiz session is not found or belongs to another user.
+    """
+    check_auth_status(request)
+    current_user = get_current_user_or_error(request)
+
+    quiz_session = _get_own_quiz_session(db, quiz_session_id, current_user.id)
+    questions, total = read_quiz_session_questions_from_db(
+        db, quiz_session.id, skip=(page - 1) * page_size, limit=page_size
+    )
+
+    delivered_questions = []
+    for question in questions:
+        question_schema = DetailedQuestionSchema.model_validate(question)
+        question_schema.answer_choices = randomize_answer_choices(
+            question_schema.answer_choices, seed=f"{quiz_session.seed}:{question.id}"
+        )
+        delivered_questions.append(question_schema)
+
+    return QuizSessionPageSchema(
+        quiz_session_id=quiz_session.id,
+        page=page,
+        page_size=page_size,
+        total=total,
+        questions=delivered_questions,
+    )
+
+
+@router.delete(
+    "/quiz-sessions/{quiz_session_id}", status_code=status.HTTP_204_NO_CONTENT
+)
+def delete_quiz_session(
+    request: Request, quiz_session_id: int, db: Session = Depends(get_db)
+):
+    """
+    Delete a specific quiz session.
+
+    Args:
+        request (Request): The FastAPI request object.
+        quiz_session_id (int): The ID of the quiz session to delete.
+        db (Session): The database session.
+
+    Returns:
+        None
+
+    Raises:
+        HTTPException: If the quiz session is not found or belongs to another user.
+    """
+    check_auth_status(request)
+    current_user = get_current_user_or_error(request)
+
+    quiz_session = _get_own_quiz_session(db, quiz_session_id, current_user.id)
+    delete_quiz_session_from_db(db, quiz_session.id)
+    return None
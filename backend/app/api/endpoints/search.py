@@ -0,0 +1,99 @@
+# filename: backend/app/api/endpoints/search.py
+
+"""
+Search API
+
+This module provides an API endpoint for full-text search over questions.
+Question text and answer choice text (including explanations) are searched
+through the database's full-text index, and results are ranked by relevance
+with the matching words highlighted.
+
+The module uses FastAPI for defining the API endpoints and Pydantic for data validation.
+It interacts with the database through CRUD operations defined in the crud_search module.
+
+Endpoints:
+- GET /questions/search: Search questions, optionally narrowed by the /questions/filter filters
+
+The endpoint requires authentication.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session
+
+from backend.app.api.endpoints.filters import build_filter_params
+from backend.app.crud.crud_search import search_questions_in_db
+from backend.app.db.session import get_db
+from backend.app.schemas.filters import FilterParamsSchema
+from backend.app.schemas.questions import DetailedQuestionSchema
+from backend.app.schemas.search import (
+    QuestionSearchResultSchema,
+    QuestionSearchResultsSchema,
+)
+from backend.app.services.auth_utils import check_auth_status, get_current_user_or_error
+
+router = APIRouter()
+
+
+@router.get("/questions/search", response_model=QuestionSearchResultsSchema)
+def search_questions(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    filters: FilterParamsSchema = Depends(build_filter_params),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Search question and answer choice text.
+
+    Results are ordered by relevance. Matching words are wrapped in <mark> tags
+    in the question text, and an excerpt of the answer text is included when
+    the answers matched. The filters work as they do on /questions/filter.
+
+    Args:
+        request (Request): The FastAPI request object.
+        q (str): The words to search for.
+        filters (FilterParamsSchema): The validated filter query parameters.
+        skip (int): The number of results to skip.
+        limit (int): The maximum number of results to return.
+        db (Session): The database session.
+
+    Returns:
+        QuestionSearchResultsSchema: The ranked, highlighted results.
+
+    Raises:
+        HTTPException:
+            - 400: If the difficulty level is invalid.
+            - 422: If the query contains no words or the filters are invalid.
+            - 501: If the database has no full-text search support.
+    """
+    check_auth_status(request)
+    get_current_user_or_error(request)
+
+    try:
+        results = search_questions_in_db(
+            db, q, filters.model_dump(), skip=skip, limit=limit
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    except NotImplementedError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(exc)
+        ) from exc
+
+    return QuestionSearchResultsSchema(
+        query=q,
+        skip=skip,
+        limit=limit,
+        results=[
+            QuestionSearchResultSchema(
+                question=DetailedQuestionSchema.model_validate(result["question"]),
+                score=result["score"],
+                highlighted_text=result["highlighted_text"],
+                answer_snippet=result["answer_snippet"],
+            )
+            for result in results
+        ],
+    )
@@ -23,9 +23,11 @@ which is handled by the check_auth_status and get_current_user_or_error function
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.crud.crud_subjects import (
     create_subject_in_db,
     delete_subject_from_db,
@@ -44,6 +46,8 @@ from backend.app.services.logging_service import logger
 
 router = APIRouter()
 
+subjects_adapter = TypeAdapter(List[SubjectSchema])
+
 
 @router.post("/subjects/", response_model=SubjectSchema, status_code=201)
 def post_subject(
@@ -107,7 +111,7 @@ def get_subjects(
     get_current_user_or_error(request)
 
     subjects = read_subjects_from_db(db, skip=skip, limit=limit)
-    return [SubjectSchema.model_validate(s) for s in subjects]
+    return validated_response(subjects_adapter, subjects)
 
 
 @router.get("/subjects/{subject_id}", response_model=SubjectSchema)
@@ -23,8 +23,10 @@ which is handled by the check_auth_status and get_current_user_or_error function
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.crud.crud_subtopics import (
     create_subtopic_in_db,
     delete_subtopic_from_db,
@@ -42,6 +44,8 @@ from backend.app.services.auth_utils import check_auth_status, get_current_user_
 
 router = APIRouter()
 
+subtopics_adapter = TypeAdapter(List[SubtopicSchema])
+
 
 @router.post("/subtopics/", response_model=SubtopicSchema, status_code=201)
 def post_subtopic(
@@ -97,7 +101,7 @@ def get_subtopics(
     get_current_user_or_error(request)
 
     subtopics = read_subtopics_from_db(db, skip=skip, limit=limit)
-    return [SubtopicSchema.model_validate(s) for s in subtopics]
+    return validated_response(subtopics_adapter, subtopics)
 
 
 @router.get("/subtopics/{subtopic_id}", response_model=SubtopicSchema)
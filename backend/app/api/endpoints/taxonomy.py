@@ -0,0 +1,52 @@
+# filename: backend/app/api/endpoints/taxonomy.py
+
+"""
+Taxonomy API
+
+This module provides an API endpoint for reading the whole content taxonomy
+(Domain -> Discipline -> Subject -> Topic -> Subtopic -> Concept) in one
+request. The tree is served from the in-process taxonomy cache. Its ETag and
+304 responses come from ConditionalGetMiddleware, which validates /taxonomy
+requests against the taxonomy resource version.
+
+Endpoints:
+- GET /taxonomy/tree: Retrieve the whole taxonomy as a nested tree
+
+Each endpoint requires authentication, which is handled by the
+check_auth_status and get_current_user_or_error functions.
+"""
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.orm import Session
+
+from backend.app.db.session import get_db
+from backend.app.services.auth_utils import check_auth_status, get_current_user_or_error
+from backend.app.services.taxonomy_service import taxonomy_cache
+
+router = APIRouter()
+
+
+@router.get("/taxonomy/tree")
+def get_taxonomy_tree(request: Request, db: Session = Depends(get_db)):
+    """
+    Retrieve the whole taxonomy as a nested tree.
+
+    The response body is {"domains": [...], "unattached": {...}}, where each node
+    has an id, a name and a list of its children under the next level's name.
+    Nodes without a parent are listed per level under "unattached".
+
+    Args:
+        request (Request): The FastAPI request object.
+        db (Session): The database session.
+
+    Returns:
+        Response: The JSON tree.
+
+    Raises:
+        HTTPException: If the user is not authenticated.
+    """
+    check_auth_status(request)
+    get_current_user_or_error(request)
+
+    body = taxonomy_cache.get_graph(db).tree_json()
+    return Response(content=body, media_type="application/json")
@@ -23,9 +23,11 @@ which is handled by the check_auth_status and get_current_user_or_error function
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.crud.crud_topics import (
     create_topic_in_db,
     delete_topic_from_db,
@@ -40,6 +42,8 @@ from backend.app.services.logging_service import logger
 
 router = APIRouter()
 
+topics_adapter = TypeAdapter(List[TopicSchema])
+
 
 @router.post("/topics/", response_model=TopicSchema, status_code=201)
 def post_topic(
@@ -103,7 +107,7 @@ def get_topics(
     get_current_user_or_error(request)
 
     topics = read_topics_from_db(db, skip=skip, limit=limit)
-    return [TopicSchema.model_validate(t) for t in topics]
+    return validated_response(topics_adapter, topics)
 
 
 @router.get("/topics/{topic_id}", response_model=TopicSchema)
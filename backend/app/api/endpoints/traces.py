@@ -0,0 +1,74 @@
+# filename: backend/app/api/endpoints/traces.py
+
+"""
+This module provides admin endpoints for reading the request traces a worker has kept.
+
+Each worker keeps the traces of the requests it served; these endpoints
+read the traces of the worker that serves them, whose pid is returned with
+the list.
+
+Endpoints:
+- GET /admin/traces: Lists the kept traces, newest first
+- GET /admin/traces/{trace_id}: Returns one trace's spans as OTLP JSON
+
+Usage example:
+    curl -H "Authorization: Bearer $TOKEN" \\
+        "http://localhost:8000/admin/traces?name=/leaderboard/&min_duration_ms=200"
+"""
+
+import os
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from backend.app.services.auth_utils import get_current_admin_or_error
+from backend.app.services.tracing_service import tracer
+
+router = APIRouter()
+
+
+@router.get("/admin/traces")
+def read_traces(
+    request: Request,
+    limit: int = Query(20, ge=1, le=1000),
+    name: Optional[str] = Query(None, description="Only traces whose root span name contains this"),
+    min_duration_ms: float = Query(0, ge=0),
+):
+    """
+    List the traces kept by this worker, newest first.
+
+    Args:
+        request (Request): The FastAPI request object.
+        limit (int): The maximum number of traces to return (default: 20).
+        name (Optional[str]): Only return traces whose name, e.g. "GET /leaderboard/", contains this.
+        min_duration_ms (float): Only return traces at least this long.
+
+    Returns:
+        dict: The worker's pid, its sample rate and the trace summaries.
+
+    Raises:
+        HTTPException: 403 if the user is not an admin.
+    """
+    get_current_admin_or_error(request)
+    return {
+        "pid": os.getpid(),
+        "sample_rate": tracer.sample_rate,
+        "traces": tracer.list_traces(limit, name, min_duration_ms),
+    }
+
+
+@router.get("/admin/traces/{trace_id}")
+def read_trace(request: Request, trace_id: str):
+    """
+    Return the spans of one trace as an OTLP JSON ExportTraceServiceRequest.
+
+    Raises:
+        HTTPException:
+            - 403: If the user is not an admin.
+            - 404: If this worker holds no trace with that ID.
+    """
+    get_current_admin_or_error(request)
+    trace = tracer.get_trace(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return trace.to_otlp()
@@ -25,8 +25,10 @@ from typing import List, Optional
 
 from fastapi import (APIRouter, Depends, HTTPException, Request, Response,
                      status)
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.crud.crud_answer_choices import read_answer_choice_from_db
 from backend.app.crud.crud_questions import read_question_from_db
 from backend.app.crud.crud_user_responses import (create_user_response_in_db,
@@ -43,6 +45,8 @@ from backend.app.services.auth_utils import (check_auth_status,
 
 router = APIRouter()
 
+user_responses_adapter = TypeAdapter(List[UserResponseSchema])
+
 
 def score_user_response(db: Session, user_response_data: dict) -> bool:
     """
@@ -210,7 +214,7 @@ def get_user_responses(
         skip=skip,
         limit=limit,
     )
-    return [UserResponseSchema.model_validate(ur) for ur in user_responses]
+    return validated_response(user_responses_adapter, user_responses)
 
 
 @router.put("/user-responses/{user_response_id}", response_model=UserResponseSchema)
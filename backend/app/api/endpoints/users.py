@@ -22,9 +22,10 @@ which is handled by the get_current_user dependency.
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.orm import Session
 
+from backend.app.api.responses import validated_response
 from backend.app.core.security import get_password_hash
 from backend.app.crud.crud_roles import read_role_from_db
 from backend.app.crud.crud_user import (
@@ -38,6 +39,8 @@ from backend.app.services.auth_utils import check_auth_status, get_current_user_
 
 router = APIRouter()
 
+users_adapter = TypeAdapter(List[UserSchema])
+
 
 @router.post("/users/", response_model=UserSchema, status_code=201)
 def post_user(request: Request, user: UserCreateSchema, db: Session = Depends(get_db)):
@@ -107,7 +110,7 @@ def get_users(
     get_current_user_or_error(request)
 
     users = read_users_from_db(db, skip=skip, limit=limit)
-    return [UserSchema.model_validate(user) for user in users]
+    return validated_response(users_adapter, users)
 
 
 @router.get("/users/me", response_model=UserSchema)
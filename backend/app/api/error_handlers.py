@@ -60,6 +60,8 @@ def parse_integrity_error(error_message: str) -> Dict[str, Any]:
     unique_match = re.search(unique_pattern, error_message)
     if unique_match:
         table, field = unique_match.groups()
+        # Normalized lookup columns (username_lower) report as their source field
+        field = field.removesuffix("_lower")
         return {
             "type": "unique_violation",
             "field": field,
@@ -0,0 +1,62 @@
+# filename: backend/app/api/responses.py
+
+"""
+Fast JSON responses for the API.
+
+FastJSONResponse is the application's default response class. It encodes
+with pydantic-core's Rust serializer, which understands models, enums and
+datetimes directly, instead of jsonable_encoder followed by the stdlib json
+module.
+
+A route that returns plain data is still validated against its
+response_model by FastAPI, which walks the data a second time. validated_response
+instead validates once with a TypeAdapter built at import time and encodes the
+result in the same pass. FastAPI sends the returned Response as is; the
+route's response_model is kept for the OpenAPI schema. The list endpoints
+use it for their pages, and pass the ORM rows straight to it.
+
+Usage example:
+    from backend.app.api.responses import validated_response
+
+    questions_adapter = TypeAdapter(List[DetailedQuestionSchema])
+
+    @router.get("/questions/", response_model=List[DetailedQuestionSchema])
+    async def get_questions(db: Session = Depends(get_db)):
+        return validated_response(questions_adapter, read_question_page(db))
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from starlette.responses import Response
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSONResponse encoded by pydantic-core."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def validated_response(
+    adapter: TypeAdapter, content: Any, status_code: int = 200
+) -> Response:
+    """
+    Validate content against a precompiled response type and encode it once.
+
+    Model instances are not revalidated, so returning already validated
+    models only costs their serialization. ORM objects are read by attribute,
+    as the response schemas' from_attributes config allows.
+
+    Args:
+        adapter (TypeAdapter): The adapter for the route's response type.
+        content (Any): The data, models or ORM objects to return.
+        status_code (int, optional): The response status code. Defaults to 200.
+
+    Returns:
+        Response: The encoded JSON response.
+    """
+    body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    return Response(body, status_code=status_code, media_type="application/json")
@@ -2,6 +2,7 @@
 
 import os
 from enum import Enum as PyEnum
+from functools import lru_cache
 from typing import List
 
 import dotenv
@@ -31,6 +32,10 @@ class TimePeriod(int, PyEnum):
         return cls(value).name.lower()
 
 
+# Each has its own database_url_<environment> in pyproject.toml
+ENVIRONMENTS = ("dev", "test", "prod")
+
+
 class SettingsCore(BaseSettings):
     PROJECT_NAME: str
     SECRET_KEY: str
@@ -41,6 +46,10 @@ class SettingsCore(BaseSettings):
     ENVIRONMENT: str
     ALGORITHM: str = "HS256"  # JWT algorithm, default to HS256
     SENTRY_DSN: str = ""  # Optional, empty string as default
+    BCRYPT_ROUNDS: int = 12  # bcrypt cost factor for new password hashes
+    BCRYPT_TARGET_MS: int = 0  # If set, calibrate the cost to this verify time
+    PASSWORD_HASH_WORKERS: int = 4  # Threads that run bcrypt for async callers
+    PASSWORD_HASH_MAX_PENDING: int = 64  # Queued + running bcrypt calls allowed
 
     class Config:
         # Define the path to the .env file relative to the location of config.py
@@ -97,15 +106,16 @@ def load_settings() -> SettingsCore:
         logger.debug("Current environment: %s", environment)
 
         # Get DATABASE_URL based on environment
-        if environment == "dev":
-            database_url = toml_config["database_url_dev"]
-        elif environment == "test":
-            database_url = toml_config["database_url_test"]
-        else:
+        if environment not in ENVIRONMENTS:
             raise ValueError(f"Invalid environment specified: {environment}")
+        database_url = toml_config[f"database_url_{environment}"]
 
         logger.debug("Database URL for environment (%s): %s", environment, database_url)
 
+        # bcrypt cost is per environment; tests use a low cost to stay fast
+        bcrypt_rounds = toml_config.get(f"bcrypt_rounds_{environment}", 12)
+        bcrypt_target_ms = toml_config.get(f"bcrypt_target_ms_{environment}", 0)
+
         # Create the settings instance with values from pyproject.toml and .env
         settings = SettingsCore(
             PROJECT_NAME=toml_config["project_name"],
@@ -116,9 +126,13 @@ def load_settings() -> SettingsCore:
             CORS_ORIGINS=toml_config["cors_origins"],
             ENVIRONMENT=environment,
             SENTRY_DSN=toml_config.get("sentry_dsn", ""),  # Optional
+            BCRYPT_ROUNDS=bcrypt_rounds,
+            BCRYPT_TARGET_MS=bcrypt_target_ms,
+            PASSWORD_HASH_WORKERS=toml_config.get("password_hash_workers", 4),
+            PASSWORD_HASH_MAX_PENDING=toml_config.get("password_hash_max_pending", 64),
         )
 
-        logger.debug("Settings created: %s", settings.model_dump())
+        logger.debug("Settings created: %s", settings.model_dump(exclude={"SECRET_KEY"}))
     except KeyError as e:
         logger.error("Missing required setting in pyproject.toml: %s", str(e))
         raise
@@ -133,8 +147,32 @@ def load_settings() -> SettingsCore:
     return settings
 
 
-# Load settings based on the environment variable
-settings_core = load_settings()
+@lru_cache(maxsize=None)
+def get_settings() -> SettingsCore:
+    """
+    Return the application settings, loading them on first use.
+
+    Reading .env and pyproject.toml is deferred from import time to the first
+    call, normally from the application's lifespan; every later call returns
+    the same instance.
+
+    Returns:
+        SettingsCore: The settings for the current ENVIRONMENT.
+
+    Usage example:
+        from backend.app.core.config import get_settings
+
+        database_url = get_settings().DATABASE_URL
+    """
+    return load_settings()
+
+
+def __getattr__(name):
+    # `from backend.app.core.config import settings_core` keeps working, and
+    # loads the settings at that point
+    if name == "settings_core":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Add a Pydantic model for JSON serialization
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
 from jose import ExpiredSignatureError, JWTError, jwt
 
-from backend.app.core.config import settings_core
+from backend.app.core.config import get_settings
 from backend.app.crud.crud_user import read_user_by_username_from_db
 from sqlalchemy.orm import Session
 
@@ -17,7 +17,7 @@ def create_access_token(data: dict, db: Session, expires_delta: timedelta = None
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings_core.ACCESS_TOKEN_EXPIRE_MINUTES
+            minutes=get_settings().ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
     user = read_user_by_username_from_db(db, to_encode["sub"])
@@ -31,7 +31,7 @@ def create_access_token(data: dict, db: Session, expires_delta: timedelta = None
             "iat": datetime.now(timezone.utc),  # Add issued at time
         }
     )
-    encoded_jwt = jwt.encode(to_encode, settings_core.SECRET_KEY, algorithm="HS256")
+    encoded_jwt = jwt.encode(to_encode, get_settings().SECRET_KEY, algorithm="HS256")
     return encoded_jwt
 
 
@@ -39,7 +39,7 @@ def decode_access_token(token: str, db: Session):
     try:
         payload = jwt.decode(
             token,
-            settings_core.SECRET_KEY,
+            get_settings().SECRET_KEY,
             algorithms=["HS256"],
             options={"verify_exp": True},
         )
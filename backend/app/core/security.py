@@ -1,13 +1,54 @@
 # filename: backend/app/core/security.py
 
-from passlib.context import CryptContext
+import asyncio
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
 from pydantic import SecretStr
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from backend.app.core.config import get_settings
+from backend.app.services.logging_service import logger
+
+# OWASP's floor for bcrypt; calibration never goes below it
+MIN_CALIBRATED_ROUNDS = 10
+MAX_CALIBRATED_ROUNDS = 16
+CALIBRATION_PROBE_ROUNDS = 8
+# The highest cost bcrypt supports
+BCRYPT_MAX_ROUNDS = 31
+
+_password_context = None
+
+
+def build_password_context(rounds: int):
+    # passlib is slow to import and only needed once a password is checked
+    from passlib.context import CryptContext
+
+    # The cost is a floor: needs_update() flags only cheaper hashes. Workers
+    # calibrated to slightly different costs therefore never rehash each
+    # other's hashes back and forth; stored hashes only move up
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=BCRYPT_MAX_ROUNDS,
+    )
+
+
+def get_password_context():
+    """Return the passlib context for password hashes, building it on first use."""
+    global _password_context
+    if _password_context is None:
+        _password_context = build_password_context(get_settings().BCRYPT_ROUNDS)
+    return _password_context
 
 
 def verify_password(plain_password, hashed_password):
-    result = pwd_context.verify(plain_password, hashed_password)
+    result = get_password_context().verify(plain_password, hashed_password)
 
     return result
 
@@ -15,6 +56,211 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     if isinstance(password, SecretStr):
         password = password.get_secret_value()
-    hashed = pwd_context.hash(password)
+    hashed = get_password_context().hash(password)
 
     return hashed
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Return True if a hash was made with another scheme or a lower bcrypt cost."""
+    return get_password_context().needs_update(hashed_password)
+
+
+def set_password_rounds(rounds: int) -> None:
+    """Hash new passwords with the given bcrypt cost from now on."""
+    global _password_context
+    _password_context = build_password_context(rounds)
+
+
+def calibrate_password_rounds(
+    target_ms: float,
+    min_rounds: int = MIN_CALIBRATED_ROUNDS,
+    max_rounds: int = MAX_CALIBRATED_ROUNDS,
+) -> int:
+    """
+    Pick the bcrypt cost whose verification takes about target_ms on this machine.
+
+    Times a verification at a cheap probe cost and extrapolates: each extra
+    round doubles bcrypt's work. Returns the highest cost predicted to stay
+    within the target.
+
+    Args:
+        target_ms (float): The desired verification time in milliseconds.
+        min_rounds (int, optional): The lowest cost to return.
+        max_rounds (int, optional): The highest cost to return.
+
+    Returns:
+        int: The bcrypt cost factor.
+
+    Usage example:
+        set_password_rounds(calibrate_password_rounds(250))
+    """
+    probe_context = build_password_context(CALIBRATION_PROBE_ROUNDS)
+    probe_hash = probe_context.hash("calibration-probe")
+    probe_ms = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        probe_context.verify("calibration-probe", probe_hash)
+        probe_ms = min(probe_ms, (time.perf_counter() - start) * 1000)
+    rounds = CALIBRATION_PROBE_ROUNDS + math.floor(math.log2(target_ms / probe_ms))
+    return max(min_rounds, min(max_rounds, rounds))
+
+
+def configure_password_rounds() -> int:
+    """
+    Set the bcrypt cost for this process from the settings.
+
+    With BCRYPT_TARGET_MS set, the cost is calibrated to that verification
+    time on the current hardware; otherwise BCRYPT_ROUNDS is used. Hashes made
+    with a lower cost are upgraded as their users log in; costlier hashes,
+    such as those of a worker that calibrated higher, are kept.
+
+    Returns:
+        int: The bcrypt cost in use.
+    """
+    settings = get_settings()
+    rounds = settings.BCRYPT_ROUNDS
+    if settings.BCRYPT_TARGET_MS:
+        rounds = calibrate_password_rounds(settings.BCRYPT_TARGET_MS)
+        logger.info(
+            "Calibrated bcrypt cost to %s rounds for a %s ms target",
+            rounds,
+            settings.BCRYPT_TARGET_MS,
+        )
+    set_password_rounds(rounds)
+    return rounds
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when too many password hashes are already queued."""
+
+
+class PasswordHashPool:
+    """
+    Runs bcrypt for async code on a bounded pool of worker threads.
+
+    bcrypt is deliberately slow, and calling it from a coroutine stops the
+    event loop for every other request until it returns. The pool runs it in
+    worker threads instead; bcrypt releases the GIL while hashing, so the
+    workers hash in parallel while the loop keeps serving requests.
+
+    At most `workers` hashes run at once. Calls beyond that wait in the
+    executor's queue, and once `max_pending` calls are queued or running new
+    calls fail fast with PasswordHashingBusyError rather than queueing for
+    longer than any client would wait.
+
+    The executor is created on first use, so processes forked after import
+    each start their own threads.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._queue_seconds_total = 0.0
+        self._queue_seconds_max = 0.0
+        self._hash_seconds_total = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+            return self._executor
+
+    async def run(self, func: Callable, *args):
+        """
+        Run a password hashing function on the pool and await its result.
+
+        Args:
+            func (Callable): The blocking function, such as verify_password.
+            *args: The arguments to call it with.
+
+        Returns:
+            The function's return value.
+
+        Raises:
+            PasswordHashingBusyError: If max_pending calls are already pending.
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHashingBusyError("Too many pending password hashes")
+            self._pending += 1
+
+        queued_at = time.perf_counter()
+
+        def timed_call():
+            started_at = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self._record(started_at - queued_at, time.perf_counter() - started_at)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), timed_call
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _record(self, queue_seconds: float, hash_seconds: float) -> None:
+        with self._lock:
+            self._completed += 1
+            self._queue_seconds_total += queue_seconds
+            self._queue_seconds_max = max(self._queue_seconds_max, queue_seconds)
+            self._hash_seconds_total += hash_seconds
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Return the pool's counters since startup.
+
+        Returns:
+            Dict[str, float]: pending, completed and rejected call counts, and
+                the total and maximum seconds calls waited for a worker and
+                the total seconds spent hashing.
+        """
+        with self._lock:
+            return {
+                "pending": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "queue_seconds_total": self._queue_seconds_total,
+                "queue_seconds_max": self._queue_seconds_max,
+                "hash_seconds_total": self._hash_seconds_total,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads after the calls already queued finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+@lru_cache(maxsize=None)
+def get_password_hash_pool() -> PasswordHashPool:
+    """Return the process's password hash pool, sized from the settings."""
+    settings = get_settings()
+    return PasswordHashPool(
+        workers=settings.PASSWORD_HASH_WORKERS,
+        max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    )
+
+
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    """verify_password for coroutines; runs on the password hash pool."""
+    return await get_password_hash_pool().run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password) -> str:
+    """get_password_hash for coroutines; runs on the password hash pool."""
+    return await get_password_hash_pool().run(get_password_hash, password)
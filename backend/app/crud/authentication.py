@@ -156,21 +156,21 @@ def is_token_revoked(db: Session, token: str) -> bool:
         db.query(RevokedTokenModel).filter(RevokedTokenModel.jti == jti).first()
     )
     if revoked_token:
-        logger.info("Token found in revoked tokens table: jti=%s", jti)
+        logger.debug("Token found in revoked tokens table: jti=%s", jti)
         return True
 
     # Check if the token was issued before the user's token_blacklist_date
     if user.token_blacklist_date:
         token_iat_datetime = datetime.fromtimestamp(token_iat, tz=timezone.utc)
         if token_iat_datetime < user.token_blacklist_date:
-            logger.info(
+            logger.debug(
                 "Token issued before blacklist date: iat=%s, blacklist_date=%s",
                 token_iat_datetime,
                 user.token_blacklist_date,
             )
             return True
 
-    logger.info("Token is not revoked: jti=%s", jti)
+    logger.debug("Token is not revoked: jti=%s", jti)
     return False
 
 
@@ -15,6 +15,8 @@ Key dependencies:
 
 Main functions:
 - create_answer_choice_in_db: Creates a new answer choice
+- create_answer_choices_in_db: Creates many answer choices for a question in two statements
+- create_answer_choices_for_questions_in_db: Creates answer choices for several questions
 - read_answer_choice_from_db: Retrieves a single answer choice
 - read_list_of_answer_choices_from_db: Retrieves multiple answer choices
 - update_answer_choice_in_db: Updates an existing answer choice
@@ -33,15 +35,19 @@ Usage example:
         return create_answer_choice_in_db(db, answer_choice_data)
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
+from backend.app.crud.crud_associations import create_association_pairs_in_db
 from backend.app.models.answer_choices import AnswerChoiceModel
 from backend.app.models.associations import QuestionToAnswerAssociation
 from backend.app.models.questions import QuestionModel
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_answer_choice_in_db(
     db: Session, answer_choice_data: Dict
 ) -> AnswerChoiceModel:
@@ -91,6 +97,124 @@ def create_answer_choice_in_db(
     return db_answer_choice
 
 
+@traced
+def create_answer_choices_for_questions_in_db(
+    db: Session, answer_choices: List[Tuple[Optional[int], Dict]]
+) -> List[int]:
+    """
+    Create answer choices for several questions with two executemany statements.
+
+    One INSERT ... RETURNING creates all the answer choices and a second one
+    writes their question_to_answer_association rows. Nothing is flushed,
+    committed or refreshed; the caller owns the transaction.
+
+    Args:
+        db (Session): The database session.
+        answer_choices (List[Tuple[Optional[int], Dict]]): (question_id, data)
+            pairs, where data has the keys accepted by create_answer_choice_in_db.
+            A question_id of None creates the answer choice without an association.
+            The answer choice is also associated with the questions in
+            data["question_ids"]; IDs of questions that do not exist are skipped.
+
+    Returns:
+        List[int]: The IDs of the created answer choices, in input order.
+
+    Raises:
+        SQLAlchemyError: If there's an issue with the database operation.
+
+    Usage example:
+        ids = create_answer_choices_for_questions_in_db(
+            db,
+            [
+                (1, {"text": "4", "is_correct": True}),
+                (2, {"text": "6", "is_correct": True}),
+            ],
+        )
+    """
+    if not answer_choices:
+        return []
+
+    answer_choice_ids = db.scalars(
+        insert(AnswerChoiceModel).returning(
+            AnswerChoiceModel.id, sort_by_parameter_order=True
+        ),
+        [
+            {
+                "text": data["text"],
+                "is_correct": data["is_correct"],
+                "explanation": data.get("explanation"),
+            }
+            for _, data in answer_choices
+        ],
+    ).all()
+
+    listed_question_ids = {
+        listed_id
+        for _, data in answer_choices
+        for listed_id in data.get("question_ids") or ()
+    }
+    if listed_question_ids:
+        # Only the listed IDs are unchecked; question_id comes from the caller
+        listed_question_ids = set(
+            db.scalars(
+                select(QuestionModel.id).where(QuestionModel.id.in_(listed_question_ids))
+            )
+        )
+
+    pairs = []
+    for (question_id, data), answer_choice_id in zip(answer_choices, answer_choice_ids):
+        if question_id is not None:
+            pairs.append((question_id, answer_choice_id))
+        for listed_id in data.get("question_ids") or ():
+            if listed_id in listed_question_ids:
+                pairs.append((listed_id, answer_choice_id))
+    create_association_pairs_in_db(db, QuestionToAnswerAssociation, pairs)
+    return answer_choice_ids
+
+
+@traced
+def create_answer_choices_in_db(
+    db: Session, answer_choices_data: List[Dict], question_id: Optional[int] = None
+) -> List[int]:
+    """
+    Create several answer choices, optionally associated with a question.
+
+    This is the batched counterpart of create_answer_choice_in_db: it costs two
+    statements regardless of the number of choices and skips the per-row
+    flush and refresh. Use read_list_of_answer_choices_from_db on the returned
+    IDs if the full objects are needed.
+
+    Args:
+        db (Session): The database session.
+        answer_choices_data (List[Dict]): The answer choice dictionaries.
+            Required keys: "text", "is_correct"
+            Optional keys: "explanation", "question_ids" (more questions to
+            associate each answer choice with)
+        question_id (Optional[int]): The ID of the question to associate with.
+
+    Returns:
+        List[int]: The IDs of the created answer choices, in input order.
+
+    Raises:
+        SQLAlchemyError: If there's an issue with the database operation.
+
+    Usage example:
+        answer_choice_ids = create_answer_choices_in_db(
+            db,
+            [
+                {"text": "Paris", "is_correct": True},
+                {"text": "Lyon", "is_correct": False},
+            ],
+            question_id=1,
+        )
+        db.commit()
+    """
+    return create_answer_choices_for_questions_in_db(
+        db, [(question_id, data) for data in answer_choices_data]
+    )
+
+
+@traced
 def read_answer_choice_from_db(
     db: Session, answer_choice_id: int
 ) -> Optional[AnswerChoiceModel]:
@@ -117,6 +241,7 @@ def read_answer_choice_from_db(
     )
 
 
+@traced
 def read_list_of_answer_choices_from_db(
     db: Session, answer_choice_ids: List[int]
 ) -> List[AnswerChoiceModel]:
@@ -142,6 +267,7 @@ def read_list_of_answer_choices_from_db(
     )
 
 
+@traced
 def read_answer_choices_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[AnswerChoiceModel]:
@@ -164,6 +290,7 @@ def read_answer_choices_from_db(
     return db.query(AnswerChoiceModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_answer_choice_in_db(
     db: Session, answer_choice_id: int, answer_choice_data: Dict
 ) -> Optional[AnswerChoiceModel]:
@@ -197,6 +324,7 @@ def update_answer_choice_in_db(
     return db_answer_choice
 
 
+@traced
 def delete_answer_choice_from_db(db: Session, answer_choice_id: int) -> bool:
     """
     Delete an answer choice from the database.
@@ -225,6 +353,7 @@ def delete_answer_choice_from_db(db: Session, answer_choice_id: int) -> bool:
     return False
 
 
+@traced
 def create_question_to_answer_association_in_db(
     db: Session, question_id: int, answer_choice_id: int
 ) -> bool:
@@ -260,6 +389,7 @@ def create_question_to_answer_association_in_db(
         raise e
 
 
+@traced
 def delete_question_to_answer_association_from_db(
     db: Session, question_id: int, answer_choice_id: int
 ) -> bool:
@@ -295,6 +425,7 @@ def delete_question_to_answer_association_from_db(
     return False
 
 
+@traced
 def read_answer_choices_for_question_from_db(
     db: Session, question_id: int
 ) -> List[AnswerChoiceModel]:
@@ -322,6 +453,7 @@ def read_answer_choices_for_question_from_db(
     )
 
 
+@traced
 def read_questions_for_answer_choice_from_db(
     db: Session, answer_choice_id: int
 ) -> List[QuestionModel]:
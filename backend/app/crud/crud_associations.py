@@ -0,0 +1,421 @@
+# filename: backend/app/crud/crud_associations.py
+
+"""
+This module provides set-based bulk operations for the association tables.
+
+The per-entity helpers (create_question_to_subject_association_in_db, etc.)
+insert or delete one row and commit per call, and the question CRUD helpers
+rebuild ORM collections in Python. The functions here work on the
+(source_ids x target_ids) cross product of any association model defined in
+backend.app.models.associations using single INSERT ... SELECT and DELETE
+statements, so no ORM collections are loaded and retagging thousands of
+questions costs a handful of round-trips.
+
+Ids that do not exist in the referenced tables are silently skipped, and
+rows that already exist are left untouched (INSERT ... ON CONFLICT DO NOTHING
+on SQLite/PostgreSQL, INSERT IGNORE on MariaDB/MySQL).
+
+None of these functions commit; the caller owns the transaction. Collections
+of ORM objects already loaded in the session are not updated, so callers
+should expire the affected relationship attributes if they keep using them.
+Writes to tables that link questions are recorded in the question change
+log, as the unit of work does for ORM writes.
+
+Key dependencies:
+- sqlalchemy: For Core insert/delete/select constructs
+- backend.app.models.associations: For the association models
+- backend.app.services.question_change_service: For logging the questions written
+
+Main functions:
+- create_associations_in_db: Inserts every missing (source, target) pair
+- create_association_pairs_in_db: Inserts explicit (source, target) pairs
+- delete_associations_from_db: Deletes (source, target) pairs
+- replace_associations_in_db: Makes the targets of each source exactly target_ids
+- read_association_pairs_from_db: Reads (source, target) pairs for sources
+- insert_ignoring_conflicts: Builds the dialect's INSERT that skips existing rows
+
+Usage example:
+    from backend.app.crud.crud_associations import replace_associations_in_db
+    from backend.app.models.associations import QuestionToTagAssociation
+
+    replace_associations_in_db(db, QuestionToTagAssociation, question_ids, [3, 7])
+    db.commit()
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import Column, delete, insert, select, true
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from backend.app.services.logging_service import logger
+from backend.app.services.question_change_service import record_question_changes
+from backend.app.services.tracing_service import traced
+
+# Keeps the number of bound parameters per statement well below SQLite's limit
+BULK_CHUNK_SIZE = 500
+
+
+def get_association_columns(
+    association_model, source_table: str = "questions"
+) -> Tuple[Column, Column]:
+    """
+    Resolve the (source, target) key columns of an association model.
+
+    The source column is the primary key column referencing source_table. When
+    no column references it (e.g. DomainToDisciplineAssociation), the first
+    declared primary key column is used as the source.
+
+    Args:
+        association_model: An association model class from models.associations.
+        source_table (str): The table name the source ids belong to.
+
+    Returns:
+        Tuple[Column, Column]: The source and target columns.
+
+    Raises:
+        ValueError: If the model is not a two-column association table.
+    """
+    columns = list(association_model.__table__.primary_key.columns)
+    if len(columns) != 2 or not all(column.foreign_keys for column in columns):
+        raise ValueError(
+            f"{association_model.__name__} is not a two-column association model"
+        )
+
+    for index, column in enumerate(columns):
+        if _referenced_column(column).table.name == source_table:
+            return column, columns[1 - index]
+    return columns[0], columns[1]
+
+
+def _referenced_column(column: Column) -> Column:
+    return next(iter(column.foreign_keys)).column
+
+
+def _record_question_changes(
+    db: Session,
+    source_column: Column,
+    target_column: Column,
+    source_ids: Iterable[int],
+    target_ids: Optional[Iterable[int]],
+) -> None:
+    if _referenced_column(source_column).table.name == "questions":
+        record_question_changes(db, source_ids)
+    elif _referenced_column(target_column).table.name == "questions":
+        # Without target_ids, any question linked to the sources may have changed
+        record_question_changes(db, target_ids if target_ids is not None else [None])
+
+
+def _chunked(ids: List[int]) -> Iterable[List[int]]:
+    for start in range(0, len(ids), BULK_CHUNK_SIZE):
+        yield ids[start : start + BULK_CHUNK_SIZE]
+
+
+def insert_ignoring_conflicts(db: Session, model):
+    """
+    Build an INSERT for a model that leaves rows with a conflicting key alone.
+
+    Args:
+        db (Session): The database session; its dialect picks the syntax.
+        model: The model or table to insert into.
+
+    Returns:
+        Tuple: The insert statement and its conflict style. With "on_conflict"
+            the caller applies .on_conflict_do_nothing() once the statement is
+            complete; with "ignore" the statement already skips conflicts.
+
+    Raises:
+        NotImplementedError: If the dialect has no insert-or-ignore form.
+    """
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        return sqlite_insert(model), "on_conflict"
+    if dialect_name == "postgresql":
+        # Imported here; the dialect package is slow to import and rarely used
+        from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+        return postgresql_insert(model), "on_conflict"
+    if dialect_name in ("mysql", "mariadb"):
+        return insert(model).prefix_with("IGNORE"), "ignore"
+    raise NotImplementedError(f"Insert-or-ignore is not supported on {dialect_name}")
+
+
+@traced
+def create_associations_in_db(
+    db: Session,
+    association_model,
+    source_ids: Iterable[int],
+    target_ids: Iterable[int],
+    source_table: str = "questions",
+) -> int:
+    """
+    Associate every source id with every target id in one statement per chunk.
+
+    Args:
+        db (Session): The database session.
+        association_model: An association model class from models.associations.
+        source_ids (Iterable[int]): Ids of the source entities (e.g. questions).
+        target_ids (Iterable[int]): Ids of the target entities (e.g. tags).
+        source_table (str): The table the source ids belong to.
+
+    Returns:
+        int: The number of association rows inserted.
+
+    Raises:
+        SQLAlchemyError: If there's an issue with the database operation.
+
+    Usage example:
+        inserted = create_associations_in_db(
+            db, QuestionToSubjectAssociation, [1, 2, 3], [4, 5]
+        )
+    """
+    source_ids = sorted(set(source_ids))
+    target_ids = sorted(set(target_ids))
+    if not source_ids or not target_ids:
+        return 0
+
+    source_column, target_column = get_association_columns(
+        association_model, source_table
+    )
+    source_ref = _referenced_column(source_column)
+    target_ref = _referenced_column(target_column)
+
+    inserted = 0
+    for source_chunk in _chunked(source_ids):
+        for target_chunk in _chunked(target_ids):
+            # Joining against the referenced tables drops unknown ids; the
+            # cross join is spelled out so it is not reported as accidental
+            pairs = (
+                select(source_ref, target_ref)
+                .select_from(source_ref.table.join(target_ref.table, true()))
+                .where(source_ref.in_(source_chunk), target_ref.in_(target_chunk))
+            )
+            stmt, conflict_style = insert_ignoring_conflicts(db, association_model)
+            stmt = stmt.from_select([source_column.key, target_column.key], pairs)
+            if conflict_style == "on_conflict":
+                stmt = stmt.on_conflict_do_nothing()
+            result = db.execute(stmt)
+            inserted += max(result.rowcount or 0, 0)
+    _record_question_changes(db, source_column, target_column, source_ids, target_ids)
+
+    logger.debug(
+        "Inserted %s %s rows for %s sources",
+        inserted,
+        association_model.__tablename__,
+        len(source_ids),
+    )
+    return inserted
+
+
+@traced
+def create_association_pairs_in_db(
+    db: Session,
+    association_model,
+    pairs: Iterable[Tuple[int, int]],
+    source_table: str = "questions",
+) -> int:
+    """
+    Insert explicit (source_id, target_id) pairs with a single executemany.
+
+    Unlike create_associations_in_db, the pairs are not joined against the
+    referenced tables, so callers must pass ids they have already validated
+    (e.g. from a prefetch of existing ids).
+
+    Args:
+        db (Session): The database session.
+        association_model: An association model class from models.associations.
+        pairs (Iterable[Tuple[int, int]]): The (source_id, target_id) pairs.
+        source_table (str): The table the source ids belong to.
+
+    Returns:
+        int: The number of distinct pairs submitted.
+
+    Raises:
+        SQLAlchemyError: If there's an issue with the database operation.
+
+    Usage example:
+        create_association_pairs_in_db(
+            db, QuestionToTagAssociation, [(1, 3), (2, 3), (2, 4)]
+        )
+    """
+    pairs = sorted(set(pairs))
+    if not pairs:
+        return 0
+
+    source_column, target_column = get_association_columns(
+        association_model, source_table
+    )
+    stmt, conflict_style = insert_ignoring_conflicts(db, association_model)
+    if conflict_style == "on_conflict":
+        stmt = stmt.on_conflict_do_nothing()
+    db.execute(
+        stmt,
+        [
+            {source_column.key: source_id, target_column.key: target_id}
+            for source_id, target_id in pairs
+        ],
+    )
+    _record_question_changes(
+        db,
+        source_column,
+        target_column,
+        [source_id for source_id, _ in pairs],
+        [target_id for _, target_id in pairs],
+    )
+    return len(pairs)
+
+
+@traced
+def delete_associations_from_db(
+    db: Session,
+    association_model,
+    source_ids: Iterable[int],
+    target_ids: Optional[Iterable[int]] = None,
+    source_table: str = "questions",
+) -> int:
+    """
+    Delete associations between the given sources and targets.
+
+    Args:
+        db (Session): The database session.
+        association_model: An association model class from models.associations.
+        source_ids (Iterable[int]): Ids of the source entities.
+        target_ids (Optional[Iterable[int]]): Ids of the targets to detach.
+            If None, all associations of the sources are deleted.
+        source_table (str): The table the source ids belong to.
+
+    Returns:
+        int: The number of association rows deleted.
+
+    Raises:
+        SQLAlchemyError: If there's an issue with the database operation.
+
+    Usage example:
+        deleted = delete_associations_from_db(db, QuestionToTagAssociation, [1, 2])
+    """
+    source_ids = sorted(set(source_ids))
+    if not source_ids:
+        return 0
+    if target_ids is not None:
+        # Read once; a generator would be used up by the first chunk
+        target_ids = sorted(set(target_ids))
+    source_column, target_column = get_association_columns(
+        association_model, source_table
+    )
+
+    deleted = 0
+    for source_chunk in _chunked(source_ids):
+        stmt = delete(association_model).where(source_column.in_(source_chunk))
+        if target_ids is None:
+            deleted += max(db.execute(stmt).rowcount or 0, 0)
+            continue
+        for target_chunk in _chunked(target_ids):
+            chunk_stmt = stmt.where(target_column.in_(target_chunk))
+            deleted += max(db.execute(chunk_stmt).rowcount or 0, 0)
+    _record_question_changes(db, source_column, target_column, source_ids, target_ids)
+    return deleted
+
+
+@traced
+def replace_associations_in_db(
+    db: Session,
+    association_model,
+    source_ids: Iterable[int],
+    target_ids: Iterable[int],
+    source_table: str = "questions",
+) -> Tuple[int, int]:
+    """
+    Make target_ids the exact set of targets associated with each source.
+
+    Rows whose target is not in target_ids are removed with a single
+    DELETE ... WHERE NOT IN, and missing pairs are inserted; rows that are
+    kept are never rewritten. When target_ids is too long to bind in one
+    NOT IN, the current targets of each chunk of sources are read first and
+    the ones to remove are deleted by chunks of IN lists.
+
+    Args:
+        db (Session): The database session.
+        association_model: An association model class from models.associations.
+        source_ids (Iterable[int]): Ids of the source entities.
+        target_ids (Iterable[int]): The desired target ids for every source.
+        source_table (str): The table the source ids belong to.
+
+    Returns:
+        Tuple[int, int]: The number of rows deleted and inserted.
+
+    Raises:
+        SQLAlchemyError: If there's an issue with the database operation.
+
+    Usage example:
+        deleted, inserted = replace_associations_in_db(
+            db, QuestionToTopicAssociation, question_ids, [10, 11]
+        )
+    """
+    source_ids = sorted(set(source_ids))
+    target_ids = sorted(set(target_ids))
+    if not source_ids:
+        return 0, 0
+    source_column, target_column = get_association_columns(
+        association_model, source_table
+    )
+
+    kept = set(target_ids)
+    deleted = 0
+    for source_chunk in _chunked(source_ids):
+        stmt = delete(association_model).where(source_column.in_(source_chunk))
+        if len(target_ids) <= BULK_CHUNK_SIZE:
+            if target_ids:
+                stmt = stmt.where(target_column.not_in(target_ids))
+            deleted += max(db.execute(stmt).rowcount or 0, 0)
+            continue
+        current = db.scalars(
+            select(target_column).where(source_column.in_(source_chunk)).distinct()
+        )
+        removed = sorted(set(current) - kept)
+        for target_chunk in _chunked(removed):
+            chunk_stmt = stmt.where(target_column.in_(target_chunk))
+            deleted += max(db.execute(chunk_stmt).rowcount or 0, 0)
+    # Which other targets were detached is not known here
+    _record_question_changes(db, source_column, target_column, source_ids, None)
+
+    inserted = create_associations_in_db(
+        db, association_model, source_ids, target_ids, source_table
+    )
+    return deleted, inserted
+
+
+@traced
+def read_association_pairs_from_db(
+    db: Session,
+    association_model,
+    source_ids: Iterable[int],
+    source_table: str = "questions",
+) -> List[Tuple[int, int]]:
+    """
+    Read the (source_id, target_id) pairs associated with the given sources.
+
+    Args:
+        db (Session): The database session.
+        association_model: An association model class from models.associations.
+        source_ids (Iterable[int]): Ids of the source entities.
+        source_table (str): The table the source ids belong to.
+
+    Returns:
+        List[Tuple[int, int]]: The association pairs, ordered by source then target.
+
+    Usage example:
+        pairs = read_association_pairs_from_db(db, QuestionToTagAssociation, [1, 2])
+    """
+    source_ids = sorted(set(source_ids))
+    source_column, target_column = get_association_columns(
+        association_model, source_table
+    )
+    pairs = []
+    for source_chunk in _chunked(source_ids):
+        rows = db.execute(
+            select(source_column, target_column)
+            .where(source_column.in_(source_chunk))
+            .order_by(source_column, target_column)
+        )
+        pairs.extend((row[0], row[1]) for row in rows)
+    return pairs
@@ -12,6 +12,8 @@ Key dependencies:
 - backend.app.models.concepts: For the ConceptModel
 - backend.app.models.questions: For the QuestionModel
 - backend.app.models.subtopics: For the SubtopicModel
+- backend.app.crud.crud_taxonomy_closure: For keeping the taxonomy closure table in sync
+- backend.app.services.taxonomy_service: For invalidating the cached taxonomy graph
 
 Main functions:
 - create_concept_in_db: Creates a new concept
@@ -41,6 +43,7 @@ from typing import Dict, List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from backend.app.crud.crud_taxonomy_closure import refresh_taxonomy_closure_in_db
 from backend.app.models.associations import (
     QuestionToConceptAssociation,
     SubtopicToConceptAssociation,
@@ -49,8 +52,11 @@ from backend.app.models.concepts import ConceptModel
 from backend.app.models.questions import QuestionModel
 from backend.app.models.subtopics import SubtopicModel
 from backend.app.services.logging_service import logger
+from backend.app.services.taxonomy_service import taxonomy_cache
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_concept_in_db(db: Session, concept_data: Dict) -> ConceptModel:
     """
     Create a new concept in the database.
@@ -77,7 +83,10 @@ def create_concept_in_db(db: Session, concept_data: Dict) -> ConceptModel:
     """
     db_concept = ConceptModel(name=concept_data["name"])
     db.add(db_concept)
+    db.flush()
+    refresh_taxonomy_closure_in_db(db, "concepts", [db_concept.id])
     db.commit()
+    taxonomy_cache.bump_version()
     db.refresh(db_concept)
 
     if "subtopic_ids" in concept_data and concept_data["subtopic_ids"]:
@@ -91,6 +100,7 @@ def create_concept_in_db(db: Session, concept_data: Dict) -> ConceptModel:
     return db_concept
 
 
+@traced
 def read_concept_from_db(db: Session, concept_id: int) -> Optional[ConceptModel]:
     """
     Retrieve a single concept from the database by its ID.
@@ -111,6 +121,7 @@ def read_concept_from_db(db: Session, concept_id: int) -> Optional[ConceptModel]
     return db.query(ConceptModel).filter(ConceptModel.id == concept_id).first()
 
 
+@traced
 def read_concept_by_name_from_db(db: Session, name: str) -> Optional[ConceptModel]:
     """
     Retrieve a single concept from the database by its name.
@@ -131,6 +142,7 @@ def read_concept_by_name_from_db(db: Session, name: str) -> Optional[ConceptMode
     return db.query(ConceptModel).filter(ConceptModel.name == name).first()
 
 
+@traced
 def read_concepts_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[ConceptModel]:
@@ -153,6 +165,7 @@ def read_concepts_from_db(
     return db.query(ConceptModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_concept_in_db(
     db: Session, concept_id: int, concept_data: Dict
 ) -> Optional[ConceptModel]:
@@ -181,11 +194,14 @@ def update_concept_in_db(
     if db_concept:
         for key, value in concept_data.items():
             setattr(db_concept, key, value)
+        refresh_taxonomy_closure_in_db(db, "concepts", [concept_id])
         db.commit()
+        taxonomy_cache.bump_version()
         db.refresh(db_concept)
     return db_concept
 
 
+@traced
 def delete_concept_from_db(db: Session, concept_id: int) -> bool:
     """
     Delete a concept from the database.
@@ -209,11 +225,14 @@ def delete_concept_from_db(db: Session, concept_id: int) -> bool:
     db_concept = read_concept_from_db(db, concept_id)
     if db_concept:
         db.delete(db_concept)
+        refresh_taxonomy_closure_in_db(db, "concepts", [concept_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_subtopic_to_concept_association_in_db(
     db: Session, subtopic_id: int, concept_id: int
 ) -> bool:
@@ -242,7 +261,9 @@ def create_subtopic_to_concept_association_in_db(
     )
     db.add(association)
     try:
+        refresh_taxonomy_closure_in_db(db, "concepts", [concept_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     except SQLAlchemyError as e:
         db.rollback()
@@ -250,6 +271,7 @@ def create_subtopic_to_concept_association_in_db(
         return False
 
 
+@traced
 def delete_subtopic_to_concept_association_from_db(
     db: Session, subtopic_id: int, concept_id: int
 ) -> bool:
@@ -280,11 +302,14 @@ def delete_subtopic_to_concept_association_from_db(
     )
     if association:
         db.delete(association)
+        refresh_taxonomy_closure_in_db(db, "concepts", [concept_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_question_to_concept_association_in_db(
     db: Session, question_id: int, concept_id: int
 ) -> bool:
@@ -321,6 +346,7 @@ def create_question_to_concept_association_in_db(
         return False
 
 
+@traced
 def delete_question_to_concept_association_from_db(
     db: Session, question_id: int, concept_id: int
 ) -> bool:
@@ -356,6 +382,7 @@ def delete_question_to_concept_association_from_db(
     return False
 
 
+@traced
 def read_subtopics_for_concept_from_db(
     db: Session, concept_id: int
 ) -> List[SubtopicModel]:
@@ -382,6 +409,7 @@ def read_subtopics_for_concept_from_db(
     )
 
 
+@traced
 def read_questions_for_concept_from_db(
     db: Session, concept_id: int
 ) -> List[QuestionModel]:
@@ -12,6 +12,8 @@ Key dependencies:
 - backend.app.models.disciplines: For the DisciplineModel
 - backend.app.models.domains: For the DomainModel
 - backend.app.models.subjects: For the SubjectModel
+- backend.app.crud.crud_taxonomy_closure: For keeping the taxonomy closure table in sync
+- backend.app.services.taxonomy_service: For invalidating the cached taxonomy graph
 
 Main functions:
 - create_discipline_in_db: Creates a new discipline
@@ -41,6 +43,7 @@ from typing import Dict, List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from backend.app.crud.crud_taxonomy_closure import refresh_taxonomy_closure_in_db
 from backend.app.models.associations import (
     DisciplineToSubjectAssociation,
     DomainToDisciplineAssociation,
@@ -49,8 +52,11 @@ from backend.app.models.disciplines import DisciplineModel
 from backend.app.models.domains import DomainModel
 from backend.app.models.subjects import SubjectModel
 from backend.app.services.logging_service import logger
+from backend.app.services.taxonomy_service import taxonomy_cache
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_discipline_in_db(db: Session, discipline_data: Dict) -> DisciplineModel:
     """
     Create a new discipline in the database.
@@ -77,7 +83,10 @@ def create_discipline_in_db(db: Session, discipline_data: Dict) -> DisciplineMod
     """
     db_discipline = DisciplineModel(name=discipline_data["name"])
     db.add(db_discipline)
+    db.flush()
+    refresh_taxonomy_closure_in_db(db, "disciplines", [db_discipline.id])
     db.commit()
+    taxonomy_cache.bump_version()
     db.refresh(db_discipline)
 
     if "domain_ids" in discipline_data and discipline_data["domain_ids"]:
@@ -95,6 +104,7 @@ def create_discipline_in_db(db: Session, discipline_data: Dict) -> DisciplineMod
     return db_discipline
 
 
+@traced
 def read_discipline_from_db(
     db: Session, discipline_id: int
 ) -> Optional[DisciplineModel]:
@@ -117,6 +127,7 @@ def read_discipline_from_db(
     return db.query(DisciplineModel).filter(DisciplineModel.id == discipline_id).first()
 
 
+@traced
 def read_discipline_by_name_from_db(
     db: Session, name: str
 ) -> Optional[DisciplineModel]:
@@ -139,6 +150,7 @@ def read_discipline_by_name_from_db(
     return db.query(DisciplineModel).filter(DisciplineModel.name == name).first()
 
 
+@traced
 def read_disciplines_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[DisciplineModel]:
@@ -161,6 +173,7 @@ def read_disciplines_from_db(
     return db.query(DisciplineModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_discipline_in_db(
     db: Session, discipline_id: int, discipline_data: Dict
 ) -> Optional[DisciplineModel]:
@@ -189,11 +202,14 @@ def update_discipline_in_db(
     if db_discipline:
         for key, value in discipline_data.items():
             setattr(db_discipline, key, value)
+        refresh_taxonomy_closure_in_db(db, "disciplines", [discipline_id])
         db.commit()
+        taxonomy_cache.bump_version()
         db.refresh(db_discipline)
     return db_discipline
 
 
+@traced
 def delete_discipline_from_db(db: Session, discipline_id: int) -> bool:
     """
     Delete a discipline from the database.
@@ -217,11 +233,14 @@ def delete_discipline_from_db(db: Session, discipline_id: int) -> bool:
     db_discipline = read_discipline_from_db(db, discipline_id)
     if db_discipline:
         db.delete(db_discipline)
+        refresh_taxonomy_closure_in_db(db, "disciplines", [discipline_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_domain_to_discipline_association_in_db(
     db: Session, domain_id: int, discipline_id: int
 ) -> bool:
@@ -250,7 +269,9 @@ def create_domain_to_discipline_association_in_db(
     )
     db.add(association)
     try:
+        refresh_taxonomy_closure_in_db(db, "disciplines", [discipline_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     except SQLAlchemyError:
         logger.exception("Error creating domain-discipline association")
@@ -258,6 +279,7 @@ def create_domain_to_discipline_association_in_db(
         return False
 
 
+@traced
 def delete_domain_to_discipline_association_from_db(
     db: Session, domain_id: int, discipline_id: int
 ) -> bool:
@@ -288,11 +310,14 @@ def delete_domain_to_discipline_association_from_db(
     )
     if association:
         db.delete(association)
+        refresh_taxonomy_closure_in_db(db, "disciplines", [discipline_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_discipline_to_subject_association_in_db(
     db: Session, discipline_id: int, subject_id: int
 ) -> bool:
@@ -321,7 +346,9 @@ def create_discipline_to_subject_association_in_db(
     )
     db.add(association)
     try:
+        refresh_taxonomy_closure_in_db(db, "subjects", [subject_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     except SQLAlchemyError:
         logger.exception("Error creating discipline-subject association")
@@ -329,6 +356,7 @@ def create_discipline_to_subject_association_in_db(
         return False
 
 
+@traced
 def delete_discipline_to_subject_association_from_db(
     db: Session, discipline_id: int, subject_id: int
 ) -> bool:
@@ -359,11 +387,14 @@ def delete_discipline_to_subject_association_from_db(
     )
     if association:
         db.delete(association)
+        refresh_taxonomy_closure_in_db(db, "subjects", [subject_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def read_domains_for_discipline_from_db(
     db: Session, discipline_id: int
 ) -> List[DomainModel]:
@@ -390,6 +421,7 @@ def read_domains_for_discipline_from_db(
     )
 
 
+@traced
 def read_subjects_for_discipline_from_db(
     db: Session, discipline_id: int
 ) -> List[SubjectModel]:
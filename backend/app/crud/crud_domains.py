@@ -11,6 +11,8 @@ Key dependencies:
 - backend.app.models.associations: For DomainToDisciplineAssociation
 - backend.app.models.disciplines: For the DisciplineModel
 - backend.app.models.domains: For the DomainModel
+- backend.app.crud.crud_taxonomy_closure: For keeping the taxonomy closure table in sync
+- backend.app.services.taxonomy_service: For invalidating the cached taxonomy graph
 
 Main functions:
 - create_domain_in_db: Creates a new domain
@@ -37,12 +39,16 @@ from typing import Dict, List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from backend.app.crud.crud_taxonomy_closure import refresh_taxonomy_closure_in_db
 from backend.app.models.associations import DomainToDisciplineAssociation
 from backend.app.models.disciplines import DisciplineModel
 from backend.app.models.domains import DomainModel
 from backend.app.services.logging_service import logger
+from backend.app.services.taxonomy_service import taxonomy_cache
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_domain_in_db(db: Session, domain_data: Dict) -> DomainModel:
     """
     Create a new domain in the database.
@@ -68,7 +74,10 @@ def create_domain_in_db(db: Session, domain_data: Dict) -> DomainModel:
     """
     db_domain = DomainModel(name=domain_data["name"])
     db.add(db_domain)
+    db.flush()
+    refresh_taxonomy_closure_in_db(db, "domains", [db_domain.id])
     db.commit()
+    taxonomy_cache.bump_version()
     db.refresh(db_domain)
 
     if "discipline_ids" in domain_data and domain_data["discipline_ids"]:
@@ -80,6 +89,7 @@ def create_domain_in_db(db: Session, domain_data: Dict) -> DomainModel:
     return db_domain
 
 
+@traced
 def read_domain_from_db(db: Session, domain_id: int) -> Optional[DomainModel]:
     """
     Retrieve a single domain from the database by its ID.
@@ -100,6 +110,7 @@ def read_domain_from_db(db: Session, domain_id: int) -> Optional[DomainModel]:
     return db.query(DomainModel).filter(DomainModel.id == domain_id).first()
 
 
+@traced
 def read_domain_by_name_from_db(db: Session, name: str) -> Optional[DomainModel]:
     """
     Retrieve a single domain from the database by its name.
@@ -120,6 +131,7 @@ def read_domain_by_name_from_db(db: Session, name: str) -> Optional[DomainModel]
     return db.query(DomainModel).filter(DomainModel.name == name).first()
 
 
+@traced
 def read_domains_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[DomainModel]:
@@ -142,6 +154,7 @@ def read_domains_from_db(
     return db.query(DomainModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_domain_in_db(
     db: Session, domain_id: int, domain_data: Dict
 ) -> Optional[DomainModel]:
@@ -170,11 +183,14 @@ def update_domain_in_db(
     if db_domain:
         for key, value in domain_data.items():
             setattr(db_domain, key, value)
+        refresh_taxonomy_closure_in_db(db, "domains", [domain_id])
         db.commit()
+        taxonomy_cache.bump_version()
         db.refresh(db_domain)
     return db_domain
 
 
+@traced
 def delete_domain_from_db(db: Session, domain_id: int) -> bool:
     """
     Delete a domain from the database.
@@ -198,11 +214,14 @@ def delete_domain_from_db(db: Session, domain_id: int) -> bool:
     db_domain = read_domain_from_db(db, domain_id)
     if db_domain:
         db.delete(db_domain)
+        refresh_taxonomy_closure_in_db(db, "domains", [domain_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_domain_to_discipline_association_in_db(
     db: Session, domain_id: int, discipline_id: int
 ) -> bool:
@@ -231,7 +250,9 @@ def create_domain_to_discipline_association_in_db(
     )
     db.add(association)
     try:
+        refresh_taxonomy_closure_in_db(db, "disciplines", [discipline_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     except SQLAlchemyError as e:
         db.rollback()
@@ -239,6 +260,7 @@ def create_domain_to_discipline_association_in_db(
         return False
 
 
+@traced
 def delete_domain_to_discipline_association_from_db(
     db: Session, domain_id: int, discipline_id: int
 ) -> bool:
@@ -269,11 +291,14 @@ def delete_domain_to_discipline_association_from_db(
     )
     if association:
         db.delete(association)
+        refresh_taxonomy_closure_in_db(db, "disciplines", [discipline_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def read_disciplines_for_domain_from_db(
     db: Session, domain_id: int
 ) -> List[DisciplineModel]:
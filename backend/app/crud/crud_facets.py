@@ -0,0 +1,223 @@
+# filename: backend/app/crud/crud_facets.py
+
+"""
+This module computes facet counts for question browsing.
+
+For a set of /questions/filter filters it counts the matching questions per
+difficulty, subject, topic and tag, so a browsing UI can show every facet
+from one request. The counts are read from the question filter index: the
+filters are matched as bitmaps and the matches are counted per indexed
+value, so the only queries are the index's version check and one name
+lookup per facet for the values returned. When the session has
+uncommitted question writes, which the index does not hold, the matching
+question ids are expressed once as a CTE and each facet is a grouped
+aggregate over its association table joined to that CTE.
+
+Key dependencies:
+- sqlalchemy: For the name lookups and the grouped aggregate queries
+- backend.app.crud.crud_filters: For the filter clauses and the filtered id query
+- backend.app.models: For the question, taxonomy and tag models
+- backend.app.services.question_filter_index_service: For the bitmap counts
+
+Main functions:
+- read_question_facets_from_db: Counts the matching questions per facet value
+
+Usage example:
+    from backend.app.crud.crud_facets import read_question_facets_from_db
+
+    facets = read_question_facets_from_db(db, {"subject": "Mathematics"})
+    print(facets["total"], facets["topics"][:5])
+"""
+
+from typing import Dict, Hashable, List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import DifficultyLevel
+from backend.app.crud.crud_filters import (
+    build_filter_clauses,
+    build_filtered_question_ids_query,
+)
+from backend.app.models.associations import (
+    QuestionToSubjectAssociation,
+    QuestionToTagAssociation,
+    QuestionToTopicAssociation,
+)
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.models.questions import QuestionModel
+from backend.app.models.subjects import SubjectModel
+from backend.app.models.topics import TopicModel
+from backend.app.services.question_change_service import (
+    has_uncommitted_question_changes,
+)
+from backend.app.services.question_filter_index_service import question_filter_index
+from backend.app.services.tracing_service import traced
+
+DEFAULT_FACET_LIMIT = 50
+
+# Keeps IN lists well below the bind parameter limits of SQLite and others
+NAME_CHUNK_SIZE = 500
+
+# facet key -> (value model, name column, association question_id column,
+# association value column)
+FACET_SOURCES = {
+    "subjects": (
+        SubjectModel,
+        SubjectModel.name,
+        QuestionToSubjectAssociation.question_id,
+        QuestionToSubjectAssociation.subject_id,
+    ),
+    "topics": (
+        TopicModel,
+        TopicModel.name,
+        QuestionToTopicAssociation.question_id,
+        QuestionToTopicAssociation.topic_id,
+    ),
+    "question_tags": (
+        QuestionTagModel,
+        QuestionTagModel.tag,
+        QuestionToTagAssociation.question_id,
+        QuestionToTagAssociation.question_tag_id,
+    ),
+}
+
+
+def _empty_facets() -> Dict:
+    return {"total": 0, "difficulty": [], **{key: [] for key in FACET_SOURCES}}
+
+
+def _largest_counts(
+    db: Session, key: str, counts: Dict[Hashable, int], facet_limit: int
+) -> List[Dict]:
+    """Name the values with the largest counts and order them like the SQL facets."""
+    if not counts:
+        return []
+    model, name_column, _, _ = FACET_SOURCES[key]
+    ranked = sorted(counts.values(), reverse=True)
+    threshold = ranked[min(facet_limit, len(ranked)) - 1]
+    # Values tied with the last one kept are ordered by name, so name them too
+    candidates = sorted(
+        value_id for value_id, count in counts.items() if count >= threshold
+    )
+    names = {}
+    for start in range(0, len(candidates), NAME_CHUNK_SIZE):
+        names.update(
+            db.execute(
+                select(model.id, name_column).where(
+                    model.id.in_(candidates[start : start + NAME_CHUNK_SIZE])
+                )
+            ).all()
+        )
+    rows = sorted(
+        (
+            {"id": value_id, "name": names[value_id], "count": counts[value_id]}
+            for value_id in candidates
+            if value_id in names
+        ),
+        key=lambda row: (-row["count"], row["name"], row["id"]),
+    )
+    return rows[:facet_limit]
+
+
+def _read_question_facets_from_index(
+    db: Session, filters: Dict, facet_limit: int
+) -> Dict:
+    clauses = build_filter_clauses(db, filters)
+    if clauses is None:
+        return _empty_facets()
+    total, counts = question_filter_index.count_by_value(
+        db, clauses, ("difficulty",) + tuple(FACET_SOURCES)
+    )
+
+    facets = _empty_facets()
+    facets["total"] = total
+    if not total:
+        return facets
+    # Difficulties tie-break on their stored names, as the SQL facets do
+    facets["difficulty"] = [
+        {"difficulty": DifficultyLevel(value), "count": count}
+        for value, count in sorted(
+            counts["difficulty"].items(),
+            key=lambda item: (-item[1], DifficultyLevel(item[0]).name),
+        )
+    ]
+    for key in FACET_SOURCES:
+        facets[key] = _largest_counts(db, key, counts[key], facet_limit)
+    return facets
+
+
+def _read_question_facets_in_sql(db: Session, filters: Dict, facet_limit: int) -> Dict:
+    stmt = build_filtered_question_ids_query(db, filters)
+    if stmt is None:
+        return _empty_facets()
+    filtered = stmt.cte("filtered_questions")
+
+    facets = _empty_facets()
+    facets["total"] = db.scalar(select(func.count()).select_from(filtered))
+    if not facets["total"]:
+        return facets
+
+    question_count = func.count().label("question_count")
+    difficulty_rows = db.execute(
+        select(QuestionModel.difficulty, question_count)
+        .join(filtered, filtered.c.id == QuestionModel.id)
+        .group_by(QuestionModel.difficulty)
+        .order_by(question_count.desc(), QuestionModel.difficulty)
+    )
+    facets["difficulty"] = [
+        {"difficulty": difficulty, "count": count}
+        for difficulty, count in difficulty_rows
+    ]
+
+    for key, (model, name_column, question_column, value_column) in FACET_SOURCES.items():
+        rows = db.execute(
+            select(model.id, name_column, question_count)
+            .join(value_column.table, value_column == model.id)
+            .join(filtered, filtered.c.id == question_column)
+            .group_by(model.id, name_column)
+            .order_by(question_count.desc(), name_column, model.id)
+            .limit(facet_limit)
+        )
+        facets[key] = [
+            {"id": value_id, "name": name, "count": count}
+            for value_id, name, count in rows
+        ]
+    return facets
+
+
+@traced
+def read_question_facets_from_db(
+    db: Session, filters: Dict, facet_limit: int = DEFAULT_FACET_LIMIT
+) -> Dict:
+    """
+    Count the questions matching the filters per difficulty, subject, topic and tag.
+
+    Counts are taken within the filtered questions, so each facet shows how
+    many results would remain if that value were added to the filters. They
+    are read from the question filter index, or aggregated in SQL when the
+    session has uncommitted question writes.
+
+    Args:
+        db (Session): The database session.
+        filters (Dict): The filters, as accepted by read_filtered_questions_from_db.
+        facet_limit (int, optional): The maximum number of values returned per
+            facet, largest counts first. Defaults to DEFAULT_FACET_LIMIT.
+
+    Returns:
+        Dict: The keys "total" (the number of matching questions),
+            "difficulty" (a list of {"difficulty", "count"} dictionaries) and
+            "subjects", "topics" and "question_tags" (lists of {"id", "name",
+            "count"} dictionaries), each ordered by count descending, then name.
+
+    Raises:
+        SQLAlchemyError: If there's an issue with the database operation.
+
+    Usage example:
+        facets = read_question_facets_from_db(db, {"difficulty": DifficultyLevel.EASY})
+        for subject in facets["subjects"]:
+            print(subject["name"], subject["count"])
+    """
+    if has_uncommitted_question_changes(db):
+        return _read_question_facets_in_sql(db, filters, facet_limit)
+    return _read_question_facets_from_index(db, filters, facet_limit)
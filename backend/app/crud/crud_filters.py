@@ -4,16 +4,39 @@
 This module handles filtering operations for questions in the database.
 
 It provides a function for retrieving filtered questions based on various criteria
-such as subject, topic, subtopic, difficulty, and question tags.
+such as subject, topic, subtopic, difficulty, question tags, and any ancestor
+node in the taxonomy.
+
+Filtering runs in two phases. Subject, topic and subtopic names are first
+resolved to ids through the cached taxonomy graph and tags through their unique
+index. A name missing from the graph is looked up in the database once per
+graph snapshot, so repeating an unknown name costs no query. The resolved ids are
+then turned into clauses over the in-process question filter index, whose
+bitmaps yield a page of matching question ids without any join. Finally that
+page is hydrated with its related collections. The index holds committed data
+only, so a session with uncommitted question writes is answered in SQL.
+
+build_filtered_question_ids_query expresses the same filters in SQL, using an
+EXISTS subquery per association filter, for callers that need the matching
+ids inside a larger query (search, facets).
 
 Key dependencies:
 - sqlalchemy: For database querying and filtering
 - sqlalchemy.orm: For database session management and query options
 - backend.app.core.config: For DifficultyLevel enum
 - backend.app.models: For various model classes (QuestionModel, SubjectModel, etc.)
+- backend.app.crud.crud_taxonomy_closure: For the ancestor filter subquery
+- backend.app.services.taxonomy_service: For cached name -> id resolution
+- backend.app.services.question_filter_index_service: For the bitmap index
+- backend.app.services.question_change_service: For detecting uncommitted question writes
 
-Main function:
-- read_filtered_questions_from_db: Retrieves questions based on specified filters
+Main functions:
+- resolve_filter_ids_from_db: Resolves the name and tag filters to ids
+- build_filter_clauses: Turns the filters into question filter index clauses
+- build_filtered_question_ids_query: Builds the id query for a set of filters
+- read_filtered_question_ids_from_db: Retrieves one page of matching question ids
+- read_listed_questions_from_db: Loads questions with their listed collections
+- read_filtered_questions_from_db: Retrieves one page of matching questions
 
 Usage example:
     from sqlalchemy.orm import Session
@@ -23,18 +46,293 @@ Usage example:
         return read_filtered_questions_from_db(db, filters)
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Select, exists, func, select
+from sqlalchemy.orm import Session, selectinload
 
+from backend.app.core.config import DifficultyLevel
+from backend.app.crud.crud_taxonomy_closure import (
+    QUESTION_COLUMNS_BY_LEVEL,
+    question_ids_under_ancestor,
+    read_descendant_ids_from_db,
+)
+from backend.app.models.associations import (
+    QuestionToSubjectAssociation,
+    QuestionToSubtopicAssociation,
+    QuestionToTagAssociation,
+    QuestionToTopicAssociation,
+)
 from backend.app.models.question_tags import QuestionTagModel
 from backend.app.models.questions import QuestionModel
-from backend.app.models.subjects import SubjectModel
-from backend.app.models.subtopics import SubtopicModel
-from backend.app.models.topics import TopicModel
+from backend.app.services.question_change_service import (
+    has_uncommitted_question_changes,
+)
+from backend.app.services.question_filter_index_service import question_filter_index
+from backend.app.services.taxonomy_service import TAXONOMY_MODELS, taxonomy_cache
+from backend.app.services.tracing_service import traced
+
+# filter key -> (taxonomy level, question_id column, node id column)
+NAME_FILTERS = {
+    "subject": (
+        "subjects",
+        QuestionToSubjectAssociation.question_id,
+        QuestionToSubjectAssociation.subject_id,
+    ),
+    "topic": (
+        "topics",
+        QuestionToTopicAssociation.question_id,
+        QuestionToTopicAssociation.topic_id,
+    ),
+    "subtopic": (
+        "subtopics",
+        QuestionToSubtopicAssociation.question_id,
+        QuestionToSubtopicAssociation.subtopic_id,
+    ),
+}
+
+
+def _resolve_name(db: Session, level: str, name: str) -> Tuple[int, ...]:
+    graph = taxonomy_cache.get_graph(db)
+    ids = graph.find_ids(level, name)
+    if ids or graph.is_missing(level, name):
+        return ids
+    # Not in the snapshot: the node may have been created by another worker
+    # since it was built, so confirm with the database once per snapshot.
+    # A new node moves the taxonomy version, which replaces the snapshot
+    model = TAXONOMY_MODELS[level]
+    ids = tuple(
+        db.scalars(
+            select(model.id)
+            .where(func.lower(model.name) == name.lower())
+            .order_by(model.id)
+        )
+    )
+    if not ids:
+        graph.mark_missing(level, name)
+    return ids
+
+
+@traced
+def resolve_filter_ids_from_db(db: Session, filters: Dict) -> Optional[Dict]:
+    """
+    Resolve the name and tag filters of a filter dictionary to ids.
+
+    Args:
+        db (Session): The database session.
+        filters (Dict): The filters, as accepted by read_filtered_questions_from_db.
+
+    Returns:
+        Optional[Dict]: The ids per filter key for the filters that are set,
+            e.g. {"subject": (3,), "question_tags": [5, 9]}, or None when a
+            filter names something that does not exist, so nothing can match.
+
+    Usage example:
+        resolved = resolve_filter_ids_from_db(db, {"subject": "Mathematics"})
+    """
+    resolved = {}
+    for key, (level, _, _) in NAME_FILTERS.items():
+        if filters.get(key):
+            ids = _resolve_name(db, level, filters[key])
+            if not ids:
+                return None
+            resolved[key] = ids
+
+    if filters.get("question_tags"):
+        tag_ids = list(
+            db.scalars(
+                select(QuestionTagModel.id).where(
+                    QuestionTagModel.tag.in_(
+                        [tag.lower() for tag in filters["question_tags"]]
+                    )
+                )
+            )
+        )
+        if not tag_ids:
+            return None
+        resolved["question_tags"] = tag_ids
+    return resolved
+
+
+@traced
+def build_filtered_question_ids_query(db: Session, filters: Dict) -> Optional[Select]:
+    """
+    Build a query selecting the ids of the questions matching the filters.
+
+    Names and tags are resolved first, so the query only compares ids. The
+    query has no ordering or paging, so callers can add their own or use it
+    as an IN subquery.
+
+    Args:
+        db (Session): The database session.
+        filters (Dict): The filters, as accepted by read_filtered_questions_from_db.
+
+    Returns:
+        Optional[Select]: The query, or None when a filter names something that
+            does not exist, so nothing can match.
+
+    Usage example:
+        stmt = build_filtered_question_ids_query(db, {"difficulty": DifficultyLevel.EASY})
+        if stmt is not None:
+            question_ids = db.scalars(stmt.limit(10)).all()
+    """
+    resolved = resolve_filter_ids_from_db(db, filters)
+    if resolved is None:
+        return None
+
+    stmt = select(QuestionModel.id)
+    for key, (_, question_column, node_column) in NAME_FILTERS.items():
+        if key in resolved:
+            stmt = stmt.where(
+                exists().where(
+                    question_column == QuestionModel.id,
+                    node_column.in_(resolved[key]),
+                )
+            )
+    if "question_tags" in resolved:
+        stmt = stmt.where(
+            exists().where(
+                QuestionToTagAssociation.question_id == QuestionModel.id,
+                QuestionToTagAssociation.question_tag_id.in_(resolved["question_tags"]),
+            )
+        )
+    if filters.get("difficulty"):
+        stmt = stmt.where(QuestionModel.difficulty == filters["difficulty"])
+    if filters.get("ancestor_level") and filters.get("ancestor_id"):
+        stmt = stmt.where(
+            QuestionModel.id.in_(
+                question_ids_under_ancestor(
+                    filters["ancestor_level"], filters["ancestor_id"]
+                )
+            )
+        )
+    return stmt
+
+
+@traced
+def build_filter_clauses(db: Session, filters: Dict) -> Optional[List[List[Tuple]]]:
+    """
+    Translate filters into clauses for the question filter index.
+
+    Each filter becomes one clause listing the (dimension, value) keys that
+    satisfy it: every node with the given name, any of the given tags, or the
+    ancestor node and every node below it at the levels questions link to.
+
+    Args:
+        db (Session): The database session.
+        filters (Dict): The filters, as accepted by read_filtered_questions_from_db.
+
+    Returns:
+        Optional[List[List[Tuple]]]: The clauses, or None when a filter names
+            something that does not exist, so nothing can match.
+
+    Usage example:
+        clauses = build_filter_clauses(db, {"topic": "Algebra"})
+    """
+    resolved = resolve_filter_ids_from_db(db, filters)
+    if resolved is None:
+        return None
+
+    clauses = []
+    if filters.get("difficulty"):
+        clauses.append([("difficulty", DifficultyLevel(filters["difficulty"]).value)])
+    for key, (level, _, _) in NAME_FILTERS.items():
+        if key in resolved:
+            clauses.append([(level, node_id) for node_id in resolved[key]])
+    if "question_tags" in resolved:
+        clauses.append([("question_tags", tag_id) for tag_id in resolved["question_tags"]])
+    if filters.get("ancestor_level") and filters.get("ancestor_id"):
+        ancestor_level, ancestor_id = filters["ancestor_level"], filters["ancestor_id"]
+        descendants = read_descendant_ids_from_db(db, ancestor_level, ancestor_id)
+        clause = [
+            (level, node_id)
+            for level in QUESTION_COLUMNS_BY_LEVEL
+            for node_id in descendants.get(level, ())
+        ]
+        if ancestor_level in QUESTION_COLUMNS_BY_LEVEL:
+            clause.append((ancestor_level, ancestor_id))
+        clauses.append(clause)
+    return clauses
+
+
+@traced
+def read_filtered_question_ids_from_db(
+    db: Session, filters: Dict, skip: int = 0, limit: int = 100
+) -> List[int]:
+    """
+    Retrieve one page of the ids of the questions matching the filters.
+
+    The ids are read from the question filter index, which is first checked
+    against the database's "questions" version and brought up to date if it
+    is behind. When the session has uncommitted question writes, which the
+    index does not hold, the ids are queried in SQL instead. Ids are returned
+    in ascending order, so pages are stable and never overlap.
+
+    Args:
+        db (Session): The database session.
+        filters (Dict): The filters, as accepted by read_filtered_questions_from_db.
+        skip (int, optional): The number of ids to skip. Defaults to 0.
+        limit (int, optional): The maximum number of ids to return. Defaults to 100.
+
+    Returns:
+        List[int]: The matching question ids on the requested page.
+
+    Usage example:
+        question_ids = read_filtered_question_ids_from_db(db, {"topic": "Algebra"})
+    """
+    if has_uncommitted_question_changes(db):
+        stmt = build_filtered_question_ids_query(db, filters)
+        if stmt is None:
+            return []
+        return list(
+            db.scalars(stmt.order_by(QuestionModel.id).offset(skip).limit(limit))
+        )
+    clauses = build_filter_clauses(db, filters)
+    if clauses is None:
+        return []
+    return question_filter_index.select_page(db, clauses, skip, limit)
+
+
+@traced
+def read_listed_questions_from_db(
+    db: Session, question_ids: List[int]
+) -> List[QuestionModel]:
+    """
+    Load a page of questions with the collections QuestionSchema lists.
+
+    selectinload issues one query per collection instead of multiplying rows.
+
+    Args:
+        db (Session): The database session.
+        question_ids (List[int]): The IDs of the questions to load.
+
+    Returns:
+        List[QuestionModel]: The questions, in the order of question_ids.
+            IDs that do not exist are skipped.
+
+    Usage example:
+        questions = read_listed_questions_from_db(db, [3, 1, 2])
+    """
+    if not question_ids:
+        return []
+    questions = db.scalars(
+        select(QuestionModel)
+        .where(QuestionModel.id.in_(question_ids))
+        .options(
+            selectinload(QuestionModel.subjects),
+            selectinload(QuestionModel.topics),
+            selectinload(QuestionModel.subtopics),
+            selectinload(QuestionModel.concepts),
+            selectinload(QuestionModel.answer_choices),
+            selectinload(QuestionModel.question_tags),
+            selectinload(QuestionModel.question_sets),
+        )
+    ).all()
+    questions_by_id = {question.id: question for question in questions}
+    return [questions_by_id[qid] for qid in question_ids if qid in questions_by_id]
 
 
+@traced
 def read_filtered_questions_from_db(
     db: Session, filters: Dict, skip: int = 0, limit: int = 100
 ) -> List[QuestionModel]:
@@ -43,7 +341,9 @@ def read_filtered_questions_from_db(
 
     This function applies various filters to the questions in the database and returns
     a list of questions that match all the specified criteria. It supports filtering by
-    subject, topic, subtopic, difficulty level, and question tags.
+    subject, topic, subtopic, difficulty level, question tags, and taxonomy ancestor.
+    Questions are ordered by ID. A name matches every node with that name, and a
+    question matches the tag filter when it has at least one of the tags.
 
     Args:
         db (Session): The database session.
@@ -54,6 +354,8 @@ def read_filtered_questions_from_db(
             - "subtopic": str, the name of the subtopic (case-insensitive)
             - "difficulty": DifficultyLevel, the difficulty level of the questions
             - "question_tags": List[str], a list of tags to filter by (case-insensitive)
+            - "ancestor_level" and "ancestor_id": str and int, a taxonomy node; only
+              questions linked to it or to any node below it are returned
         skip (int, optional): The number of records to skip. Defaults to 0.
         limit (int, optional): The maximum number of records to return. Defaults to 100.
 
@@ -74,30 +376,5 @@ def read_filtered_questions_from_db(
         for question in filtered_questions:
             print(f"Question: {question.text}, Difficulty: {question.difficulty}")
     """
-    query = db.query(QuestionModel).options(
-        joinedload(QuestionModel.subjects),
-        joinedload(QuestionModel.topics),
-        joinedload(QuestionModel.subtopics),
-        joinedload(QuestionModel.question_tags),
-    )
-
-    if filters.get("subject"):
-        query = query.join(QuestionModel.subjects).filter(
-            func.lower(SubjectModel.name) == func.lower(filters["subject"])
-        )
-    if filters.get("topic"):
-        query = query.join(QuestionModel.topics).filter(
-            func.lower(TopicModel.name) == func.lower(filters["topic"])
-        )
-    if filters.get("subtopic"):
-        query = query.join(QuestionModel.subtopics).filter(
-            func.lower(SubtopicModel.name) == func.lower(filters["subtopic"])
-        )
-    if filters.get("difficulty"):
-        query = query.filter(QuestionModel.difficulty == filters["difficulty"])
-    if filters.get("question_tags"):
-        query = query.join(QuestionModel.question_tags).filter(
-            QuestionTagModel.tag.in_([tag.lower() for tag in filters["question_tags"]])
-        )
-
-    return query.offset(skip).limit(limit).all()
+    question_ids = read_filtered_question_ids_from_db(db, filters, skip, limit)
+    return read_listed_questions_from_db(db, question_ids)
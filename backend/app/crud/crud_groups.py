@@ -48,8 +48,10 @@ from backend.app.models.groups import GroupModel
 from backend.app.models.question_sets import QuestionSetModel
 from backend.app.models.users import UserModel
 from backend.app.services.logging_service import logger
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_group_in_db(db: Session, group_data: Dict) -> GroupModel:
     """
     Create a new group in the database.
@@ -87,6 +89,7 @@ def create_group_in_db(db: Session, group_data: Dict) -> GroupModel:
     return db_group
 
 
+@traced
 def read_group_from_db(db: Session, group_id: int) -> Optional[GroupModel]:
     """
     Retrieve a single group from the database by its ID.
@@ -107,6 +110,7 @@ def read_group_from_db(db: Session, group_id: int) -> Optional[GroupModel]:
     return db.query(GroupModel).filter(GroupModel.id == group_id).first()
 
 
+@traced
 def read_groups_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[GroupModel]:
@@ -129,6 +133,7 @@ def read_groups_from_db(
     return db.query(GroupModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_group_in_db(
     db: Session, group_id: int, group_data: Dict
 ) -> Optional[GroupModel]:
@@ -162,6 +167,7 @@ def update_group_in_db(
     return db_group
 
 
+@traced
 def delete_group_from_db(db: Session, group_id: int) -> bool:
     """
     Delete a group from the database.
@@ -190,6 +196,7 @@ def delete_group_from_db(db: Session, group_id: int) -> bool:
     return False
 
 
+@traced
 def create_user_to_group_association_in_db(
     db: Session, user_id: int, group_id: int
 ) -> bool:
@@ -224,6 +231,7 @@ def create_user_to_group_association_in_db(
         return False
 
 
+@traced
 def delete_user_to_group_association_from_db(
     db: Session, user_id: int, group_id: int
 ) -> bool:
@@ -259,6 +267,7 @@ def delete_user_to_group_association_from_db(
     return False
 
 
+@traced
 def create_question_set_to_group_association_in_db(
     db: Session, question_set_id: int, group_id: int
 ) -> bool:
@@ -295,6 +304,7 @@ def create_question_set_to_group_association_in_db(
         return False
 
 
+@traced
 def delete_question_set_to_group_association_from_db(
     db: Session, question_set_id: int, group_id: int
 ) -> bool:
@@ -330,6 +340,7 @@ def delete_question_set_to_group_association_from_db(
     return False
 
 
+@traced
 def read_users_for_group_from_db(db: Session, group_id: int) -> List[UserModel]:
     """
     Retrieve all users associated with a specific group from the database.
@@ -354,6 +365,7 @@ def read_users_for_group_from_db(db: Session, group_id: int) -> List[UserModel]:
     )
 
 
+@traced
 def read_question_sets_for_group_from_db(
     db: Session, group_id: int
 ) -> List[QuestionSetModel]:
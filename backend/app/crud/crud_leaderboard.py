@@ -46,8 +46,10 @@ from backend.app.crud.crud_time_period import (
 from backend.app.models.leaderboard import LeaderboardModel
 from backend.app.models.time_period import TimePeriodModel
 from backend.app.services.logging_service import logger
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_leaderboard_entry_in_db(
     db: Session, leaderboard_data: dict
 ) -> LeaderboardModel:
@@ -108,6 +110,7 @@ def create_leaderboard_entry_in_db(
         raise
 
 
+@traced
 def read_leaderboard_entry_from_db(
     db: Session, leaderboard_id: int
 ) -> Optional[LeaderboardModel]:
@@ -132,6 +135,7 @@ def read_leaderboard_entry_from_db(
     )
 
 
+@traced
 def read_leaderboard_entries_from_db(
     db: Session,
     time_period_id: int,
@@ -167,6 +171,7 @@ def read_leaderboard_entries_from_db(
     return query.order_by(LeaderboardModel.score.desc()).limit(limit).all()
 
 
+@traced
 def read_leaderboard_entries_for_user_from_db(
     db: Session, user_id: int
 ) -> List[LeaderboardModel]:
@@ -188,6 +193,7 @@ def read_leaderboard_entries_for_user_from_db(
     return db.query(LeaderboardModel).filter(LeaderboardModel.user_id == user_id).all()
 
 
+@traced
 def read_leaderboard_entries_for_group_from_db(
     db: Session, group_id: int
 ) -> List[LeaderboardModel]:
@@ -211,6 +217,7 @@ def read_leaderboard_entries_for_group_from_db(
     )
 
 
+@traced
 def update_leaderboard_entry_in_db(
     db: Session, entry_id: int, update_data: dict
 ) -> Optional[LeaderboardModel]:
@@ -251,6 +258,7 @@ def update_leaderboard_entry_in_db(
         raise
 
 
+@traced
 def delete_leaderboard_entry_from_db(db: Session, leaderboard_id: int) -> bool:
     """
     Delete a leaderboard entry from the database.
@@ -288,6 +296,7 @@ def delete_leaderboard_entry_from_db(db: Session, leaderboard_id: int) -> bool:
         raise
 
 
+@traced
 def read_or_create_time_period_in_db(
     db: Session, time_period_id: int
 ) -> TimePeriodModel:
@@ -22,6 +22,7 @@ Main functions:
 - create_role_to_permission_association_in_db: Associates a role with a permission
 - delete_role_to_permission_association_from_db: Removes a role-permission association
 - read_roles_for_permission_from_db: Retrieves roles for a permission
+- create_missing_permissions_in_db: Inserts the permissions that do not exist yet
 
 Usage example:
     from sqlalchemy.orm import Session
@@ -32,17 +33,20 @@ Usage example:
         return create_permission_in_db(db, permission_data)
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from backend.app.crud.crud_associations import insert_ignoring_conflicts
 from backend.app.models.associations import RoleToPermissionAssociation
 from backend.app.models.permissions import PermissionModel
 from backend.app.models.roles import RoleModel
 from backend.app.services.logging_service import logger
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_permission_in_db(db: Session, permission_data: Dict) -> PermissionModel:
     """
     Create a new permission in the database.
@@ -75,6 +79,7 @@ def create_permission_in_db(db: Session, permission_data: Dict) -> PermissionMod
     return db_permission
 
 
+@traced
 def read_permission_from_db(
     db: Session, permission_id: int
 ) -> Optional[PermissionModel]:
@@ -97,6 +102,7 @@ def read_permission_from_db(
     return db.query(PermissionModel).filter(PermissionModel.id == permission_id).first()
 
 
+@traced
 def read_permission_by_name_from_db(
     db: Session, name: str
 ) -> Optional[PermissionModel]:
@@ -119,6 +125,7 @@ def read_permission_by_name_from_db(
     return db.query(PermissionModel).filter(PermissionModel.name == name).first()
 
 
+@traced
 def read_permissions_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[PermissionModel]:
@@ -141,6 +148,7 @@ def read_permissions_from_db(
     return db.query(PermissionModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_permission_in_db(
     db: Session, permission_id: int, permission_data: Dict
 ) -> Optional[PermissionModel]:
@@ -174,6 +182,7 @@ def update_permission_in_db(
     return db_permission
 
 
+@traced
 def delete_permission_from_db(db: Session, permission_id: int) -> bool:
     """
     Delete a permission from the database.
@@ -202,6 +211,7 @@ def delete_permission_from_db(db: Session, permission_id: int) -> bool:
     return False
 
 
+@traced
 def create_role_to_permission_association_in_db(
     db: Session, role_id: int, permission_id: int
 ) -> bool:
@@ -247,6 +257,7 @@ def create_role_to_permission_association_in_db(
         return False
 
 
+@traced
 def delete_role_to_permission_association_from_db(
     db: Session, role_id: int, permission_id: int
 ) -> bool:
@@ -282,6 +293,7 @@ def delete_role_to_permission_association_from_db(
     return False
 
 
+@traced
 def read_roles_for_permission_from_db(
     db: Session, permission_id: int
 ) -> List[RoleModel]:
@@ -306,3 +318,29 @@ def read_roles_for_permission_from_db(
         .filter(RoleToPermissionAssociation.permission_id == permission_id)
         .all()
     )
+
+
+@traced
+def create_missing_permissions_in_db(db: Session, names: Iterable[str]) -> None:
+    """
+    Insert every permission name that is not in the database yet.
+
+    Uses one insert-or-ignore statement for all names, so no rows are read
+    first and concurrent callers cannot fail on each other's rows. Does not
+    commit.
+
+    Args:
+        db (Session): The database session.
+        names (Iterable[str]): The permission names that must exist.
+
+    Usage example:
+        create_missing_permissions_in_db(db, {"read_questions", "create_questions"})
+        db.commit()
+    """
+    rows = [{"name": name} for name in sorted(set(names))]
+    if not rows:
+        return
+    stmt, conflict_style = insert_ignoring_conflicts(db, PermissionModel)
+    if conflict_style == "on_conflict":
+        stmt = stmt.on_conflict_do_nothing()
+    db.execute(stmt, rows)
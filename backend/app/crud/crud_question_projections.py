@@ -0,0 +1,184 @@
+# filename: backend/app/crud/crud_question_projections.py
+
+"""
+This module builds question response data straight from column projections.
+
+Serializing ORM questions loads every related object in full, maps it into
+the session's identity map and then reads it back attribute by attribute.
+The functions here select only the columns DetailedQuestionSchema returns:
+one query for the questions themselves and one join per related collection,
+each reading just the related (id, name)-style columns listed in
+RELATED_ITEM_FIELDS. Rows become plain dictionaries that the response schema
+validates in pydantic-core without any ORM object being created.
+
+Key dependencies:
+- sqlalchemy: For the column projection queries
+- backend.app.models: For the question, association and related models
+- backend.app.schemas.questions: For the fields returned per related collection
+
+Main functions:
+- read_question_projections_from_db: Builds the response data for given question ids
+- read_question_projection_page_from_db: Builds the response data for a page of questions
+
+Usage example:
+    from backend.app.crud.crud_question_projections import (
+        read_question_projections_from_db,
+    )
+
+    questions = read_question_projections_from_db(db, [1, 2, 3])
+    print(questions[0]["subjects"])  # [{"id": 4, "name": "Algebra"}]
+"""
+
+from typing import Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.app.models.answer_choices import AnswerChoiceModel
+from backend.app.models.associations import (
+    QuestionSetToQuestionAssociation,
+    QuestionToAnswerAssociation,
+    QuestionToConceptAssociation,
+    QuestionToSubjectAssociation,
+    QuestionToSubtopicAssociation,
+    QuestionToTagAssociation,
+    QuestionToTopicAssociation,
+)
+from backend.app.models.concepts import ConceptModel
+from backend.app.models.question_sets import QuestionSetModel
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.models.questions import QuestionModel
+from backend.app.models.subjects import SubjectModel
+from backend.app.models.subtopics import SubtopicModel
+from backend.app.models.topics import TopicModel
+from backend.app.schemas.questions import RELATED_ITEM_FIELDS
+from backend.app.services.tracing_service import traced
+
+ANSWER_CHOICE_FIELDS = ("id", "text", "is_correct", "explanation")
+
+# response key -> (association question_id column, association value column,
+# related model, projected fields)
+PROJECTED_COLLECTIONS = {
+    "subjects": (
+        QuestionToSubjectAssociation.question_id,
+        QuestionToSubjectAssociation.subject_id,
+        SubjectModel,
+        RELATED_ITEM_FIELDS["subjects"],
+    ),
+    "topics": (
+        QuestionToTopicAssociation.question_id,
+        QuestionToTopicAssociation.topic_id,
+        TopicModel,
+        RELATED_ITEM_FIELDS["topics"],
+    ),
+    "subtopics": (
+        QuestionToSubtopicAssociation.question_id,
+        QuestionToSubtopicAssociation.subtopic_id,
+        SubtopicModel,
+        RELATED_ITEM_FIELDS["subtopics"],
+    ),
+    "concepts": (
+        QuestionToConceptAssociation.question_id,
+        QuestionToConceptAssociation.concept_id,
+        ConceptModel,
+        RELATED_ITEM_FIELDS["concepts"],
+    ),
+    "answer_choices": (
+        QuestionToAnswerAssociation.question_id,
+        QuestionToAnswerAssociation.answer_choice_id,
+        AnswerChoiceModel,
+        ANSWER_CHOICE_FIELDS,
+    ),
+    "question_tags": (
+        QuestionToTagAssociation.question_id,
+        QuestionToTagAssociation.question_tag_id,
+        QuestionTagModel,
+        RELATED_ITEM_FIELDS["question_tags"],
+    ),
+    "question_sets": (
+        QuestionSetToQuestionAssociation.question_id,
+        QuestionSetToQuestionAssociation.question_set_id,
+        QuestionSetModel,
+        RELATED_ITEM_FIELDS["question_sets"],
+    ),
+}
+
+
+@traced
+def read_question_projections_from_db(
+    db: Session, question_ids: List[int]
+) -> List[Dict]:
+    """
+    Build the DetailedQuestionSchema data of questions without loading ORM objects.
+
+    Issues one query for the questions and one per related collection, however
+    many questions are requested.
+
+    Args:
+        db (Session): The database session.
+        question_ids (List[int]): The IDs of the questions.
+
+    Returns:
+        List[Dict]: One dictionary per question, in the order of question_ids,
+            with the keys of DetailedQuestionSchema. Related items are ordered
+            by ID. IDs that do not exist are skipped.
+
+    Usage example:
+        data = read_question_projections_from_db(db, [3, 1])
+        DetailedQuestionSchema.model_validate(data[0])
+    """
+    if not question_ids:
+        return []
+    questions_by_id = {
+        question_id: {
+            "id": question_id,
+            "text": text,
+            "difficulty": difficulty,
+            **{key: [] for key in PROJECTED_COLLECTIONS},
+        }
+        for question_id, text, difficulty in db.execute(
+            select(QuestionModel.id, QuestionModel.text, QuestionModel.difficulty).where(
+                QuestionModel.id.in_(question_ids)
+            )
+        )
+    }
+    if not questions_by_id:
+        return []
+
+    for key, (question_column, value_column, model, fields) in (
+        PROJECTED_COLLECTIONS.items()
+    ):
+        rows = db.execute(
+            select(question_column, *(getattr(model, field) for field in fields))
+            .join(model, model.id == value_column)
+            .where(question_column.in_(list(questions_by_id)))
+            .order_by(question_column, model.id)
+        )
+        for question_id, *values in rows:
+            questions_by_id[question_id][key].append(dict(zip(fields, values)))
+
+    return [questions_by_id[qid] for qid in question_ids if qid in questions_by_id]
+
+
+@traced
+def read_question_projection_page_from_db(
+    db: Session, skip: int = 0, limit: int = 100
+) -> List[Dict]:
+    """
+    Build the DetailedQuestionSchema data of one page of questions, ordered by ID.
+
+    Args:
+        db (Session): The database session.
+        skip (int, optional): The number of questions to skip. Defaults to 0.
+        limit (int, optional): The maximum number of questions. Defaults to 100.
+
+    Returns:
+        List[Dict]: One dictionary per question on the page.
+
+    Usage example:
+        page = read_question_projection_page_from_db(db, skip=20, limit=20)
+    """
+    question_ids = db.scalars(
+        select(QuestionModel.id).order_by(QuestionModel.id).offset(skip).limit(limit)
+    ).all()
+    return read_question_projections_from_db(db, list(question_ids))
@@ -54,8 +54,10 @@ from backend.app.models.groups import GroupModel
 from backend.app.models.question_sets import QuestionSetModel
 from backend.app.models.questions import QuestionModel
 from backend.app.services.logging_service import logger
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def check_existing_question_set(
     db: Session, name: str, creator_id: int
 ) -> Optional[QuestionSetModel]:
@@ -84,6 +86,7 @@ def check_existing_question_set(
     )
 
 
+@traced
 def create_question_set_in_db(db: Session, question_set_data: Dict) -> QuestionSetModel:
     """
     Create a new question set in the database.
@@ -154,6 +157,7 @@ def create_question_set_in_db(db: Session, question_set_data: Dict) -> QuestionS
         raise
 
 
+@traced
 def add_questions_to_question_set(
     db: Session, question_set_id: int, question_ids: List[int]
 ):
@@ -180,6 +184,7 @@ def add_questions_to_question_set(
             raise ValueError(f"Question with id {question_id} does not exist")
 
 
+@traced
 def add_groups_to_question_set(db: Session, question_set_id: int, group_ids: List[int]):
     """
     Add groups to a question set.
@@ -203,6 +208,7 @@ def add_groups_to_question_set(db: Session, question_set_id: int, group_ids: Lis
             raise ValueError(f"Group with id {group_id} does not exist")
 
 
+@traced
 def read_question_set_from_db(
     db: Session, question_set_id: int
 ) -> Optional[QuestionSetModel]:
@@ -229,6 +235,7 @@ def read_question_set_from_db(
     )
 
 
+@traced
 def read_question_sets_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[QuestionSetModel]:
@@ -251,6 +258,7 @@ def read_question_sets_from_db(
     return db.query(QuestionSetModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_question_set_in_db(
     db: Session, question_set_id: int, question_set_data: Dict
 ) -> Optional[QuestionSetModel]:
@@ -315,6 +323,7 @@ def update_question_set_in_db(
         raise
 
 
+@traced
 def update_question_set_questions(
     db: Session, question_set_id: int, question_ids: List[int]
 ):
@@ -338,6 +347,7 @@ def update_question_set_questions(
     add_questions_to_question_set(db, question_set_id, question_ids)
 
 
+@traced
 def update_question_set_groups(db: Session, question_set_id: int, group_ids: List[int]):
     """
     Update the groups associated with a question set.
@@ -359,6 +369,7 @@ def update_question_set_groups(db: Session, question_set_id: int, group_ids: Lis
     add_groups_to_question_set(db, question_set_id, group_ids)
 
 
+@traced
 def delete_question_set_from_db(db: Session, question_set_id: int) -> bool:
     """
     Delete a question set from the database.
@@ -387,6 +398,7 @@ def delete_question_set_from_db(db: Session, question_set_id: int) -> bool:
     return False
 
 
+@traced
 def create_question_set_to_question_association_in_db(
     db: Session, question_set_id: int, question_id: int
 ) -> bool:
@@ -425,6 +437,7 @@ def create_question_set_to_question_association_in_db(
         return False
 
 
+@traced
 def delete_question_set_to_question_association_from_db(
     db: Session, question_set_id: int, question_id: int
 ) -> bool:
@@ -460,6 +473,7 @@ def delete_question_set_to_question_association_from_db(
     return False
 
 
+@traced
 def create_question_set_to_group_association_in_db(
     db: Session, question_set_id: int, group_id: int
 ) -> bool:
@@ -498,6 +512,7 @@ def create_question_set_to_group_association_in_db(
         return False
 
 
+@traced
 def delete_question_set_to_group_association_from_db(
     db: Session, question_set_id: int, group_id: int
 ) -> bool:
@@ -533,6 +548,7 @@ def delete_question_set_to_group_association_from_db(
     return False
 
 
+@traced
 def read_questions_for_question_set_from_db(
     db: Session, question_set_id: int
 ) -> List[QuestionModel]:
@@ -559,6 +575,7 @@ def read_questions_for_question_set_from_db(
     )
 
 
+@traced
 def read_groups_for_question_set_from_db(
     db: Session, question_set_id: int
 ) -> List[GroupModel]:
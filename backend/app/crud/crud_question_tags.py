@@ -43,8 +43,10 @@ from backend.app.models.associations import QuestionToTagAssociation
 from backend.app.models.question_tags import QuestionTagModel
 from backend.app.models.questions import QuestionModel
 from backend.app.services.logging_service import logger
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_question_tag_in_db(db: Session, question_tag_data: Dict) -> QuestionTagModel:
     """
     Create a new question tag in the database.
@@ -95,6 +97,7 @@ def create_question_tag_in_db(db: Session, question_tag_data: Dict) -> QuestionT
         raise e
 
 
+@traced
 def read_question_tag_from_db(
     db: Session, question_tag_id: int
 ) -> Optional[QuestionTagModel]:
@@ -121,6 +124,7 @@ def read_question_tag_from_db(
     )
 
 
+@traced
 def read_question_tag_by_tag_from_db(
     db: Session, tag: str
 ) -> Optional[QuestionTagModel]:
@@ -145,6 +149,7 @@ def read_question_tag_by_tag_from_db(
     )
 
 
+@traced
 def read_question_tags_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[QuestionTagModel]:
@@ -167,6 +172,7 @@ def read_question_tags_from_db(
     return db.query(QuestionTagModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_question_tag_in_db(
     db: Session, question_tag_id: int, question_tag_data: Dict
 ) -> Optional[QuestionTagModel]:
@@ -217,6 +223,7 @@ def update_question_tag_in_db(
         raise e
 
 
+@traced
 def delete_question_tag_from_db(db: Session, question_tag_id: int) -> bool:
     """
     Delete a question tag from the database.
@@ -245,6 +252,7 @@ def delete_question_tag_from_db(db: Session, question_tag_id: int) -> bool:
     return False
 
 
+@traced
 def create_question_to_tag_association_in_db(
     db: Session, question_id: int, tag_id: int
 ) -> bool:
@@ -285,6 +293,7 @@ def create_question_to_tag_association_in_db(
         raise e
 
 
+@traced
 def delete_question_to_tag_association_from_db(
     db: Session, question_id: int, tag_id: int
 ) -> bool:
@@ -320,6 +329,7 @@ def delete_question_to_tag_association_from_db(
     return False
 
 
+@traced
 def read_tags_for_question_from_db(
     db: Session, question_id: int
 ) -> List[QuestionTagModel]:
@@ -347,6 +357,7 @@ def read_tags_for_question_from_db(
     )
 
 
+@traced
 def read_questions_for_tag_from_db(db: Session, tag_id: int) -> List[QuestionModel]:
     """
     Retrieve all questions associated with a specific tag from the database.
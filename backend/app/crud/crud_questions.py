@@ -8,8 +8,12 @@ answer choices, tags, sets, subjects, topics, subtopics, and concepts.
 Key dependencies:
 - sqlalchemy.orm: For database session management and query options
 - backend.app.crud.crud_answer_choices: For answer choice related operations
+- backend.app.crud.crud_associations: For set-based association writes
 - backend.app.models: For various model classes (QuestionModel, AnswerChoiceModel, etc.)
 - backend.app.services.logging_service: For logging
+- backend.app.services.question_filter_index_service: For keeping the filter index current
+- backend.app.services.question_sampling_service: For keeping the sampling index current
+- backend.app.services.question_similarity_service: For keeping the near-duplicate index current
 
 Main functions:
 - create_question_in_db: Creates a new question
@@ -19,6 +23,8 @@ Main functions:
 - replace_question_in_db: Replaces an existing question
 - update_question_in_db: Updates an existing question
 - delete_question_from_db: Deletes a question
+- create_questions_in_db: Creates many questions in one transaction
+- update_questions_in_db: Updates many questions in one transaction
 
 Usage example:
     from sqlalchemy.orm import Session
@@ -29,15 +35,32 @@ Usage example:
         return create_question_in_db(db, question_data)
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from backend.app.crud.crud_answer_choices import (
-    create_answer_choice_in_db,
+    create_answer_choices_for_questions_in_db,
+    create_answer_choices_in_db,
     read_list_of_answer_choices_from_db,
 )
+from backend.app.crud.crud_associations import (
+    create_association_pairs_in_db,
+    create_associations_in_db,
+    delete_associations_from_db,
+)
 from backend.app.models.answer_choices import AnswerChoiceModel
+from backend.app.models.associations import (
+    QuestionSetToQuestionAssociation,
+    QuestionToAnswerAssociation,
+    QuestionToConceptAssociation,
+    QuestionToSubjectAssociation,
+    QuestionToSubtopicAssociation,
+    QuestionToTagAssociation,
+    QuestionToTopicAssociation,
+)
 from backend.app.models.concepts import ConceptModel
 from backend.app.models.question_sets import QuestionSetModel
 from backend.app.models.question_tags import QuestionTagModel
@@ -46,6 +69,12 @@ from backend.app.models.subjects import SubjectModel
 from backend.app.models.subtopics import SubtopicModel
 from backend.app.models.topics import TopicModel
 from backend.app.services.logging_service import logger
+from backend.app.services.question_filter_index_service import question_filter_index
+from backend.app.services.question_sampling_service import question_sampling_index
+from backend.app.services.question_similarity_service import (
+    question_similarity_index,
+)
+from backend.app.services.tracing_service import traced
 
 ASSOCIATED_FIELDS = [
     "answer_choices",
@@ -58,7 +87,38 @@ ASSOCIATED_FIELDS = [
     "concept_ids",
 ]
 
+QUESTION_ASSOCIATION_MODELS = {
+    "question_tag_ids": QuestionToTagAssociation,
+    "question_set_ids": QuestionSetToQuestionAssociation,
+    "subject_ids": QuestionToSubjectAssociation,
+    "topic_ids": QuestionToTopicAssociation,
+    "subtopic_ids": QuestionToSubtopicAssociation,
+    "concept_ids": QuestionToConceptAssociation,
+}
+
+# Models whose ids are resolved once per batch by the bulk CRUD functions
+BULK_PREFETCH_MODELS = {
+    "question_tag_ids": QuestionTagModel,
+    "question_set_ids": QuestionSetModel,
+    "subject_ids": SubjectModel,
+    "topic_ids": TopicModel,
+    "subtopic_ids": SubtopicModel,
+    "concept_ids": ConceptModel,
+    "answer_choice_ids": AnswerChoiceModel,
+}
+
+QUESTION_RELATIONSHIPS = [
+    "subjects",
+    "topics",
+    "subtopics",
+    "concepts",
+    "question_tags",
+    "question_sets",
+    "answer_choices",
+]
+
 
+@traced
 def associate_question_related_models(
     db: Session, db_question: QuestionModel, question_data: Dict
 ) -> None:
@@ -78,53 +138,27 @@ def associate_question_related_models(
             continue
 
         if key in ["answer_choices", "new_answer_choices"]:
-            for answer_choice_data in value:
-                if (
-                    "question_ids" not in answer_choice_data
-                    or answer_choice_data["question_ids"] is None
-                ):
-                    answer_choice_data["question_ids"] = [db_question.id]
-                else:
-                    answer_choice_data["question_ids"].append(db_question.id)
-                db_answer_choice = create_answer_choice_in_db(db, answer_choice_data)
-                db_question.answer_choices.append(db_answer_choice)
+            # Persist pending collection changes before writing rows directly
+            db.flush()
+            create_answer_choices_in_db(db, value, db_question.id)
+            db.expire(db_question, ["answer_choices"])
 
         elif key == "answer_choice_ids":
             existing_answer_choices = read_list_of_answer_choices_from_db(db, value)
             db_question.answer_choices = existing_answer_choices
 
-        elif key in [
-            "question_tag_ids",
-            "question_set_ids",
-            "subject_ids",
-            "topic_ids",
-            "subtopic_ids",
-            "concept_ids",
-        ]:
-            model_map = {
-                "question_tag_ids": QuestionTagModel,
-                "question_set_ids": QuestionSetModel,
-                "subject_ids": SubjectModel,
-                "topic_ids": TopicModel,
-                "subtopic_ids": SubtopicModel,
-                "concept_ids": ConceptModel,
-            }
-            related_items = (
-                db.query(model_map[key])
-                .filter(model_map[key].id.in_(value))
-                .all()
-            )
-            current_items = getattr(db_question, key.replace("_ids", "s"))
-            setattr(
-                db_question,
-                key.replace("_ids", "s"),
-                list(set(current_items + related_items)),
+        elif key in QUESTION_ASSOCIATION_MODELS:
+            # Set-based insert; existing rows are kept, unknown ids are skipped
+            create_associations_in_db(
+                db, QUESTION_ASSOCIATION_MODELS[key], [db_question.id], value
             )
+            db.expire(db_question, [key.replace("_ids", "s")])
 
         else:
             setattr(db_question, key, value)
 
 
+@traced
 def update_associations_to_question_related_models(
     db: Session, db_question: QuestionModel, question_data: Dict
 ) -> None:
@@ -154,35 +188,18 @@ def update_associations_to_question_related_models(
                 db_question.answer_choices = existing_answer_choices
             else:
                 db_question.answer_choices = []
-        elif key in [
-            "question_tag_ids",
-            "question_set_ids",
-            "subject_ids",
-            "topic_ids",
-            "subtopic_ids",
-            "concept_ids",
-        ]:
-            model_map = {
-                "question_tag_ids": QuestionTagModel,
-                "question_set_ids": QuestionSetModel,
-                "subject_ids": SubjectModel,
-                "topic_ids": TopicModel,
-                "subtopic_ids": SubtopicModel,
-                "concept_ids": ConceptModel,
-            }
-            attr_name = key.replace("_ids", "s")
-            current_items = getattr(db_question, attr_name)
+        elif key in QUESTION_ASSOCIATION_MODELS:
+            association_model = QUESTION_ASSOCIATION_MODELS[key]
             if value:
-                new_items = (
-                    db.query(model_map[key])
-                    .filter(model_map[key].id.in_(value))
-                    .all()
+                create_associations_in_db(
+                    db, association_model, [db_question.id], value
                 )
-                setattr(db_question, attr_name, list(set(current_items + new_items)))
             else:
-                setattr(db_question, attr_name, [])
+                delete_associations_from_db(db, association_model, [db_question.id])
+            db.expire(db_question, [key.replace("_ids", "s")])
 
 
+@traced
 def create_question_in_db(db: Session, question_data: Dict) -> QuestionModel:
     """Creates a new question in the database.
 
@@ -232,6 +249,9 @@ def create_question_in_db(db: Session, question_data: Dict) -> QuestionModel:
 
         db.commit()
         db.refresh(db_question)
+        question_filter_index.sync_question(db_question)
+        question_sampling_index.sync_question(db_question)
+        question_similarity_index.sync_question(db_question)
         return db_question
 
     except Exception:
@@ -240,6 +260,7 @@ def create_question_in_db(db: Session, question_data: Dict) -> QuestionModel:
         raise
 
 
+@traced
 def read_question_from_db(db: Session, question_id: int) -> Optional[QuestionModel]:
     """Retrieve a single question from the database by its ID.
 
@@ -259,6 +280,7 @@ def read_question_from_db(db: Session, question_id: int) -> Optional[QuestionMod
     return db.query(QuestionModel).filter(QuestionModel.id == question_id).first()
 
 
+@traced
 def read_questions_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[QuestionModel]:
@@ -280,6 +302,7 @@ def read_questions_from_db(
     return db.query(QuestionModel).offset(skip).limit(limit).all()
 
 
+@traced
 def read_full_question_from_db(
     db: Session, question_id: int
 ) -> Optional[QuestionModel]:
@@ -303,14 +326,14 @@ def read_full_question_from_db(
     return (
         db.query(QuestionModel)
         .options(
-            joinedload(QuestionModel.subjects),
-            joinedload(QuestionModel.topics),
-            joinedload(QuestionModel.subtopics),
-            joinedload(QuestionModel.concepts),
-            joinedload(QuestionModel.answer_choices),
-            joinedload(QuestionModel.question_tags),
-            joinedload(QuestionModel.question_sets),
-            joinedload(QuestionModel.user_responses),
+            selectinload(QuestionModel.subjects),
+            selectinload(QuestionModel.topics),
+            selectinload(QuestionModel.subtopics),
+            selectinload(QuestionModel.concepts),
+            selectinload(QuestionModel.answer_choices),
+            selectinload(QuestionModel.question_tags),
+            selectinload(QuestionModel.question_sets),
+            selectinload(QuestionModel.user_responses),
             joinedload(QuestionModel.creator),
         )
         .filter(QuestionModel.id == question_id)
@@ -318,6 +341,7 @@ def read_full_question_from_db(
     )
 
 
+@traced
 def replace_question_in_db(
     db: Session, question_id: int, replace_data: Dict
 ) -> Optional[QuestionModel]:
@@ -393,6 +417,9 @@ def replace_question_in_db(
         db.flush()
         db.commit()
         db.refresh(db_question)
+        question_filter_index.sync_question(db_question)
+        question_sampling_index.sync_question(db_question)
+        question_similarity_index.sync_question(db_question)
         return db_question
 
     except Exception:
@@ -401,6 +428,7 @@ def replace_question_in_db(
         raise
 
 
+@traced
 def update_question_in_db(
     db: Session, question_id: int, update_data: Dict
 ) -> Optional[QuestionModel]:
@@ -476,15 +504,16 @@ def update_question_in_db(
 
         # Handle new answer choices
         if new_answer_choices:
-            for answer_choice_data in new_answer_choices:
-                db_answer_choice = AnswerChoiceModel(**answer_choice_data)
-                db.add(db_answer_choice)
-                db_question.answer_choices.append(db_answer_choice)
+            create_answer_choices_in_db(db, new_answer_choices, db_question.id)
+            db.expire(db_question, ["answer_choices"])
 
         # Final flush and commit
         db.flush()
         db.commit()
         db.refresh(db_question)
+        question_filter_index.sync_question(db_question)
+        question_sampling_index.sync_question(db_question)
+        question_similarity_index.sync_question(db_question)
         return db_question
 
     except Exception:
@@ -493,6 +522,7 @@ def update_question_in_db(
         raise
 
 
+@traced
 def delete_question_from_db(db: Session, question_id: int) -> bool:
     """Delete a question from the database.
 
@@ -516,5 +546,409 @@ def delete_question_from_db(db: Session, question_id: int) -> bool:
     if db_question:
         db.delete(db_question)
         db.commit()
+        question_filter_index.remove_question(question_id)
+        question_sampling_index.remove_question(question_id)
+        question_similarity_index.remove_question(question_id)
         return True
     return False
+
+
+@traced
+def read_full_questions_from_db(
+    db: Session, question_ids: List[int]
+) -> List[QuestionModel]:
+    """Retrieve several questions by ID, including all related data.
+
+    Issues one query for the questions and one per collection; joining the
+    collections instead would multiply the rows by each of their sizes.
+
+    Args:
+        db (Session): The database session.
+        question_ids (List[int]): The IDs of the questions to retrieve.
+
+    Returns:
+        List[QuestionModel]: The retrieved questions, in the order of question_ids.
+                             IDs that do not exist are skipped.
+
+    Usage example:
+        questions = read_full_questions_from_db(db, [1, 2, 3])
+    """
+    if not question_ids:
+        return []
+    questions = (
+        db.query(QuestionModel)
+        .options(
+            selectinload(QuestionModel.subjects),
+            selectinload(QuestionModel.topics),
+            selectinload(QuestionModel.subtopics),
+            selectinload(QuestionModel.concepts),
+            selectinload(QuestionModel.answer_choices),
+            selectinload(QuestionModel.question_tags),
+            selectinload(QuestionModel.question_sets),
+            joinedload(QuestionModel.creator),
+        )
+        .filter(QuestionModel.id.in_(question_ids))
+        .all()
+    )
+    questions_by_id = {question.id: question for question in questions}
+    return [questions_by_id[qid] for qid in question_ids if qid in questions_by_id]
+
+
+def _prefetch_related_ids(db: Session, items: List[Dict]) -> Dict[str, set]:
+    """Resolve every related id referenced by a batch with one query per table."""
+    existing_ids = {}
+    for key, model in BULK_PREFETCH_MODELS.items():
+        requested = set()
+        for item in items:
+            requested.update(item.get(key) or [])
+        if requested:
+            existing_ids[key] = set(
+                db.scalars(select(model.id).where(model.id.in_(requested)))
+            )
+        else:
+            existing_ids[key] = set()
+    return existing_ids
+
+
+def _validate_bulk_question_fields(item: Dict, require_text: bool) -> Optional[str]:
+    """Return an error message for invalid scalar fields, or None if valid."""
+    text = item.get("text")
+    if (require_text or "text" in item) and (text is None or not str(text).strip()):
+        return "Question text cannot be None or empty"
+
+    difficulty = item.get("difficulty")
+    if difficulty is None:
+        return "Question difficulty is required" if require_text else None
+    if isinstance(difficulty, DifficultyLevel):
+        return None
+    if difficulty not in [level.value for level in DifficultyLevel]:
+        return (
+            f"'{difficulty}' is not among the defined enum values. Possible values: "
+            f"{', '.join([level.value for level in DifficultyLevel])}"
+        )
+    return None
+
+
+def _run_question_batch(
+    db: Session,
+    items: List[Tuple[int, Dict]],
+    errors: List[Dict],
+    apply_batch: Callable[[List[Dict]], List[QuestionModel]],
+    lenient: bool,
+) -> List[QuestionModel]:
+    """Apply a batch in one go, isolating failing items when lenient is set.
+
+    In strict mode the whole batch runs in the session transaction and any
+    error rolls everything back. In lenient mode the batch runs inside a
+    savepoint; if it fails, each item is retried in its own savepoint so only
+    the failing items are dropped and reported in errors.
+    """
+    if not items:
+        return []
+
+    if not lenient:
+        return apply_batch([item for _, item in items])
+
+    try:
+        with db.begin_nested():
+            return apply_batch([item for _, item in items])
+    except SQLAlchemyError:
+        logger.warning(
+            "Bulk question batch failed, retrying %s items individually", len(items)
+        )
+
+    results = []
+    for index, item in items:
+        try:
+            with db.begin_nested():
+                results.extend(apply_batch([item]))
+        except SQLAlchemyError as e:
+            logger.error("Bulk question item %s failed: %s", index, str(e))
+            errors.append({"index": index, "detail": str(getattr(e, "orig", None) or e)})
+    return results
+
+
+def _create_question_batch(
+    db: Session, items: List[Dict], existing_ids: Dict[str, set]
+) -> List[QuestionModel]:
+    db_questions = [
+        QuestionModel(
+            text=item["text"],
+            difficulty=DifficultyLevel(item["difficulty"]),
+            creator_id=item.get("creator_id"),
+        )
+        for item in items
+    ]
+    db.add_all(db_questions)
+    db.flush()
+
+    create_answer_choices_for_questions_in_db(
+        db,
+        [
+            (db_question.id, answer_choice_data)
+            for db_question, item in zip(db_questions, items)
+            for answer_choice_data in item.get("answer_choices") or []
+        ],
+    )
+    create_association_pairs_in_db(
+        db,
+        QuestionToAnswerAssociation,
+        [
+            (db_question.id, answer_choice_id)
+            for db_question, item in zip(db_questions, items)
+            for answer_choice_id in item.get("answer_choice_ids") or []
+            if answer_choice_id in existing_ids["answer_choice_ids"]
+        ],
+    )
+
+    for key, association_model in QUESTION_ASSOCIATION_MODELS.items():
+        create_association_pairs_in_db(
+            db,
+            association_model,
+            [
+                (db_question.id, related_id)
+                for db_question, item in zip(db_questions, items)
+                for related_id in item.get(key) or []
+                if related_id in existing_ids[key]
+            ],
+        )
+    return db_questions
+
+
+@traced
+def create_questions_in_db(
+    db: Session, questions_data: List[Dict], lenient: bool = False
+) -> Tuple[List[QuestionModel], List[Dict]]:
+    """Creates many questions in a single transaction.
+
+    All referenced tag/set/taxonomy/answer choice ids are resolved with one
+    query per table, questions and new answer choices are inserted in batches,
+    and association rows are written with one executemany per table. Unknown
+    related ids are skipped, as in create_question_in_db.
+
+    Args:
+        db (Session): The database session.
+        questions_data (List[Dict]): The question dictionaries, in the format
+            accepted by create_question_in_db.
+        lenient (bool): If True, invalid or failing items are reported in the
+            returned errors and the remaining items are still committed. If
+            False, any invalid item aborts the whole batch.
+
+    Returns:
+        Tuple[List[QuestionModel], List[Dict]]: The created questions with their
+        related data loaded, and a list of {"index", "detail"} errors for the
+        items that were not created.
+
+    Raises:
+        ValueError: In strict mode, if any item has invalid text or difficulty.
+        SQLAlchemyError: In strict mode, if there's an issue with the database operation.
+
+    Usage example:
+        created, errors = create_questions_in_db(
+            db,
+            [
+                {"text": "What is 2 + 2?", "difficulty": "Easy", "subject_ids": [1]},
+                {"text": "What is 3 + 3?", "difficulty": "Easy", "subject_ids": [1]},
+            ],
+            lenient=True,
+        )
+    """
+    errors = []
+    valid_items = []
+    for index, item in enumerate(questions_data):
+        error = _validate_bulk_question_fields(item, require_text=True)
+        if error is None:
+            valid_items.append((index, item))
+        elif lenient:
+            errors.append({"index": index, "detail": error})
+        else:
+            raise ValueError(f"Question at index {index}: {error}")
+
+    try:
+        existing_ids = _prefetch_related_ids(db, [item for _, item in valid_items])
+        created = _run_question_batch(
+            db,
+            valid_items,
+            errors,
+            lambda batch: _create_question_batch(db, batch, existing_ids),
+            lenient,
+        )
+        created_ids = [db_question.id for db_question in created]
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Error creating questions in bulk")
+        raise
+
+    errors.sort(key=lambda error: error["index"])
+    logger.debug(
+        "Bulk created %s questions with %s errors", len(created_ids), len(errors)
+    )
+    # One query reloads every committed question with its relationships
+    questions = read_full_questions_from_db(db, created_ids)
+    for question in questions:
+        question_filter_index.sync_question(question)
+        question_sampling_index.sync_question(question)
+        question_similarity_index.sync_question(question)
+    return questions, errors
+
+
+def _update_question_batch(
+    db: Session,
+    items: List[Dict],
+    existing_ids: Dict[str, set],
+    questions_by_id: Dict[int, QuestionModel],
+) -> List[QuestionModel]:
+    db_questions = []
+    for item in items:
+        db_question = questions_by_id[item["id"]]
+        for key, value in item.items():
+            if key in ASSOCIATED_FIELDS or key in ("id", "new_answer_choices"):
+                continue
+            if key == "difficulty" and value is not None:
+                value = DifficultyLevel(value)
+            if value is not None:
+                setattr(db_question, key, value)
+        db_questions.append(db_question)
+    db.flush()
+
+    for key, association_model in QUESTION_ASSOCIATION_MODELS.items():
+        # Same semantics as update_question_in_db: ids are added, [] clears
+        delete_associations_from_db(
+            db,
+            association_model,
+            [item["id"] for item in items if item.get(key) == []],
+        )
+        create_association_pairs_in_db(
+            db,
+            association_model,
+            [
+                (item["id"], related_id)
+                for item in items
+                for related_id in item.get(key) or []
+                if related_id in existing_ids[key]
+            ],
+        )
+
+    # answer_choice_ids replaces the question's answer choices
+    delete_associations_from_db(
+        db,
+        QuestionToAnswerAssociation,
+        [item["id"] for item in items if item.get("answer_choice_ids") is not None],
+    )
+    create_association_pairs_in_db(
+        db,
+        QuestionToAnswerAssociation,
+        [
+            (item["id"], answer_choice_id)
+            for item in items
+            for answer_choice_id in item.get("answer_choice_ids") or []
+            if answer_choice_id in existing_ids["answer_choice_ids"]
+        ],
+    )
+    create_answer_choices_for_questions_in_db(
+        db,
+        [
+            (item["id"], answer_choice_data)
+            for item in items
+            for answer_choice_data in item.get("new_answer_choices") or []
+        ],
+    )
+
+    for db_question in db_questions:
+        db.expire(db_question, QUESTION_RELATIONSHIPS)
+    return db_questions
+
+
+@traced
+def update_questions_in_db(
+    db: Session, updates: List[Dict], lenient: bool = False
+) -> Tuple[List[QuestionModel], List[Dict]]:
+    """Updates many questions in a single transaction.
+
+    Each update dictionary must contain the question "id" plus the fields
+    accepted by update_question_in_db. The questions are loaded with a single
+    query, related ids are resolved once per table, and association changes
+    are written with set-based statements.
+
+    Args:
+        db (Session): The database session.
+        updates (List[Dict]): The update dictionaries.
+        lenient (bool): If True, invalid or failing items are reported in the
+            returned errors and the remaining items are still committed. If
+            False, any invalid item aborts the whole batch.
+
+    Returns:
+        Tuple[List[QuestionModel], List[Dict]]: The updated questions with their
+        related data loaded, and a list of {"index", "detail"} errors for the
+        items that were not updated.
+
+    Raises:
+        ValueError: In strict mode, if any item is invalid or its question is missing.
+        SQLAlchemyError: In strict mode, if there's an issue with the database operation.
+
+    Usage example:
+        updated, errors = update_questions_in_db(
+            db,
+            [
+                {"id": 1, "difficulty": "Hard"},
+                {"id": 2, "question_tag_ids": [4, 5]},
+            ],
+        )
+    """
+    question_ids = [item.get("id") for item in updates if item.get("id") is not None]
+    questions_by_id = {
+        question.id: question
+        for question in db.query(QuestionModel)
+        .filter(QuestionModel.id.in_(question_ids))
+        .all()
+    }
+
+    errors = []
+    valid_items = []
+    seen_ids = set()
+    for index, item in enumerate(updates):
+        question_id = item.get("id")
+        if question_id not in questions_by_id:
+            error = f"Question with ID {question_id} not found"
+        elif question_id in seen_ids:
+            error = f"Question with ID {question_id} appears more than once"
+        else:
+            error = _validate_bulk_question_fields(item, require_text=False)
+
+        if error is None:
+            seen_ids.add(question_id)
+            valid_items.append((index, item))
+        elif lenient:
+            errors.append({"index": index, "detail": error})
+        else:
+            raise ValueError(f"Question at index {index}: {error}")
+
+    try:
+        existing_ids = _prefetch_related_ids(db, [item for _, item in valid_items])
+        updated = _run_question_batch(
+            db,
+            valid_items,
+            errors,
+            lambda batch: _update_question_batch(
+                db, batch, existing_ids, questions_by_id
+            ),
+            lenient,
+        )
+        updated_ids = [db_question.id for db_question in updated]
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Error updating questions in bulk")
+        raise
+
+    errors.sort(key=lambda error: error["index"])
+    logger.debug(
+        "Bulk updated %s questions with %s errors", len(updated_ids), len(errors)
+    )
+    questions = read_full_questions_from_db(db, updated_ids)
+    for question in questions:
+        question_filter_index.sync_question(question)
+        question_sampling_index.sync_question(question)
+        question_similarity_index.sync_question(question)
+    return questions, errors
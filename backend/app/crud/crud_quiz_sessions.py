@@ -0,0 +1,354 @@
+# filename: backend/app/crud/crud_quiz_sessions.py
+
+"""
+This module handles CRUD operations for quiz sessions in the database.
+
+A quiz session is a reproducible draw of questions for one user. When a
+session only filters by difficulty, subject and topic, the seeded,
+difficulty-stratified sample is drawn from the in-process question sampling
+index; otherwise only (id, difficulty) pairs of the matching questions are
+selected and sampled. Should the index turn out to hold a question that no
+longer exists, or the session have uncommitted question writes, the draw is
+taken from the database instead, so a session never comes up short. The
+resulting order is persisted in quiz_session_questions. Pages are then
+served by position from that stored order and hydrated with a single query,
+so no request ever loads the whole question bank into memory.
+
+Key dependencies:
+- sqlalchemy: For database queries and bulk inserts
+- backend.app.models.quiz_sessions: For QuizSessionModel and QuizSessionQuestionModel
+- backend.app.services.randomization_service: For the seeded stratified sampling
+- backend.app.services.question_sampling_service: For the cached id index
+- backend.app.crud.crud_questions: For association models and question hydration
+- backend.app.core.config: For DifficultyLevel enum
+
+Main functions:
+- read_candidate_question_ids_from_db: Selects matching question ids by difficulty
+- create_quiz_session_in_db: Draws and persists the questions of a new session
+- read_quiz_session_from_db: Retrieves a single quiz session
+- read_quiz_session_questions_from_db: Retrieves one page of a session's questions
+- delete_quiz_session_from_db: Deletes a quiz session
+
+Usage example:
+    from backend.app.crud.crud_quiz_sessions import create_quiz_session_in_db
+
+    quiz_session = create_quiz_session_in_db(
+        db, {"user_id": 1, "question_count": 20, "question_set_id": 3}
+    )
+"""
+
+import random
+import secrets
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import DifficultyLevel
+from backend.app.crud.crud_associations import get_association_columns
+from backend.app.crud.crud_questions import (
+    QUESTION_ASSOCIATION_MODELS,
+    read_full_questions_from_db,
+)
+from backend.app.models.question_sets import QuestionSetModel
+from backend.app.models.questions import QuestionModel
+from backend.app.models.quiz_sessions import QuizSessionModel, QuizSessionQuestionModel
+from backend.app.schemas.quiz_sessions import MAX_QUIZ_SESSION_SEED
+from backend.app.services.logging_service import logger
+from backend.app.services.question_change_service import (
+    has_uncommitted_question_changes,
+)
+from backend.app.services.question_sampling_service import question_sampling_index
+from backend.app.services.randomization_service import (
+    allocate_stratified_counts,
+    stratified_sample,
+)
+from backend.app.services.tracing_service import traced
+
+QUIZ_SESSION_FILTER_KEYS = [
+    "subject_ids",
+    "topic_ids",
+    "subtopic_ids",
+    "concept_ids",
+    "question_tag_ids",
+]
+
+
+@traced
+def read_candidate_question_ids_from_db(
+    db: Session, filters: Dict
+) -> Dict[str, List[int]]:
+    """
+    Select the ids of the questions matching a quiz session's filters.
+
+    Only the id and difficulty columns are read. Each id filter is applied as
+    an IN (subquery) on its association table, so a question matches when it is
+    linked to at least one of the given ids for every filter that is set.
+
+    Args:
+        db (Session): The database session.
+        filters (Dict): The filters. Possible keys: question_set_id, subject_ids,
+            topic_ids, subtopic_ids, concept_ids, question_tag_ids and difficulties.
+
+    Returns:
+        Dict[str, List[int]]: The matching question ids, ascending, per difficulty value.
+
+    Usage example:
+        ids_by_difficulty = read_candidate_question_ids_from_db(
+            db, {"topic_ids": [4], "difficulties": ["Easy", "Medium"]}
+        )
+    """
+    stmt = select(QuestionModel.id, QuestionModel.difficulty)
+
+    id_filters = {key: filters.get(key) for key in QUIZ_SESSION_FILTER_KEYS}
+    if filters.get("question_set_id") is not None:
+        id_filters["question_set_ids"] = [filters["question_set_id"]]
+
+    for key, target_ids in id_filters.items():
+        if not target_ids:
+            continue
+        source_column, target_column = get_association_columns(
+            QUESTION_ASSOCIATION_MODELS[key]
+        )
+        stmt = stmt.where(
+            QuestionModel.id.in_(
+                select(source_column).where(target_column.in_(target_ids))
+            )
+        )
+
+    if filters.get("difficulties"):
+        difficulties = [DifficultyLevel(value) for value in filters["difficulties"]]
+        stmt = stmt.where(QuestionModel.difficulty.in_(difficulties))
+
+    ids_by_difficulty: Dict[str, List[int]] = {}
+    for question_id, difficulty in db.execute(stmt.order_by(QuestionModel.id)):
+        ids_by_difficulty.setdefault(difficulty.value, []).append(question_id)
+    return ids_by_difficulty
+
+
+def _can_use_sampling_index(db: Session, filters: Dict) -> bool:
+    # The index only knows each question's committed difficulty, subjects and topics
+    return (
+        filters.get("question_set_id") is None
+        and not any(
+            filters.get(key)
+            for key in ("subtopic_ids", "concept_ids", "question_tag_ids")
+        )
+        and not has_uncommitted_question_changes(db)
+    )
+
+
+def _draw_from_db(db: Session, filters: Dict, seed: int) -> List[int]:
+    ids_by_difficulty = read_candidate_question_ids_from_db(db, filters)
+    if not filters.get("stratify_by_difficulty", True):
+        ids_by_difficulty = {
+            "all": sorted(
+                question_id
+                for question_ids in ids_by_difficulty.values()
+                for question_id in question_ids
+            )
+        }
+    return stratified_sample(ids_by_difficulty, filters["question_count"], seed)
+
+
+def _draw_from_sampling_index(db: Session, filters: Dict, seed: int) -> List[int]:
+    question_sampling_index.ensure_current(db)
+    rng = random.Random(seed)
+    constraints = {
+        "subject_ids": filters.get("subject_ids"),
+        "topic_ids": filters.get("topic_ids"),
+    }
+    difficulties = filters.get("difficulties") or list(DifficultyLevel)
+
+    if filters.get("stratify_by_difficulty", True):
+        stratum_sizes = {
+            DifficultyLevel(difficulty).value: question_sampling_index.count(
+                difficulties=[difficulty], **constraints
+            )
+            for difficulty in difficulties
+        }
+        allocation = allocate_stratified_counts(
+            stratum_sizes, filters["question_count"]
+        )
+        question_ids = []
+        for difficulty in sorted(allocation):
+            question_ids.extend(
+                question_sampling_index.sample(
+                    allocation[difficulty],
+                    difficulties=[difficulty],
+                    seed=rng,
+                    **constraints,
+                )
+            )
+        rng.shuffle(question_ids)
+    else:
+        question_ids = question_sampling_index.sample(
+            filters["question_count"], difficulties=difficulties, seed=rng, **constraints
+        )
+
+    # The index is per process; a question it still holds may be gone already
+    existing_count = db.scalar(
+        select(func.count())
+        .select_from(QuestionModel)
+        .where(QuestionModel.id.in_(question_ids))
+    )
+    if existing_count < len(question_ids):
+        logger.warning("Question sampling index is stale, drawing from the database")
+        question_sampling_index.invalidate()
+        return _draw_from_db(db, filters, seed)
+    return question_ids
+
+
+@traced
+def create_quiz_session_in_db(db: Session, quiz_session_data: Dict) -> QuizSessionModel:
+    """
+    Create a quiz session by drawing questions and persisting their order.
+
+    The draw is deterministic: the same filters, question bank and seed always
+    yield the same ordered questions. When stratify_by_difficulty is set (the
+    default) the difficulty mix of the draw follows that of the matching pool.
+    If fewer questions match than requested, all of them are used.
+
+    Args:
+        db (Session): The database session.
+        quiz_session_data (Dict): A dictionary containing user_id, question_count,
+            and optionally seed, question_set_id, the id filters, difficulties
+            and stratify_by_difficulty.
+
+    Returns:
+        QuizSessionModel: The created quiz session.
+
+    Raises:
+        ValueError: If the question set does not exist or no question matches.
+        SQLAlchemyError: If there's an issue with the database operation.
+
+    Usage example:
+        quiz_session = create_quiz_session_in_db(
+            db, {"user_id": 1, "question_count": 10, "seed": 7, "topic_ids": [2]}
+        )
+    """
+    question_set_id = quiz_session_data.get("question_set_id")
+    if question_set_id is not None and db.get(QuestionSetModel, question_set_id) is None:
+        raise ValueError(f"Question set with ID {question_set_id} not found")
+
+    seed = quiz_session_data.get("seed")
+    if seed is None:
+        seed = secrets.randbelow(MAX_QUIZ_SESSION_SEED + 1)
+
+    if _can_use_sampling_index(db, quiz_session_data):
+        question_ids = _draw_from_sampling_index(db, quiz_session_data, seed)
+    else:
+        question_ids = _draw_from_db(db, quiz_session_data, seed)
+    if not question_ids:
+        raise ValueError("No questions match the quiz session filters")
+
+    db_quiz_session = QuizSessionModel(
+        user_id=quiz_session_data["user_id"],
+        question_set_id=question_set_id,
+        seed=seed,
+        question_count=len(question_ids),
+    )
+    db.add(db_quiz_session)
+    db.flush()
+    db.execute(
+        insert(QuizSessionQuestionModel),
+        [
+            {
+                "quiz_session_id": db_quiz_session.id,
+                "position": position,
+                "question_id": question_id,
+            }
+            for position, question_id in enumerate(question_ids)
+        ],
+    )
+    db.commit()
+    db.refresh(db_quiz_session)
+    logger.debug(
+        "Created quiz session %s with %s questions (seed %s)",
+        db_quiz_session.id,
+        len(question_ids),
+        seed,
+    )
+    return db_quiz_session
+
+
+@traced
+def read_quiz_session_from_db(
+    db: Session, quiz_session_id: int
+) -> Optional[QuizSessionModel]:
+    """
+    Retrieve a quiz session by its ID.
+
+    Args:
+        db (Session): The database session.
+        quiz_session_id (int): The ID of the quiz session to retrieve.
+
+    Returns:
+        Optional[QuizSessionModel]: The quiz session if found, None otherwise.
+
+    Usage example:
+        quiz_session = read_quiz_session_from_db(db, 1)
+    """
+    return db.get(QuizSessionModel, quiz_session_id)
+
+
+@traced
+def read_quiz_session_questions_from_db(
+    db: Session, quiz_session_id: int, skip: int = 0, limit: int = 10
+) -> Tuple[List[QuestionModel], int]:
+    """
+    Retrieve one page of a quiz session's questions in their stored order.
+
+    Questions deleted since the session was created are no longer part of it,
+    so the total reflects the questions that can still be delivered.
+
+    Args:
+        db (Session): The database session.
+        quiz_session_id (int): The ID of the quiz session.
+        skip (int): The number of questions to skip.
+        limit (int): The maximum number of questions to return.
+
+    Returns:
+        Tuple[List[QuestionModel], int]: The questions on the page, fully loaded,
+            and the total number of questions in the session.
+
+    Usage example:
+        questions, total = read_quiz_session_questions_from_db(db, 1, skip=10, limit=10)
+    """
+    session_filter = QuizSessionQuestionModel.quiz_session_id == quiz_session_id
+    total = db.scalar(
+        select(func.count()).select_from(QuizSessionQuestionModel).where(session_filter)
+    )
+    question_ids = list(
+        db.scalars(
+            select(QuizSessionQuestionModel.question_id)
+            .where(session_filter)
+            .order_by(QuizSessionQuestionModel.position)
+            .offset(skip)
+            .limit(limit)
+        )
+    )
+    return read_full_questions_from_db(db, question_ids), total
+
+
+@traced
+def delete_quiz_session_from_db(db: Session, quiz_session_id: int) -> bool:
+    """
+    Delete a quiz session and its stored question order.
+
+    Args:
+        db (Session): The database session.
+        quiz_session_id (int): The ID of the quiz session to delete.
+
+    Returns:
+        bool: True if the quiz session was deleted, False if it was not found.
+
+    Usage example:
+        deleted = delete_quiz_session_from_db(db, 1)
+    """
+    db_quiz_session = read_quiz_session_from_db(db, quiz_session_id)
+    if db_quiz_session:
+        db.delete(db_quiz_session)
+        db.commit()
+        return True
+    return False
@@ -46,8 +46,10 @@ from backend.app.models.permissions import PermissionModel
 from backend.app.models.roles import RoleModel
 from backend.app.models.users import UserModel
 from backend.app.services.logging_service import logger
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_role_in_db(db: Session, role_data: Dict) -> RoleModel:
     """
     Create a new role in the database.
@@ -109,6 +111,7 @@ def create_role_in_db(db: Session, role_data: Dict) -> RoleModel:
     return db_role
 
 
+@traced
 def read_role_from_db(db: Session, role_id: int) -> Optional[RoleModel]:
     """
     Retrieve a single role from the database by its ID.
@@ -129,6 +132,7 @@ def read_role_from_db(db: Session, role_id: int) -> Optional[RoleModel]:
     return db.query(RoleModel).filter(RoleModel.id == role_id).first()
 
 
+@traced
 def read_role_by_name_from_db(db: Session, name: str) -> Optional[RoleModel]:
     """
     Retrieve a single role from the database by its name.
@@ -149,6 +153,7 @@ def read_role_by_name_from_db(db: Session, name: str) -> Optional[RoleModel]:
     return db.query(RoleModel).filter(RoleModel.name == name).first()
 
 
+@traced
 def read_roles_from_db(db: Session, skip: int = 0, limit: int = 100) -> List[RoleModel]:
     """
     Retrieve a list of roles from the database with pagination.
@@ -169,6 +174,7 @@ def read_roles_from_db(db: Session, skip: int = 0, limit: int = 100) -> List[Rol
     return db.query(RoleModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_role_in_db(
     db: Session, role_id: int, role_data: Dict
 ) -> Optional[RoleModel]:
@@ -241,6 +247,7 @@ def update_role_in_db(
     return db_role
 
 
+@traced
 def delete_role_from_db(db: Session, role_id: int) -> bool:
     """
     Delete a role from the database.
@@ -283,6 +290,7 @@ def delete_role_from_db(db: Session, role_id: int) -> bool:
 
 
 
+@traced
 def create_role_to_permission_association_in_db(
     db: Session, role_id: int, permission_id: int
 ) -> bool:
@@ -319,6 +327,7 @@ def create_role_to_permission_association_in_db(
         return False
 
 
+@traced
 def delete_role_to_permission_association_from_db(
     db: Session, role_id: int, permission_id: int
 ) -> bool:
@@ -354,6 +363,7 @@ def delete_role_to_permission_association_from_db(
     return False
 
 
+@traced
 def read_permissions_for_role_from_db(
     db: Session, role_id: int
 ) -> List[PermissionModel]:
@@ -380,6 +390,7 @@ def read_permissions_for_role_from_db(
     )
 
 
+@traced
 def read_users_for_role_from_db(db: Session, role_id: int) -> List[UserModel]:
     """
     Retrieve all users associated with a specific role from the database.
@@ -399,6 +410,7 @@ def read_users_for_role_from_db(db: Session, role_id: int) -> List[UserModel]:
     return db.query(UserModel).filter(UserModel.role_id == role_id).all()
 
 
+@traced
 def read_default_role_from_db(db: Session) -> Optional[RoleModel]:
     """
     Retrieve the default role from the database.
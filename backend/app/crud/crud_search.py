@@ -0,0 +1,296 @@
+# filename: backend/app/crud/crud_search.py
+
+"""
+This module handles full-text search over questions and their answer choices.
+
+On SQLite, searches run against the question_search FTS5 index: matches are
+ranked with bm25 (question text weighted above answer text) and highlighted
+by FTS5 itself. On MariaDB/MySQL they use MATCH ... AGAINST on the FULLTEXT
+indexes and are highlighted in Python. In both cases only one page of ids is
+selected before the questions are loaded, and the /questions/filter filters
+can narrow the search.
+
+Highlighted text is HTML: matches are first delimited with private-use
+sentinel characters, the text is HTML-escaped, and only then are the
+sentinels replaced by <mark> tags, so question text can never inject markup.
+
+Key dependencies:
+- sqlalchemy: For the search queries
+- backend.app.models.question_search: For the FTS5 table handle
+- backend.app.crud.crud_filters: For the filters and question loading
+
+Main functions:
+- build_search_terms: Splits a user query into search terms
+- search_questions_in_db: Searches questions and returns ranked, highlighted results
+- rebuild_question_search_index_in_db: Repopulates the SQLite index
+
+Usage example:
+    from backend.app.crud.crud_search import search_questions_in_db
+
+    results = search_questions_in_db(db, "photosynthesis light", {"subject": "Biology"})
+    for result in results:
+        print(result["score"], result["highlighted_text"])
+"""
+
+import html
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, exists, func, literal_column, or_, select, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from backend.app.crud.crud_filters import (
+    build_filtered_question_ids_query,
+    read_listed_questions_from_db,
+)
+from backend.app.models.answer_choices import AnswerChoiceModel
+from backend.app.models.associations import QuestionToAnswerAssociation
+from backend.app.models.question_search import (
+    QUESTION_SEARCH_TABLE,
+    SQLITE_SEARCH_BACKFILL_SQL,
+    question_search_table,
+)
+from backend.app.models.questions import QuestionModel
+from backend.app.services.tracing_service import traced
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+# Delimit matches until the text has been escaped; never valid in question text
+_MATCH_START = "\ue000"
+_MATCH_END = "\ue001"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_TOKENS = 16
+MAX_SEARCH_TERMS = 16
+
+# bm25 weights for the question_text and answer_text columns
+QUESTION_TEXT_WEIGHT = 2.0
+ANSWER_TEXT_WEIGHT = 1.0
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def build_search_terms(query: str) -> List[str]:
+    """
+    Split a user query into lowercase search terms.
+
+    Punctuation and operators are dropped, so user input can never change the
+    meaning of the full-text query.
+
+    Args:
+        query (str): The query as typed by the user.
+
+    Returns:
+        List[str]: Up to MAX_SEARCH_TERMS terms, in query order.
+
+    Raises:
+        ValueError: If the query contains no words.
+
+    Usage example:
+        build_search_terms("Newton's 2nd law?")  # ["newton", "s", "2nd", "law"]
+    """
+    terms = [term.lower() for term in _WORD_PATTERN.findall(query)]
+    if not terms:
+        raise ValueError("Search query must contain at least one word")
+    return terms[:MAX_SEARCH_TERMS]
+
+
+def _fts5_query(terms: List[str]) -> str:
+    # Every term must match; the last one also matches as a prefix, so results
+    # keep up with a query that is still being typed
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _escape_and_mark(value: Optional[str]) -> Optional[str]:
+    # Turns sentinel-delimited matches into HTML with the rest of the text escaped
+    if value is None:
+        return value
+    return (
+        html.escape(value)
+        .replace(_MATCH_START, HIGHLIGHT_START)
+        .replace(_MATCH_END, HIGHLIGHT_END)
+    )
+
+
+def highlight_terms(value: Optional[str], terms: List[str]) -> Optional[str]:
+    """
+    HTML-escape value and wrap every word that starts with one of the terms in highlight tags.
+    """
+    if not value:
+        return value
+    value = value.replace(_MATCH_START, "").replace(_MATCH_END, "")
+    pattern = re.compile(
+        r"\b(" + "|".join(re.escape(term) for term in terms) + r")\w*",
+        re.IGNORECASE,
+    )
+    return _escape_and_mark(
+        pattern.sub(lambda m: f"{_MATCH_START}{m.group(0)}{_MATCH_END}", value)
+    )
+
+
+def _search_sqlite(db, terms, filter_stmt, skip, limit) -> List[Dict]:
+    search_ref = literal_column(QUESTION_SEARCH_TABLE)
+    rank = func.bm25(search_ref, QUESTION_TEXT_WEIGHT, ANSWER_TEXT_WEIGHT)
+    stmt = select(
+        question_search_table.c.rowid,
+        rank.label("rank"),
+        func.highlight(search_ref, 0, _MATCH_START, _MATCH_END),
+        func.snippet(
+            search_ref, 1, _MATCH_START, _MATCH_END, SNIPPET_ELLIPSIS, SNIPPET_TOKENS
+        ),
+    ).where(search_ref.op("MATCH")(_fts5_query(terms)))
+    if filter_stmt is not None:
+        stmt = stmt.where(question_search_table.c.rowid.in_(filter_stmt))
+    stmt = stmt.order_by(rank, question_search_table.c.rowid).offset(skip).limit(limit)
+
+    return [
+        {
+            "question_id": question_id,
+            # bm25 is negative, lower is better; expose higher-is-better scores
+            "score": -rank_value,
+            "highlighted_text": _escape_and_mark(highlighted),
+            "answer_snippet": (
+                _escape_and_mark(snippet) if _MATCH_START in (snippet or "") else None
+            ),
+        }
+        for question_id, rank_value, highlighted, snippet in db.execute(stmt)
+    ]
+
+
+def _search_mysql(db, terms, filter_stmt, skip, limit) -> List[Dict]:
+    against = " ".join(terms)
+    question_score = match(QuestionModel.text, against=against).in_natural_language_mode()
+    answer_match = match(
+        AnswerChoiceModel.text, AnswerChoiceModel.explanation, against=against
+    ).in_natural_language_mode()
+    answer_score = (
+        select(func.max(answer_match))
+        .join(
+            QuestionToAnswerAssociation,
+            QuestionToAnswerAssociation.answer_choice_id == AnswerChoiceModel.id,
+        )
+        .where(QuestionToAnswerAssociation.question_id == QuestionModel.id)
+        .scalar_subquery()
+    )
+    score = QUESTION_TEXT_WEIGHT * question_score + ANSWER_TEXT_WEIGHT * func.coalesce(
+        answer_score, 0
+    )
+    stmt = select(QuestionModel.id, score.label("score")).where(
+        or_(
+            question_score > 0,
+            exists().where(
+                and_(
+                    QuestionToAnswerAssociation.question_id == QuestionModel.id,
+                    QuestionToAnswerAssociation.answer_choice_id == AnswerChoiceModel.id,
+                    answer_match > 0,
+                )
+            ),
+        )
+    )
+    if filter_stmt is not None:
+        stmt = stmt.where(QuestionModel.id.in_(filter_stmt))
+    stmt = stmt.order_by(score.desc(), QuestionModel.id).offset(skip).limit(limit)
+
+    return [
+        {"question_id": question_id, "score": float(score_value)}
+        for question_id, score_value in db.execute(stmt)
+    ]
+
+
+@traced
+def search_questions_in_db(
+    db: Session,
+    query: str,
+    filters: Optional[Dict] = None,
+    skip: int = 0,
+    limit: int = 20,
+) -> List[Dict]:
+    """
+    Search question and answer choice text, best matches first.
+
+    Args:
+        db (Session): The database session.
+        query (str): The words to search for. On SQLite all of them must match
+            and the last one also matches as a prefix; MariaDB/MySQL rank by
+            natural language relevance instead.
+        filters (Optional[Dict]): Filters as accepted by read_filtered_questions_from_db.
+        skip (int, optional): The number of results to skip. Defaults to 0.
+        limit (int, optional): The maximum number of results. Defaults to 20.
+
+    Returns:
+        List[Dict]: One dictionary per result with the keys "question"
+            (QuestionModel), "score" (float, higher is better),
+            "highlighted_text" (the HTML-escaped question text with matches
+            wrapped in <mark> tags) and "answer_snippet" (an HTML-escaped
+            excerpt of the matching answer text, or None if only the question
+            text matched).
+
+    Raises:
+        ValueError: If the query contains no words.
+        NotImplementedError: If the database has no full-text search support.
+
+    Usage example:
+        results = search_questions_in_db(
+            db, "quadratic formula", {"difficulty": DifficultyLevel.EASY}, limit=10
+        )
+    """
+    terms = build_search_terms(query)
+
+    filter_stmt = None
+    if filters and any(filters.values()):
+        filter_stmt = build_filtered_question_ids_query(db, filters)
+        if filter_stmt is None:
+            return []
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        hits = _search_sqlite(db, terms, filter_stmt, skip, limit)
+    elif dialect in ("mysql", "mariadb"):
+        hits = _search_mysql(db, terms, filter_stmt, skip, limit)
+    else:
+        raise NotImplementedError(f"Full-text search is not supported on {dialect}")
+
+    questions = read_listed_questions_from_db(db, [hit["question_id"] for hit in hits])
+    questions_by_id = {question.id: question for question in questions}
+
+    results = []
+    for hit in hits:
+        question = questions_by_id.get(hit["question_id"])
+        if question is None:
+            continue
+        if "highlighted_text" not in hit:
+            hit["highlighted_text"] = highlight_terms(question.text, terms)
+            hit["answer_snippet"] = None
+            for answer_choice in question.answer_choices:
+                highlighted = highlight_terms(answer_choice.text, terms)
+                if HIGHLIGHT_START in highlighted:
+                    hit["answer_snippet"] = highlighted
+                    break
+        del hit["question_id"]
+        results.append({"question": question, **hit})
+    return results
+
+
+@traced
+def rebuild_question_search_index_in_db(db: Session) -> None:
+    """
+    Repopulate the SQLite search index from the questions and answer choices.
+
+    The triggers keep the index current, so this is only needed after loading
+    data with the triggers absent. FULLTEXT indexes on MariaDB/MySQL are
+    maintained by the server, so nothing is done there. Nothing is committed.
+
+    Args:
+        db (Session): The database session.
+
+    Usage example:
+        rebuild_question_search_index_in_db(db)
+        db.commit()
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        return
+    db.flush()
+    for statement in SQLITE_SEARCH_BACKFILL_SQL:
+        db.execute(text(statement))
@@ -0,0 +1,132 @@
+# filename: backend/app/crud/crud_similarity.py
+
+"""
+This module finds near-duplicate questions.
+
+Lookups go through the process-wide MinHash/LSH index in
+question_similarity_service, so only questions that share an LSH bucket with
+the query are compared; the question bank is never scanned pairwise. Matching
+questions are then loaded in one round of queries.
+
+Key dependencies:
+- backend.app.services.question_similarity_service: For the signature index
+- backend.app.crud.crud_filters: For loading the matched questions
+
+Main functions:
+- read_similar_questions_from_db: Lists the questions similar to a question
+- build_duplicate_report: Flags the near-duplicates in a batch of new questions
+
+Usage example:
+    from backend.app.crud.crud_similarity import read_similar_questions_from_db
+
+    for question, similarity in read_similar_questions_from_db(db, 42) or []:
+        print(question.id, similarity)
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.app.crud.crud_filters import read_listed_questions_from_db
+from backend.app.models.questions import QuestionModel
+from backend.app.services.question_similarity_service import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    DUPLICATE_SIMILARITY_THRESHOLD,
+    QuestionSimilarityIndex,
+    minhash_signature,
+    question_similarity_index,
+)
+from backend.app.services.tracing_service import traced
+
+
+@traced
+def read_similar_questions_from_db(
+    db: Session,
+    question_id: int,
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    limit: int = 10,
+) -> Optional[List[Tuple[QuestionModel, float]]]:
+    """
+    Retrieve the questions whose text is similar to a question's text.
+
+    Args:
+        db (Session): The database session.
+        question_id (int): The ID of the question.
+        threshold (float, optional): The minimum estimated Jaccard similarity
+            of the two texts' word bigrams. Defaults to DEFAULT_SIMILARITY_THRESHOLD.
+        limit (int, optional): The maximum number of questions. Defaults to 10.
+
+    Returns:
+        Optional[List[Tuple[QuestionModel, float]]]: (question, similarity)
+            pairs, most similar first, or None if the question does not exist.
+
+    Usage example:
+        similar = read_similar_questions_from_db(db, 42, threshold=0.8)
+    """
+    question = db.get(QuestionModel, question_id)
+    if question is None:
+        return None
+
+    question_similarity_index.ensure_current(db)
+    matches = question_similarity_index.find_similar(
+        question.text, threshold, limit, exclude_ids=[question_id]
+    )
+    similarity_by_id = dict(matches)
+    questions = read_listed_questions_from_db(db, [match_id for match_id, _ in matches])
+    return [(match, similarity_by_id[match.id]) for match in questions]
+
+
+@traced
+def build_duplicate_report(
+    db: Session,
+    texts: Sequence[Optional[str]],
+    threshold: float = DUPLICATE_SIMILARITY_THRESHOLD,
+) -> List[Dict]:
+    """
+    Flag the texts of a batch of new questions that look like duplicates.
+
+    Each text is compared with the existing questions and with the texts
+    before it in the batch.
+
+    Args:
+        db (Session): The database session.
+        texts (Sequence[Optional[str]]): The question texts, in upload order.
+        threshold (float, optional): The minimum estimated similarity to flag.
+            Defaults to DUPLICATE_SIMILARITY_THRESHOLD.
+
+    Returns:
+        List[Dict]: One entry per flagged text with the keys "index" (its
+            position in texts), "existing" (a list of {"question_id",
+            "similarity"} dictionaries) and "in_upload" (a list of {"index",
+            "similarity"} dictionaries for earlier texts in the batch).
+
+    Usage example:
+        report = build_duplicate_report(db, [item["text"] for item in items])
+    """
+    question_similarity_index.ensure_current(db)
+    batch_index = QuestionSimilarityIndex()
+    batch_index.load([])
+
+    report = []
+    for position, text in enumerate(texts):
+        signature = minhash_signature(text)
+        existing = question_similarity_index.find_similar_to_signature(
+            signature, threshold
+        )
+        in_upload = batch_index.find_similar_to_signature(signature, threshold)
+        if existing or in_upload:
+            report.append(
+                {
+                    "index": position,
+                    "existing": [
+                        {"question_id": question_id, "similarity": similarity}
+                        for question_id, similarity in existing
+                    ],
+                    "in_upload": [
+                        {"index": index, "similarity": similarity}
+                        for index, similarity in sorted(in_upload)
+                    ],
+                }
+            )
+        batch_index.add_question(position, text)
+    return report
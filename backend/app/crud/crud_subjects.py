@@ -13,6 +13,8 @@ Key dependencies:
 - fastapi: For raising HTTPExceptions
 - backend.app.models: For various model classes (SubjectModel, DisciplineModel, etc.)
 - backend.app.services.logging_service: For logging
+- backend.app.crud.crud_taxonomy_closure: For keeping the taxonomy closure table in sync
+- backend.app.services.taxonomy_service: For invalidating the cached taxonomy graph
 
 Main functions:
 - create_subject_in_db: Creates a new subject
@@ -39,6 +41,7 @@ from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from backend.app.crud.crud_taxonomy_closure import refresh_taxonomy_closure_in_db
 from backend.app.models.associations import (
     DisciplineToSubjectAssociation,
     QuestionToSubjectAssociation,
@@ -49,8 +52,11 @@ from backend.app.models.questions import QuestionModel
 from backend.app.models.subjects import SubjectModel
 from backend.app.models.topics import TopicModel
 from backend.app.services.logging_service import logger
+from backend.app.services.taxonomy_service import taxonomy_cache
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_subject_in_db(db: Session, subject_data: Dict) -> SubjectModel:
     """
     Create a new subject in the database.
@@ -92,7 +98,10 @@ def create_subject_in_db(db: Session, subject_data: Dict) -> SubjectModel:
 
     db_subject = SubjectModel(name=subject_data["name"])
     db.add(db_subject)
+    db.flush()
+    refresh_taxonomy_closure_in_db(db, "subjects", [db_subject.id])
     db.commit()
+    taxonomy_cache.bump_version()
     db.refresh(db_subject)
 
     if "discipline_ids" in subject_data and subject_data["discipline_ids"]:
@@ -112,6 +121,7 @@ def create_subject_in_db(db: Session, subject_data: Dict) -> SubjectModel:
     return db_subject
 
 
+@traced
 def read_subject_from_db(db: Session, subject_id: int) -> Optional[SubjectModel]:
     """
     Retrieve a single subject from the database by its ID.
@@ -132,6 +142,7 @@ def read_subject_from_db(db: Session, subject_id: int) -> Optional[SubjectModel]
     return db.query(SubjectModel).filter(SubjectModel.id == subject_id).first()
 
 
+@traced
 def read_subject_by_name_from_db(db: Session, name: str) -> Optional[SubjectModel]:
     """
     Retrieve a single subject from the database by its name.
@@ -152,6 +163,7 @@ def read_subject_by_name_from_db(db: Session, name: str) -> Optional[SubjectMode
     return db.query(SubjectModel).filter(SubjectModel.name == name).first()
 
 
+@traced
 def read_subjects_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[SubjectModel]:
@@ -174,6 +186,7 @@ def read_subjects_from_db(
     return db.query(SubjectModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_subject_in_db(
     db: Session, subject_id: int, subject_data: Dict
 ) -> Optional[SubjectModel]:
@@ -235,7 +248,9 @@ def update_subject_in_db(
                 )
 
         try:
+            refresh_taxonomy_closure_in_db(db, "subjects", [subject_id])
             db.commit()
+            taxonomy_cache.bump_version()
         except IntegrityError as e:
             db.rollback()
             logger.exception(
@@ -259,6 +274,7 @@ def update_subject_in_db(
     return db_subject
 
 
+@traced
 def delete_subject_from_db(db: Session, subject_id: int) -> bool:
     """
     Delete a subject from the database.
@@ -282,11 +298,14 @@ def delete_subject_from_db(db: Session, subject_id: int) -> bool:
     db_subject = read_subject_from_db(db, subject_id)
     if db_subject:
         db.delete(db_subject)
+        refresh_taxonomy_closure_in_db(db, "subjects", [subject_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_discipline_to_subject_association_in_db(
     db: Session, discipline_id: int, subject_id: int
 ) -> bool:
@@ -315,7 +334,9 @@ def create_discipline_to_subject_association_in_db(
     )
     db.add(association)
     try:
+        refresh_taxonomy_closure_in_db(db, "subjects", [subject_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     except SQLAlchemyError as e:
         logger.exception("Error creating discipline-subject association: %s", str(e))
@@ -323,6 +344,7 @@ def create_discipline_to_subject_association_in_db(
         return False
 
 
+@traced
 def delete_discipline_to_subject_association_from_db(
     db: Session, discipline_id: int, subject_id: int
 ) -> bool:
@@ -353,11 +375,14 @@ def delete_discipline_to_subject_association_from_db(
     )
     if association:
         db.delete(association)
+        refresh_taxonomy_closure_in_db(db, "subjects", [subject_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_subject_to_topic_association_in_db(
     db: Session, subject_id: int, topic_id: int
 ) -> bool:
@@ -384,7 +409,9 @@ def create_subject_to_topic_association_in_db(
     association = SubjectToTopicAssociation(subject_id=subject_id, topic_id=topic_id)
     db.add(association)
     try:
+        refresh_taxonomy_closure_in_db(db, "topics", [topic_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     except SQLAlchemyError as e:
         logger.exception("Error creating subject-topic association: %s", str(e))
@@ -392,6 +419,7 @@ def create_subject_to_topic_association_in_db(
         return False
 
 
+@traced
 def delete_subject_to_topic_association_from_db(
     db: Session, subject_id: int, topic_id: int
 ) -> bool:
@@ -422,11 +450,14 @@ def delete_subject_to_topic_association_from_db(
     )
     if association:
         db.delete(association)
+        refresh_taxonomy_closure_in_db(db, "topics", [topic_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_question_to_subject_association_in_db(
     db: Session, question_id: int, subject_id: int
 ) -> bool:
@@ -463,6 +494,7 @@ def create_question_to_subject_association_in_db(
         return False
 
 
+@traced
 def delete_question_to_subject_association_from_db(
     db: Session, question_id: int, subject_id: int
 ) -> bool:
@@ -498,6 +530,7 @@ def delete_question_to_subject_association_from_db(
     return False
 
 
+@traced
 def read_disciplines_for_subject_from_db(
     db: Session, subject_id: int
 ) -> List[DisciplineModel]:
@@ -524,6 +557,7 @@ def read_disciplines_for_subject_from_db(
     )
 
 
+@traced
 def read_topics_for_subject_from_db(db: Session, subject_id: int) -> List[TopicModel]:
     """
     Retrieve all topics associated with a specific subject from the database.
@@ -548,6 +582,7 @@ def read_topics_for_subject_from_db(db: Session, subject_id: int) -> List[TopicM
     )
 
 
+@traced
 def read_questions_for_subject_from_db(
     db: Session, subject_id: int
 ) -> List[QuestionModel]:
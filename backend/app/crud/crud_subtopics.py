@@ -10,6 +10,8 @@ topics, concepts, and questions.
 Key dependencies:
 - sqlalchemy.orm: For database session management
 - backend.app.models: For various model classes (SubtopicModel, TopicModel, etc.)
+- backend.app.crud.crud_taxonomy_closure: For keeping the taxonomy closure table in sync
+- backend.app.services.taxonomy_service: For invalidating the cached taxonomy graph
 
 Main functions:
 - create_subtopic_in_db: Creates a new subtopic
@@ -35,6 +37,7 @@ from typing import Dict, List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from backend.app.crud.crud_taxonomy_closure import refresh_taxonomy_closure_in_db
 from backend.app.models.associations import (
     QuestionToSubtopicAssociation,
     SubtopicToConceptAssociation,
@@ -45,8 +48,11 @@ from backend.app.models.questions import QuestionModel
 from backend.app.models.subtopics import SubtopicModel
 from backend.app.models.topics import TopicModel
 from backend.app.services.logging_service import logger
+from backend.app.services.taxonomy_service import taxonomy_cache
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_subtopic_in_db(db: Session, subtopic_data: Dict) -> SubtopicModel:
     """
     Create a new subtopic in the database.
@@ -74,7 +80,10 @@ def create_subtopic_in_db(db: Session, subtopic_data: Dict) -> SubtopicModel:
     """
     db_subtopic = SubtopicModel(name=subtopic_data["name"])
     db.add(db_subtopic)
+    db.flush()
+    refresh_taxonomy_closure_in_db(db, "subtopics", [db_subtopic.id])
     db.commit()
+    taxonomy_cache.bump_version()
     db.refresh(db_subtopic)
 
     if "topic_ids" in subtopic_data and subtopic_data["topic_ids"]:
@@ -94,6 +103,7 @@ def create_subtopic_in_db(db: Session, subtopic_data: Dict) -> SubtopicModel:
     return db_subtopic
 
 
+@traced
 def read_subtopic_from_db(db: Session, subtopic_id: int) -> Optional[SubtopicModel]:
     """
     Retrieve a single subtopic from the database by its ID.
@@ -114,6 +124,7 @@ def read_subtopic_from_db(db: Session, subtopic_id: int) -> Optional[SubtopicMod
     return db.query(SubtopicModel).filter(SubtopicModel.id == subtopic_id).first()
 
 
+@traced
 def read_subtopic_by_name_from_db(db: Session, name: str) -> Optional[SubtopicModel]:
     """
     Retrieve a single subtopic from the database by its name.
@@ -134,6 +145,7 @@ def read_subtopic_by_name_from_db(db: Session, name: str) -> Optional[SubtopicMo
     return db.query(SubtopicModel).filter(SubtopicModel.name == name).first()
 
 
+@traced
 def read_subtopics_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[SubtopicModel]:
@@ -156,6 +168,7 @@ def read_subtopics_from_db(
     return db.query(SubtopicModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_subtopic_in_db(
     db: Session, subtopic_id: int, subtopic_data: Dict
 ) -> Optional[SubtopicModel]:
@@ -185,11 +198,14 @@ def update_subtopic_in_db(
     if db_subtopic:
         for key, value in subtopic_data.items():
             setattr(db_subtopic, key, value)
+        refresh_taxonomy_closure_in_db(db, "subtopics", [subtopic_id])
         db.commit()
+        taxonomy_cache.bump_version()
         db.refresh(db_subtopic)
     return db_subtopic
 
 
+@traced
 def delete_subtopic_from_db(db: Session, subtopic_id: int) -> bool:
     """
     Delete a subtopic from the database.
@@ -213,11 +229,14 @@ def delete_subtopic_from_db(db: Session, subtopic_id: int) -> bool:
     db_subtopic = read_subtopic_from_db(db, subtopic_id)
     if db_subtopic:
         db.delete(db_subtopic)
+        refresh_taxonomy_closure_in_db(db, "subtopics", [subtopic_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_topic_to_subtopic_association_in_db(
     db: Session, topic_id: int, subtopic_id: int
 ) -> bool:
@@ -244,7 +263,9 @@ def create_topic_to_subtopic_association_in_db(
     association = TopicToSubtopicAssociation(topic_id=topic_id, subtopic_id=subtopic_id)
     db.add(association)
     try:
+        refresh_taxonomy_closure_in_db(db, "subtopics", [subtopic_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     except SQLAlchemyError:
         logger.exception("Failed to create topic-subtopic association")
@@ -252,6 +273,7 @@ def create_topic_to_subtopic_association_in_db(
         return False
 
 
+@traced
 def delete_topic_to_subtopic_association_from_db(
     db: Session, topic_id: int, subtopic_id: int
 ) -> bool:
@@ -282,11 +304,14 @@ def delete_topic_to_subtopic_association_from_db(
     )
     if association:
         db.delete(association)
+        refresh_taxonomy_closure_in_db(db, "subtopics", [subtopic_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_subtopic_to_concept_association_in_db(
     db: Session, subtopic_id: int, concept_id: int
 ) -> bool:
@@ -315,7 +340,9 @@ def create_subtopic_to_concept_association_in_db(
     )
     db.add(association)
     try:
+        refresh_taxonomy_closure_in_db(db, "concepts", [concept_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     except SQLAlchemyError:
         logger.exception("Failed to create subtopic-concept association")
@@ -323,6 +350,7 @@ def create_subtopic_to_concept_association_in_db(
         return False
 
 
+@traced
 def delete_subtopic_to_concept_association_from_db(
     db: Session, subtopic_id: int, concept_id: int
 ) -> bool:
@@ -353,11 +381,14 @@ def delete_subtopic_to_concept_association_from_db(
     )
     if association:
         db.delete(association)
+        refresh_taxonomy_closure_in_db(db, "concepts", [concept_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_question_to_subtopic_association_in_db(
     db: Session, question_id: int, subtopic_id: int
 ) -> bool:
@@ -394,6 +425,7 @@ def create_question_to_subtopic_association_in_db(
         return False
 
 
+@traced
 def delete_question_to_subtopic_association_from_db(
     db: Session, question_id: int, subtopic_id: int
 ) -> bool:
@@ -429,6 +461,7 @@ def delete_question_to_subtopic_association_from_db(
     return False
 
 
+@traced
 def read_topics_for_subtopic_from_db(db: Session, subtopic_id: int) -> List[TopicModel]:
     """
     Retrieve all topics associated with a specific subtopic from the database.
@@ -453,6 +486,7 @@ def read_topics_for_subtopic_from_db(db: Session, subtopic_id: int) -> List[Topi
     )
 
 
+@traced
 def read_concepts_for_subtopic_from_db(
     db: Session, subtopic_id: int
 ) -> List[ConceptModel]:
@@ -479,6 +513,7 @@ def read_concepts_for_subtopic_from_db(
     )
 
 
+@traced
 def read_questions_for_subtopic_from_db(
     db: Session, subtopic_id: int
 ) -> List[QuestionModel]:
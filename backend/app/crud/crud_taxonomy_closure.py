@@ -0,0 +1,335 @@
+# filename: backend/app/crud/crud_taxonomy_closure.py
+
+"""
+This module maintains the taxonomy closure table.
+
+The taxonomy_closure table holds one row for every (ancestor, descendant)
+pair in the Domain -> Discipline -> Subject -> Topic -> Subtopic -> Concept
+hierarchy, including a depth-0 row linking each node to itself. Selecting
+everything under a node is then a single indexed lookup instead of one join
+per level.
+
+The taxonomy CRUD functions call refresh_taxonomy_closure_in_db before they
+commit, so closure rows change in the same transaction as the associations
+they are derived from. Writes that bypass those functions (raw inserts,
+imports) can be repaired with rebuild_taxonomy_closure_in_db, which is also
+available as the backend/utilities/rebuild_taxonomy_closure.py script.
+
+Key dependencies:
+- sqlalchemy: For the INSERT ... SELECT statements that derive closure rows
+- backend.app.models.taxonomy_closure: For TaxonomyClosureModel
+- backend.app.services.taxonomy_service: For the taxonomy levels and edges
+
+Main functions:
+- refresh_taxonomy_closure_in_db: Recomputes the rows of some nodes and their descendants
+- rebuild_taxonomy_closure_in_db: Recomputes the whole table
+- read_descendant_ids_from_db: Lists the descendants of a node
+- question_ids_under_ancestor: Builds a subquery of the questions under a node
+
+Usage example:
+    from backend.app.crud.crud_taxonomy_closure import refresh_taxonomy_closure_in_db
+
+    db.add(DisciplineToSubjectAssociation(discipline_id=1, subject_id=2))
+    refresh_taxonomy_closure_in_db(db, "subjects", [2])
+    db.commit()
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import and_, delete, func, insert, literal, select, union
+from sqlalchemy.orm import Session
+
+from backend.app.models.associations import (
+    QuestionToConceptAssociation,
+    QuestionToSubjectAssociation,
+    QuestionToSubtopicAssociation,
+    QuestionToTopicAssociation,
+)
+from backend.app.models.taxonomy_closure import TaxonomyClosureModel
+from backend.app.services.logging_service import logger
+from backend.app.services.taxonomy_service import (
+    TAXONOMY_EDGES,
+    TAXONOMY_LEVELS,
+    TAXONOMY_MODELS,
+)
+from backend.app.services.tracing_service import traced
+
+# Keeps IN lists well below the bind parameter limits of SQLite and others
+CLOSURE_CHUNK_SIZE = 500
+
+# (question_id column, node id column) of the question association at each level
+QUESTION_COLUMNS_BY_LEVEL = {
+    "subjects": (
+        QuestionToSubjectAssociation.question_id,
+        QuestionToSubjectAssociation.subject_id,
+    ),
+    "topics": (
+        QuestionToTopicAssociation.question_id,
+        QuestionToTopicAssociation.topic_id,
+    ),
+    "subtopics": (
+        QuestionToSubtopicAssociation.question_id,
+        QuestionToSubtopicAssociation.subtopic_id,
+    ),
+    "concepts": (
+        QuestionToConceptAssociation.question_id,
+        QuestionToConceptAssociation.concept_id,
+    ),
+}
+
+_CLOSURE_COLUMNS = [
+    "ancestor_level",
+    "ancestor_id",
+    "descendant_level",
+    "descendant_id",
+    "depth",
+]
+
+
+def _validate_level(level: str) -> None:
+    if level not in TAXONOMY_LEVELS:
+        raise ValueError(f"Unknown taxonomy level: {level}")
+
+
+def _chunks(ids: List[int]):
+    for start in range(0, len(ids), CLOSURE_CHUNK_SIZE):
+        yield ids[start : start + CLOSURE_CHUNK_SIZE]
+
+
+def _insert_closure_rows(db: Session, level: str, ids: Optional[List[int]]) -> None:
+    """Insert the self row and ancestor rows of the given nodes (all when ids is None)."""
+    model = TAXONOMY_MODELS[level]
+    self_rows = select(
+        literal(level), model.id, literal(level), model.id, literal(0)
+    )
+    if ids is not None:
+        self_rows = self_rows.where(model.id.in_(ids))
+    db.execute(insert(TaxonomyClosureModel).from_select(_CLOSURE_COLUMNS, self_rows))
+
+    index = TAXONOMY_LEVELS.index(level)
+    if index == 0:
+        return
+    parent_level, parent_column, child_column = TAXONOMY_EDGES[index - 1]
+    # The parents' rows are already correct, so each child inherits them one
+    # level deeper. DISTINCT collapses ancestors reached through several parents.
+    ancestor_rows = (
+        select(
+            TaxonomyClosureModel.ancestor_level,
+            TaxonomyClosureModel.ancestor_id,
+            literal(level),
+            child_column,
+            TaxonomyClosureModel.depth + 1,
+        )
+        .select_from(parent_column.table)
+        .join(
+            TaxonomyClosureModel,
+            and_(
+                TaxonomyClosureModel.descendant_level == parent_level,
+                TaxonomyClosureModel.descendant_id == parent_column,
+            ),
+        )
+        .distinct()
+    )
+    if ids is not None:
+        ancestor_rows = ancestor_rows.where(child_column.in_(ids))
+    db.execute(
+        insert(TaxonomyClosureModel).from_select(_CLOSURE_COLUMNS, ancestor_rows)
+    )
+
+
+def _collect_affected_nodes(
+    db: Session, level: str, node_ids: Iterable[int]
+) -> Dict[str, Set[int]]:
+    affected: Dict[str, Set[int]] = {name: set() for name in TAXONOMY_LEVELS}
+    affected[level].update(node_ids)
+
+    # Nodes that were below these ones before the change...
+    for chunk in _chunks(sorted(affected[level])):
+        rows = db.execute(
+            select(
+                TaxonomyClosureModel.descendant_level,
+                TaxonomyClosureModel.descendant_id,
+            ).where(
+                TaxonomyClosureModel.ancestor_level == level,
+                TaxonomyClosureModel.ancestor_id.in_(chunk),
+            )
+        )
+        for descendant_level, descendant_id in rows:
+            affected[descendant_level].add(descendant_id)
+
+    # ...and the nodes that are below them now
+    for index in range(TAXONOMY_LEVELS.index(level), len(TAXONOMY_EDGES)):
+        parent_level, parent_column, child_column = TAXONOMY_EDGES[index]
+        child_level = TAXONOMY_LEVELS[index + 1]
+        for chunk in _chunks(sorted(affected[parent_level])):
+            affected[child_level].update(
+                db.scalars(select(child_column).where(parent_column.in_(chunk)))
+            )
+    return affected
+
+
+@traced
+def refresh_taxonomy_closure_in_db(
+    db: Session, level: str, node_ids: Iterable[int]
+) -> None:
+    """
+    Recompute the closure rows of some nodes and of everything below them.
+
+    Call this after adding, changing or deleting a taxonomy node or one of
+    its parent or child associations, before committing. Descendants are
+    found both through the current associations and through the existing
+    closure rows, so nodes that were just detached are recomputed too. A node
+    that no longer exists simply loses all of its rows.
+
+    Pending ORM changes are flushed first. Nothing is committed.
+
+    Args:
+        db (Session): The database session.
+        level (str): The level of the nodes, e.g. "subjects".
+        node_ids (Iterable[int]): The IDs of the changed nodes.
+
+    Raises:
+        ValueError: If the level is not a taxonomy level.
+        SQLAlchemyError: If there's an issue with the database operation.
+
+    Usage example:
+        delete_subject_to_topic_association(db, subject_id=3, topic_id=7)
+        refresh_taxonomy_closure_in_db(db, "topics", [7])
+        db.commit()
+    """
+    _validate_level(level)
+    db.flush()
+    affected = _collect_affected_nodes(db, level, node_ids)
+
+    # Levels are processed top-down so every node's parents are final when
+    # its own ancestor rows are derived from theirs
+    for affected_level in TAXONOMY_LEVELS:
+        for chunk in _chunks(sorted(affected[affected_level])):
+            db.execute(
+                delete(TaxonomyClosureModel).where(
+                    TaxonomyClosureModel.descendant_level == affected_level,
+                    TaxonomyClosureModel.descendant_id.in_(chunk),
+                )
+            )
+            _insert_closure_rows(db, affected_level, chunk)
+
+
+@traced
+def rebuild_taxonomy_closure_in_db(db: Session) -> int:
+    """
+    Recompute the whole closure table from the taxonomy and association tables.
+
+    The table is emptied and refilled with one INSERT ... SELECT per level, in
+    the current transaction. Nothing is committed.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        int: The number of closure rows after the rebuild.
+
+    Raises:
+        SQLAlchemyError: If there's an issue with the database operation.
+
+    Usage example:
+        row_count = rebuild_taxonomy_closure_in_db(db)
+        db.commit()
+    """
+    db.flush()
+    db.execute(delete(TaxonomyClosureModel))
+    for level in TAXONOMY_LEVELS:
+        _insert_closure_rows(db, level, None)
+    row_count = db.scalar(select(func.count()).select_from(TaxonomyClosureModel))
+    logger.info("Rebuilt taxonomy closure table with %s rows", row_count)
+    return row_count
+
+
+@traced
+def read_descendant_ids_from_db(
+    db: Session,
+    ancestor_level: str,
+    ancestor_id: int,
+    descendant_level: Optional[str] = None,
+) -> Dict[str, List[int]]:
+    """
+    Retrieve the IDs of the nodes below a taxonomy node.
+
+    Args:
+        db (Session): The database session.
+        ancestor_level (str): The level of the node, e.g. "disciplines".
+        ancestor_id (int): The ID of the node.
+        descendant_level (Optional[str]): Only return descendants at this level.
+
+    Returns:
+        Dict[str, List[int]]: The descendant IDs, ascending, per level. The node
+            itself is not included.
+
+    Raises:
+        ValueError: If a level is not a taxonomy level.
+
+    Usage example:
+        topic_ids = read_descendant_ids_from_db(db, "disciplines", 1, "topics")["topics"]
+    """
+    _validate_level(ancestor_level)
+    stmt = select(
+        TaxonomyClosureModel.descendant_level, TaxonomyClosureModel.descendant_id
+    ).where(
+        TaxonomyClosureModel.ancestor_level == ancestor_level,
+        TaxonomyClosureModel.ancestor_id == ancestor_id,
+        TaxonomyClosureModel.depth > 0,
+    )
+    if descendant_level is not None:
+        _validate_level(descendant_level)
+        stmt = stmt.where(TaxonomyClosureModel.descendant_level == descendant_level)
+
+    descendants: Dict[str, List[int]] = {}
+    for level, node_id in db.execute(stmt.order_by(TaxonomyClosureModel.descendant_id)):
+        descendants.setdefault(level, []).append(node_id)
+    return descendants
+
+
+def question_ids_under_ancestor(ancestor_level: str, ancestor_id: int):
+    """
+    Build a subquery of the IDs of the questions at or below a taxonomy node.
+
+    Each question association at or below the node's level is joined to the
+    closure table once, on its descendant index, and the results are combined
+    with UNION. Questions cannot be linked to domains or disciplines directly,
+    so for those levels only the subject and lower associations are used.
+
+    Args:
+        ancestor_level (str): The level of the node, e.g. "domains".
+        ancestor_id (int): The ID of the node.
+
+    Returns:
+        A selectable of question IDs, suitable for QuestionModel.id.in_().
+
+    Raises:
+        ValueError: If the level is not a taxonomy level.
+
+    Usage example:
+        query = query.filter(
+            QuestionModel.id.in_(question_ids_under_ancestor("disciplines", 2))
+        )
+    """
+    _validate_level(ancestor_level)
+    ancestor_index = TAXONOMY_LEVELS.index(ancestor_level)
+    selects = []
+    for level, (question_column, node_column) in QUESTION_COLUMNS_BY_LEVEL.items():
+        if TAXONOMY_LEVELS.index(level) < ancestor_index:
+            continue
+        selects.append(
+            select(question_column)
+            .join(
+                TaxonomyClosureModel,
+                and_(
+                    TaxonomyClosureModel.descendant_level == level,
+                    TaxonomyClosureModel.descendant_id == node_column,
+                ),
+            )
+            .where(
+                TaxonomyClosureModel.ancestor_level == ancestor_level,
+                TaxonomyClosureModel.ancestor_id == ancestor_id,
+            )
+        )
+    return selects[0] if len(selects) == 1 else union(*selects)
@@ -19,6 +19,7 @@ Main functions:
 - read_all_time_periods_from_db: Retrieves all time periods
 - update_time_period_in_db: Updates an existing time period
 - delete_time_period_from_db: Deletes a time period
+- create_missing_time_periods_in_db: Inserts the predefined time periods that do not exist yet
 - init_time_periods_in_db: Initializes the database with predefined time periods
 
 Usage example:
@@ -35,10 +36,13 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from backend.app.core.config import TimePeriod
+from backend.app.crud.crud_associations import insert_ignoring_conflicts
 from backend.app.models.time_period import TimePeriodModel
 from backend.app.services.logging_service import logger
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_time_period_in_db(db: Session, time_period: TimePeriod) -> TimePeriodModel:
     """
     Create a new time period in the database.
@@ -70,6 +74,7 @@ def create_time_period_in_db(db: Session, time_period: TimePeriod) -> TimePeriod
         raise
 
 
+@traced
 def read_time_period_from_db(
     db: Session, time_period_id: int
 ) -> Optional[TimePeriodModel]:
@@ -94,6 +99,7 @@ def read_time_period_from_db(
     )
 
 
+@traced
 def read_all_time_periods_from_db(db: Session) -> List[TimePeriodModel]:
     """
     Retrieve all time periods from the database.
@@ -112,6 +118,7 @@ def read_all_time_periods_from_db(db: Session) -> List[TimePeriodModel]:
     return db.query(TimePeriodModel).all()
 
 
+@traced
 def update_time_period_in_db(
     db: Session, time_period_id: int, new_name: str
 ) -> Optional[TimePeriodModel]:
@@ -152,6 +159,7 @@ def update_time_period_in_db(
         raise
 
 
+@traced
 def delete_time_period_from_db(db: Session, time_period_id: int) -> bool:
     """
     Delete a time period from the database.
@@ -189,12 +197,40 @@ def delete_time_period_from_db(db: Session, time_period_id: int) -> bool:
         raise
 
 
+@traced
+def create_missing_time_periods_in_db(db: Session) -> None:
+    """
+    Insert every TimePeriod that is not in the database yet, in one statement.
+
+    Existing rows are left alone, so concurrent callers cannot conflict.
+    Does not commit.
+
+    Args:
+        db (Session): The database session.
+
+    Usage example:
+        create_missing_time_periods_in_db(db)
+        db.commit()
+    """
+    stmt, conflict_style = insert_ignoring_conflicts(db, TimePeriodModel)
+    if conflict_style == "on_conflict":
+        stmt = stmt.on_conflict_do_nothing()
+    db.execute(
+        stmt,
+        [
+            {"id": time_period.value, "name": time_period.name.lower()}
+            for time_period in TimePeriod
+        ],
+    )
+
+
+@traced
 def init_time_periods_in_db(db: Session) -> None:
     """
     Initialize the database with predefined time periods.
 
-    This function checks for existing time periods and adds any missing ones
-    from the TimePeriod enum.
+    This function adds any time periods from the TimePeriod enum that are
+    missing, with a single insert-or-ignore statement, and commits.
 
     Args:
         db (Session): The database session.
@@ -206,14 +242,10 @@ def init_time_periods_in_db(db: Session) -> None:
         init_time_periods_in_db(db)
     """
     try:
-        existing_periods = read_all_time_periods_from_db(db)
-        existing_ids = {period.id for period in existing_periods}
-
-        for time_period in TimePeriod:
-            if time_period.value not in existing_ids:
-                create_time_period_in_db(db, time_period)
-
+        create_missing_time_periods_in_db(db)
+        db.commit()
         logger.info("Time periods initialized successfully")
     except SQLAlchemyError as e:
+        db.rollback()
         logger.exception("Error initializing time periods: %s", str(e))
         raise
@@ -13,6 +13,8 @@ Key dependencies:
 - fastapi: For raising HTTPExceptions
 - backend.app.models: For various model classes (TopicModel, SubjectModel, etc.)
 - backend.app.services.logging_service: For logging
+- backend.app.crud.crud_taxonomy_closure: For keeping the taxonomy closure table in sync
+- backend.app.services.taxonomy_service: For invalidating the cached taxonomy graph
 
 Main functions:
 - create_topic_in_db: Creates a new topic
@@ -39,6 +41,7 @@ from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from backend.app.crud.crud_taxonomy_closure import refresh_taxonomy_closure_in_db
 from backend.app.models.associations import (
     QuestionToTopicAssociation,
     SubjectToTopicAssociation,
@@ -49,8 +52,11 @@ from backend.app.models.subjects import SubjectModel
 from backend.app.models.subtopics import SubtopicModel
 from backend.app.models.topics import TopicModel
 from backend.app.services.logging_service import logger
+from backend.app.services.taxonomy_service import taxonomy_cache
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_topic_in_db(db: Session, topic_data: Dict) -> Optional[TopicModel]:
     """
     Create a new topic in the database.
@@ -90,7 +96,10 @@ def create_topic_in_db(db: Session, topic_data: Dict) -> Optional[TopicModel]:
 
     db_topic = TopicModel(name=topic_data["name"])
     db.add(db_topic)
+    db.flush()
+    refresh_taxonomy_closure_in_db(db, "topics", [db_topic.id])
     db.commit()
+    taxonomy_cache.bump_version()
     db.refresh(db_topic)
 
     if "subject_ids" in topic_data and topic_data["subject_ids"]:
@@ -108,6 +117,7 @@ def create_topic_in_db(db: Session, topic_data: Dict) -> Optional[TopicModel]:
     return db_topic
 
 
+@traced
 def read_topic_from_db(db: Session, topic_id: int) -> Optional[TopicModel]:
     """
     Retrieve a single topic from the database by its ID.
@@ -133,6 +143,7 @@ def read_topic_from_db(db: Session, topic_id: int) -> Optional[TopicModel]:
     return topic
 
 
+@traced
 def read_topic_by_name_from_db(db: Session, name: str) -> Optional[TopicModel]:
     """
     Retrieve a single topic from the database by its name.
@@ -153,6 +164,7 @@ def read_topic_by_name_from_db(db: Session, name: str) -> Optional[TopicModel]:
     return db.query(TopicModel).filter(TopicModel.name == name).first()
 
 
+@traced
 def read_topics_from_db(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[TopicModel]:
@@ -175,6 +187,7 @@ def read_topics_from_db(
     return db.query(TopicModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_topic_in_db(
     db: Session, topic_id: int, topic_data: Dict
 ) -> Optional[TopicModel]:
@@ -227,7 +240,9 @@ def update_topic_in_db(
                 create_subject_to_topic_association_in_db(db, subject_id, topic_id)
 
         try:
+            refresh_taxonomy_closure_in_db(db, "topics", [topic_id])
             db.commit()
+            taxonomy_cache.bump_version()
         except IntegrityError:
             db.rollback()
             raise
@@ -235,6 +250,7 @@ def update_topic_in_db(
     return db_topic
 
 
+@traced
 def delete_topic_from_db(db: Session, topic_id: int) -> bool:
     """
     Delete a topic from the database.
@@ -258,11 +274,14 @@ def delete_topic_from_db(db: Session, topic_id: int) -> bool:
     db_topic = read_topic_from_db(db, topic_id)
     if db_topic:
         db.delete(db_topic)
+        refresh_taxonomy_closure_in_db(db, "topics", [topic_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_subject_to_topic_association_in_db(
     db: Session, subject_id: int, topic_id: int
 ) -> bool:
@@ -290,6 +309,7 @@ def create_subject_to_topic_association_in_db(
     db.add(association)
     try:
         db.flush()
+        refresh_taxonomy_closure_in_db(db, "topics", [topic_id])
         logger.debug(
             "Created association: subject_id=%s, topic_id=%s",
             subject_id,
@@ -307,6 +327,7 @@ def create_subject_to_topic_association_in_db(
         return False
 
 
+@traced
 def delete_subject_to_topic_association_from_db(
     db: Session, subject_id: int, topic_id: int
 ) -> bool:
@@ -337,11 +358,14 @@ def delete_subject_to_topic_association_from_db(
     )
     if association:
         db.delete(association)
+        refresh_taxonomy_closure_in_db(db, "topics", [topic_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_topic_to_subtopic_association_in_db(
     db: Session, topic_id: int, subtopic_id: int
 ) -> bool:
@@ -369,6 +393,7 @@ def create_topic_to_subtopic_association_in_db(
     db.add(association)
     try:
         db.flush()
+        refresh_taxonomy_closure_in_db(db, "subtopics", [subtopic_id])
         return True
     except SQLAlchemyError:
         db.rollback()
@@ -380,6 +405,7 @@ def create_topic_to_subtopic_association_in_db(
         return False
 
 
+@traced
 def delete_topic_to_subtopic_association_from_db(
     db: Session, topic_id: int, subtopic_id: int
 ) -> bool:
@@ -410,11 +436,14 @@ def delete_topic_to_subtopic_association_from_db(
     )
     if association:
         db.delete(association)
+        refresh_taxonomy_closure_in_db(db, "subtopics", [subtopic_id])
         db.commit()
+        taxonomy_cache.bump_version()
         return True
     return False
 
 
+@traced
 def create_question_to_topic_association_in_db(
     db: Session, question_id: int, topic_id: int
 ) -> bool:
@@ -453,6 +482,7 @@ def create_question_to_topic_association_in_db(
         return False
 
 
+@traced
 def delete_question_to_topic_association_from_db(
     db: Session, question_id: int, topic_id: int
 ) -> bool:
@@ -488,6 +518,7 @@ def delete_question_to_topic_association_from_db(
     return False
 
 
+@traced
 def read_subjects_for_topic_from_db(db: Session, topic_id: int) -> List[SubjectModel]:
     """
     Retrieve all subjects associated with a specific topic from the database.
@@ -512,6 +543,7 @@ def read_subjects_for_topic_from_db(db: Session, topic_id: int) -> List[SubjectM
     )
 
 
+@traced
 def read_subtopics_for_topic_from_db(db: Session, topic_id: int) -> List[SubtopicModel]:
     """
     Retrieve all subtopics associated with a specific topic from the database.
@@ -536,6 +568,7 @@ def read_subtopics_for_topic_from_db(db: Session, topic_id: int) -> List[Subtopi
     )
 
 
+@traced
 def read_questions_for_topic_from_db(db: Session, topic_id: int) -> List[QuestionModel]:
     """
     Retrieve all questions associated with a specific topic from the database.
@@ -26,6 +26,7 @@ Main functions:
 - read_role_for_user_from_db: Retrieves the role for a user
 - read_created_question_sets_for_user_from_db: Retrieves question sets created by a user
 - update_user_token_blacklist_date: Updates the token blacklist date for a user
+- update_user_password_hash_in_db: Replaces a user's password hash if it is unchanged
 
 Usage example:
     from sqlalchemy.orm import Session
@@ -43,7 +44,7 @@ Usage example:
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
-from sqlalchemy import func
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -54,8 +55,10 @@ from backend.app.models.question_sets import QuestionSetModel
 from backend.app.models.roles import RoleModel
 from backend.app.models.users import UserModel
 from backend.app.services.logging_service import logger
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_user_in_db(db: Session, user_data: Dict) -> UserModel:
     """
     Create a new user in the database.
@@ -112,6 +115,7 @@ def create_user_in_db(db: Session, user_data: Dict) -> UserModel:
         raise ValueError(f"Error creating user: {str(exc)}") from exc
 
 
+@traced
 def read_user_from_db(db: Session, user_id: int) -> Optional[UserModel]:
     """
     Retrieve a single user from the database by their ID.
@@ -131,10 +135,13 @@ def read_user_from_db(db: Session, user_id: int) -> Optional[UserModel]:
     return db.query(UserModel).filter(UserModel.id == user_id).first()
 
 
+@traced
 def read_user_by_username_from_db(db: Session, username: str) -> Optional[UserModel]:
     """
     Retrieve a single user from the database by their username.
 
+    The match is case-insensitive and uses the unique index on username_lower.
+
     Args:
         db (Session): The database session.
         username (str): The username of the user to retrieve.
@@ -148,9 +155,7 @@ def read_user_by_username_from_db(db: Session, username: str) -> Optional[UserMo
             print(f"User ID: {user.id}")
     """
     user = (
-        db.query(UserModel)
-        .filter(func.lower(UserModel.username) == username.lower())
-        .first()
+        db.query(UserModel).filter(UserModel.username_lower == username.lower()).first()
     )
     if user and user.token_blacklist_date:
         # Ensure token_blacklist_date is timezone-aware
@@ -161,10 +166,13 @@ def read_user_by_username_from_db(db: Session, username: str) -> Optional[UserMo
     return user
 
 
+@traced
 def read_user_by_email_from_db(db: Session, email: str) -> Optional[UserModel]:
     """
     Retrieve a single user from the database by their email.
 
+    The match is case-insensitive and uses the unique index on email_lower.
+
     Args:
         db (Session): The database session.
         email (str): The email of the user to retrieve.
@@ -177,9 +185,10 @@ def read_user_by_email_from_db(db: Session, email: str) -> Optional[UserModel]:
         if user:
             print(f"User: {user.username}")
     """
-    return db.query(UserModel).filter(UserModel.email == email).first()
+    return db.query(UserModel).filter(UserModel.email_lower == email.lower()).first()
 
 
+@traced
 def read_users_from_db(db: Session, skip: int = 0, limit: int = 100) -> List[UserModel]:
     """
     Retrieve a list of users from the database with pagination.
@@ -200,6 +209,7 @@ def read_users_from_db(db: Session, skip: int = 0, limit: int = 100) -> List[Use
     return db.query(UserModel).offset(skip).limit(limit).all()
 
 
+@traced
 def update_user_in_db(
     db: Session, user_id: int, user_data: Dict
 ) -> Optional[UserModel]:
@@ -259,6 +269,7 @@ def update_user_in_db(
     return None
 
 
+@traced
 def delete_user_from_db(db: Session, user_id: int) -> bool:
     """
     Delete a user from the database.
@@ -284,6 +295,7 @@ def delete_user_from_db(db: Session, user_id: int) -> bool:
     return False
 
 
+@traced
 def create_user_to_group_association_in_db(
     db: Session, user_id: int, group_id: int
 ) -> bool:
@@ -314,6 +326,7 @@ def create_user_to_group_association_in_db(
         return False
 
 
+@traced
 def delete_user_to_group_association_from_db(
     db: Session, user_id: int, group_id: int
 ) -> bool:
@@ -346,6 +359,7 @@ def delete_user_to_group_association_from_db(
     return False
 
 
+@traced
 def read_groups_for_user_from_db(db: Session, user_id: int) -> List[GroupModel]:
     """
     Retrieve all groups associated with a specific user from the database.
@@ -370,6 +384,7 @@ def read_groups_for_user_from_db(db: Session, user_id: int) -> List[GroupModel]:
     )
 
 
+@traced
 def read_role_for_user_from_db(db: Session, user_id: int) -> Optional[RoleModel]:
     """
     Retrieve the role associated with a specific user from the database.
@@ -391,6 +406,7 @@ def read_role_for_user_from_db(db: Session, user_id: int) -> Optional[RoleModel]
     return user.role if user else None
 
 
+@traced
 def read_created_question_sets_for_user_from_db(
     db: Session, user_id: int
 ) -> List[QuestionSetModel]:
@@ -414,6 +430,7 @@ def read_created_question_sets_for_user_from_db(
     )
 
 
+@traced
 def update_user_token_blacklist_date(
     db: Session, user_id: int, new_date: Optional[datetime]
 ) -> Optional[UserModel]:
@@ -443,3 +460,36 @@ def update_user_token_blacklist_date(
         db.refresh(db_user)
         return db_user
     return None
+
+
+@traced
+def update_user_password_hash_in_db(
+    db: Session, user_id: int, old_hash: str, new_hash: str
+) -> bool:
+    """
+    Replace a user's password hash, unless the password changed in the meantime.
+
+    Used to upgrade hashes made with an outdated bcrypt cost. The update only
+    applies while the stored hash is still old_hash, so a password change that
+    races the upgrade is never overwritten.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The ID of the user.
+        old_hash (str): The hash the new hash replaces.
+        new_hash (str): The new hash of the same password.
+
+    Returns:
+        bool: True if the hash was replaced.
+
+    Usage example:
+        if update_user_password_hash_in_db(db, 1, user.hashed_password, new_hash):
+            print("Password hash upgraded")
+    """
+    result = db.execute(
+        update(UserModel)
+        .where(UserModel.id == user_id, UserModel.hashed_password == old_hash)
+        .values(hashed_password=new_hash)
+    )
+    db.commit()
+    return result.rowcount == 1
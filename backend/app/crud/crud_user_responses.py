@@ -41,8 +41,10 @@ from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from backend.app.models.user_responses import UserResponseModel
+from backend.app.services.tracing_service import traced
 
 
+@traced
 def create_user_response_in_db(
     db: Session, user_response_data: Dict
 ) -> UserResponseModel:
@@ -85,6 +87,7 @@ def create_user_response_in_db(
     return db_user_response
 
 
+@traced
 def read_user_response_from_db(
     db: Session, user_response_id: int
 ) -> Optional[UserResponseModel]:
@@ -111,6 +114,7 @@ def read_user_response_from_db(
     )
 
 
+@traced
 def read_user_responses_from_db(
     db: Session,
     filters: Dict[str, any],
@@ -153,6 +157,7 @@ def read_user_responses_from_db(
     return query.offset(skip).limit(limit).all()
 
 
+@traced
 def update_user_response_in_db(
     db: Session, user_response_id: int, user_response_data: Dict
 ) -> Optional[UserResponseModel]:
@@ -191,6 +196,7 @@ def update_user_response_in_db(
     return db_user_response
 
 
+@traced
 def delete_user_response_from_db(db: Session, user_response_id: int) -> bool:
     """
     Delete a user response from the database.
@@ -219,6 +225,7 @@ def delete_user_response_from_db(db: Session, user_response_id: int) -> bool:
     return False
 
 
+@traced
 def read_user_responses_for_user_from_db(
     db: Session, user_id: int
 ) -> List[UserResponseModel]:
@@ -244,6 +251,7 @@ def read_user_responses_for_user_from_db(
     )
 
 
+@traced
 def read_user_responses_for_question_from_db(
     db: Session, question_id: int
 ) -> List[UserResponseModel]:
@@ -1,51 +1,84 @@
 # filename: backend/app/db/session.py
 
 import os
+from functools import lru_cache
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool, QueuePool
 
-from backend.app.core.config import settings_core
+from backend.app.core.config import get_settings
 from backend.app.db.base import Base
 from backend.app.models.permissions import PermissionModel
 from backend.app.models.roles import RoleModel
 from backend.app.services.logging_service import logger
 
-# Determine the environment
-ENVIRONMENT = os.getenv("ENVIRONMENT", "dev")
-
-# Set pool settings based on the environment
-if ENVIRONMENT == "test":
-    # For SQLite (testing), use a smaller pool
-    pool_settings = {
-        "poolclass": QueuePool,
-        "pool_size": 30,
-        "max_overflow": 40,
-        "pool_recycle": 3600,
-        "pool_pre_ping": True,
-    }
-elif ENVIRONMENT in ["dev", "prod"]:
-    # For MariaDB (production), use a larger pool
-    pool_settings = {
-        "poolclass": QueuePool,
-        "pool_size": 50,
-        "max_overflow": 100,
-        "pool_recycle": 3600,
-        "pool_pre_ping": True,
-    }
-else:
+
+def get_pool_settings(environment: str) -> dict:
+    # Set pool settings based on the environment
+    if environment == "test":
+        # For SQLite (testing), use a smaller pool
+        return {
+            "poolclass": QueuePool,
+            "pool_size": 30,
+            "max_overflow": 40,
+            "pool_recycle": 3600,
+            "pool_pre_ping": True,
+        }
+    if environment in ["dev", "prod"]:
+        # For MariaDB (production), use a larger pool
+        return {
+            "poolclass": QueuePool,
+            "pool_size": 50,
+            "max_overflow": 100,
+            "pool_recycle": 3600,
+            "pool_pre_ping": True,
+        }
     # For unknown environments, use NullPool as a safe default
-    pool_settings = {"poolclass": NullPool}
+    return {"poolclass": NullPool}
+
+
+# Bound to the engine by get_engine(), so sessions are only usable after it
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """
+    Return the application's engine, creating it on first use.
+
+    Creating the engine needs the settings, so it is deferred from import
+    time to the first call, normally from the application's lifespan.
+    SessionLocal is bound to the engine at the same time.
+
+    Returns:
+        Engine: The engine for the configured DATABASE_URL.
+
+    Usage example:
+        from backend.app.db.session import get_engine
+
+        with get_engine().connect() as connection:
+            ...
+    """
+    environment = os.getenv("ENVIRONMENT", "dev")
+    engine = create_engine(
+        get_settings().DATABASE_URL, **get_pool_settings(environment)
+    )
+    SessionLocal.configure(bind=engine)
+    return engine
 
-# Create the engine with the appropriate pool settings
-engine = create_engine(settings_core.DATABASE_URL, **pool_settings)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def __getattr__(name):
+    # `from backend.app.db.session import engine` keeps working
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init_db():
     # Import all the models here to ensure they are registered with SQLAlchemy
+    engine = get_engine()
     db = SessionLocal()
     try:
         # Add default roles
@@ -93,6 +126,7 @@ def init_db():
 
 
 def get_db():
+    get_engine()
     db = SessionLocal()
     try:
         yield db
@@ -102,6 +136,7 @@ def get_db():
 
 # Add logging for connection pool statistics
 def log_pool_info():
+    engine = get_engine()
     if hasattr(engine.pool, "size"):
         logger.info("Database connection pool status:")
         logger.info("  Pool size: %s", engine.pool.size())
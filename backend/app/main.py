@@ -12,50 +12,85 @@ from backend.app.api.endpoints import domains as domains_router
 from backend.app.api.endpoints import filters as filters_router
 from backend.app.api.endpoints import groups as groups_router
 from backend.app.api.endpoints import leaderboard as leaderboard_router
+from backend.app.api.endpoints import metrics as metrics_router
+from backend.app.api.endpoints import profiling as profiling_router
 from backend.app.api.endpoints import question_sets as question_sets_router
 from backend.app.api.endpoints import question_tags as question_tags_router
 from backend.app.api.endpoints import questions as questions_router
+from backend.app.api.endpoints import quiz_sessions as quiz_sessions_router
 from backend.app.api.endpoints import register as register_router
+from backend.app.api.endpoints import search as search_router
 from backend.app.api.endpoints import subjects as subjects_router
 from backend.app.api.endpoints import subtopics as subtopics_router
+from backend.app.api.endpoints import taxonomy as taxonomy_router
 from backend.app.api.endpoints import time_periods as time_periods_router
+from backend.app.api.endpoints import traces as traces_router
 from backend.app.api.endpoints import topics as topics_router
 from backend.app.api.endpoints import user_responses as user_responses_router
 from backend.app.api.endpoints import users as users_router
-from backend.app.crud.crud_time_period import init_time_periods_in_db
-from backend.app.db.session import get_db
+from backend.app.core.config import get_settings
+from backend.app.core.security import configure_password_rounds, get_password_hash_pool
+from backend.app.db.session import get_db, get_engine
 from backend.app.middleware.authorization_middleware import AuthorizationMiddleware
 from backend.app.middleware.blacklist_middleware import BlacklistMiddleware
+from backend.app.middleware.conditional_get_middleware import ConditionalGetMiddleware
 from backend.app.middleware.cors_middleware import add_cors_middleware
-from backend.app.services.permission_generator_service import (
-    ensure_permissions_in_db,
-    generate_permissions,
+from backend.app.middleware.metrics_middleware import MetricsMiddleware
+from backend.app.middleware.profiling_middleware import RequestProfilingMiddleware
+from backend.app.services.bootstrap_service import bootstrap_reference_data_in_db
+from backend.app.services.permission_generator_service import generate_permissions
+from backend.app.services.logging_service import get_logger
+from backend.app.services.metrics_service import configure_metrics, shutdown_metrics
+from backend.app.services.question_filter_index_service import question_filter_index
+from backend.app.services.tracing_service import (
+    TracingMiddleware,
+    configure_tracing,
+    instrument_routes,
+    shutdown_tracing,
 )
 from backend.app.api.error_handlers import add_error_handlers
+from backend.app.api.responses import FastJSONResponse
 # Validation service removed - database constraints provide all necessary validation
 
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # This code runs when the application starts up
+    # Settings, logging and the engine are loaded here rather than at import
+    get_logger()
+    get_settings()
+    get_engine()
+    configure_password_rounds()  # Calibrates bcrypt if BCRYPT_TARGET_MS is set
+    configure_metrics()
+    configure_tracing()
     app.state.db = get_db()
     db = next(app.state.db)
-    permissions = generate_permissions(app)
-    ensure_permissions_in_db(db, permissions)
+    # Permissions and time periods; one worker seeds them, the rest wait
+    bootstrap_reference_data_in_db(db, generate_permissions(app))
     # register_validation_listeners() - REMOVED: Database constraints handle validation
-    init_time_periods_in_db(db)  # Initialize time periods
+    question_filter_index.build(db)  # Warm the question filter index
     yield
     # Anything after the yield runs when the application shuts down
     app.state.db.close()
+    get_password_hash_pool().shutdown()
+    shutdown_metrics()
+    shutdown_tracing()
 
 
 app.router.lifespan_context = lifespan
 
+# Innermost, so only authorized requests are answered with 304
+app.add_middleware(ConditionalGetMiddleware, get_db_func=get_db)
 app.add_middleware(AuthorizationMiddleware, get_db_func=get_db)
 app.add_middleware(BlacklistMiddleware, get_db_func=get_db)
 add_cors_middleware(app)
+app.add_middleware(RequestProfilingMiddleware)
+# Request latency includes every other middleware
+app.add_middleware(MetricsMiddleware)
+# Outermost, so a trace's root span covers every other middleware
+app.add_middleware(TracingMiddleware)
 
 # Add database error handlers
 add_error_handlers(app)
@@ -65,11 +100,16 @@ app.include_router(answer_choices_router.router, tags=["Answer Choices"])
 app.include_router(authentication_router.router, tags=["Authentication"])
 app.include_router(register_router.router, tags=["Authentication"])
 app.include_router(filters_router.router, tags=["Filters"])
+# Before the questions router, so /questions/search is not read as a question ID
+app.include_router(search_router.router, tags=["Search"])
 app.include_router(groups_router.router, tags=["Groups"])
 app.include_router(leaderboard_router.router, tags=["Leaderboard"])
+app.include_router(metrics_router.router, tags=["Metrics"])
+app.include_router(profiling_router.router, tags=["Profiling"])
 app.include_router(question_sets_router.router, tags=["Question Sets"])
 app.include_router(question_tags_router.router, tags=["Question Tags"])
 app.include_router(questions_router.router, tags=["Questions"])
+app.include_router(quiz_sessions_router.router, tags=["Quiz Sessions"])
 app.include_router(subjects_router.router, tags=["Subjects"])
 app.include_router(domains_router.router, tags=["Domains"])
 app.include_router(disciplines_router.router, tags=["Disciplines"])
@@ -78,9 +118,15 @@ app.include_router(user_responses_router.router, tags=["User Responses"])
 app.include_router(users_router.router, tags=["User Management"])
 app.include_router(topics_router.router, tags=["Topics"])
 app.include_router(subtopics_router.router, tags=["Subtopics"])
+app.include_router(taxonomy_router.router, tags=["Taxonomy"])
 app.include_router(time_periods_router.router, tags=["Time Periods"])
+app.include_router(traces_router.router, tags=["Tracing"])
 
 
 @app.get("/")
 def read_root():
     return {"Hello": "World"}
+
+
+# After every route is added
+instrument_routes(app)
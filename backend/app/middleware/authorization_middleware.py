@@ -5,13 +5,15 @@ from fastapi.responses import JSONResponse
 from jose import ExpiredSignatureError, JWTError
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from backend.app.core.config import settings_core
+from backend.app.core.config import get_settings
 from backend.app.db.session import get_db
 from backend.app.models.permissions import PermissionModel
 from backend.app.services.authorization_service import has_permission
+from backend.app.services.tracing_service import traced_middleware
 from backend.app.services.user_service import get_current_user_with_db, oauth2_scheme
 
 
+@traced_middleware
 class AuthorizationMiddleware(BaseHTTPMiddleware):
     method_map = {
         "GET": "read",
@@ -28,7 +30,7 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
         request.state.auth_status = {"is_authorized": True, "error": None}
         request.state.current_user = None
 
-        if request.url.path in settings_core.UNPROTECTED_ENDPOINTS:
+        if request.url.path in get_settings().UNPROTECTED_ENDPOINTS:
             return await call_next(request)
 
         token = await oauth2_scheme(request)
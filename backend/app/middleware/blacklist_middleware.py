@@ -5,25 +5,28 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 from jose import ExpiredSignatureError
 
-from backend.app.core.config import settings_core
+from backend.app.core.config import get_settings
 from backend.app.core.jwt import decode_access_token
 from backend.app.crud.authentication import is_token_revoked
 from backend.app.db.session import get_db
 from backend.app.services.logging_service import logger
+from backend.app.services.tracing_service import traced_middleware
 
 
+@traced_middleware
 class BlacklistMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, get_db_func=None):
         super().__init__(app)
         self.get_db_func = get_db_func or get_db
 
     async def dispatch(self, request: Request, call_next):
-        logger.debug(f"BlacklistMiddleware: Processing request to {request.url.path}")
+        logger.debug("BlacklistMiddleware: Processing request to %s", request.url.path)
 
         # Allow unprotected endpoints to pass through without token validation
-        if request.url.path in settings_core.UNPROTECTED_ENDPOINTS:
+        if request.url.path in get_settings().UNPROTECTED_ENDPOINTS:
             logger.debug(
-                f"BlacklistMiddleware: Allowing unprotected endpoint {request.url.path} to pass through"
+                "BlacklistMiddleware: Allowing unprotected endpoint %s to pass through",
+                request.url.path,
             )
             return await call_next(request)
 
@@ -39,7 +42,6 @@ class BlacklistMiddleware(BaseHTTPMiddleware):
 
                 # Use injected database function (supports test overrides)
                 db = next(self.get_db_func())
-                logger.debug(f"BlacklistMiddleware: Using database session: {db}")
                 try:
                     if is_token_revoked(db, token):
                         logger.warning("BlacklistMiddleware: Token has been revoked")
@@ -53,19 +55,22 @@ class BlacklistMiddleware(BaseHTTPMiddleware):
                     )
                 except HTTPException as middleware_http_exc:
                     # Re-raise HTTP exceptions from is_token_revoked (like "User not found")
-                    logger.error(f"BlacklistMiddleware: Token validation failed - {middleware_http_exc.detail}")
+                    logger.error(
+                        "BlacklistMiddleware: Token validation failed - %s",
+                        middleware_http_exc.detail,
+                    )
                     raise middleware_http_exc
                 finally:
                     db.close()
 
                 logger.debug("BlacklistMiddleware: Token is valid")
             except HTTPException as e:
-                logger.error(f"BlacklistMiddleware: HTTPException - {e.detail}")
+                logger.error("BlacklistMiddleware: HTTPException - %s", e.detail)
                 return JSONResponse(
                     status_code=e.status_code, content={"detail": e.detail}
                 )
             except Exception as e:
-                logger.error(f"BlacklistMiddleware: Unexpected error - {str(e)}")
+                logger.error("BlacklistMiddleware: Unexpected error - %s", e)
                 return JSONResponse(status_code=401, content={"detail": str(e)})
         else:
             logger.debug("BlacklistMiddleware: No Authorization header present")
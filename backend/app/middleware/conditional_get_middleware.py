@@ -0,0 +1,106 @@
+# filename: backend/app/middleware/conditional_get_middleware.py
+
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from backend.app.db.session import get_db
+from backend.app.services.logging_service import logger
+from backend.app.services.resource_version_service import (
+    read_resource_version_from_db,
+    resource_for_path,
+)
+from backend.app.services.tracing_service import traced_middleware
+
+
+def build_etag(resource: str, version: int, updated_at: Optional[datetime]) -> str:
+    # The timestamp keeps tags from different databases at the same version apart
+    stamp = int(updated_at.timestamp() * 1_000_000) if updated_at else 0
+    return f'W/"{resource}-{version}-{stamp:x}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified_since(if_modified_since: str, updated_at: Optional[datetime]) -> bool:
+    if updated_at is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP dates have one-second resolution
+    return updated_at.replace(microsecond=0) <= since
+
+
+@traced_middleware
+class ConditionalGetMiddleware(BaseHTTPMiddleware):
+    """
+    Answer GETs of versioned resources with 304 when the client's copy is current.
+
+    The resource's version is read before the route runs. A 304 is returned
+    without calling the route, so no rows are loaded or serialized; other
+    successful responses carry the ETag and Last-Modified validators. The
+    version is read first, so a write racing the route can only make a
+    validator older than the body, which costs the client one refetch.
+
+    Added before the authentication middleware, so it only sees requests
+    that passed authentication and authorization.
+    """
+
+    def __init__(self, app, get_db_func=None):
+        super().__init__(app)
+        self.get_db_func = get_db_func or get_db
+
+    async def dispatch(self, request: Request, call_next):
+        resource = resource_for_path(request.url.path)
+        if request.method != "GET" or resource is None:
+            return await call_next(request)
+
+        db = next(self.get_db_func())
+        try:
+            version, updated_at = read_resource_version_from_db(db, resource)
+        except SQLAlchemyError as e:
+            logger.warning(f"ConditionalGetMiddleware: Version lookup failed - {e}")
+            return await call_next(request)
+        finally:
+            db.close()
+
+        headers = {
+            "ETag": build_etag(resource, version, updated_at),
+            "Cache-Control": "private, no-cache",
+        }
+        if updated_at is not None:
+            headers["Last-Modified"] = format_datetime(updated_at, usegmt=True)
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            not_modified = etag_matches(if_none_match, headers["ETag"])
+        else:
+            if_modified_since = request.headers.get("if-modified-since")
+            not_modified = if_modified_since is not None and not_modified_since(
+                if_modified_since, updated_at
+            )
+        if not_modified:
+            logger.debug(f"ConditionalGetMiddleware: {request.url.path} not modified")
+            return Response(status_code=304, headers=headers)
+
+        response = await call_next(request)
+        if response.status_code == 200:
+            response.headers.update(headers)
+        return response
@@ -2,13 +2,21 @@
 
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.app.core.config import settings_core
+from backend.app.core.config import get_settings
+from backend.app.services.tracing_service import traced_middleware
+
+
+@traced_middleware
+class SettingsCORSMiddleware(CORSMiddleware):
+    # Starlette builds middleware on the app's first call (the lifespan
+    # startup), so the origins are read then rather than at import time
+    def __init__(self, app, **kwargs):
+        super().__init__(app, allow_origins=get_settings().CORS_ORIGINS, **kwargs)
 
 
 def add_cors_middleware(app):
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings_core.CORS_ORIGINS,
+        SettingsCORSMiddleware,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
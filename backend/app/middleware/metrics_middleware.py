@@ -0,0 +1,52 @@
+# filename: backend/app/middleware/metrics_middleware.py
+
+import time
+
+from backend.app.services.metrics_service import metrics, request_db_timer
+from backend.app.services.tracing_service import traced_middleware
+
+# Requests no route matched, including those rejected by the authentication
+# middleware before routing; a label per raw path would be unbounded
+UNMATCHED_ROUTE = "unmatched"
+
+
+@traced_middleware
+class MetricsMiddleware:
+    """
+    Records the count, status, latency and SQL time of every HTTP request.
+
+    A plain ASGI middleware rather than a BaseHTTPMiddleware, so it adds no
+    task or stream per request. Added last, it is the outermost layer and
+    its latency covers every other middleware. Requests are labelled with
+    their route's path template, which the router stores in the scope.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        db_timer = [0.0]
+        token = request_db_timer.set(db_timer)
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            request_db_timer.reset(token)
+            route = scope.get("route")
+            labels = (route.path if route is not None else UNMATCHED_ROUTE, scope["method"])
+            metrics.inc("http_requests_total", (*labels, str(status_code)))
+            metrics.observe("http_request_duration_seconds", labels, elapsed)
+            metrics.observe("http_request_db_seconds", labels, db_timer[0])
@@ -0,0 +1,50 @@
+# filename: backend/app/middleware/profiling_middleware.py
+
+import time
+
+from backend.app.services.profiler_service import request_profiler
+from backend.app.services.tracing_service import traced_middleware
+
+
+@traced_middleware
+class RequestProfilingMiddleware:
+    """
+    Captures a stack profile of requests matching the armed path pattern.
+
+    While request_profiler has no pattern armed, a request costs one
+    attribute check. A plain ASGI middleware, so it adds no task or stream
+    per request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or request_profiler.pattern is None:
+            await self.app(scope, receive, send)
+            return
+
+        sampler = request_profiler.begin(scope["path"])
+        if sampler is None:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            request_profiler.finish(
+                sampler,
+                scope["method"],
+                scope["path"],
+                status_code,
+                time.perf_counter() - started_at,
+            )
@@ -0,0 +1,17 @@
+# filename: backend/app/models/bootstrap_markers.py
+
+from sqlalchemy import Column, DateTime, String
+
+from backend.app.db.base import Base
+
+
+class BootstrapMarkerModel(Base):
+    __tablename__ = "bootstrap_markers"
+
+    # One row per startup task; the fingerprint identifies the data it seeded
+    name = Column(String(50), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<BootstrapMarkerModel(name='{self.name}', fingerprint='{self.fingerprint}')>"
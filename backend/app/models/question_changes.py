@@ -0,0 +1,18 @@
+# filename: backend/app/models/question_changes.py
+
+from sqlalchemy import Column, Integer
+
+from backend.app.db.base import Base
+
+
+class QuestionChangeModel(Base):
+    __tablename__ = "question_changes"
+
+    # One row per question changed by a commit, tagged with the "questions"
+    # version the commit bumped to; a NULL question_id means every question
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, index=True)
+    question_id = Column(Integer, nullable=True)
+
+    def __repr__(self):
+        return f"<QuestionChangeModel(version={self.version}, question_id={self.question_id})>"
@@ -0,0 +1,110 @@
+# filename: backend/app/models/question_search.py
+
+"""
+Full-text search index over question and answer choice text.
+
+On SQLite the index is an FTS5 virtual table, question_search, with one row per
+question (rowid = question id) holding the question text and the concatenated
+text and explanations of its answer choices. Triggers on questions,
+answer_choices and question_to_answer_association keep it in sync with every
+write, whether it comes from the ORM or from Core statements.
+
+On MariaDB/MySQL the server maintains FULLTEXT indexes on questions.text and
+answer_choices(text, explanation) instead, so no extra table is needed.
+
+The DDL is attached to Base.metadata, so create_all() builds the index along
+with the tables; the Alembic migration uses the same statements.
+"""
+
+from sqlalchemy import DDL, column, event, table
+
+from backend.app.db.base import Base
+
+QUESTION_SEARCH_TABLE = "question_search"
+
+# Lightweight handle for querying the virtual table; it is not part of the metadata
+question_search_table = table(
+    QUESTION_SEARCH_TABLE,
+    column("rowid"),
+    column("question_text"),
+    column("answer_text"),
+)
+
+
+def _insert_sql(question_ids_sql: str) -> str:
+    """Return an INSERT that indexes the selected questions and their answer choices."""
+    return f"""INSERT INTO {QUESTION_SEARCH_TABLE} (rowid, question_text, answer_text)
+    SELECT q.id, q.text, coalesce((
+        SELECT group_concat(a.text || ' ' || coalesce(a.explanation, ''), ' ')
+        FROM answer_choices a
+        JOIN question_to_answer_association qa ON qa.answer_choice_id = a.id
+        WHERE qa.question_id = q.id
+    ), '')
+    FROM questions q WHERE q.id IN ({question_ids_sql})"""
+
+
+def _reindex_sql(question_ids_sql: str) -> str:
+    """Return trigger statements that rebuild the index rows of the selected questions."""
+    return (
+        f"DELETE FROM {QUESTION_SEARCH_TABLE} WHERE rowid IN ({question_ids_sql}); "
+        f"{_insert_sql(question_ids_sql)};"
+    )
+
+
+SQLITE_SEARCH_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {QUESTION_SEARCH_TABLE}
+    USING fts5(question_text, answer_text, tokenize = 'porter unicode61')""",
+    f"""CREATE TRIGGER IF NOT EXISTS questions_search_ai AFTER INSERT ON questions
+    BEGIN {_reindex_sql("NEW.id")} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS questions_search_au AFTER UPDATE OF text ON questions
+    BEGIN {_reindex_sql("NEW.id")} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS questions_search_ad AFTER DELETE ON questions
+    BEGIN DELETE FROM {QUESTION_SEARCH_TABLE} WHERE rowid = OLD.id; END""",
+    f"""CREATE TRIGGER IF NOT EXISTS question_answers_search_ai
+    AFTER INSERT ON question_to_answer_association
+    BEGIN {_reindex_sql("NEW.question_id")} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS question_answers_search_ad
+    AFTER DELETE ON question_to_answer_association
+    BEGIN {_reindex_sql("OLD.question_id")} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS answer_choices_search_au
+    AFTER UPDATE OF text, explanation ON answer_choices
+    BEGIN {_reindex_sql(
+        "SELECT question_id FROM question_to_answer_association "
+        "WHERE answer_choice_id = NEW.id"
+    )} END""",
+]
+
+SQLITE_SEARCH_DROP_DDL = [f"DROP TABLE IF EXISTS {QUESTION_SEARCH_TABLE}"]
+
+# Rebuilds every row; used after bulk loads and by the migration
+SQLITE_SEARCH_BACKFILL_SQL = [
+    f"DELETE FROM {QUESTION_SEARCH_TABLE}",
+    _insert_sql("SELECT id FROM questions"),
+]
+
+MYSQL_SEARCH_DDL = [
+    "CREATE FULLTEXT INDEX ft_questions_text ON questions (text)",
+    "CREATE FULLTEXT INDEX ft_answer_choices_text ON answer_choices (text, explanation)",
+]
+
+
+def _is_sqlite(ddl, target, bind, **kw):
+    return bind.dialect.name == "sqlite"
+
+
+def _is_mysql(ddl, target, bind, **kw):
+    return bind.dialect.name in ("mysql", "mariadb")
+
+
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        Base.metadata, "after_create", DDL(statement).execute_if(callable_=_is_sqlite)
+    )
+for statement in SQLITE_SEARCH_DROP_DDL:
+    event.listen(
+        Base.metadata, "before_drop", DDL(statement).execute_if(callable_=_is_sqlite)
+    )
+for statement in MYSQL_SEARCH_DDL:
+    event.listen(
+        Base.metadata, "after_create", DDL(statement).execute_if(callable_=_is_mysql)
+    )
@@ -0,0 +1,55 @@
+# filename: backend/app/models/quiz_sessions.py
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from backend.app.db.base import Base
+
+
+class QuizSessionModel(Base):
+    __tablename__ = "quiz_sessions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    question_set_id = Column(
+        Integer,
+        ForeignKey("question_sets.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    seed = Column(Integer, nullable=False)
+    question_count = Column(Integer, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    # Relationships
+    user = relationship("UserModel")
+    question_set = relationship("QuestionSetModel")
+    questions = relationship(
+        "QuizSessionQuestionModel",
+        order_by="QuizSessionQuestionModel.position",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    def __repr__(self):
+        return f"<QuizSessionModel(id={self.id}, user_id={self.user_id}, question_set_id={self.question_set_id}, seed={self.seed}, question_count={self.question_count})>"
+
+
+class QuizSessionQuestionModel(Base):
+    __tablename__ = "quiz_session_questions"
+
+    quiz_session_id = Column(
+        Integer, ForeignKey("quiz_sessions.id", ondelete="CASCADE"), primary_key=True
+    )
+    position = Column(Integer, primary_key=True)
+    question_id = Column(
+        Integer, ForeignKey("questions.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    def __repr__(self):
+        return f"<QuizSessionQuestionModel(quiz_session_id={self.quiz_session_id}, position={self.position}, question_id={self.question_id})>"
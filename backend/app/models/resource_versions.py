@@ -0,0 +1,17 @@
+# filename: backend/app/models/resource_versions.py
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from backend.app.db.base import Base
+
+
+class ResourceVersionModel(Base):
+    __tablename__ = "resource_versions"
+
+    # One row per API resource; bumped in the transaction of every write to it
+    resource = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<ResourceVersionModel(resource='{self.resource}', version={self.version})>"
@@ -0,0 +1,27 @@
+# filename: backend/app/models/taxonomy_closure.py
+
+from sqlalchemy import Column, Index, Integer, String
+
+from backend.app.db.base import Base
+
+
+class TaxonomyClosureModel(Base):
+    __tablename__ = "taxonomy_closure"
+
+    # Node ids refer to the table named by the level, so there are no foreign keys
+    ancestor_level = Column(String(20), primary_key=True)
+    ancestor_id = Column(Integer, primary_key=True)
+    descendant_level = Column(String(20), primary_key=True)
+    descendant_id = Column(Integer, primary_key=True)
+    depth = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_taxonomy_closure_descendant",
+            "descendant_level",
+            "descendant_id",
+        ),
+    )
+
+    def __repr__(self):
+        return f"<TaxonomyClosureModel(ancestor={self.ancestor_level}:{self.ancestor_id}, descendant={self.descendant_level}:{self.descendant_id}, depth={self.depth})>"
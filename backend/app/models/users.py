@@ -1,7 +1,7 @@
 # filename: backend/app/models/users.py
 
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 
 from backend.app.db.base import Base
@@ -13,6 +13,9 @@ class UserModel(Base):
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, unique=True, index=True, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
+    # Lowercased copies for case-insensitive lookups through a plain index
+    username_lower = Column(String, unique=True, index=True, nullable=False)
+    email_lower = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
     is_admin = Column(Boolean, default=False)
@@ -38,5 +41,10 @@ class UserModel(Base):
     )
     created_questions = relationship("QuestionModel", back_populates="creator")
 
+    @validates("username", "email")
+    def sync_lowercase_columns(self, key, value):
+        setattr(self, f"{key}_lower", value.lower() if value is not None else None)
+        return value
+
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', email='{self.email}', role_id='{self.role_id}')>"
@@ -1,8 +1,8 @@
 # filename: backend/app/schemas/filters.py
 
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator, validator
 
 from backend.app.schemas.questions import DifficultyLevel
 
@@ -23,6 +23,12 @@ class FilterParamsSchema(BaseModel):
     question_tags: Optional[List[str]] = Field(
         None, max_items=10, description="Filter questions by tags"
     )
+    ancestor_level: Optional[
+        Literal["domains", "disciplines", "subjects", "topics", "subtopics", "concepts"]
+    ] = Field(None, description="Taxonomy level of the ancestor node to filter under")
+    ancestor_id: Optional[int] = Field(
+        None, gt=0, description="Filter questions under this taxonomy node"
+    )
 
     @validator("question_tags")
     def validate_question_tags(cls, v):
@@ -30,6 +36,12 @@ class FilterParamsSchema(BaseModel):
             return [tag.lower() for tag in v]
         return v
 
+    @model_validator(mode="after")
+    def check_ancestor_pair(self):
+        if (self.ancestor_level is None) != (self.ancestor_id is None):
+            raise ValueError("ancestor_level and ancestor_id must be provided together")
+        return self
+
     class Config:
         extra = "forbid"
         json_schema_extra = {
@@ -39,5 +51,26 @@ class FilterParamsSchema(BaseModel):
                 "subtopic": "Linear Equations",
                 "difficulty": "Easy",
                 "question_tags": ["equations", "solving"],
+                "ancestor_level": "disciplines",
+                "ancestor_id": 1,
             }
         }
+
+
+class FacetCountSchema(BaseModel):
+    id: int
+    name: str
+    count: int = Field(..., ge=0, description="Number of matching questions")
+
+
+class DifficultyFacetCountSchema(BaseModel):
+    difficulty: DifficultyLevel
+    count: int = Field(..., ge=0, description="Number of matching questions")
+
+
+class QuestionFacetsSchema(BaseModel):
+    total: int = Field(..., ge=0, description="Number of questions matching the filters")
+    difficulty: List[DifficultyFacetCountSchema]
+    subjects: List[FacetCountSchema]
+    topics: List[FacetCountSchema]
+    question_tags: List[FacetCountSchema]
@@ -0,0 +1,20 @@
+# filename: backend/app/schemas/projections.py
+
+from typing import Any, List, Tuple
+
+
+def project_related_items(value: Any, fields: Tuple[str, ...]) -> List[dict]:
+    """
+    Convert related ORM objects to dictionaries holding only the given fields.
+
+    Dictionaries are passed through unchanged, so responses built by the
+    projection queries in crud_question_projections skip this work entirely.
+    Only the named attributes are read, so no other column or relationship is
+    loaded.
+    """
+    if not value:
+        return []
+    return [
+        item if isinstance(item, dict) else {field: getattr(item, field) for field in fields}
+        for item in value
+    ]
@@ -5,6 +5,15 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from backend.app.schemas.projections import project_related_items
+
+
+# The fields serialized for each related collection of a question set
+RELATED_ITEM_FIELDS = {
+    "questions": ("id", "text"),
+    "groups": ("id", "name"),
+}
+
 
 class QuestionSetBaseSchema(BaseModel):
     name: str = Field(
@@ -78,20 +87,8 @@ class QuestionSetSchema(QuestionSetBaseSchema):
 
     @field_validator("questions", "groups", mode="before")
     @classmethod
-    def convert_to_dict(cls, v):
-        if v is None:
-            return []
-        if isinstance(v, list) and all(isinstance(item, dict) for item in v):
-            return v
-        result = []
-        for item in v:
-            item_dict = {"id": item.id}
-            if hasattr(item, "name"):
-                item_dict["name"] = item.name
-            elif hasattr(item, "text"):
-                item_dict["text"] = item.text
-            result.append(item_dict)
-        return result
+    def convert_to_dict(cls, v, info):
+        return project_related_items(v, RELATED_ITEM_FIELDS[info.field_name])
 
     class Config:
         from_attributes = True
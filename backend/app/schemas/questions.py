@@ -1,6 +1,6 @@
 # filename: backend/app/schemas/questions.py
 
-from typing import List, Optional, Any
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field, validator, field_validator
 
@@ -9,10 +9,22 @@ from backend.app.schemas.answer_choices import (
     AnswerChoiceCreateSchema,
     AnswerChoiceSchema,
 )
+from backend.app.schemas.projections import project_related_items
 from backend.app.schemas.question_sets import QuestionSetCreateSchema
 from backend.app.schemas.question_tags import QuestionTagCreateSchema
 
 
+# The fields serialized for each related collection of a question
+RELATED_ITEM_FIELDS = {
+    "subjects": ("id", "name"),
+    "topics": ("id", "name"),
+    "subtopics": ("id", "name"),
+    "concepts": ("id", "name"),
+    "question_tags": ("id", "tag", "description"),
+    "question_sets": ("id", "name"),
+}
+
+
 class QuestionBaseSchema(BaseModel):
     text: str = Field(
         ..., min_length=1, max_length=10000, description="The text of the question"
@@ -163,25 +175,11 @@ class DetailedQuestionSchema(BaseModel):
     class Config:
         from_attributes = True
 
-    @field_validator('subjects', 'topics', 'subtopics', 'concepts', 'question_tags', 'question_sets', mode='before')
+    @field_validator(*RELATED_ITEM_FIELDS, mode="before")
     @classmethod
-    def convert_sqlalchemy_objects_to_dicts(cls, value: Any) -> List[dict]:
-        """Convert SQLAlchemy objects to dictionaries for JSON serialization."""
-        if not value:
-            return []
-        
-        result = []
-        for item in value:
-            if hasattr(item, '__dict__'):
-                # Convert SQLAlchemy object to dict, excluding private attributes
-                item_dict = {k: v for k, v in item.__dict__.items() if not k.startswith('_')}
-                result.append(item_dict)
-            elif isinstance(item, dict):
-                result.append(item)
-            else:
-                # Fallback for other types
-                result.append({'id': getattr(item, 'id', None), 'name': getattr(item, 'name', str(item))})
-        return result
+    def convert_sqlalchemy_objects_to_dicts(cls, value: Any, info) -> List[dict]:
+        """Project related SQLAlchemy objects onto the fields listed for them."""
+        return project_related_items(value, RELATED_ITEM_FIELDS[info.field_name])
 
 
 class QuestionWithAnswersCreateSchema(QuestionCreateSchema):
@@ -197,3 +195,30 @@ class QuestionWithAnswersReplaceSchema(QuestionReplaceSchema):
     new_answer_choices: Optional[List[AnswerChoiceCreateSchema]] = Field(
         None, description="New answer choices to create"
     )
+
+
+class QuestionBulkCreateSchema(QuestionCreateSchema):
+    answer_choices: List[AnswerChoiceCreateSchema] = Field(
+        default_factory=list, description="New answer choices to create"
+    )
+
+
+class QuestionBulkUpdateSchema(QuestionUpdateSchema):
+    id: int = Field(..., description="The ID of the question to update")
+    new_answer_choices: Optional[List[AnswerChoiceCreateSchema]] = Field(
+        None, description="New answer choices to create"
+    )
+
+
+class QuestionBulkErrorSchema(BaseModel):
+    index: int = Field(..., description="Position of the failed item in the request")
+    detail: str = Field(..., description="Why the item was not processed")
+
+
+class QuestionBulkResultSchema(BaseModel):
+    questions: List[DetailedQuestionSchema] = Field(
+        ..., description="The questions that were processed successfully"
+    )
+    errors: List[QuestionBulkErrorSchema] = Field(
+        default_factory=list, description="Items that failed in lenient mode"
+    )
@@ -0,0 +1,74 @@
+# filename: backend/app/schemas/quiz_sessions.py
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from backend.app.core.config import DifficultyLevel
+from backend.app.schemas.questions import DetailedQuestionSchema
+
+MAX_QUIZ_SESSION_QUESTIONS = 500
+MAX_QUIZ_SESSION_SEED = 2**31 - 1
+
+
+class QuizSessionCreateSchema(BaseModel):
+    question_count: int = Field(
+        ...,
+        gt=0,
+        le=MAX_QUIZ_SESSION_QUESTIONS,
+        description="The number of questions to draw",
+    )
+    seed: Optional[int] = Field(
+        None,
+        ge=0,
+        le=MAX_QUIZ_SESSION_SEED,
+        description="Seed for the draw; a random one is chosen if omitted",
+    )
+    question_set_id: Optional[int] = Field(
+        None, gt=0, description="Only draw questions from this question set"
+    )
+    subject_ids: Optional[List[int]] = Field(
+        None, description="Only draw questions linked to one of these subjects"
+    )
+    topic_ids: Optional[List[int]] = Field(
+        None, description="Only draw questions linked to one of these topics"
+    )
+    subtopic_ids: Optional[List[int]] = Field(
+        None, description="Only draw questions linked to one of these subtopics"
+    )
+    concept_ids: Optional[List[int]] = Field(
+        None, description="Only draw questions linked to one of these concepts"
+    )
+    question_tag_ids: Optional[List[int]] = Field(
+        None, description="Only draw questions linked to one of these tags"
+    )
+    difficulties: Optional[List[DifficultyLevel]] = Field(
+        None, description="Only draw questions with one of these difficulty levels"
+    )
+    stratify_by_difficulty: bool = Field(
+        True,
+        description="Keep the difficulty mix of the draw proportional to the pool",
+    )
+
+
+class QuizSessionSchema(BaseModel):
+    id: int
+    user_id: int
+    question_set_id: Optional[int]
+    seed: int
+    question_count: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class QuizSessionPageSchema(BaseModel):
+    quiz_session_id: int
+    page: int
+    page_size: int
+    total: int = Field(..., description="The number of questions in the session")
+    questions: List[DetailedQuestionSchema] = Field(
+        ..., description="The questions on this page, in session order"
+    )
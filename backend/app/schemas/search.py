@@ -0,0 +1,29 @@
+# filename: backend/app/schemas/search.py
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from backend.app.schemas.questions import DetailedQuestionSchema
+
+
+class QuestionSearchResultSchema(BaseModel):
+    question: DetailedQuestionSchema
+    score: float = Field(..., description="Relevance of the match, higher is better")
+    highlighted_text: str = Field(
+        ..., description="The HTML-escaped question text with matches wrapped in <mark> tags"
+    )
+    answer_snippet: Optional[str] = Field(
+        None,
+        description="An HTML-escaped excerpt of the matching answer text, if the answers matched",
+    )
+
+    class Config:
+        from_attributes = True
+
+
+class QuestionSearchResultsSchema(BaseModel):
+    query: str
+    skip: int
+    limit: int
+    results: List[QuestionSearchResultSchema]
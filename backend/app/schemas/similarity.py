@@ -0,0 +1,18 @@
+# filename: backend/app/schemas/similarity.py
+
+from pydantic import BaseModel, Field
+
+from backend.app.schemas.questions import DetailedQuestionSchema
+
+
+class SimilarQuestionSchema(BaseModel):
+    question: DetailedQuestionSchema
+    similarity: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Estimated Jaccard similarity of the two question texts",
+    )
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,334 @@
+# filename: backend/app/server.py
+
+"""
+This module is the production entry point: a pre-forking uvicorn server.
+
+The parent process imports the application once, binds the listening socket
+and forks the workers. Code and data loaded before the fork (the app, its
+routes and schemas, the configured SQLAlchemy mappers) are shared with every
+worker copy-on-write; gc.freeze() keeps the collector from touching, and so
+copying, those pages. Nothing that opens connections or starts threads runs
+in the parent: the engine, the log listener and the password hash pool are
+all created lazily inside each worker.
+
+Each worker runs the application's lifespan (the reference data bootstrap,
+the question filter index) and then warms the taxonomy cache before uvicorn
+starts accepting connections, so no request pays for a cold cache. Workers
+that die are replaced. The workers write their metrics to a shared
+directory, named by PROMETHEUS_MULTIPROC_DIR, so /metrics reports all of
+them; without the variable a temporary directory is used for the run.
+
+On SIGTERM or SIGINT the parent forwards SIGTERM to the workers. Each stops
+accepting connections, lets in-flight requests finish for up to
+--graceful-timeout seconds and runs the lifespan shutdown. Workers still
+running after that are killed.
+
+uvloop and httptools are used when installed, the asyncio loop and h11
+parser otherwise.
+
+Key dependencies:
+- uvicorn: For the per-worker server and socket binding
+- backend.app.main: For the application
+
+Main functions:
+- default_worker_count: The number of CPUs this process may run on
+- build_config: Builds the uvicorn config from the command line options
+- add_cache_warmup: Warms the worker caches at the end of the app's startup
+- prepare_metrics_directory: Sets up the directory the workers share metrics through
+- WorkerSupervisor: Forks, replaces and drains the workers
+- main: The command line entry point
+
+Usage example:
+    python -m backend.app.server --port 8000 --workers 4
+"""
+
+import argparse
+import gc
+import glob
+import importlib.util
+import logging
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI
+from sqlalchemy.orm import configure_mappers
+
+from backend.app.services.metrics_service import MULTIPROC_DIR_ENV
+
+DEFAULT_HOST = "0.0.0.0"
+DEFAULT_PORT = 8000
+# Longer than the usual 60 s load balancer idle timeout, so the balancer
+# always closes idle connections first and never reuses one we just closed
+DEFAULT_KEEP_ALIVE_SECONDS = 65
+# Connections the kernel queues while every worker is busy; capped by net.core.somaxconn
+DEFAULT_BACKLOG = 2048
+DEFAULT_GRACEFUL_TIMEOUT_SECONDS = 30
+# Seconds to wait before replacing a worker that died, so a crash loop cannot spin
+RESPAWN_DELAY_SECONDS = 1.0
+
+# The backend logger's handlers start a thread, which must not exist before
+# the fork; the parent logs through uvicorn's logger instead
+supervisor_logger = logging.getLogger("uvicorn.error")
+
+
+def default_worker_count() -> int:
+    """Return the number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS or Windows
+        return os.cpu_count() or 1
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the Quiz App API server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=default_worker_count(),
+        help="Worker processes (default: the number of available CPUs)",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=DEFAULT_KEEP_ALIVE_SECONDS,
+        help="Seconds to hold idle keep-alive connections open",
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=DEFAULT_BACKLOG,
+        help="Pending connections the listening socket queues",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=DEFAULT_GRACEFUL_TIMEOUT_SECONDS,
+        help="Seconds in-flight requests get to finish on shutdown",
+    )
+    parser.add_argument("--log-level", default="info")
+    return parser.parse_args(argv)
+
+
+def build_config(args: argparse.Namespace, app="backend.app.main:app") -> uvicorn.Config:
+    """
+    Build the uvicorn config from the command line options.
+
+    Args:
+        args (argparse.Namespace): The parsed command line options.
+        app: The application or its import string.
+
+    Returns:
+        uvicorn.Config: The config the workers are started with.
+    """
+    return uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        timeout_keep_alive=args.keep_alive,
+        backlog=args.backlog,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        log_level=args.log_level,
+        # The workers sit behind a proxy that sets these headers
+        proxy_headers=True,
+    )
+
+
+def warm_caches() -> None:
+    """Load the caches the first requests would otherwise build."""
+    from backend.app.db.session import get_db
+    from backend.app.services.taxonomy_service import taxonomy_cache
+
+    db_generator = get_db()
+    db = next(db_generator)
+    try:
+        taxonomy_cache.get_graph(db)
+    finally:
+        db_generator.close()
+
+
+def add_cache_warmup(app: FastAPI) -> None:
+    """
+    Run warm_caches() at the end of the application's startup.
+
+    uvicorn accepts connections only once the lifespan startup completes, so
+    a worker never serves a request before its caches are loaded. The
+    lifespan itself already seeds the permissions and time periods and builds
+    the question filter index.
+
+    Args:
+        app (FastAPI): The application whose lifespan to extend.
+    """
+    lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan_with_warmup(app: FastAPI):
+        async with lifespan(app) as state:
+            warm_caches()
+            yield state
+
+    app.router.lifespan_context = lifespan_with_warmup
+
+
+class WorkerSupervisor:
+    """
+    Forks the worker processes and keeps them running until shutdown.
+
+    Every worker serves the same listening socket; the kernel hands each new
+    connection to one of the workers waiting in accept().
+    """
+
+    def __init__(self, config: uvicorn.Config, sock: socket.socket, workers: int):
+        self.config = config
+        self.sock = sock
+        self.worker_count = workers
+        self.workers: Dict[int, int] = {}  # pid -> worker number
+        self.should_exit = False
+        self.shutdown_deadline: Optional[float] = None
+
+    def spawn_worker(self, number: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            # uvicorn installs its own handlers; drop the parent's meanwhile
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            exit_code = 0
+            try:
+                uvicorn.Server(self.config).run(sockets=[self.sock])
+            except BaseException:
+                supervisor_logger.exception("Worker %s crashed", number)
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        self.workers[pid] = number
+        supervisor_logger.info("Started worker %s (pid %s)", number, pid)
+
+    def handle_exit(self, signum, frame) -> None:
+        if self.should_exit:
+            return
+        self.should_exit = True
+        self.shutdown_deadline = time.monotonic() + self.config.timeout_graceful_shutdown + 5
+        supervisor_logger.info(
+            "Received %s, draining %s workers",
+            signal.Signals(signum).name,
+            len(self.workers),
+        )
+        self.signal_workers(signal.SIGTERM)
+
+    def signal_workers(self, signum: int) -> None:
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                self.workers.pop(pid, None)
+
+    def reap_workers(self) -> List[int]:
+        """Collect the workers that exited and return their numbers."""
+        exited = []
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.workers.clear()
+                break
+            if pid == 0:
+                break
+            number = self.workers.pop(pid, None)
+            if number is not None:
+                exited.append(number)
+                if not self.should_exit:
+                    supervisor_logger.warning(
+                        "Worker %s (pid %s) exited with status %s",
+                        number,
+                        pid,
+                        os.waitstatus_to_exitcode(status),
+                    )
+        return exited
+
+    def run(self) -> None:
+        """Fork the workers and supervise them until they have all exited."""
+        signal.signal(signal.SIGTERM, self.handle_exit)
+        signal.signal(signal.SIGINT, self.handle_exit)
+        for number in range(self.worker_count):
+            self.spawn_worker(number)
+
+        while self.workers:
+            exited = self.reap_workers()
+            if self.should_exit:
+                if self.workers and time.monotonic() > self.shutdown_deadline:
+                    supervisor_logger.warning(
+                        "Killing %s workers still running", len(self.workers)
+                    )
+                    self.signal_workers(signal.SIGKILL)
+            elif exited:
+                time.sleep(RESPAWN_DELAY_SECONDS)
+                for number in exited:
+                    if not self.should_exit:
+                        self.spawn_worker(number)
+            time.sleep(0.1)
+
+        supervisor_logger.info("All workers stopped")
+
+
+def prepare_metrics_directory() -> Optional[str]:
+    """
+    Point the workers at an empty metrics directory.
+
+    Returns:
+        Optional[str]: The temporary directory created for this run, which
+            the caller removes, or None if PROMETHEUS_MULTIPROC_DIR was set.
+    """
+    directory = os.environ.get(MULTIPROC_DIR_ENV)
+    if directory:
+        # Snapshots from a previous run would be added to this run's totals
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, "metrics-*.json")):
+            os.remove(path)
+        return None
+    directory = tempfile.mkdtemp(prefix="quiz-app-metrics-")
+    os.environ[MULTIPROC_DIR_ENV] = directory
+    return directory
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    config = build_config(args)
+    temporary_metrics_directory = prepare_metrics_directory()
+
+    # Preload before forking so the workers share these pages
+    config.load()
+    from backend.app.main import app
+
+    add_cache_warmup(app)
+    configure_mappers()
+    gc.collect()
+    gc.freeze()
+
+    sock = config.bind_socket()
+    supervisor_logger.info(
+        "Serving on %s:%s with %s workers (%s loop, %s parser)",
+        args.host,
+        args.port,
+        args.workers,
+        config.loop,
+        config.http,
+    )
+    WorkerSupervisor(config, sock, args.workers).run()
+    sock.close()
+    if temporary_metrics_directory is not None:
+        shutil.rmtree(temporary_metrics_directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
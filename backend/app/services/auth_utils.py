@@ -63,3 +63,16 @@ def get_current_user_or_error(request: Request):
             headers={"WWW-Authenticate": "Bearer"},
         )
     return request.state.current_user
+
+
+def get_current_admin_or_error(request: Request):
+    """
+    Get the current user from the request state, raising a 403 HTTP exception if they are not an admin.
+    """
+    current_user = get_current_user_or_error(request)
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admin users can use this endpoint",
+        )
+    return current_user
@@ -1,30 +1,91 @@
 # filename: backend/app/services/authentication_service.py
 
+from typing import Optional
+
+from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
 
-from backend.app.core.security import verify_password
+from backend.app.core.security import (
+    PasswordHashingBusyError,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
+)
 from backend.app.crud.authentication import revoke_all_tokens_for_user
-from backend.app.crud.crud_user import read_user_by_username_from_db
+from backend.app.crud.crud_user import (
+    read_user_by_username_from_db,
+    update_user_password_hash_in_db,
+)
+from backend.app.db.session import SessionLocal
 from backend.app.models.users import UserModel
+from backend.app.services.logging_service import logger
 
 
-def authenticate_user(db: Session, username: str, password: str = None) -> UserModel:
+async def authenticate_user(
+    db: Session,
+    username: str,
+    password: str = None,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> UserModel:
+    # bcrypt runs on the password hash pool so logins do not block the event loop
     user = read_user_by_username_from_db(db, username)
 
     if not user:
         return False
 
     if password is not None:
-        verification_result = verify_password(password, user.hashed_password)
+        verification_result = await verify_password_async(
+            password, user.hashed_password
+        )
         if not verification_result:
             return False
 
     if not user.is_active:
         return False
 
+    # The password is only known now, so this is when an outdated hash can be
+    # upgraded; with background_tasks the upgrade runs after the response
+    if password is not None and password_needs_rehash(user.hashed_password):
+        if background_tasks is not None:
+            background_tasks.add_task(
+                rehash_user_password, db, user.id, user.hashed_password, password
+            )
+        else:
+            await rehash_user_password(db, user.id, user.hashed_password, password)
+
     return user
 
 
+async def rehash_user_password(
+    db: Session, user_id: int, old_hash: str, password: str
+) -> None:
+    """
+    Store a hash of a user's password made with the current bcrypt cost.
+
+    Runs as a background task after the response, when the request's session
+    has been closed, so the hash is written through a fresh session on the
+    same bind. If the hash pool is busy the upgrade is skipped; the user's
+    next login retries it.
+
+    Args:
+        db (Session): The request's database session; only its bind is used.
+        user_id (int): The ID of the user.
+        old_hash (str): The outdated hash; it is only replaced if still stored.
+        password (str): The user's verified plain-text password.
+
+    Returns:
+        None
+    """
+    try:
+        new_hash = await get_password_hash_async(password)
+    except PasswordHashingBusyError:
+        logger.debug("Hash pool full, not upgrading password hash for user ID %s", user_id)
+        return
+    with SessionLocal(bind=db.get_bind()) as session:
+        if update_user_password_hash_in_db(session, user_id, old_hash, new_hash):
+            logger.debug("Upgraded password hash for user ID %s", user_id)
+
+
 def revoke_all_user_tokens(db: Session, user_id: int):
     """
     Revoke all tokens for a given user.
@@ -0,0 +1,281 @@
+# filename: backend/app/services/bitmap_service.py
+
+"""
+This module provides a compressed bitmap of non-negative integer ids.
+
+RoaringBitmap follows the Roaring layout: ids are split by their high 16 bits
+into containers of up to 65536 values. A sparse container is a sorted
+array('H') of the low 16 bits (2 bytes per id); once it holds more than
+ARRAY_CONTAINER_MAX values it becomes a 65536-bit Python int, on which AND,
+OR and population counts run in C. A bitmap of a million clustered question
+ids therefore costs ~128 KB whether it is sparse or dense, and intersecting
+two of them touches only the containers they share.
+
+Key dependencies:
+- array: For the sparse containers
+
+Main class:
+- RoaringBitmap: A compressed, ordered set of ids
+
+Usage example:
+    from backend.app.services.bitmap_service import RoaringBitmap
+
+    easy = RoaringBitmap([1, 2, 3, 70000])
+    algebra = RoaringBitmap([2, 3, 4])
+    page = (easy & algebra).page(skip=0, limit=10)  # [2, 3]
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+ARRAY_CONTAINER_MAX = 4096
+_LOW_BITS = 16
+_LOW_MASK = (1 << _LOW_BITS) - 1
+_BITSET_BYTES = (1 << _LOW_BITS) // 8
+
+Container = Union[array, int]
+
+
+def _array_to_bitset(values: Iterable[int]) -> int:
+    buffer = bytearray(_BITSET_BYTES)
+    for value in values:
+        buffer[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _bitset_values(bitset: int) -> Iterator[int]:
+    for byte_index, byte in enumerate(bitset.to_bytes(_BITSET_BYTES, "little")):
+        if byte:
+            base = byte_index << 3
+            for bit in range(8):
+                if byte >> bit & 1:
+                    yield base + bit
+
+
+def _cardinality(container: Container) -> int:
+    return container.bit_count() if isinstance(container, int) else len(container)
+
+
+def _normalize(bitset: int) -> Optional[Container]:
+    """Return the cheapest container for a bitset, or None when it is empty."""
+    count = bitset.bit_count()
+    if count == 0:
+        return None
+    if count <= ARRAY_CONTAINER_MAX:
+        return array("H", _bitset_values(bitset))
+    return bitset
+
+
+def _from_values(values: Iterable[int]) -> Optional[Container]:
+    values = sorted(set(values))
+    if not values:
+        return None
+    if len(values) <= ARRAY_CONTAINER_MAX:
+        return array("H", values)
+    return _array_to_bitset(values)
+
+
+def _and(first: Container, second: Container) -> Optional[Container]:
+    if isinstance(first, int) and isinstance(second, int):
+        return _normalize(first & second)
+    if isinstance(first, int):
+        first, second = second, first
+    if isinstance(second, int):
+        values = array("H", (value for value in first if second >> value & 1))
+    else:
+        if len(first) > len(second):
+            first, second = second, first
+        members = set(second)
+        values = array("H", (value for value in first if value in members))
+    return values or None
+
+
+def _and_cardinality(first: Container, second: Container) -> int:
+    if isinstance(first, int) and isinstance(second, int):
+        return (first & second).bit_count()
+    if isinstance(first, int):
+        first, second = second, first
+    if isinstance(second, int):
+        return sum(1 for value in first if second >> value & 1)
+    if len(first) > len(second):
+        first, second = second, first
+    members = set(second)
+    return sum(1 for value in first if value in members)
+
+
+def _or(first: Container, second: Container) -> Container:
+    if isinstance(first, int) or isinstance(second, int):
+        first = first if isinstance(first, int) else _array_to_bitset(first)
+        second = second if isinstance(second, int) else _array_to_bitset(second)
+        return first | second
+    return _from_values(set(first).union(second))
+
+
+def _container_values(container: Container) -> Iterator[int]:
+    if isinstance(container, int):
+        return _bitset_values(container)
+    return iter(container)
+
+
+class RoaringBitmap:
+    """A compressed, ordered set of non-negative integer ids."""
+
+    __slots__ = ("_containers",)
+
+    def __init__(self, values: Iterable[int] = ()):
+        grouped: Dict[int, List[int]] = {}
+        for value in values:
+            grouped.setdefault(value >> _LOW_BITS, []).append(value & _LOW_MASK)
+        self._containers: Dict[int, Container] = {}
+        for high in sorted(grouped):
+            self._containers[high] = _from_values(grouped[high])
+
+    @classmethod
+    def _from_containers(cls, containers: Dict[int, Container]) -> "RoaringBitmap":
+        bitmap = cls()
+        bitmap._containers = dict(sorted(containers.items()))
+        return bitmap
+
+    @classmethod
+    def union_all(cls, bitmaps: Iterable["RoaringBitmap"]) -> "RoaringBitmap":
+        """Return the union of several bitmaps."""
+        containers: Dict[int, Container] = {}
+        for bitmap in bitmaps:
+            for high, container in bitmap._containers.items():
+                existing = containers.get(high)
+                if existing is not None:
+                    containers[high] = _or(existing, container)
+                elif isinstance(container, int):
+                    containers[high] = container
+                else:
+                    # Array containers are mutable; the result must not share them
+                    containers[high] = array("H", container)
+        return cls._from_containers(containers)
+
+    def copy(self) -> "RoaringBitmap":
+        bitmap = RoaringBitmap()
+        bitmap._containers = {
+            high: container if isinstance(container, int) else array("H", container)
+            for high, container in self._containers.items()
+        }
+        return bitmap
+
+    def add(self, value: int) -> None:
+        high, low = value >> _LOW_BITS, value & _LOW_MASK
+        container = self._containers.get(high)
+        if container is None:
+            out_of_order = bool(self._containers) and high < next(
+                reversed(self._containers)
+            )
+            self._containers[high] = array("H", [low])
+            # Keep containers ordered by their high bits
+            if out_of_order:
+                self._containers = dict(sorted(self._containers.items()))
+        elif isinstance(container, int):
+            self._containers[high] = container | (1 << low)
+        else:
+            position = bisect_left(container, low)
+            if position < len(container) and container[position] == low:
+                return
+            container.insert(position, low)
+            if len(container) > ARRAY_CONTAINER_MAX:
+                self._containers[high] = _array_to_bitset(container)
+
+    def discard(self, value: int) -> None:
+        high, low = value >> _LOW_BITS, value & _LOW_MASK
+        container = self._containers.get(high)
+        if container is None:
+            return
+        if isinstance(container, int):
+            updated = _normalize(container & ~(1 << low))
+        else:
+            position = bisect_left(container, low)
+            if position < len(container) and container[position] == low:
+                del container[position]
+            updated = container or None
+        if updated is None:
+            del self._containers[high]
+        else:
+            self._containers[high] = updated
+
+    def __contains__(self, value: int) -> bool:
+        container = self._containers.get(value >> _LOW_BITS)
+        if container is None:
+            return False
+        low = value & _LOW_MASK
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        position = bisect_left(container, low)
+        return position < len(container) and container[position] == low
+
+    def __len__(self) -> int:
+        return sum(_cardinality(container) for container in self._containers.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._containers)
+
+    def __iter__(self) -> Iterator[int]:
+        for high, container in self._containers.items():
+            base = high << _LOW_BITS
+            for low in _container_values(container):
+                yield base + low
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"RoaringBitmap(<{len(self)} ids>)"
+
+    def __and__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        containers = {}
+        for high, container in self._containers.items():
+            other_container = other._containers.get(high)
+            if other_container is not None:
+                combined = _and(container, other_container)
+                if combined is not None:
+                    containers[high] = combined
+        return RoaringBitmap._from_containers(containers)
+
+    def __or__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        return RoaringBitmap.union_all([self, other])
+
+    def intersection_count(self, other: "RoaringBitmap") -> int:
+        """Return len(self & other) without building the intersection."""
+        return sum(
+            _and_cardinality(container, other._containers[high])
+            for high, container in self._containers.items()
+            if high in other._containers
+        )
+
+    def page(self, skip: int = 0, limit: Optional[int] = None) -> List[int]:
+        """
+        Return the ids at ascending positions skip .. skip + limit - 1.
+
+        Whole containers before the page are skipped by their cardinality,
+        so only the containers holding the page are decoded.
+        """
+        ids: List[int] = []
+        if limit is not None and limit <= 0:
+            return ids
+        for high, container in self._containers.items():
+            size = _cardinality(container)
+            if skip >= size:
+                skip -= size
+                continue
+            base = high << _LOW_BITS
+            if isinstance(container, int):
+                values: Iterable[int] = _bitset_values(container)
+            else:
+                values = container[skip:] if skip else container
+                skip = 0
+            for low in values:
+                if skip:
+                    skip -= 1
+                    continue
+                ids.append(base + low)
+                if limit is not None and len(ids) >= limit:
+                    return ids
+        return ids
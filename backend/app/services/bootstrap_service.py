@@ -0,0 +1,213 @@
+# filename: backend/app/services/bootstrap_service.py
+
+"""
+This module seeds the reference data every worker needs before serving.
+
+At startup the application must hold a permission for every route and a row
+for every TimePeriod. When many workers start at once they would all insert
+the same rows. Instead:
+
+1. A worker reads the "reference_data" bootstrap marker. If its fingerprint
+   matches the data this build needs, everything is in place and the worker
+   is done after one primary-key lookup; this is the normal rolling-restart
+   path.
+2. Otherwise the worker takes the bootstrap lock: a PostgreSQL advisory lock,
+   a MySQL/MariaDB named lock, or a file lock next to the system's temporary
+   files for SQLite and other databases. Workers arriving meanwhile wait; one
+   that gives up on the named lock after BOOTSTRAP_LOCK_TIMEOUT_SECONDS
+   carries on without it.
+3. Holding the lock it re-reads the marker, since the worker it waited for
+   has usually just finished. If the data is still missing, it issues one
+   insert-or-ignore per table and writes the marker in the same transaction.
+
+The inserts skip existing rows, so the data stays correct even without the
+lock (for example, workers on several hosts sharing a SQLite file, or a
+worker whose wait for the lock timed out). A
+database not yet migrated to the bootstrap_markers table is seeded on every
+start, as before.
+
+Key dependencies:
+- sqlalchemy: For the lock statements and the marker
+- backend.app.crud: For the permission and time period inserts
+
+Main functions:
+- reference_data_fingerprint: Identifies the reference data a build needs
+- bootstrap_reference_data_in_db: Makes sure the reference data exists
+
+Usage example:
+    from backend.app.services.bootstrap_service import bootstrap_reference_data_in_db
+
+    bootstrap_reference_data_in_db(db, generate_permissions(app))
+"""
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import TimePeriod
+from backend.app.crud.crud_permissions import create_missing_permissions_in_db
+from backend.app.crud.crud_time_period import create_missing_time_periods_in_db
+from backend.app.models.bootstrap_markers import BootstrapMarkerModel
+from backend.app.services.logging_service import logger
+
+REFERENCE_DATA_MARKER = "reference_data"
+# Advisory lock key on PostgreSQL and lock name on MySQL/MariaDB
+BOOTSTRAP_LOCK_KEY = 7315_0046
+BOOTSTRAP_LOCK_NAME = "quiz_app_bootstrap"
+BOOTSTRAP_LOCK_TIMEOUT_SECONDS = 60
+
+
+def reference_data_fingerprint(permissions: Iterable[str]) -> str:
+    """
+    Hash the permission names and time periods a build needs.
+
+    Args:
+        permissions (Iterable[str]): The permission names generated from the routes.
+
+    Returns:
+        str: A hex SHA-256 digest that changes whenever the data changes.
+    """
+    digest = hashlib.sha256()
+    for name in sorted(set(permissions)):
+        digest.update(f"permission:{name}\n".encode())
+    for time_period in TimePeriod:
+        digest.update(f"time_period:{time_period.value}:{time_period.name}\n".encode())
+    return digest.hexdigest()
+
+
+def _read_marker_fingerprint(db: Session) -> Optional[str]:
+    return db.scalar(
+        select(BootstrapMarkerModel.fingerprint).where(
+            BootstrapMarkerModel.name == REFERENCE_DATA_MARKER
+        )
+    )
+
+
+@contextmanager
+def _file_lock(path: str):
+    try:
+        import fcntl
+    except ImportError:  # No flock on this platform; the inserts still skip duplicates
+        yield
+        return
+    with open(path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@contextmanager
+def bootstrap_lock(connection: Connection):
+    """
+    Hold the bootstrap lock for the duration of the block.
+
+    Database locks are tied to the connection, so the caller must run the
+    whole bootstrap on the same connection.
+
+    Args:
+        connection (Connection): The connection the bootstrap runs on.
+    """
+    dialect_name = connection.dialect.name
+    if dialect_name == "postgresql":
+        connection.execute(
+            text("SELECT pg_advisory_lock(:key)"), {"key": BOOTSTRAP_LOCK_KEY}
+        )
+        try:
+            yield
+        finally:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": BOOTSTRAP_LOCK_KEY}
+            )
+    elif dialect_name in ("mysql", "mariadb"):
+        acquired = connection.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": BOOTSTRAP_LOCK_NAME, "timeout": BOOTSTRAP_LOCK_TIMEOUT_SECONDS},
+        ).scalar()
+        if acquired != 1:
+            # 0 is a timeout, NULL an error; the inserts still skip duplicates
+            logger.warning(
+                "Could not take the bootstrap lock within %s s; bootstrapping without it",
+                BOOTSTRAP_LOCK_TIMEOUT_SECONDS,
+            )
+            yield
+            return
+        try:
+            yield
+        finally:
+            connection.execute(
+                text("SELECT RELEASE_LOCK(:name)"), {"name": BOOTSTRAP_LOCK_NAME}
+            )
+    else:
+        database_key = hashlib.sha1(
+            connection.engine.url.render_as_string(hide_password=True).encode()
+        ).hexdigest()[:12]
+        path = os.path.join(
+            tempfile.gettempdir(), f"quiz-app-bootstrap-{database_key}.lock"
+        )
+        with _file_lock(path):
+            yield
+
+
+def bootstrap_reference_data_in_db(db: Session, permissions: Iterable[str]) -> bool:
+    """
+    Make sure the permissions and time periods exist, seeding them at most once.
+
+    Args:
+        db (Session): A database session; the bootstrap itself runs on its
+            own connection from the same engine.
+        permissions (Iterable[str]): The permission names generated from the routes.
+
+    Returns:
+        bool: True if this call inserted the data, False if the marker showed
+            it was already in place.
+
+    Usage example:
+        if bootstrap_reference_data_in_db(db, generate_permissions(app)):
+            logger.info("Seeded reference data")
+    """
+    permissions = set(permissions)
+    fingerprint = reference_data_fingerprint(permissions)
+    engine = db.get_bind().engine
+    has_marker = inspect(engine).has_table(BootstrapMarkerModel.__tablename__)
+    if not has_marker:
+        logger.warning(
+            "No %s table; run the migrations to seed reference data only once",
+            BootstrapMarkerModel.__tablename__,
+        )
+    elif _read_marker_fingerprint(db) == fingerprint:
+        logger.debug("Reference data already bootstrapped")
+        return False
+
+    with engine.connect() as connection, bootstrap_lock(connection):
+        # The lock statement began a transaction; a session joining it would
+        # never commit. Database locks are per connection, so they outlive it
+        connection.commit()
+        with Session(bind=connection) as session:
+            # The worker we waited for has usually just done the work
+            if has_marker and _read_marker_fingerprint(session) == fingerprint:
+                session.commit()
+                logger.debug("Reference data bootstrapped by another worker")
+                return False
+            create_missing_permissions_in_db(session, permissions)
+            create_missing_time_periods_in_db(session)
+            if has_marker:
+                session.merge(
+                    BootstrapMarkerModel(
+                        name=REFERENCE_DATA_MARKER,
+                        fingerprint=fingerprint,
+                        completed_at=datetime.now(timezone.utc),
+                    )
+                )
+            session.commit()
+
+    logger.info("Bootstrapped reference data (%s permissions)", len(permissions))
+    return True
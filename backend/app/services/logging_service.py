@@ -1,12 +1,70 @@
 # app/services/logging_service.py
 
+"""
+This module configures the application's "backend" logger.
+
+Records are written by a background thread: the logger's only handler is a
+QueueHandler that puts records on a bounded in-memory queue, and a
+QueueListener drains the queue into the rotating JSON log file (and the
+console, if enabled). A request thread never waits on disk I/O; if the
+listener falls so far behind that the queue is full, records are dropped and
+counted instead.
+
+Two filters run in the calling thread before a record is queued:
+- ModuleLevelFilter applies per-module levels, keyed by dotted module prefix
+- DebugSampleFilter keeps one in every N DEBUG records per call site
+
+Settings come from the [tool.app.logging] table of pyproject.toml:
+    log_file            the JSON log file
+    level_<environment> the default level, e.g. level_dev = "DEBUG"
+    debug_sample_rate   N for DebugSampleFilter; 1 keeps every record
+    queue_size          the queue bound
+    [tool.app.logging.modules]
+    "backend.app.middleware" = "INFO"
+
+Key dependencies:
+- logging.handlers: For QueueHandler, QueueListener and RotatingFileHandler
+- toml: For reading the logging settings
+
+Handlers are attached on first use of get_logger(), which the application's
+lifespan calls at startup. Until then `logger` has no handlers and only
+warnings reach stderr, so importing this module costs nothing.
+
+Main functions:
+- get_logger: Returns the logger, setting it up on first use
+- setup_logging: Builds the logger and starts the queue listener
+- sqlalchemy_obj_to_dict: Converts a model instance to a dict for logging
+
+Usage example:
+    from backend.app.services.logging_service import logger
+
+    logger.debug("Processing question %s", question_id)
+"""
+
+import atexit
+import itertools
+import json
 import logging
 import os
+import queue
 from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
 
+import toml
 from sqlalchemy.inspection import inspect
 
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+DEFAULT_LOG_FILE = "/var/log/quiz-app/backend/backend.log"
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "relativepath", "funcname", "taskName"}
+
 
 def sqlalchemy_obj_to_dict(obj, include_relationships=False):
     if obj is None:
@@ -33,6 +91,12 @@ def sqlalchemy_obj_to_dict(obj, include_relationships=False):
     return data
 
 
+def module_name_for_path(pathname: str) -> str:
+    """Return the dotted module name of a source file inside the project."""
+    relative_path = os.path.relpath(pathname, PROJECT_ROOT)
+    return os.path.splitext(relative_path)[0].replace(os.sep, ".")
+
+
 class UTCFormatter(logging.Formatter):
     def formatTime(self, record, datefmt=None):
         dt = datetime.fromtimestamp(record.created, tz=timezone.utc)
@@ -51,40 +115,174 @@ class UTCFormatter(logging.Formatter):
         return super().format(record)
 
 
+class JSONFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line."""
+
+    def format(self, record):
+        entry = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": module_name_for_path(record.pathname),
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+
+class ModuleLevelFilter(logging.Filter):
+    """
+    Applies a minimum level per module.
+
+    Modules are matched by the longest configured dotted prefix, so
+    "backend.app.middleware" covers every middleware module. Records from
+    other modules must reach the default level.
+    """
+
+    def __init__(self, default_level: int, module_levels: Dict[str, int]):
+        super().__init__()
+        self.default_level = default_level
+        self.module_levels = module_levels
+        self._levels_by_path: Dict[str, int] = {}
+
+    def level_for_path(self, pathname: str) -> int:
+        level = self._levels_by_path.get(pathname)
+        if level is None:
+            module = module_name_for_path(pathname)
+            matches = [
+                prefix
+                for prefix in self.module_levels
+                if module == prefix or module.startswith(prefix + ".")
+            ]
+            level = (
+                self.module_levels[max(matches, key=len)]
+                if matches
+                else self.default_level
+            )
+            self._levels_by_path[pathname] = level
+        return level
+
+    def filter(self, record):
+        return record.levelno >= self.level_for_path(record.pathname)
+
+
+class DebugSampleFilter(logging.Filter):
+    """
+    Keeps one in every `rate` DEBUG records per call site.
+
+    The first record from each call site is always kept. Records above DEBUG
+    are never sampled.
+    """
+
+    def __init__(self, rate: int):
+        super().__init__()
+        self.rate = max(rate, 1)
+        self._counters: Dict[tuple, itertools.count] = {}
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.rate == 1:
+            return True
+        site = (record.pathname, record.lineno)
+        counter = self._counters.get(site)
+        if counter is None:
+            counter = self._counters.setdefault(site, itertools.count())
+        return next(counter) % self.rate == 0
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """A QueueHandler that drops records instead of waiting on a full queue."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def load_logging_config() -> dict:
+    """Read the [tool.app.logging] table of pyproject.toml, or {} if absent."""
+    try:
+        return toml.load(os.path.join(PROJECT_ROOT, "pyproject.toml"))["tool"][
+            "app"
+        ].get("logging", {})
+    except (FileNotFoundError, KeyError):
+        return {}
+
+
+log_listener: Optional[QueueListener] = None
+
+
 def setup_logging(disable_logging=False, disable_cli_logging=False):
+    global log_listener
     logger_setup = logging.getLogger("backend")
 
     if disable_logging:
         logger_setup.disabled = True
         return logger_setup
 
-    logger_setup.setLevel(logging.DEBUG)
+    if log_listener is not None:
+        return logger_setup
 
-    # File Handler
-    log_file = "/var/log/quiz-app/backend/backend.log"
-    if not disable_logging:
-        handler = RotatingFileHandler(log_file, maxBytes=10485760, backupCount=10)
-    else:
-        handler = (
-            logging.NullHandler()
-        )  # Redirect logs to /dev/null if logging is disabled
+    config = load_logging_config()
+    environment = os.getenv("ENVIRONMENT", "dev")
+    default_level = logging.getLevelName(
+        config.get(f"level_{environment}", "INFO").upper()
+    )
+    module_levels = {
+        module: logging.getLevelName(level.upper())
+        for module, level in config.get("modules", {}).items()
+    }
+    # The logger passes the lowest configured level; the filter does the rest
+    logger_setup.setLevel(min([default_level, *module_levels.values()]))
 
-    handler.setLevel(logging.DEBUG)
-    formatter = UTCFormatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(relativepath)s - %(funcname)s - line %(lineno)d - %(message)s"
+    file_handler = RotatingFileHandler(
+        config.get("log_file", DEFAULT_LOG_FILE), maxBytes=10485760, backupCount=10
     )
-    handler.setFormatter(formatter)
-    logger_setup.addHandler(handler)
+    file_handler.setFormatter(JSONFormatter())
+    handlers = [file_handler]
 
     # CLI Handler
     if not disable_cli_logging:
         cli_handler = logging.StreamHandler()
-        cli_handler.setLevel(logging.DEBUG)
-        cli_handler.setFormatter(formatter)
-        logger_setup.addHandler(cli_handler)
+        cli_handler.setFormatter(
+            UTCFormatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(relativepath)s - %(funcname)s - line %(lineno)d - %(message)s"
+            )
+        )
+        handlers.append(cli_handler)
+
+    log_queue = queue.Queue(maxsize=config.get("queue_size", 10000))
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(ModuleLevelFilter(default_level, module_levels))
+    queue_handler.addFilter(DebugSampleFilter(config.get("debug_sample_rate", 1)))
+    logger_setup.addHandler(queue_handler)
+
+    log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    log_listener.start()
+    # Flush the records still queued when the process exits
+    atexit.register(log_listener.stop)
 
     return logger_setup
 
 
-# Example usage:
-logger = setup_logging(disable_logging=False, disable_cli_logging=True)
+@lru_cache(maxsize=None)
+def get_logger() -> logging.Logger:
+    """Return the "backend" logger, attaching its handlers on the first call."""
+    return setup_logging(disable_logging=False, disable_cli_logging=True)
+
+
+# Modules log through this object; get_logger() attaches its handlers
+logger = logging.getLogger("backend")
@@ -0,0 +1,460 @@
+# filename: backend/app/services/metrics_service.py
+
+"""
+This module collects runtime metrics and renders them in the Prometheus text format.
+
+Metrics are recorded into plain dicts in the current process; recording a
+request is a few dict updates and a bisect under an uncontended lock. Counters and
+histograms are declared up front in METRIC_DEFINITIONS with their label
+names, and recorded with a tuple of label values. Gauges and counters owned
+by other components (the connection pool, the password hash pool, the log
+queue) are read by collectors when the metrics are rendered.
+
+With several worker processes, each worker sees only its own requests. If
+the PROMETHEUS_MULTIPROC_DIR environment variable names a directory, every
+worker writes a snapshot of its metrics there every few seconds and at
+shutdown, and rendering sums the snapshots of all workers. Counters and
+histograms of workers that have exited are kept, so totals never go
+backwards; their gauges are dropped. backend.app.server sets the variable
+to a fresh directory when it starts.
+
+Key dependencies:
+- backend.app.db.session: For the connection pool collector
+- backend.app.core.security: For the password hash pool collector
+
+Main functions:
+- MetricsRegistry: Records counters and histograms and renders them
+- metrics: The process-wide registry
+- configure_metrics: Registers the collectors and starts snapshot writing
+- request_db_timer: Accumulates SQL time for the current request
+
+Usage example:
+    from backend.app.services.metrics_service import metrics
+
+    metrics.inc("cache_requests_total", ("taxonomy", "hit"))
+    metrics.observe("leaderboard_refresh_seconds", (), elapsed)
+"""
+
+import glob
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+SNAPSHOT_INTERVAL_SECONDS = 5.0
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# name -> (type, help, label names, histogram buckets)
+METRIC_DEFINITIONS: Dict[str, Tuple[str, str, Tuple[str, ...], Tuple[float, ...]]] = {
+    "http_requests_total": (
+        "counter",
+        "HTTP requests by route, method and status code",
+        ("route", "method", "status"),
+        (),
+    ),
+    "http_request_duration_seconds": (
+        "histogram",
+        "Time from receiving a request to sending its response",
+        ("route", "method"),
+        LATENCY_BUCKETS,
+    ),
+    "http_request_db_seconds": (
+        "histogram",
+        "Time a request spent executing SQL statements",
+        ("route", "method"),
+        DB_TIME_BUCKETS,
+    ),
+    "cache_requests_total": (
+        "counter",
+        "Cache lookups by cache and result (hit or miss)",
+        ("cache", "result"),
+        (),
+    ),
+    "leaderboard_refresh_seconds": (
+        "histogram",
+        "Time taken to recalculate and store leaderboard scores",
+        (),
+        LATENCY_BUCKETS,
+    ),
+    "db_pool_connections": (
+        "gauge",
+        "Database connections by state",
+        ("state",),
+        (),
+    ),
+    "password_hash_pending": (
+        "gauge",
+        "Password hashes queued or running",
+        (),
+        (),
+    ),
+    "password_hash_total": (
+        "counter",
+        "Password hashes by outcome (completed or rejected)",
+        ("outcome",),
+        (),
+    ),
+    "password_hash_queue_seconds_total": (
+        "counter",
+        "Time password hashes waited for a worker thread",
+        (),
+        (),
+    ),
+    "log_records_dropped_total": (
+        "counter",
+        "Log records dropped because the log queue was full",
+        (),
+        (),
+    ),
+}
+
+Labels = Tuple[str, ...]
+Sample = Tuple[str, Labels, float]
+
+
+class MetricsRegistry:
+    """
+    Holds the current process's counters and histograms.
+
+    A histogram is stored as a list of per-bucket counts followed by the sum
+    and the count of the observed values; buckets are made cumulative when
+    rendered. Values are recorded from the event loop and from the
+    threadpool that runs sync endpoints, so updates take a lock.
+    """
+
+    def __init__(self, definitions=METRIC_DEFINITIONS):
+        self.definitions = definitions
+        self.counters: Dict[str, Dict[Labels, float]] = {}
+        self.histograms: Dict[str, Dict[Labels, List[float]]] = {}
+        for name, (metric_type, _, _, _) in definitions.items():
+            if metric_type == "counter":
+                self.counters[name] = {}
+            elif metric_type == "histogram":
+                self.histograms[name] = {}
+        self.collectors: Dict[str, Callable[[], Iterable[Sample]]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, labels: Labels = (), amount: float = 1) -> None:
+        """Add amount to a counter."""
+        values = self.counters[name]
+        with self._lock:
+            values[labels] = values.get(labels, 0) + amount
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        """Record a value in a histogram."""
+        buckets = self.definitions[name][3]
+        # bisect_left puts a value equal to a bound in that bound's bucket
+        index = bisect_left(buckets, value)
+        with self._lock:
+            values = self.histograms[name].get(labels)
+            if values is None:
+                values = self.histograms[name][labels] = [0] * (len(buckets) + 3)
+            values[index] += 1
+            values[-2] += value
+            values[-1] += 1
+
+    def register_collector(self, key: str, collector: Callable[[], Iterable[Sample]]) -> None:
+        """
+        Register a function returning (name, labels, value) samples at render time.
+
+        Registering again under the same key replaces the collector.
+        """
+        self.collectors[key] = collector
+
+    def snapshot(self) -> dict:
+        """
+        Return the metrics of this process as JSON-serializable data.
+
+        Collected samples are split into counters, which are summed across
+        all processes that ever ran, and gauges, which only count while their
+        process is alive.
+        """
+        with self._lock:
+            counters = {
+                name: [[list(labels), value] for labels, value in values.items()]
+                for name, values in self.counters.items()
+            }
+            histograms = {
+                name: [[list(labels), list(values)] for labels, values in series.items()]
+                for name, series in self.histograms.items()
+            }
+        gauges: Dict[str, list] = {}
+        for collector in list(self.collectors.values()):
+            for name, labels, value in collector():
+                target = counters if self.definitions[name][0] == "counter" else gauges
+                target.setdefault(name, []).append([list(labels), value])
+        return {
+            "pid": os.getpid(),
+            "counters": counters,
+            "gauges": gauges,
+            "histograms": histograms,
+        }
+
+    def render(self, snapshots: Optional[List[dict]] = None) -> str:
+        """
+        Render metrics in the Prometheus text exposition format.
+
+        Args:
+            snapshots (Optional[List[dict]]): Snapshots to sum, as returned by
+                snapshot(); defaults to this process's snapshot.
+
+        Returns:
+            str: The exposition text.
+        """
+        if snapshots is None:
+            snapshots = [self.snapshot()]
+        totals: Dict[str, Dict[Labels, float]] = {}
+        histograms: Dict[str, Dict[Labels, List[float]]] = {}
+        for snapshot in snapshots:
+            for section in ("counters", "gauges"):
+                for name, samples in snapshot.get(section, {}).items():
+                    series = totals.setdefault(name, {})
+                    for labels, value in samples:
+                        series[tuple(labels)] = series.get(tuple(labels), 0) + value
+            for name, samples in snapshot.get("histograms", {}).items():
+                series = histograms.setdefault(name, {})
+                for labels, values in samples:
+                    current = series.get(tuple(labels))
+                    if current is None:
+                        series[tuple(labels)] = list(values)
+                    else:
+                        series[tuple(labels)] = [a + b for a, b in zip(current, values)]
+
+        lines = []
+        for name, (metric_type, help_text, label_names, buckets) in self.definitions.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            if metric_type == "histogram":
+                for labels, values in sorted(histograms.get(name, {}).items()):
+                    base = _format_labels(label_names, labels)
+                    cumulative = 0
+                    for bound, count in zip((*buckets, math.inf), values):
+                        cumulative += count
+                        bucket_labels = _format_labels(
+                            (*label_names, "le"), (*labels, _format_value(bound))
+                        )
+                        lines.append(f"{name}_bucket{bucket_labels} {_format_value(cumulative)}")
+                    lines.append(f"{name}_sum{base} {_format_value(values[-2])}")
+                    lines.append(f"{name}_count{base} {_format_value(values[-1])}")
+            else:
+                for labels, value in sorted(totals.get(name, {}).items()):
+                    lines.append(
+                        f"{name}{_format_labels(label_names, labels)} {_format_value(value)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Forget every recorded value; collectors stay registered."""
+        with self._lock:
+            for values in self.counters.values():
+                values.clear()
+            for values in self.histograms.values():
+                values.clear()
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+metrics = MetricsRegistry()
+
+
+# SQL time per request: the metrics middleware sets a one-item list, and the
+# cursor hooks add each statement's duration to it
+request_db_timer: ContextVar[Optional[List[float]]] = ContextVar(
+    "request_db_timer", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info["statement_started_at"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    # A statement that raised leaves its start behind; the next one overwrites it
+    started_at = conn.info.pop("statement_started_at", None)
+    timer = request_db_timer.get()
+    if timer is not None and started_at is not None:
+        timer[0] += time.perf_counter() - started_at
+
+
+def collect_db_pool() -> Iterable[Sample]:
+    from backend.app.db.session import get_engine
+
+    # Reading the pool must not be what creates the engine
+    if not get_engine.cache_info().currsize:
+        return []
+    pool = get_engine().pool
+    if not hasattr(pool, "checkedout"):
+        return []
+    return [
+        ("db_pool_connections", ("checked_out",), pool.checkedout()),
+        ("db_pool_connections", ("idle",), pool.checkedin()),
+        ("db_pool_connections", ("overflow",), max(pool.overflow(), 0)),
+    ]
+
+
+def collect_password_hash_pool() -> Iterable[Sample]:
+    from backend.app.core.security import get_password_hash_pool
+
+    pool_metrics = get_password_hash_pool().metrics()
+    return [
+        ("password_hash_pending", (), pool_metrics["pending"]),
+        ("password_hash_total", ("completed",), pool_metrics["completed"]),
+        ("password_hash_total", ("rejected",), pool_metrics["rejected"]),
+        (
+            "password_hash_queue_seconds_total",
+            (),
+            pool_metrics["queue_seconds_total"],
+        ),
+    ]
+
+
+def collect_log_queue() -> Iterable[Sample]:
+    from backend.app.services.logging_service import NonBlockingQueueHandler, logger
+
+    dropped = sum(
+        handler.dropped
+        for handler in logger.handlers
+        if isinstance(handler, NonBlockingQueueHandler)
+    )
+    return [("log_records_dropped_total", (), dropped)]
+
+
+class SnapshotWriter:
+    """Writes this process's snapshot to the multiprocess directory periodically."""
+
+    def __init__(self, registry: MetricsRegistry, directory: str):
+        self.registry = registry
+        self.directory = directory
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def path(self) -> str:
+        # The pid is read on every write: forked workers inherit this object
+        return os.path.join(self.directory, f"metrics-{os.getpid()}.json")
+
+    def write(self) -> None:
+        """Write the snapshot atomically, so readers never see a partial file."""
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as temp_file:
+            json.dump(self.registry.snapshot(), temp_file)
+        os.replace(temp_path, self.path)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-snapshot", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(SNAPSHOT_INTERVAL_SECONDS):
+            self.write()
+
+    def stop(self) -> None:
+        """Stop the thread and write a final snapshot."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.write()
+
+
+snapshot_writer: Optional[SnapshotWriter] = None
+
+
+def _process_is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_snapshots(directory: str) -> List[dict]:
+    """
+    Read the snapshots in a multiprocess directory.
+
+    The current process's snapshot is taken fresh rather than read from its
+    file. Gauges of processes that have exited are dropped.
+    """
+    snapshots = [metrics.snapshot()]
+    for path in glob.glob(os.path.join(directory, "metrics-*.json")):
+        try:
+            with open(path) as snapshot_file:
+                snapshot = json.load(snapshot_file)
+        except (OSError, ValueError):
+            continue
+        if snapshot["pid"] == os.getpid():
+            continue
+        if not _process_is_alive(snapshot["pid"]):
+            snapshot["gauges"] = {}
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def render_metrics() -> str:
+    """Render the metrics of every worker, or of this process if there is only one."""
+    if snapshot_writer is None:
+        return metrics.render()
+    return metrics.render(read_snapshots(snapshot_writer.directory))
+
+
+def configure_metrics() -> None:
+    """
+    Register the default collectors and, in multiprocess mode, start writing snapshots.
+
+    Called from the application's lifespan in every worker.
+    """
+    global snapshot_writer
+    metrics.register_collector("db_pool", collect_db_pool)
+    metrics.register_collector("password_hash_pool", collect_password_hash_pool)
+    metrics.register_collector("log_queue", collect_log_queue)
+
+    directory = os.getenv(MULTIPROC_DIR_ENV)
+    if directory and snapshot_writer is None:
+        snapshot_writer = SnapshotWriter(metrics, directory)
+    if snapshot_writer is not None:
+        snapshot_writer.start()
+
+
+def shutdown_metrics() -> None:
+    """Write the final snapshot of this process, if snapshots are enabled."""
+    if snapshot_writer is not None:
+        snapshot_writer.stop()
@@ -2,8 +2,8 @@
 
 from fastapi import FastAPI
 
-from backend.app.core.config import settings_core
-from backend.app.models.permissions import PermissionModel
+from backend.app.core.config import get_settings
+from backend.app.crud.crud_permissions import create_missing_permissions_in_db
 
 
 def generate_permissions(app: FastAPI):
@@ -22,7 +22,7 @@ def generate_permissions(app: FastAPI):
                     path = (
                         route.path.strip("/").replace("/", "_").replace("{", "").replace("}", "")
                     )
-                    if path not in settings_core.UNPROTECTED_ENDPOINTS:
+                    if path not in get_settings().UNPROTECTED_ENDPOINTS:
                         permission = f"{method_map[method]}_{path}"
                         permissions.add(permission)
 
@@ -30,10 +30,6 @@ def generate_permissions(app: FastAPI):
 
 
 def ensure_permissions_in_db(db, permissions):
-    existing_permissions = set(p.name for p in db.query(PermissionModel).all())
-    new_permissions = permissions - existing_permissions
-
-    for permission in new_permissions:
-        db.add(PermissionModel(name=permission))
-
+    # One insert-or-ignore for the whole set instead of loading every row
+    create_missing_permissions_in_db(db, permissions)
     db.commit()
@@ -0,0 +1,292 @@
+# filename: backend/app/services/profiler_service.py
+
+"""
+This module samples the running worker's Python stacks for flame graphs.
+
+A sampler thread reads the current frame of every other thread through
+sys._current_frames() at a fixed interval and counts each distinct stack.
+Nothing is attached to the threads being sampled, so the application runs at
+full speed and profiling can be switched on and off while it serves
+traffic; the only cost is the sampler thread itself. Threads that are
+waiting for work (idle pool threads, the event loop waiting in select) are
+left out.
+
+Profiles are returned in the collapsed-stack format read by flamegraph.pl,
+speedscope and most other flame graph tools: one line per stack, frames from
+the thread's outermost call to its innermost separated by ";", followed by
+the number of samples.
+
+Two kinds of profile are supported:
+- profile_process samples the whole worker for a number of seconds
+- request_profiler samples while requests whose path matches a pattern are
+  in flight, keeping the most recent captures; when no pattern is armed the
+  only cost per request is one attribute check
+
+Only one sampler runs at a time. Profiles describe the worker process that
+takes the request; with several workers, each is profiled separately.
+
+Key dependencies:
+- sys._current_frames: For reading the other threads' stacks
+
+Main functions:
+- StackSampler: Samples stacks on a background thread
+- profile_process: Profiles the worker for a number of seconds
+- request_profiler: The process-wide per-request profiler
+
+Usage example:
+    from backend.app.services.profiler_service import profile_process
+
+    collapsed = profile_process(seconds=30)
+"""
+
+import itertools
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional, Pattern
+
+from backend.app.services.logging_service import PROJECT_ROOT, module_name_for_path
+
+DEFAULT_INTERVAL_SECONDS = 0.01
+MAX_PROFILE_SECONDS = 300
+MAX_REQUEST_CAPTURES = 20
+
+# Innermost frames of threads blocked waiting for work, as (file, function)
+IDLE_FRAMES = frozenset(
+    {
+        ("threading.py", "wait"),
+        ("selectors.py", "select"),
+        ("queue.py", "get"),
+        ("thread.py", "_worker"),
+    }
+)
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a profile is requested while another one is running."""
+
+
+_sampler_lock = threading.Lock()
+_frame_labels: Dict[object, str] = {}
+
+
+def _frame_label(code) -> str:
+    label = _frame_labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        if filename.startswith(PROJECT_ROOT):
+            location = module_name_for_path(filename)
+        else:
+            location = os.path.basename(filename)
+        label = _frame_labels[code] = f"{code.co_name} ({location}:{code.co_firstlineno})"
+    return label
+
+
+class StackSampler:
+    """
+    Counts the stacks of the process's threads on a background thread.
+
+    Usage example:
+        sampler = StackSampler()
+        sampler.start()
+        ...
+        sampler.stop()
+        print(sampler.collapsed())
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        exclude_thread_ids: Optional[set] = None,
+        include_idle: bool = False,
+    ):
+        self.interval = interval
+        self.exclude_thread_ids = set(exclude_thread_ids or ())
+        self.include_idle = include_idle
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        """Record the current stack of every thread once."""
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id in self.exclude_thread_ids:
+                continue
+            code = frame.f_code
+            if (
+                not self.include_idle
+                and (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES
+            ):
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            labels.append(thread_names.get(thread_id, str(thread_id)))
+            self.stacks[";".join(reversed(labels))] += 1
+        self.samples += 1
+
+    def _run(self) -> None:
+        self.exclude_thread_ids.add(threading.get_ident())
+        next_sample = time.perf_counter()
+        while not self._stop.is_set():
+            self.sample()
+            next_sample += self.interval
+            self._stop.wait(max(next_sample - time.perf_counter(), 0))
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def collapsed(self) -> str:
+        """Return the counted stacks in the collapsed-stack format, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def profile_process(seconds: float, interval: float = DEFAULT_INTERVAL_SECONDS) -> str:
+    """
+    Sample every thread of this worker for a number of seconds.
+
+    Blocks the calling thread for the duration; the calling thread itself is
+    not sampled.
+
+    Args:
+        seconds (float): How long to sample, up to MAX_PROFILE_SECONDS.
+        interval (float, optional): Seconds between samples.
+
+    Returns:
+        str: The profile in the collapsed-stack format.
+
+    Raises:
+        ProfilerBusyError: If another profile is running.
+        ValueError: If seconds is out of range.
+    """
+    if not 0 < seconds <= MAX_PROFILE_SECONDS:
+        raise ValueError(f"seconds must be between 0 and {MAX_PROFILE_SECONDS}")
+    if not _sampler_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+    try:
+        sampler = StackSampler(interval, exclude_thread_ids={threading.get_ident()})
+        sampler.start()
+        try:
+            time.sleep(seconds)
+        finally:
+            sampler.stop()
+        return sampler.collapsed()
+    finally:
+        _sampler_lock.release()
+
+
+class RequestProfiler:
+    """
+    Samples stacks while requests matching a path pattern are in flight.
+
+    Armed with a regular expression and a request budget; each matching
+    request is sampled until the budget runs out. Samples cover every thread
+    of the worker, so requests served concurrently with a captured one show
+    up in its profile too. A matching request that arrives while another
+    profile is running is not captured.
+    """
+
+    def __init__(self, max_captures: int = MAX_REQUEST_CAPTURES):
+        self.pattern: Optional[Pattern] = None
+        self.remaining = 0
+        self.interval = DEFAULT_INTERVAL_SECONDS
+        self.captures: Deque[dict] = deque(maxlen=max_captures)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def arm(self, pattern: str, max_requests: int, interval: float = DEFAULT_INTERVAL_SECONDS) -> None:
+        """
+        Capture the next max_requests requests whose path matches pattern.
+
+        Raises:
+            re.error: If pattern is not a valid regular expression.
+        """
+        compiled = re.compile(pattern)
+        with self._lock:
+            self.interval = interval
+            self.remaining = max_requests
+            self.pattern = compiled
+
+    def disarm(self) -> None:
+        with self._lock:
+            self.pattern = None
+            self.remaining = 0
+
+    def begin(self, path: str) -> Optional[StackSampler]:
+        """Start sampling for a request if it should be captured, else return None."""
+        pattern = self.pattern
+        if pattern is None or not pattern.search(path):
+            return None
+        with self._lock:
+            if self.remaining <= 0:
+                return None
+            if not _sampler_lock.acquire(blocking=False):
+                return None
+            self.remaining -= 1
+            if self.remaining == 0:
+                self.pattern = None
+        sampler = StackSampler(self.interval)
+        sampler.start()
+        return sampler
+
+    def finish(
+        self, sampler: StackSampler, method: str, path: str, status_code: int, duration: float
+    ) -> dict:
+        """Stop a request's sampler and keep its capture."""
+        try:
+            sampler.stop()
+        finally:
+            _sampler_lock.release()
+        capture = {
+            "id": next(self._ids),
+            "pid": os.getpid(),
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "duration_ms": round(duration * 1000, 3),
+            "samples": sampler.samples,
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+            "collapsed": sampler.collapsed(),
+        }
+        self.captures.append(capture)
+        return capture
+
+    def get_capture(self, capture_id: int) -> Optional[dict]:
+        for capture in list(self.captures):
+            if capture["id"] == capture_id:
+                return capture
+        return None
+
+    def list_captures(self) -> List[dict]:
+        """Return the kept captures without their stacks, newest first."""
+        return [
+            {key: value for key, value in capture.items() if key != "collapsed"}
+            for capture in reversed(list(self.captures))
+        ]
+
+    def status(self) -> dict:
+        pattern = self.pattern
+        return {
+            "pid": os.getpid(),
+            "pattern": pattern.pattern if pattern is not None else None,
+            "remaining": self.remaining if pattern is not None else 0,
+            "interval_ms": self.interval * 1000,
+        }
+
+
+request_profiler = RequestProfiler()
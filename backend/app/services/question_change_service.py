@@ -0,0 +1,245 @@
+# filename: backend/app/services/question_change_service.py
+
+"""
+This module keeps a log of which questions each commit changed.
+
+The in-process question indexes (filtering, sampling, similarity) are
+validated against the "questions" row of resource_versions. A version that
+moved only says that something changed; this log says what. Every commit
+that bumps "questions" also inserts one question_changes row per changed
+question, tagged with the version it bumped to, so a worker whose index is
+at version V catches up to W by re-reading only the questions logged
+between them. The version row is locked from the bump to the commit, so
+versions are assigned in commit order and a reader that sees W sees every
+change up to W.
+
+Changes are collected on the session after every flush: questions that
+were added, modified or deleted, association rows linking a question to a
+subject, topic, subtopic, concept or tag, and questions added to or removed
+from a taxonomy node's or tag's questions collection. Deleting a node or a
+tag logs every question it was linked to, or a NULL question_id ("every
+question") when they are not known. Statements that bypass the unit of
+work, such as the Core writers of crud_associations, must call
+record_question_changes().
+
+Until the commit finishes, COMMITTED_CHANGES_KEY in session.info holds the
+version and the changed ids, so after_commit listeners can bring this
+worker's indexes up to date without reading the log back. Rows older than
+QUESTION_CHANGE_RETENTION versions are pruned; a worker that falls further
+behind rebuilds its index.
+
+Key dependencies:
+- sqlalchemy: For the session events and the log statements
+- backend.app.services.resource_version_service: For the version each commit bumps
+
+Main functions:
+- record_question_changes: Logs questions written without the ORM
+- has_uncommitted_question_changes: Tells whether a session has unlogged question writes
+- read_question_changes_since: Reads the ids changed between two versions
+
+Usage example:
+    from backend.app.services.question_change_service import (
+        read_question_changes_since,
+    )
+
+    changed_ids = read_question_changes_since(db, since=41, until=45)
+"""
+
+from itertools import chain
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import delete, event, inspect, insert, select
+from sqlalchemy.orm import Session
+
+from backend.app.models.associations import (
+    QuestionToConceptAssociation,
+    QuestionToSubjectAssociation,
+    QuestionToSubtopicAssociation,
+    QuestionToTagAssociation,
+    QuestionToTopicAssociation,
+)
+from backend.app.models.concepts import ConceptModel
+from backend.app.models.question_changes import QuestionChangeModel
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.models.questions import QuestionModel
+from backend.app.models.subjects import SubjectModel
+from backend.app.models.subtopics import SubtopicModel
+from backend.app.models.topics import TopicModel
+from backend.app.services.resource_version_service import BUMPED_VERSIONS_KEY
+
+# How many versions of changes are kept; older rows are pruned every
+# QUESTION_CHANGE_PRUNE_INTERVAL versions
+QUESTION_CHANGE_RETENTION = 10000
+QUESTION_CHANGE_PRUNE_INTERVAL = 1000
+
+# session.info keys: ids changed in the transaction, and (version, ids) once committed
+_PENDING_KEY = "question_changes_pending"
+COMMITTED_CHANGES_KEY = "question_changes_committed"
+
+_ASSOCIATION_MODELS = (
+    QuestionToSubjectAssociation,
+    QuestionToTopicAssociation,
+    QuestionToSubtopicAssociation,
+    QuestionToConceptAssociation,
+    QuestionToTagAssociation,
+)
+_VALUE_MODELS = (
+    SubjectModel,
+    TopicModel,
+    SubtopicModel,
+    ConceptModel,
+    QuestionTagModel,
+)
+_TRACKED_MODELS = (QuestionModel,) + _ASSOCIATION_MODELS + _VALUE_MODELS
+
+_change_table_exists: Dict[str, bool] = {}
+
+
+def _log_exists(db: Session) -> bool:
+    bind = db.get_bind()
+    url = str(bind.engine.url)
+    exists = _change_table_exists.get(url)
+    if exists is None:
+        # Checked once per database; only unmigrated databases lack the table
+        exists = _change_table_exists[url] = inspect(bind).has_table(
+            QuestionChangeModel.__tablename__
+        )
+    return exists
+
+
+def record_question_changes(db: Session, question_ids: Iterable[Optional[int]]) -> None:
+    """
+    Log questions written by statements that bypass the unit of work.
+
+    The ids are logged when the session commits, with the "questions"
+    version the commit bumps to.
+
+    Args:
+        db (Session): The session the statements were executed on.
+        question_ids (Iterable[Optional[int]]): The changed questions; None
+            stands for every question.
+
+    Usage example:
+        record_question_changes(db, [3, 7])
+    """
+    db.info.setdefault(_PENDING_KEY, set()).update(question_ids)
+
+
+def has_uncommitted_question_changes(db: Session) -> bool:
+    """
+    Tell whether a session has question writes that are not committed yet.
+
+    The in-process indexes hold committed data only, so a session that must
+    see its own pending writes should query the database instead.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        bool: True if questions were written since the last commit or rollback.
+    """
+    return bool(db.info.get(_PENDING_KEY)) or any(
+        isinstance(instance, _TRACKED_MODELS)
+        for instance in chain(db.new, db.dirty, db.deleted)
+    )
+
+
+def read_question_changes_since(
+    db: Session, since: int, until: int
+) -> Optional[Set[Optional[int]]]:
+    """
+    Read the ids of the questions changed after one version, up to another.
+
+    Args:
+        db (Session): The database session.
+        since (int): The version the caller is up to date with.
+        until (int): The version the caller is catching up to.
+
+    Returns:
+        Optional[Set[Optional[int]]]: The changed ids, including None when
+            every question changed, or None if the log cannot tell: the
+            table does not exist or the changes have been pruned.
+
+    Usage example:
+        changed_ids = read_question_changes_since(db, 41, 45)
+    """
+    if until - since > QUESTION_CHANGE_RETENTION or not _log_exists(db):
+        return None
+    return set(
+        db.scalars(
+            select(QuestionChangeModel.question_id)
+            .where(
+                QuestionChangeModel.version > since,
+                QuestionChangeModel.version <= until,
+            )
+            .distinct()
+        )
+    )
+
+
+def _question_ids_in_history(history) -> Iterable[int]:
+    return (
+        question.id
+        for question in chain(history.added or (), history.deleted or ())
+        if question.id is not None
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_questions(session: Session, flush_context) -> None:
+    changed: Set[Optional[int]] = set()
+    # new, dirty and deleted still describe the flushed changes at this point
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, QuestionModel):
+            changed.add(instance.id)
+        elif isinstance(instance, _ASSOCIATION_MODELS):
+            changed.add(instance.question_id)
+        elif isinstance(instance, _VALUE_MODELS):
+            questions = inspect(instance).attrs.questions
+            if instance not in session.deleted:
+                changed.update(_question_ids_in_history(questions.history))
+            elif isinstance(questions.loaded_value, list):
+                # Loaded by the flush to delete the association rows
+                changed.update(question.id for question in questions.loaded_value)
+            else:
+                changed.add(None)
+    if changed:
+        record_question_changes(session, changed)
+
+
+@event.listens_for(Session, "before_commit")
+def _log_changed_questions(session: Session) -> None:
+    # Registered after resource_version_service's listener, which has
+    # flushed the session and bumped the versions by now
+    if session.in_nested_transaction():
+        return
+    version = session.info.get(BUMPED_VERSIONS_KEY, {}).get("questions")
+    changed = session.info.pop(_PENDING_KEY, None) or set()
+    if version is None and not changed:
+        return
+    if version is not None and _log_exists(session):
+        # On the connection, so these statements do not trigger the hooks again
+        connection = session.connection()
+        if changed:
+            connection.execute(
+                insert(QuestionChangeModel),
+                [
+                    {"version": version, "question_id": question_id}
+                    for question_id in changed
+                ],
+            )
+        if version % QUESTION_CHANGE_PRUNE_INTERVAL == 0:
+            connection.execute(
+                delete(QuestionChangeModel).where(
+                    QuestionChangeModel.version <= version - QUESTION_CHANGE_RETENTION
+                )
+            )
+    # The version is None on databases without resource_versions
+    session.info[COMMITTED_CHANGES_KEY] = (version, changed)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_changed_questions(session: Session, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+        session.info.pop(COMMITTED_CHANGES_KEY, None)
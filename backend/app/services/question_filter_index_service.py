@@ -0,0 +1,447 @@
+# filename: backend/app/services/question_filter_index_service.py
+
+"""
+This module keeps an in-process inverted index of questions for filtering.
+
+Every difficulty level, subject, topic, subtopic, concept and question tag
+maps to a RoaringBitmap of the ids of its questions. A filter is a list of
+clauses: the bitmaps named in a clause are OR-ed and the clauses are AND-ed,
+so any combination of filters resolves to a candidate id set with a few
+bitwise operations, and a page of ids is read straight off the result.
+
+The index is built at startup (or on first use) with one query per
+association table, and remembers the "questions" version of
+resource_versions it was built at. After that it is kept current from the
+question change log (question_change_service): when this process commits,
+the questions the commit changed are marked stale and the index moves to
+the commit's version, and when a lookup finds that the version has moved
+past the index (another process wrote), the ids logged since are read from
+the log and marked stale. Stale questions are re-read with one query per
+table before the lookup, so the whole index is only rebuilt when the log
+cannot tell what changed: the index fell behind by more than the log
+keeps, a taxonomy node was deleted, or more than MAX_REFRESHED_QUESTIONS
+changed at once.
+
+On a database without the resource_versions table the index is instead
+rebuilt once it is older than FILTER_INDEX_TTL_SECONDS, like the taxonomy
+cache. It is also rebuilt when it is used with a session for a different
+database than the one it was built from. The index holds committed data
+only; callers whose session has uncommitted question writes should query
+the database instead (see has_uncommitted_question_changes).
+
+Key dependencies:
+- sqlalchemy: For the build queries and the session events
+- backend.app.services.bitmap_service: For the compressed bitmaps
+- backend.app.services.resource_version_service: For validating the index against the database
+- backend.app.services.question_change_service: For the questions changed since the index's version
+
+Main class:
+- QuestionFilterIndex: The inverted index, answering pages of ids and facet counts
+
+Usage example:
+    from backend.app.services.question_filter_index_service import (
+        question_filter_index,
+    )
+
+    clauses = [[("difficulty", "Easy")], [("topics", 4), ("topics", 9)]]
+    question_ids = question_filter_index.select_page(db, clauses, skip=0, limit=20)
+"""
+
+import threading
+import time
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from backend.app.models.associations import (
+    QuestionToConceptAssociation,
+    QuestionToSubjectAssociation,
+    QuestionToSubtopicAssociation,
+    QuestionToTagAssociation,
+    QuestionToTopicAssociation,
+)
+from backend.app.models.concepts import ConceptModel
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.models.questions import QuestionModel
+from backend.app.models.subjects import SubjectModel
+from backend.app.models.subtopics import SubtopicModel
+from backend.app.models.topics import TopicModel
+from backend.app.services.bitmap_service import RoaringBitmap
+from backend.app.services.logging_service import logger
+from backend.app.services.metrics_service import metrics
+from backend.app.services.question_change_service import (
+    COMMITTED_CHANGES_KEY,
+    read_question_changes_since,
+)
+from backend.app.services.resource_version_service import read_resource_version_key
+
+FILTER_INDEX_TTL_SECONDS = 300
+
+# Keeps IN lists well below the bind parameter limits of SQLite and others
+REFRESH_CHUNK_SIZE = 500
+
+# Catching up on more changed questions than this rebuilds the index instead
+MAX_REFRESHED_QUESTIONS = 10000
+
+# dimension -> (association model, question_id column, value column, value model)
+INDEXED_ASSOCIATIONS = {
+    "subjects": (
+        QuestionToSubjectAssociation,
+        QuestionToSubjectAssociation.question_id,
+        QuestionToSubjectAssociation.subject_id,
+        SubjectModel,
+    ),
+    "topics": (
+        QuestionToTopicAssociation,
+        QuestionToTopicAssociation.question_id,
+        QuestionToTopicAssociation.topic_id,
+        TopicModel,
+    ),
+    "subtopics": (
+        QuestionToSubtopicAssociation,
+        QuestionToSubtopicAssociation.question_id,
+        QuestionToSubtopicAssociation.subtopic_id,
+        SubtopicModel,
+    ),
+    "concepts": (
+        QuestionToConceptAssociation,
+        QuestionToConceptAssociation.question_id,
+        QuestionToConceptAssociation.concept_id,
+        ConceptModel,
+    ),
+    "question_tags": (
+        QuestionToTagAssociation,
+        QuestionToTagAssociation.question_id,
+        QuestionToTagAssociation.question_tag_id,
+        QuestionTagModel,
+    ),
+}
+
+FILTER_DIMENSIONS = ("difficulty",) + tuple(INDEXED_ASSOCIATIONS)
+
+Key = Tuple[str, Hashable]
+Clause = Iterable[Key]
+
+
+def _database_url(db: Session) -> str:
+    return str(db.get_bind().engine.url)
+
+
+def _chunks(ids: List[int]):
+    for start in range(0, len(ids), REFRESH_CHUNK_SIZE):
+        yield ids[start : start + REFRESH_CHUNK_SIZE]
+
+
+class QuestionFilterIndex:
+    """Bitmaps of question ids per difficulty level, taxonomy node and tag."""
+
+    def __init__(self, ttl_seconds: float = FILTER_INDEX_TTL_SECONDS):
+        self._lock = threading.RLock()
+        self._all = RoaringBitmap()
+        self._bitmaps: Dict[Key, RoaringBitmap] = {}
+        self._question_keys: Dict[int, Tuple[Key, ...]] = {}
+        self._stale: Set[int] = set()
+        self._built = False
+        self._built_at = 0.0
+        self._database_url: Optional[str] = None
+        # The "questions" version every change up to which is applied or stale
+        self._data_version: Optional[int] = None
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def __len__(self) -> int:
+        return len(self._question_keys)
+
+    def build(self, db: Session) -> None:
+        """
+        Rebuild the index from the database with one query per table.
+
+        Args:
+            db (Session): The database session.
+        """
+        # Read first, so a write racing the build moves the version past it
+        data_version = read_resource_version_key(db, "questions")
+        keys_by_question: Dict[int, List[Key]] = {}
+        for question_id, difficulty in db.execute(
+            select(QuestionModel.id, QuestionModel.difficulty)
+        ):
+            keys_by_question[question_id] = [("difficulty", difficulty.value)]
+        for dimension, (_, question_column, value_column, _) in (
+            INDEXED_ASSOCIATIONS.items()
+        ):
+            for question_id, value_id in db.execute(
+                select(question_column, value_column)
+            ):
+                if question_id in keys_by_question:
+                    keys_by_question[question_id].append((dimension, value_id))
+
+        ids_by_key: Dict[Key, List[int]] = {}
+        for question_id, keys in keys_by_question.items():
+            for key in keys:
+                ids_by_key.setdefault(key, []).append(question_id)
+
+        with self._lock:
+            self._all = RoaringBitmap(keys_by_question)
+            self._bitmaps = {key: RoaringBitmap(ids) for key, ids in ids_by_key.items()}
+            self._question_keys = {
+                question_id: tuple(keys) for question_id, keys in keys_by_question.items()
+            }
+            self._stale = set()
+            self._built = True
+            self._built_at = time.monotonic()
+            self._database_url = _database_url(db)
+            self._data_version = data_version[0] if data_version else None
+        logger.debug(
+            "Built question filter index with %s questions in %s bitmaps",
+            len(keys_by_question),
+            len(ids_by_key),
+        )
+
+    def invalidate(self) -> None:
+        """Drop the index so the next lookup rebuilds it."""
+        with self._lock:
+            self._all = RoaringBitmap()
+            self._bitmaps = {}
+            self._question_keys = {}
+            self._stale = set()
+            self._built = False
+
+    def mark_stale(self, question_ids: Iterable[int]) -> None:
+        """Re-read these questions from the database before the next lookup."""
+        if not self._built:
+            return
+        with self._lock:
+            self._stale.update(question_ids)
+
+    def apply_committed_changes(
+        self, version: Optional[int], question_ids: Set[Optional[int]]
+    ) -> None:
+        """
+        Take in the questions a commit of this process changed.
+
+        The index moves to the commit's version when it was at the version
+        just before; otherwise the changes are marked stale and the next
+        lookup catches up on the rest from the change log.
+
+        Args:
+            version (Optional[int]): The "questions" version the commit bumped to.
+            question_ids (Set[Optional[int]]): The changed ids; None stands
+                for every question.
+        """
+        if not self._built:
+            return
+        with self._lock:
+            if None in question_ids:
+                self.invalidate()
+                return
+            self._stale.update(question_ids)
+            if (
+                version is not None
+                and self._data_version is not None
+                and version == self._data_version + 1
+            ):
+                self._data_version = version
+
+    def sync_question(self, question: QuestionModel) -> None:
+        """Mark a question written through the question CRUD functions as stale."""
+        self.mark_stale([question.id])
+
+    def remove_question(self, question_id: int) -> None:
+        """Remove a question from the index, if present."""
+        if not self._built:
+            return
+        with self._lock:
+            self._discard(question_id)
+            self._stale.discard(question_id)
+
+    def question_ids_for(self, dimension: str, value: Hashable) -> List[int]:
+        """Return the ids of the questions indexed under a value."""
+        with self._lock:
+            bitmap = self._bitmaps.get((dimension, value))
+            return list(bitmap) if bitmap is not None else []
+
+    def _discard(self, question_id: int) -> None:
+        for key in self._question_keys.pop(question_id, ()):
+            bitmap = self._bitmaps[key]
+            bitmap.discard(question_id)
+            if not bitmap:
+                del self._bitmaps[key]
+        self._all.discard(question_id)
+
+    def _add(self, question_id: int, keys: Sequence[Key]) -> None:
+        self._question_keys[question_id] = tuple(keys)
+        for key in keys:
+            bitmap = self._bitmaps.get(key)
+            if bitmap is None:
+                bitmap = self._bitmaps[key] = RoaringBitmap()
+            bitmap.add(question_id)
+        self._all.add(question_id)
+
+    def _refresh_stale(self, db: Session) -> None:
+        stale = sorted(self._stale)
+        self._stale = set()
+        keys_by_question: Dict[int, List[Key]] = {}
+        for chunk in _chunks(stale):
+            for question_id, difficulty in db.execute(
+                select(QuestionModel.id, QuestionModel.difficulty).where(
+                    QuestionModel.id.in_(chunk)
+                )
+            ):
+                keys_by_question[question_id] = [("difficulty", difficulty.value)]
+            for dimension, (_, question_column, value_column, _) in (
+                INDEXED_ASSOCIATIONS.items()
+            ):
+                for question_id, value_id in db.execute(
+                    select(question_column, value_column).where(
+                        question_column.in_(chunk)
+                    )
+                ):
+                    if question_id in keys_by_question:
+                        keys_by_question[question_id].append((dimension, value_id))
+
+        for question_id in stale:
+            self._discard(question_id)
+            if question_id in keys_by_question:
+                self._add(question_id, keys_by_question[question_id])
+
+    def _is_current(self, db: Session, data_version: Optional[Tuple]) -> bool:
+        # Also catches up on the changes logged since the index's version
+        if not self._built or self._database_url != _database_url(db):
+            return False
+        if data_version is None:
+            return time.monotonic() - self._built_at < self.ttl_seconds
+        version = data_version[0]
+        if self._data_version is None or version < self._data_version:
+            return False
+        if version == self._data_version:
+            return True
+        changed = read_question_changes_since(db, self._data_version, version)
+        if (
+            changed is None
+            or None in changed
+            or len(changed) > MAX_REFRESHED_QUESTIONS
+        ):
+            return False
+        self._stale.update(changed)
+        self._data_version = version
+        return True
+
+    def ensure_current(self, db: Session) -> None:
+        """Bring the index up to the database's version, re-reading only changed questions."""
+        data_version = read_resource_version_key(db, "questions")
+        with self._lock:
+            if not self._is_current(db, data_version):
+                metrics.inc("cache_requests_total", ("question_filter_index", "miss"))
+                self.build(db)
+            elif self._stale:
+                # Only the changed questions are re-read
+                metrics.inc("cache_requests_total", ("question_filter_index", "miss"))
+                self._refresh_stale(db)
+            else:
+                metrics.inc("cache_requests_total", ("question_filter_index", "hit"))
+
+    def _match(self, clauses: Sequence[Clause]) -> RoaringBitmap:
+        # Must be called with the lock held; the result may be a live bitmap
+        result: Optional[RoaringBitmap] = None
+        for clause in clauses:
+            bitmaps = [
+                self._bitmaps[key] for key in set(clause) if key in self._bitmaps
+            ]
+            if len(bitmaps) == 1:
+                matched = bitmaps[0]
+            else:
+                matched = RoaringBitmap.union_all(bitmaps)
+            result = matched if result is None else result & matched
+            if not result:
+                break
+        return self._all if result is None else result
+
+    def select_page(
+        self,
+        db: Session,
+        clauses: Sequence[Clause],
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Return one page of the ids of the questions matching every clause.
+
+        Args:
+            db (Session): The database session, used to bring the index up to date.
+            clauses (Sequence[Clause]): Lists of (dimension, value) keys. A
+                question matches a clause when it is indexed under at least one
+                of its keys; an empty clause matches nothing. Difficulty values
+                are DifficultyLevel values, e.g. ("difficulty", "Easy").
+            skip (int): The number of ids to skip.
+            limit (Optional[int]): The maximum number of ids to return.
+
+        Returns:
+            List[int]: The matching ids on the page, ascending.
+
+        Usage example:
+            question_filter_index.select_page(db, [[("subjects", 3)]], limit=10)
+        """
+        self.ensure_current(db)
+        with self._lock:
+            return self._match(clauses).page(skip, limit)
+
+    def count_by_value(
+        self, db: Session, clauses: Sequence[Clause], dimensions: Iterable[str]
+    ) -> Tuple[int, Dict[str, Dict[Hashable, int]]]:
+        """
+        Count the questions matching every clause, in total and per indexed value.
+
+        When fewer questions match than there are bitmaps, the keys of each
+        matching question are tallied; otherwise each bitmap of the requested
+        dimensions is intersected with the matches, counting without
+        materializing the intersection.
+
+        Args:
+            db (Session): The database session, used to bring the index up to date.
+            clauses (Sequence[Clause]): The clauses, as accepted by select_page.
+            dimensions (Iterable[str]): The dimensions to count values of,
+                e.g. ("difficulty", "topics").
+
+        Returns:
+            Tuple[int, Dict[str, Dict[Hashable, int]]]: The number of matching
+                questions, and per dimension the non-zero count of each value.
+
+        Usage example:
+            total, counts = question_filter_index.count_by_value(
+                db, [[("subjects", 3)]], ["topics"]
+            )
+        """
+        self.ensure_current(db)
+        counts: Dict[str, Dict[Hashable, int]] = {
+            dimension: {} for dimension in dimensions
+        }
+        with self._lock:
+            matched = self._match(clauses)
+            total = len(matched)
+            if total < len(self._bitmaps):
+                for question_id in matched:
+                    for dimension, value in self._question_keys[question_id]:
+                        if dimension in counts:
+                            values = counts[dimension]
+                            values[value] = values.get(value, 0) + 1
+            else:
+                for (dimension, value), bitmap in self._bitmaps.items():
+                    if dimension in counts:
+                        count = matched.intersection_count(bitmap)
+                        if count:
+                            counts[dimension][value] = count
+        return total, counts
+
+
+question_filter_index = QuestionFilterIndex()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_question_changes(session: Session) -> None:
+    committed = session.info.get(COMMITTED_CHANGES_KEY)
+    if committed is not None:
+        question_filter_index.apply_committed_changes(*committed)
@@ -0,0 +1,524 @@
+# filename: backend/app/services/question_sampling_service.py
+
+"""
+This module keeps an in-process index of question ids for random sampling.
+
+Question ids are stored in compact, sorted array('i') buckets keyed by
+(difficulty, subject_id, topic_id), so a 500k question bank costs a few MB
+instead of a 500k-row query per draw. A question linked to several subjects or
+topics appears in one bucket per (subject, topic) pair.
+
+The bucket keys are also indexed by difficulty, subject and topic, so the
+buckets matching a draw's constraints are found by intersecting those key
+sets rather than scanning every bucket. Sampling k questions then picks
+random positions across the matching buckets and accepts each candidate
+with probability 1/m, where m is the number of matching buckets containing
+it. m is counted from the candidate's own bucket keys, so the draw stays
+uniform over distinct questions while costing O(k) lookups instead of a
+scan or ORDER BY RANDOM().
+
+The index is built lazily from one query and remembers the "questions"
+version of resource_versions it was built at. Like the question filter
+index, it is then kept current from the question change log: this
+process's commits mark the questions they changed stale and move the index
+to their version, and ensure_current() reads the ids logged since the
+index's version when another process moved it. Stale questions are re-read
+with one query per chunk, and the whole index is only rebuilt when the log
+cannot tell what changed. On a database without the resource_versions
+table it is rebuilt once it is older than SAMPLING_INDEX_TTL_SECONDS
+instead.
+
+Key dependencies:
+- array: For the compact id buckets
+- sqlalchemy: For the build and refresh queries and the session events
+- backend.app.services.randomization_service: For seeded random generators
+- backend.app.services.resource_version_service: For validating the index against the database
+- backend.app.services.question_change_service: For the questions changed since the index's version
+
+Main class:
+- QuestionSamplingIndex: The bucketed id index
+
+Usage example:
+    from backend.app.services.question_sampling_service import question_sampling_index
+
+    question_sampling_index.ensure_current(db)
+    question_ids = question_sampling_index.sample(
+        20, difficulties=["Easy"], subject_ids=[3], seed=42
+    )
+"""
+
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import Select, event, select
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import DifficultyLevel
+from backend.app.models.associations import (
+    QuestionToSubjectAssociation,
+    QuestionToTopicAssociation,
+)
+from backend.app.models.questions import QuestionModel
+from backend.app.services.logging_service import logger
+from backend.app.services.question_change_service import (
+    COMMITTED_CHANGES_KEY,
+    read_question_changes_since,
+)
+from backend.app.services.randomization_service import SeedType, get_rng
+from backend.app.services.resource_version_service import read_resource_version_key
+
+BucketKey = Tuple[str, Optional[int], Optional[int]]
+
+# Rejection sampling gives up after this many attempts per requested id and
+# finishes the draw from the merged candidate ids instead
+MAX_REJECTION_ATTEMPTS_PER_ITEM = 20
+
+SAMPLING_INDEX_TTL_SECONDS = 300
+
+# Keeps IN lists well below the bind parameter limits of SQLite and others
+REFRESH_CHUNK_SIZE = 500
+
+# Catching up on more changed questions than this rebuilds the index instead
+MAX_REFRESHED_QUESTIONS = 10000
+
+
+def _database_url(db: Session) -> str:
+    return str(db.get_bind().engine.url)
+
+
+def _bucket_rows_query() -> Select:
+    # One row per (question, subject, topic); questions without either get None
+    return (
+        select(
+            QuestionModel.id,
+            QuestionModel.difficulty,
+            QuestionToSubjectAssociation.subject_id,
+            QuestionToTopicAssociation.topic_id,
+        )
+        .outerjoin(
+            QuestionToSubjectAssociation,
+            QuestionToSubjectAssociation.question_id == QuestionModel.id,
+        )
+        .outerjoin(
+            QuestionToTopicAssociation,
+            QuestionToTopicAssociation.question_id == QuestionModel.id,
+        )
+        .order_by(QuestionModel.id)
+    )
+
+
+class QuestionSamplingIndex:
+    """Sorted question id buckets per (difficulty, subject_id, topic_id)."""
+
+    def __init__(self, ttl_seconds: float = SAMPLING_INDEX_TTL_SECONDS):
+        self._lock = threading.RLock()
+        self._buckets: Dict[BucketKey, array] = {}
+        # Bucket keys per difficulty value, subject id and topic id
+        self._keys_by_part: Tuple[Dict, Dict, Dict] = ({}, {}, {})
+        self._question_keys: Dict[int, Tuple[BucketKey, ...]] = {}
+        self._difficulty_counts: Counter = Counter()
+        self._stale: Set[int] = set()
+        self._built = False
+        self._built_at = 0.0
+        self._database_url: Optional[str] = None
+        # The "questions" version every change up to which is applied or stale
+        self._data_version: Optional[int] = None
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def __len__(self) -> int:
+        return len(self._question_keys)
+
+    def build(self, db: Session) -> None:
+        """
+        Rebuild the index from the database with a single query.
+
+        Args:
+            db (Session): The database session.
+        """
+        # Read first, so a write racing the build moves the version past it
+        data_version = read_resource_version_key(db, "questions")
+        keys_by_question: Dict[int, Set[BucketKey]] = {}
+        for question_id, difficulty, subject_id, topic_id in db.execute(
+            _bucket_rows_query()
+        ):
+            keys_by_question.setdefault(question_id, set()).add(
+                (difficulty.value, subject_id, topic_id)
+            )
+
+        buckets: Dict[BucketKey, array] = {}
+        for question_id, keys in keys_by_question.items():
+            for key in keys:
+                # Rows arrive ordered by id, so appending keeps buckets sorted
+                buckets.setdefault(key, array("i")).append(question_id)
+
+        keys_by_part: Tuple[Dict, Dict, Dict] = ({}, {}, {})
+        for key in buckets:
+            for part, keys in zip(key, keys_by_part):
+                keys.setdefault(part, set()).add(key)
+
+        with self._lock:
+            self._buckets = buckets
+            self._keys_by_part = keys_by_part
+            self._question_keys = {
+                question_id: tuple(keys) for question_id, keys in keys_by_question.items()
+            }
+            self._difficulty_counts = Counter(
+                next(iter(keys))[0] for keys in keys_by_question.values()
+            )
+            self._stale = set()
+            self._built = True
+            self._built_at = time.monotonic()
+            self._database_url = _database_url(db)
+            self._data_version = data_version[0] if data_version else None
+        logger.debug(
+            "Built question sampling index with %s questions in %s buckets",
+            len(keys_by_question),
+            len(buckets),
+        )
+
+    def _is_current(self, db: Session, data_version: Optional[Tuple]) -> bool:
+        # Also catches up on the changes logged since the index's version
+        if not self._built or self._database_url != _database_url(db):
+            return False
+        if data_version is None:
+            return time.monotonic() - self._built_at < self.ttl_seconds
+        version = data_version[0]
+        if self._data_version is None or version < self._data_version:
+            return False
+        if version == self._data_version:
+            return True
+        changed = read_question_changes_since(db, self._data_version, version)
+        if (
+            changed is None
+            or None in changed
+            or len(changed) > MAX_REFRESHED_QUESTIONS
+        ):
+            return False
+        self._stale.update(changed)
+        self._data_version = version
+        return True
+
+    def ensure_current(self, db: Session) -> None:
+        """Bring the index up to the database's version, re-reading only changed questions."""
+        data_version = read_resource_version_key(db, "questions")
+        with self._lock:
+            if not self._is_current(db, data_version):
+                self.build(db)
+            elif self._stale:
+                self._refresh_stale(db)
+
+    def _refresh_stale(self, db: Session) -> None:
+        stale = sorted(self._stale)
+        self._stale = set()
+        rows_by_question: Dict[int, List[Tuple]] = {}
+        for start in range(0, len(stale), REFRESH_CHUNK_SIZE):
+            chunk = stale[start : start + REFRESH_CHUNK_SIZE]
+            for question_id, difficulty, subject_id, topic_id in db.execute(
+                _bucket_rows_query().where(QuestionModel.id.in_(chunk))
+            ):
+                rows_by_question.setdefault(question_id, []).append(
+                    (difficulty, subject_id, topic_id)
+                )
+
+        for question_id in stale:
+            rows = rows_by_question.get(question_id)
+            if rows is None:
+                self._discard(question_id)
+                continue
+            self.add_question(
+                question_id,
+                rows[0][0],
+                {subject_id for _, subject_id, _ in rows if subject_id is not None},
+                {topic_id for _, _, topic_id in rows if topic_id is not None},
+            )
+
+    def invalidate(self) -> None:
+        """Drop the index so the next ensure_current() rebuilds it."""
+        with self._lock:
+            self._buckets = {}
+            self._keys_by_part = ({}, {}, {})
+            self._question_keys = {}
+            self._difficulty_counts = Counter()
+            self._stale = set()
+            self._built = False
+
+    def apply_committed_changes(
+        self, version: Optional[int], question_ids: Set[Optional[int]]
+    ) -> None:
+        """
+        Take in the questions a commit of this process changed.
+
+        The index moves to the commit's version when it was at the version
+        just before; otherwise the changes are marked stale and the next
+        ensure_current() catches up on the rest from the change log.
+
+        Args:
+            version (Optional[int]): The "questions" version the commit bumped to.
+            question_ids (Set[Optional[int]]): The changed ids; None stands
+                for every question.
+        """
+        if not self._built:
+            return
+        with self._lock:
+            if None in question_ids:
+                self.invalidate()
+                return
+            self._stale.update(question_ids)
+            if (
+                version is not None
+                and self._data_version is not None
+                and version == self._data_version + 1
+            ):
+                self._data_version = version
+
+    def add_question(
+        self,
+        question_id: int,
+        difficulty,
+        subject_ids: Iterable[int],
+        topic_ids: Iterable[int],
+    ) -> None:
+        """
+        Add a question to the index, replacing any previous entry for it.
+
+        Does nothing until the index has been built.
+
+        Args:
+            question_id (int): The ID of the question.
+            difficulty: The DifficultyLevel (or its value) of the question.
+            subject_ids (Iterable[int]): The IDs of the question's subjects.
+            topic_ids (Iterable[int]): The IDs of the question's topics.
+        """
+        if not self._built:
+            return
+        difficulty = DifficultyLevel(difficulty).value
+        subject_ids = list(subject_ids) or [None]
+        topic_ids = list(topic_ids) or [None]
+        keys = tuple(
+            sorted(
+                {
+                    (difficulty, subject_id, topic_id)
+                    for subject_id in subject_ids
+                    for topic_id in topic_ids
+                },
+                key=str,
+            )
+        )
+        with self._lock:
+            self._discard(question_id)
+            for key in keys:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = array("i")
+                    for part, keys_by_part in zip(key, self._keys_by_part):
+                        keys_by_part.setdefault(part, set()).add(key)
+                insort(bucket, question_id)
+            self._question_keys[question_id] = keys
+            self._difficulty_counts[difficulty] += 1
+
+    def sync_question(self, question: QuestionModel) -> None:
+        """
+        Re-index a question from its ORM object.
+
+        Reads the subjects and topics relationships, so it is skipped entirely
+        (no lazy loads) until the index has been built.
+
+        Args:
+            question (QuestionModel): The question to re-index.
+        """
+        if not self._built:
+            return
+        self.add_question(
+            question.id,
+            question.difficulty,
+            [subject.id for subject in question.subjects],
+            [topic.id for topic in question.topics],
+        )
+
+    def remove_question(self, question_id: int) -> None:
+        """Remove a question from the index, if present."""
+        if not self._built:
+            return
+        with self._lock:
+            self._discard(question_id)
+
+    def _discard(self, question_id: int) -> None:
+        keys = self._question_keys.pop(question_id, ())
+        if keys:
+            self._difficulty_counts[keys[0][0]] -= 1
+        for key in keys:
+            bucket = self._buckets[key]
+            position = bisect_left(bucket, question_id)
+            if position < len(bucket) and bucket[position] == question_id:
+                del bucket[position]
+            if not bucket:
+                del self._buckets[key]
+                for part, keys_by_part in zip(key, self._keys_by_part):
+                    keys_by_part[part].discard(key)
+                    if not keys_by_part[part]:
+                        del keys_by_part[part]
+
+    def _matching_keys(
+        self,
+        difficulties: Optional[Iterable] = None,
+        subject_ids: Optional[Iterable[int]] = None,
+        topic_ids: Optional[Iterable[int]] = None,
+    ) -> List[BucketKey]:
+        constraints = [
+            {DifficultyLevel(value).value for value in difficulties}
+            if difficulties
+            else None,
+            set(subject_ids) if subject_ids else None,
+            set(topic_ids) if topic_ids else None,
+        ]
+        # Union the keys of each constrained part, then intersect the unions,
+        # smallest first, so only buckets that can match are visited
+        candidates = sorted(
+            (
+                set().union(*(keys_by_part.get(value, ()) for value in values))
+                for values, keys_by_part in zip(constraints, self._keys_by_part)
+                if values is not None
+            ),
+            key=len,
+        )
+        if not candidates:
+            return list(self._buckets)
+        matching = candidates[0].intersection(*candidates[1:])
+        # Sorted, so seeded draws do not depend on set iteration order
+        return sorted(matching, key=str)
+
+    def _matching_buckets(self, *constraints) -> List[array]:
+        return [self._buckets[key] for key in self._matching_keys(*constraints)]
+
+    def candidate_ids(
+        self,
+        difficulties: Optional[Iterable] = None,
+        subject_ids: Optional[Iterable[int]] = None,
+        topic_ids: Optional[Iterable[int]] = None,
+    ) -> array:
+        """
+        Return the sorted, distinct ids of the questions matching the constraints.
+
+        When a single bucket matches, a copy of it is returned without merging.
+
+        Args:
+            difficulties (Optional[Iterable]): Allowed difficulty levels.
+            subject_ids (Optional[Iterable[int]]): Allowed subject IDs.
+            topic_ids (Optional[Iterable[int]]): Allowed topic IDs.
+
+        Returns:
+            array: The matching question ids.
+        """
+        with self._lock:
+            buckets = self._matching_buckets(difficulties, subject_ids, topic_ids)
+            if len(buckets) == 1:
+                return array("i", buckets[0])
+            return array("i", sorted(set().union(*buckets)))
+
+    def count(
+        self,
+        difficulties: Optional[Iterable] = None,
+        subject_ids: Optional[Iterable[int]] = None,
+        topic_ids: Optional[Iterable[int]] = None,
+    ) -> int:
+        """Return the number of distinct questions matching the constraints."""
+        with self._lock:
+            if not subject_ids and not topic_ids:
+                # Every question is in exactly one difficulty
+                if not difficulties:
+                    return len(self._question_keys)
+                return sum(
+                    self._difficulty_counts[DifficultyLevel(value).value]
+                    for value in set(difficulties)
+                )
+            buckets = self._matching_buckets(difficulties, subject_ids, topic_ids)
+            if len(buckets) == 1:
+                return len(buckets[0])
+            return len(set().union(*buckets))
+
+    def sample(
+        self,
+        count: int,
+        difficulties: Optional[Iterable] = None,
+        subject_ids: Optional[Iterable[int]] = None,
+        topic_ids: Optional[Iterable[int]] = None,
+        seed: SeedType = None,
+    ) -> List[int]:
+        """
+        Draw up to count distinct question ids uniformly from the matching questions.
+
+        Args:
+            count (int): The number of ids to draw.
+            difficulties (Optional[Iterable]): Allowed difficulty levels.
+            subject_ids (Optional[Iterable[int]]): Allowed subject IDs.
+            topic_ids (Optional[Iterable[int]]): Allowed topic IDs.
+            seed (SeedType): A seed or random.Random for reproducible draws.
+
+        Returns:
+            List[int]: The drawn ids, in draw order. Fewer than count ids are
+                returned only when fewer questions match.
+
+        Usage example:
+            ids = question_sampling_index.sample(10, difficulties=["Hard"], seed=7)
+        """
+        rng = get_rng(seed)
+        with self._lock:
+            keys = self._matching_keys(difficulties, subject_ids, topic_ids)
+            buckets = [self._buckets[key] for key in keys]
+            if count <= 0 or not buckets:
+                return []
+            if len(buckets) == 1:
+                bucket = buckets[0]
+                return rng.sample(bucket, min(count, len(bucket)))
+
+            offsets = list(accumulate(len(bucket) for bucket in buckets))
+            total = offsets[-1]
+            if 2 * count >= total:
+                candidates = sorted(set().union(*buckets))
+                return rng.sample(candidates, min(count, len(candidates)))
+
+            matching_keys = set(keys)
+            picked: List[int] = []
+            seen: Set[int] = set()
+            for _ in range(MAX_REJECTION_ATTEMPTS_PER_ITEM * count):
+                position = rng.randrange(total)
+                bucket_index = bisect_right(offsets, position)
+                start = offsets[bucket_index - 1] if bucket_index else 0
+                question_id = buckets[bucket_index][position - start]
+                if question_id in seen:
+                    continue
+                copies = sum(
+                    1 for key in self._question_keys[question_id] if key in matching_keys
+                )
+                # Questions present in several matching buckets would be
+                # over-represented; thin them out to keep the draw uniform
+                if copies > 1 and rng.random() * copies >= 1:
+                    continue
+                seen.add(question_id)
+                picked.append(question_id)
+                if len(picked) == count:
+                    return picked
+
+            # Heavy overlap between buckets: finish the draw from the merged ids
+            remaining = sorted(set().union(*buckets) - seen)
+            picked.extend(rng.sample(remaining, min(count - len(picked), len(remaining))))
+            return picked
+
+
+question_sampling_index = QuestionSamplingIndex()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_question_changes(session: Session) -> None:
+    committed = session.info.get(COMMITTED_CHANGES_KEY)
+    if committed is not None:
+        question_sampling_index.apply_committed_changes(*committed)
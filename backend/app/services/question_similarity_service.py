@@ -0,0 +1,478 @@
+# filename: backend/app/services/question_similarity_service.py
+
+"""
+This module keeps an in-process MinHash/LSH index for near-duplicate questions.
+
+Question text is normalized (lowercased, punctuation dropped, whitespace
+collapsed) and split into word bigrams. Each question gets a MinHash
+signature of SIGNATURE_SIZE 32-bit values: the share of positions where two
+signatures agree estimates the Jaccard similarity of their bigram sets.
+
+Signatures are cut into LSH_BANDS bands of LSH_ROWS values, and every band is
+hashed into a bucket. Two questions become candidates only if they share a
+bucket in at least one band, so a lookup touches LSH_BANDS buckets instead of
+comparing against every question. With 8 bands of 3 rows, pairs at the 0.8
+duplicate threshold collide with >99% probability, pairs at 0.65 with ~92%,
+and pairs below 0.3 rarely do.
+
+The index is kept compact: all signatures live in one array('I') with a
+slot per question (SIGNATURE_SIZE * 4 = 96 bytes each), and a bucket holding
+a single question stores the bare id rather than a set.
+
+The index is built lazily from one query and remembers the "questions"
+version of resource_versions it was built at. Like the question filter
+index, it is then kept current from the question change log: this
+process's commits mark the questions they changed stale and move the index
+to their version, and ensure_current() reads the ids logged since the
+index's version when another process moved it, so duplicate checks see
+questions written by every worker. Stale questions are re-read in chunks,
+and the whole index is only rebuilt when the log cannot tell what changed.
+On a database without the resource_versions table it is rebuilt once it is
+older than SIMILARITY_INDEX_TTL_SECONDS instead.
+
+Key dependencies:
+- array: For the compact signatures
+- hashlib: For stable shingle hashes
+- sqlalchemy: For the build and refresh queries and the session events
+- backend.app.services.resource_version_service: For validating the index against the database
+- backend.app.services.question_change_service: For the questions changed since the index's version
+
+Main class and functions:
+- normalize_question_text: Canonical form of a question's text
+- minhash_signature: The MinHash signature of a text
+- QuestionSimilarityIndex: The banded signature index
+
+Usage example:
+    from backend.app.services.question_similarity_service import (
+        question_similarity_index,
+    )
+
+    question_similarity_index.ensure_current(db)
+    matches = question_similarity_index.find_similar("What is 2 + 2?", threshold=0.8)
+"""
+
+import hashlib
+import random
+import re
+import threading
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from backend.app.models.questions import QuestionModel
+from backend.app.services.logging_service import logger
+from backend.app.services.question_change_service import (
+    COMMITTED_CHANGES_KEY,
+    read_question_changes_since,
+)
+from backend.app.services.resource_version_service import read_resource_version_key
+
+LSH_BANDS = 8
+LSH_ROWS = 3
+SIGNATURE_SIZE = LSH_BANDS * LSH_ROWS
+
+# Pairs below this estimated similarity are never reported; LSH rarely
+# surfaces them as candidates anyway
+MIN_SIMILARITY_THRESHOLD = 0.3
+DEFAULT_SIMILARITY_THRESHOLD = 0.5
+DUPLICATE_SIMILARITY_THRESHOLD = 0.8
+
+BUILD_BATCH_SIZE = 1000
+
+SIMILARITY_INDEX_TTL_SECONDS = 300
+
+# Keeps IN lists well below the bind parameter limits of SQLite and others
+REFRESH_CHUNK_SIZE = 500
+
+# Catching up on more changed questions than this rebuilds the index instead
+MAX_REFRESHED_QUESTIONS = 10000
+
+# Fixed seed: signatures must agree across processes and restarts
+_mask_rng = random.Random(20240601)
+_PERMUTATION_MASKS = tuple(_mask_rng.getrandbits(32) for _ in range(SIGNATURE_SIZE))
+_NON_WORD_PATTERN = re.compile(r"[^\w]+", re.UNICODE)
+
+Match = Tuple[int, float]
+
+# A bucket holding one id stores the id itself; sets cost ~200 bytes each
+Bucket = Union[int, array]
+
+
+def normalize_question_text(text: Optional[str]) -> str:
+    """
+    Return the canonical form of a question's text used for duplicate detection.
+
+    Usage example:
+        normalize_question_text("What is  2+2?")  # "what is 2 2"
+    """
+    return _NON_WORD_PATTERN.sub(" ", (text or "").lower()).strip()
+
+
+def _shingle_hashes(text: str) -> Set[int]:
+    words = normalize_question_text(text).split()
+    if len(words) < 2:
+        shingles = words
+    else:
+        shingles = [f"{first} {second}" for first, second in zip(words, words[1:])]
+    return {
+        int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "big"
+        )
+        for shingle in shingles
+    }
+
+
+def minhash_signature(text: Optional[str]) -> Optional[array]:
+    """
+    Compute the MinHash signature of a text.
+
+    Each shingle is hashed once; the SIGNATURE_SIZE permutations are derived by
+    XOR-ing that hash with fixed random masks.
+
+    Args:
+        text (Optional[str]): The text to sign.
+
+    Returns:
+        Optional[array]: SIGNATURE_SIZE unsigned 32-bit values, or None if the
+            text contains no words.
+    """
+    hashes = _shingle_hashes(text or "")
+    if not hashes:
+        return None
+    return array(
+        "I", [min(value ^ mask for value in hashes) for mask in _PERMUTATION_MASKS]
+    )
+
+
+def estimate_similarity(first: array, second: array) -> float:
+    """Estimate the Jaccard similarity of two texts from their signatures."""
+    return sum(1 for a, b in zip(first, second) if a == b) / SIGNATURE_SIZE
+
+
+def _band_keys(signature: array) -> List[int]:
+    return [
+        hash(tuple(signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]))
+        for band in range(LSH_BANDS)
+    ]
+
+
+def _add_to_bucket(buckets: Dict[int, Bucket], key: int, item_id: int) -> None:
+    bucket = buckets.get(key)
+    if bucket is None:
+        buckets[key] = item_id
+    elif isinstance(bucket, int):
+        buckets[key] = array("i", (bucket, item_id))
+    else:
+        bucket.append(item_id)
+
+
+def _remove_from_bucket(buckets: Dict[int, Bucket], key: int, item_id: int) -> None:
+    bucket = buckets.get(key)
+    if isinstance(bucket, int):
+        if bucket == item_id:
+            del buckets[key]
+    elif bucket is not None and item_id in bucket:
+        bucket.remove(item_id)
+        if len(bucket) == 1:
+            buckets[key] = bucket[0]
+
+
+def _database_url(db: Session) -> str:
+    return str(db.get_bind().engine.url)
+
+
+class QuestionSimilarityIndex:
+    """MinHash signatures of question text, bucketed by LSH band."""
+
+    def __init__(self, ttl_seconds: float = SIMILARITY_INDEX_TTL_SECONDS):
+        self._lock = threading.RLock()
+        # SIGNATURE_SIZE values per slot; _slots maps question ids to slots
+        self._store = array("I")
+        self._slots: Dict[int, int] = {}
+        self._free_slots: List[int] = []
+        self._bands: List[Dict[int, Bucket]] = [{} for _ in range(LSH_BANDS)]
+        self._stale: Set[int] = set()
+        self._built = False
+        self._built_at = 0.0
+        self._database_url: Optional[str] = None
+        # The "questions" version every change up to which is applied or stale
+        self._data_version: Optional[int] = None
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def load(self, items: Iterable[Tuple[int, Optional[str]]]) -> None:
+        """
+        Replace the index contents with the given (id, text) pairs.
+
+        Args:
+            items (Iterable[Tuple[int, Optional[str]]]): The ids and texts to index.
+        """
+        store = array("I")
+        slots: Dict[int, int] = {}
+        bands: List[Dict[int, Bucket]] = [{} for _ in range(LSH_BANDS)]
+        for item_id, text in items:
+            signature = minhash_signature(text)
+            if signature is None:
+                continue
+            if item_id in slots:
+                # Ids are expected to be unique; the first text wins
+                continue
+            slots[item_id] = len(store) // SIGNATURE_SIZE
+            store.extend(signature)
+            for buckets, key in zip(bands, _band_keys(signature)):
+                _add_to_bucket(buckets, key, item_id)
+
+        with self._lock:
+            self._store = store
+            self._slots = slots
+            self._free_slots = []
+            self._bands = bands
+            self._stale = set()
+            self._built = True
+
+    def build(self, db: Session) -> None:
+        """
+        Rebuild the index from the database with a single streamed query.
+
+        Args:
+            db (Session): The database session.
+        """
+        # Read first, so a write racing the build moves the version past it
+        data_version = read_resource_version_key(db, "questions")
+        rows = db.execute(
+            select(QuestionModel.id, QuestionModel.text).execution_options(
+                yield_per=BUILD_BATCH_SIZE
+            )
+        )
+        with self._lock:
+            self.load((question_id, text) for question_id, text in rows)
+            self._built_at = time.monotonic()
+            self._database_url = _database_url(db)
+            self._data_version = data_version[0] if data_version else None
+        logger.debug("Built question similarity index with %s questions", len(self))
+
+    def _is_current(self, db: Session, data_version: Optional[Tuple]) -> bool:
+        # Also catches up on the changes logged since the index's version
+        if not self._built or self._database_url != _database_url(db):
+            return False
+        if data_version is None:
+            return time.monotonic() - self._built_at < self.ttl_seconds
+        version = data_version[0]
+        if self._data_version is None or version < self._data_version:
+            return False
+        if version == self._data_version:
+            return True
+        changed = read_question_changes_since(db, self._data_version, version)
+        if (
+            changed is None
+            or None in changed
+            or len(changed) > MAX_REFRESHED_QUESTIONS
+        ):
+            return False
+        self._stale.update(changed)
+        self._data_version = version
+        return True
+
+    def ensure_current(self, db: Session) -> None:
+        """Bring the index up to the database's version, re-reading only changed questions."""
+        data_version = read_resource_version_key(db, "questions")
+        with self._lock:
+            if not self._is_current(db, data_version):
+                self.build(db)
+            elif self._stale:
+                self._refresh_stale(db)
+
+    def _refresh_stale(self, db: Session) -> None:
+        stale = sorted(self._stale)
+        self._stale = set()
+        texts: Dict[int, Optional[str]] = {}
+        for start in range(0, len(stale), REFRESH_CHUNK_SIZE):
+            chunk = stale[start : start + REFRESH_CHUNK_SIZE]
+            texts.update(
+                db.execute(
+                    select(QuestionModel.id, QuestionModel.text).where(
+                        QuestionModel.id.in_(chunk)
+                    )
+                ).all()
+            )
+        for question_id in stale:
+            if question_id in texts:
+                self.add_question(question_id, texts[question_id])
+            else:
+                self._discard(question_id)
+
+    def invalidate(self) -> None:
+        """Drop the index so the next ensure_current() rebuilds it."""
+        with self._lock:
+            self._store = array("I")
+            self._slots = {}
+            self._free_slots = []
+            self._bands = [{} for _ in range(LSH_BANDS)]
+            self._stale = set()
+            self._built = False
+
+    def apply_committed_changes(
+        self, version: Optional[int], question_ids: Set[Optional[int]]
+    ) -> None:
+        """
+        Take in the questions a commit of this process changed.
+
+        The index moves to the commit's version when it was at the version
+        just before; otherwise the changes are marked stale and the next
+        ensure_current() catches up on the rest from the change log.
+
+        Args:
+            version (Optional[int]): The "questions" version the commit bumped to.
+            question_ids (Set[Optional[int]]): The changed ids; None stands
+                for every question.
+        """
+        if not self._built:
+            return
+        with self._lock:
+            if None in question_ids:
+                self.invalidate()
+                return
+            self._stale.update(question_ids)
+            if (
+                version is not None
+                and self._data_version is not None
+                and version == self._data_version + 1
+            ):
+                self._data_version = version
+
+    def add_question(self, question_id: int, text: Optional[str]) -> None:
+        """
+        Index a question's text, replacing any previous entry for it.
+
+        Does nothing until the index has been built.
+
+        Args:
+            question_id (int): The ID of the question.
+            text (Optional[str]): The question text.
+        """
+        if not self._built:
+            return
+        signature = minhash_signature(text)
+        with self._lock:
+            self._discard(question_id)
+            if signature is None:
+                return
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                start = slot * SIGNATURE_SIZE
+                self._store[start : start + SIGNATURE_SIZE] = signature
+            else:
+                slot = len(self._store) // SIGNATURE_SIZE
+                self._store.extend(signature)
+            self._slots[question_id] = slot
+            for buckets, key in zip(self._bands, _band_keys(signature)):
+                _add_to_bucket(buckets, key, question_id)
+
+    def sync_question(self, question: QuestionModel) -> None:
+        """Re-index a question from its ORM object."""
+        self.add_question(question.id, question.text)
+
+    def remove_question(self, question_id: int) -> None:
+        """Remove a question from the index, if present."""
+        if not self._built:
+            return
+        with self._lock:
+            self._discard(question_id)
+
+    def _signature_at(self, slot: int) -> array:
+        start = slot * SIGNATURE_SIZE
+        return self._store[start : start + SIGNATURE_SIZE]
+
+    def _discard(self, question_id: int) -> None:
+        slot = self._slots.pop(question_id, None)
+        if slot is None:
+            return
+        for buckets, key in zip(self._bands, _band_keys(self._signature_at(slot))):
+            _remove_from_bucket(buckets, key, question_id)
+        self._free_slots.append(slot)
+
+    def signature_of(self, question_id: int) -> Optional[array]:
+        """Return the indexed signature of a question, if any."""
+        with self._lock:
+            slot = self._slots.get(question_id)
+            return self._signature_at(slot) if slot is not None else None
+
+    def find_similar_to_signature(
+        self,
+        signature: Optional[array],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        limit: Optional[int] = None,
+        exclude_ids: Iterable[int] = (),
+    ) -> List[Match]:
+        """
+        Return the indexed questions whose estimated similarity reaches threshold.
+
+        Only questions sharing an LSH bucket with the signature are compared.
+
+        Args:
+            signature (Optional[array]): The signature to look up.
+            threshold (float): The minimum estimated Jaccard similarity.
+            limit (Optional[int]): The maximum number of matches to return.
+            exclude_ids (Iterable[int]): IDs never to return, e.g. the query's own.
+
+        Returns:
+            List[Match]: (question_id, similarity) pairs, most similar first,
+                ties broken by ascending ID.
+        """
+        if signature is None:
+            return []
+        excluded = set(exclude_ids)
+        with self._lock:
+            candidates: Set[int] = set()
+            for buckets, key in zip(self._bands, _band_keys(signature)):
+                bucket = buckets.get(key)
+                if isinstance(bucket, int):
+                    candidates.add(bucket)
+                elif bucket is not None:
+                    candidates.update(bucket)
+            candidates -= excluded
+            matches = []
+            for candidate_id in candidates:
+                similarity = estimate_similarity(
+                    signature, self._signature_at(self._slots[candidate_id])
+                )
+                if similarity >= threshold:
+                    matches.append((candidate_id, similarity))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches[:limit] if limit is not None else matches
+
+    def find_similar(
+        self,
+        text: Optional[str],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        limit: Optional[int] = None,
+        exclude_ids: Iterable[int] = (),
+    ) -> List[Match]:
+        """
+        Return the indexed questions whose text is similar to the given text.
+
+        Usage example:
+            question_similarity_index.find_similar(text, threshold=0.8, limit=5)
+        """
+        return self.find_similar_to_signature(
+            minhash_signature(text), threshold, limit, exclude_ids
+        )
+
+
+question_similarity_index = QuestionSimilarityIndex()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_question_changes(session: Session) -> None:
+    committed = session.info.get(COMMITTED_CHANGES_KEY)
+    if committed is not None:
+        question_similarity_index.apply_committed_changes(*committed)
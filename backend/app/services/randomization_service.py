@@ -1,11 +1,102 @@
 # filename: backend/app/utils/randomization.py
 
 import random
+from typing import Dict, Hashable, List, Optional, Sequence, Union
 
+# An int/str seed for a reproducible draw, a Random to draw from, or None
+SeedType = Optional[Union[int, str, random.Random]]
 
-def randomize_questions(questions):
-    return random.sample(questions, len(questions))
 
+def get_rng(seed: SeedType = None):
+    if isinstance(seed, random.Random):
+        return seed
+    return random.Random(seed) if seed is not None else random
 
-def randomize_answer_choices(answer_choices):
-    return random.sample(answer_choices, len(answer_choices))
+
+def randomize_questions(questions, seed: SeedType = None, count: Optional[int] = None):
+    """
+    Shuffle questions, or draw count of them in random order.
+
+    questions can be any sequence, including the id arrays returned by
+    QuestionSamplingIndex.candidate_ids; drawing count items from it costs
+    O(count) rather than a copy of the whole sequence.
+    """
+    rng = get_rng(seed)
+    size = len(questions) if count is None else min(count, len(questions))
+    return rng.sample(questions, size)
+
+
+def randomize_answer_choices(answer_choices, seed: SeedType = None):
+    rng = get_rng(seed)
+    return rng.sample(answer_choices, len(answer_choices))
+
+
+def allocate_stratified_counts(
+    stratum_sizes: Dict[Hashable, int], count: int
+) -> Dict[Hashable, int]:
+    """
+    Split count across strata in proportion to their sizes.
+
+    Uses the largest remainder method so the allocations always add up to
+    min(count, total size), and no stratum is asked for more items than it has.
+
+    Args:
+        stratum_sizes (Dict[Hashable, int]): The number of items in each stratum.
+        count (int): The total number of items to draw.
+
+    Returns:
+        Dict[Hashable, int]: The number of items to draw from each stratum.
+    """
+    total = sum(stratum_sizes.values())
+    if count >= total:
+        return dict(stratum_sizes)
+    if count <= 0:
+        return {key: 0 for key in stratum_sizes}
+
+    # Sort keys so ties are broken the same way on every call
+    keys = sorted(stratum_sizes, key=str)
+    quotas = {key: count * stratum_sizes[key] / total for key in keys}
+    allocation = {key: int(quotas[key]) for key in keys}
+    remaining = count - sum(allocation.values())
+    # Equal remainders go to the larger stratum first
+    by_remainder = sorted(
+        keys,
+        key=lambda key: (quotas[key] - allocation[key], stratum_sizes[key]),
+        reverse=True,
+    )
+    for key in by_remainder[:remaining]:
+        allocation[key] += 1
+    return allocation
+
+
+def stratified_sample(
+    ids_by_stratum: Dict[Hashable, Sequence[int]], count: int, seed: SeedType
+) -> List[int]:
+    """
+    Draw a reproducible sample of ids, keeping the mix of strata proportional.
+
+    The same ids, count and seed always produce the same ordered result, so
+    callers only need to persist the seed and the filters to replay a draw.
+
+    Args:
+        ids_by_stratum (Dict[Hashable, Sequence[int]]): Candidate ids per stratum
+            (e.g. question ids per difficulty level).
+        count (int): The number of ids to draw.
+        seed (SeedType): The seed for the random number generator.
+
+    Returns:
+        List[int]: The sampled ids in delivery order.
+
+    Usage example:
+        ids = stratified_sample({"Easy": [1, 2, 3], "Hard": [4, 5]}, 3, seed=42)
+    """
+    rng = get_rng(seed)
+    allocation = allocate_stratified_counts(
+        {key: len(ids) for key, ids in ids_by_stratum.items()}, count
+    )
+
+    sample = []
+    for key in sorted(ids_by_stratum, key=str):
+        sample.extend(rng.sample(sorted(ids_by_stratum[key]), allocation[key]))
+    rng.shuffle(sample)
+    return sample
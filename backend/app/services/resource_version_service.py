@@ -0,0 +1,353 @@
+# filename: backend/app/services/resource_version_service.py
+
+"""
+This module keeps a version counter per read-mostly API resource.
+
+Every flush that inserts, updates or deletes a model a resource's responses
+are built from marks that resource as changed on the session, and the
+commit increments each marked resource's row in resource_versions once,
+inside the same transaction. A rolled back write therefore never changes a
+version, every worker process sees the same versions, and a row is locked
+only from the end of a transaction to its commit rather than from its first
+flush. The counters and their
+timestamps are the validators for conditional GETs (ETag/Last-Modified), so
+checking whether a client's copy is current costs one primary-key lookup.
+
+A resource depends on every model its responses include: a question
+response lists its subjects' names, so renaming a subject bumps "questions"
+as well as "taxonomy". The taxonomy graph itself does not include questions,
+so question writes leave "taxonomy" alone; the subject, topic, subtopic and
+concept endpoints, whose responses list their questions, are validated by
+"taxonomy_nodes" instead. Insert, update and delete statements executed
+through a session (the bulk association and answer choice writers,
+Query.delete()) mark the resources of the table they write, as flushes do.
+Statements executed on a bare Connection should call
+bump_resource_versions_in_db().
+
+The versions bumped by a commit are left in session.info under
+BUMPED_VERSIONS_KEY until the commit finishes, for before_commit listeners
+registered after this module's, such as the question change log.
+
+Key dependencies:
+- sqlalchemy: For the session flush hook and the counter statements
+- backend.app.models: For the models each resource depends on
+
+Main functions:
+- resource_for_path: Maps a request path to its resource
+- read_resource_version_from_db: Reads a resource's version and timestamp
+- read_resource_version_key: Reads a version key for validating in-process caches
+- bump_resource_versions_in_db: Increments the versions of some resources
+
+Usage example:
+    from backend.app.services.resource_version_service import (
+        read_resource_version_from_db,
+    )
+
+    version, updated_at = read_resource_version_from_db(db, "questions")
+"""
+
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from sqlalchemy import event, insert, inspect, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from backend.app.models.answer_choices import AnswerChoiceModel
+from backend.app.models.associations import (
+    DisciplineToSubjectAssociation,
+    DomainToDisciplineAssociation,
+    QuestionSetToGroupAssociation,
+    QuestionSetToQuestionAssociation,
+    QuestionToAnswerAssociation,
+    QuestionToConceptAssociation,
+    QuestionToSubjectAssociation,
+    QuestionToSubtopicAssociation,
+    QuestionToTagAssociation,
+    QuestionToTopicAssociation,
+    SubjectToTopicAssociation,
+    SubtopicToConceptAssociation,
+    TopicToSubtopicAssociation,
+)
+from backend.app.models.concepts import ConceptModel
+from backend.app.models.disciplines import DisciplineModel
+from backend.app.models.domains import DomainModel
+from backend.app.models.groups import GroupModel
+from backend.app.models.question_sets import QuestionSetModel
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.models.questions import QuestionModel
+from backend.app.models.resource_versions import ResourceVersionModel
+from backend.app.models.subjects import SubjectModel
+from backend.app.models.subtopics import SubtopicModel
+from backend.app.models.topics import TopicModel
+
+# session.info keys: resources changed in the transaction, and the versions
+# the commit bumped them to
+_PENDING_RESOURCES_KEY = "resource_versions_pending"
+BUMPED_VERSIONS_KEY = "resource_versions_bumped"
+
+_QUESTION_TAXONOMY_MODELS = frozenset(
+    {
+        SubjectModel,
+        TopicModel,
+        SubtopicModel,
+        ConceptModel,
+        QuestionToSubjectAssociation,
+        QuestionToTopicAssociation,
+        QuestionToSubtopicAssociation,
+        QuestionToConceptAssociation,
+    }
+)
+
+_TAXONOMY_GRAPH_MODELS = frozenset(
+    {
+        DomainModel,
+        DisciplineModel,
+        SubjectModel,
+        TopicModel,
+        SubtopicModel,
+        ConceptModel,
+        DomainToDisciplineAssociation,
+        DisciplineToSubjectAssociation,
+        SubjectToTopicAssociation,
+        TopicToSubtopicAssociation,
+        SubtopicToConceptAssociation,
+    }
+)
+
+# resource -> the models its responses are built from
+RESOURCE_DEPENDENCIES = {
+    "questions": _QUESTION_TAXONOMY_MODELS
+    | {
+        QuestionModel,
+        AnswerChoiceModel,
+        QuestionTagModel,
+        QuestionSetModel,
+        QuestionToAnswerAssociation,
+        QuestionToTagAssociation,
+        QuestionSetToQuestionAssociation,
+    },
+    "question_sets": frozenset(
+        {
+            QuestionSetModel,
+            QuestionModel,
+            GroupModel,
+            QuestionSetToQuestionAssociation,
+            QuestionSetToGroupAssociation,
+        }
+    ),
+    "question_tags": frozenset({QuestionTagModel}),
+    # The taxonomy graph: nodes and their parent/child links, no questions
+    "taxonomy": _TAXONOMY_GRAPH_MODELS,
+    # Subject, topic, subtopic and concept responses also list their questions
+    "taxonomy_nodes": _TAXONOMY_GRAPH_MODELS | _QUESTION_TAXONOMY_MODELS | {QuestionModel},
+}
+
+# first path segment -> resource
+RESOURCE_PATH_PREFIXES = {
+    "questions": "questions",
+    "question-sets": "question_sets",
+    "question-tags": "question_tags",
+    "domains": "taxonomy",
+    "disciplines": "taxonomy",
+    "subjects": "taxonomy_nodes",
+    "topics": "taxonomy_nodes",
+    "subtopics": "taxonomy_nodes",
+    "concepts": "taxonomy_nodes",
+    "taxonomy": "taxonomy",
+}
+
+
+# resource -> the tables of its models, for statements that bypass the unit of work
+RESOURCE_TABLES = {
+    resource: frozenset(model.__table__.name for model in models)
+    for resource, models in RESOURCE_DEPENDENCIES.items()
+}
+
+
+def resource_for_path(path: str) -> Optional[str]:
+    """
+    Return the resource whose version validates responses for a request path.
+
+    Usage example:
+        resource_for_path("/subjects/3")  # "taxonomy"
+    """
+    return RESOURCE_PATH_PREFIXES.get(path.strip("/").split("/", 1)[0])
+
+
+def read_resource_version_from_db(
+    db: Session, resource: str
+) -> Tuple[int, Optional[datetime]]:
+    """
+    Read the version of a resource and when it last changed.
+
+    Args:
+        db (Session): The database session.
+        resource (str): The resource, a key of RESOURCE_DEPENDENCIES.
+
+    Returns:
+        Tuple[int, Optional[datetime]]: The version and its UTC timestamp, or
+            (0, None) if the resource has never been written.
+    """
+    row = db.execute(
+        select(ResourceVersionModel.version, ResourceVersionModel.updated_at).where(
+            ResourceVersionModel.resource == resource
+        )
+    ).first()
+    if row is None:
+        return 0, None
+    version, updated_at = row
+    # SQLite returns naive datetimes; they were stored in UTC
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return version, updated_at.astimezone(timezone.utc)
+
+
+_version_table_exists: Dict[str, bool] = {}
+
+
+def read_resource_version_key(db: Session, resource: str) -> Optional[Tuple]:
+    """
+    Read a key identifying the current data of a resource, for in-process caches.
+
+    A cache built at one key is current while the key is unchanged; the
+    timestamp tells apart two writes that rolled back to the same version.
+
+    Args:
+        db (Session): The database session.
+        resource (str): The resource, a key of RESOURCE_DEPENDENCIES.
+
+    Returns:
+        Optional[Tuple]: (version, updated_at), or None if the database has
+            not been migrated to the resource_versions table.
+    """
+    bind = db.get_bind()
+    url = str(bind.engine.url)
+    exists = _version_table_exists.get(url)
+    if exists is None:
+        # Checked once per database; only unmigrated databases lack the table
+        exists = _version_table_exists[url] = inspect(bind).has_table(
+            ResourceVersionModel.__tablename__
+        )
+    if not exists:
+        return None
+    return read_resource_version_from_db(db, resource)
+
+
+def bump_resource_versions_in_db(
+    db: Union[Session, Connection], resources: Iterable[str]
+) -> Dict[str, int]:
+    """
+    Increment the versions of resources in the current transaction.
+
+    Args:
+        db (Union[Session, Connection]): The session or connection to write with.
+        resources (Iterable[str]): The resources whose data changed.
+
+    Returns:
+        Dict[str, int]: The new version of each resource.
+
+    Usage example:
+        bump_resource_versions_in_db(db, ["questions"])
+    """
+    resources = sorted(set(resources))
+    if not resources:
+        return {}
+    now = datetime.now(timezone.utc)
+    stmt = (
+        update(ResourceVersionModel)
+        .where(ResourceVersionModel.resource.in_(resources))
+        .values(version=ResourceVersionModel.version + 1, updated_at=now)
+    )
+    dialect = db.dialect if isinstance(db, Connection) else db.get_bind().dialect
+    if dialect.update_returning:
+        versions = dict(
+            db.execute(
+                stmt.returning(
+                    ResourceVersionModel.resource, ResourceVersionModel.version
+                )
+            ).all()
+        )
+    else:
+        db.execute(stmt)
+        versions = dict(
+            db.execute(
+                select(
+                    ResourceVersionModel.resource, ResourceVersionModel.version
+                ).where(ResourceVersionModel.resource.in_(resources))
+            ).all()
+        )
+    missing = [resource for resource in resources if resource not in versions]
+    if missing:
+        # The migration seeds every resource; this only runs on fresh schemas
+        db.execute(
+            insert(ResourceVersionModel),
+            [
+                {"resource": resource, "version": 1, "updated_at": now}
+                for resource in missing
+            ],
+        )
+        versions.update((resource, 1) for resource in missing)
+    return versions
+
+
+def _mark_resources_changed(session: Session, resources: Iterable[str]) -> None:
+    session.info.setdefault(_PENDING_RESOURCES_KEY, set()).update(resources)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_resources(session: Session, flush_context) -> None:
+    # new, dirty and deleted still describe the flushed changes at this point
+    changed_models = {
+        type(instance)
+        for instance in chain(session.new, session.dirty, session.deleted)
+    }
+    _mark_resources_changed(
+        session,
+        (
+            resource
+            for resource, models in RESOURCE_DEPENDENCIES.items()
+            if not models.isdisjoint(changed_models)
+        ),
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_resources_written_by_statement(orm_execute_state) -> None:
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    table_name = getattr(orm_execute_state.statement.table, "name", None)
+    resources = [
+        resource
+        for resource, tables in RESOURCE_TABLES.items()
+        if table_name in tables
+    ]
+    _mark_resources_changed(orm_execute_state.session, resources)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_changed_resources(session: Session) -> None:
+    if session.in_nested_transaction():
+        # Releasing a savepoint; the outermost commit bumps
+        return
+    # before_commit runs ahead of the commit's own flush
+    session.flush()
+    resources = session.info.pop(_PENDING_RESOURCES_KEY, None)
+    if not resources:
+        return
+    # On the connection, so these statements do not trigger the hooks again
+    session.info[BUMPED_VERSIONS_KEY] = bump_resource_versions_in_db(
+        session.connection(), resources
+    )
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_changed_resources(session: Session, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_PENDING_RESOURCES_KEY, None)
+        session.info.pop(BUMPED_VERSIONS_KEY, None)
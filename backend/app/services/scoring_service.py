@@ -11,6 +11,7 @@ from backend.app.models.time_period import TimePeriodModel
 from backend.app.models.user_responses import UserResponseModel
 from backend.app.models.users import UserModel
 from backend.app.schemas.leaderboard import LeaderboardSchema, TimePeriodSchema
+from backend.app.services.tracing_service import traced
 
 
 def calculate_user_score(user_id: int, db: Session) -> int:
@@ -21,6 +22,7 @@ def calculate_user_score(user_id: int, db: Session) -> int:
     return total_score
 
 
+@traced
 def calculate_leaderboard_scores(
     db: Session, time_period: TimePeriodModel, group_id: int = None
 ) -> Dict[int, int]:
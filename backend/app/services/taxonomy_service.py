@@ -0,0 +1,345 @@
+# filename: backend/app/services/taxonomy_service.py
+
+"""
+This module keeps an in-process, versioned snapshot of the content taxonomy.
+
+The Domain -> Discipline -> Subject -> Topic -> Subtopic -> Concept hierarchy
+changes rarely but is read constantly, and walking it through the CRUD
+helpers costs one query per hop. A TaxonomyGraph is an immutable snapshot of
+the whole hierarchy, loaded with one query per table, holding id -> name and
+name -> id maps per level and adjacency tuples in both directions.
+
+Each read checks the "taxonomy" row of resource_versions, which every
+write to the taxonomy bumps in its transaction, and the snapshot is rebuilt
+when it has moved, so a write in one worker process is seen by the others on
+their next read. The taxonomy CRUD modules also call
+taxonomy_cache.bump_version() after every committed create, update or
+delete. On a database that has not been migrated to resource_versions,
+snapshots instead expire after TAXONOMY_CACHE_TTL_SECONDS.
+
+Key dependencies:
+- sqlalchemy: For the snapshot queries
+- backend.app.models: For the taxonomy and association models
+
+Main classes and functions:
+- TaxonomyGraph: An immutable snapshot of the hierarchy
+- build_taxonomy_graph: Loads a snapshot from the database
+- TaxonomyCache: Holds the current snapshot and version
+- taxonomy_cache: The process-wide TaxonomyCache
+
+Usage example:
+    from backend.app.services.taxonomy_service import taxonomy_cache
+
+    graph = taxonomy_cache.get_graph(db)
+    subject_id = graph.find_id("subjects", "Algebra")
+    topic_ids = graph.children["subjects"].get(subject_id, ())
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Hashable, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.app.models.associations import (
+    DisciplineToSubjectAssociation,
+    DomainToDisciplineAssociation,
+    SubjectToTopicAssociation,
+    SubtopicToConceptAssociation,
+    TopicToSubtopicAssociation,
+)
+from backend.app.models.concepts import ConceptModel
+from backend.app.models.disciplines import DisciplineModel
+from backend.app.models.domains import DomainModel
+from backend.app.models.subjects import SubjectModel
+from backend.app.models.subtopics import SubtopicModel
+from backend.app.models.topics import TopicModel
+from backend.app.services.logging_service import logger
+from backend.app.services.metrics_service import metrics
+from backend.app.services.resource_version_service import read_resource_version_key
+
+TAXONOMY_LEVELS = (
+    "domains",
+    "disciplines",
+    "subjects",
+    "topics",
+    "subtopics",
+    "concepts",
+)
+
+TAXONOMY_MODELS = {
+    "domains": DomainModel,
+    "disciplines": DisciplineModel,
+    "subjects": SubjectModel,
+    "topics": TopicModel,
+    "subtopics": SubtopicModel,
+    "concepts": ConceptModel,
+}
+
+# (parent level, parent column, child column) for each hop down the hierarchy
+TAXONOMY_EDGES = (
+    (
+        "domains",
+        DomainToDisciplineAssociation.domain_id,
+        DomainToDisciplineAssociation.discipline_id,
+    ),
+    (
+        "disciplines",
+        DisciplineToSubjectAssociation.discipline_id,
+        DisciplineToSubjectAssociation.subject_id,
+    ),
+    (
+        "subjects",
+        SubjectToTopicAssociation.subject_id,
+        SubjectToTopicAssociation.topic_id,
+    ),
+    (
+        "topics",
+        TopicToSubtopicAssociation.topic_id,
+        TopicToSubtopicAssociation.subtopic_id,
+    ),
+    (
+        "subtopics",
+        SubtopicToConceptAssociation.subtopic_id,
+        SubtopicToConceptAssociation.concept_id,
+    ),
+)
+
+# Only used when the database has no resource_versions table
+TAXONOMY_CACHE_TTL_SECONDS = 60
+
+# How many unknown names a snapshot remembers before it forgets them all
+MAX_MISSING_NAMES = 10000
+
+Adjacency = Mapping[int, Tuple[int, ...]]
+
+
+def _freeze(groups: Dict[Hashable, List[int]]) -> Mapping[Hashable, Tuple[int, ...]]:
+    return MappingProxyType({key: tuple(sorted(ids)) for key, ids in groups.items()})
+
+
+@dataclass(frozen=True)
+class TaxonomyGraph:
+    """
+    An immutable snapshot of the taxonomy.
+
+    Attributes:
+        version (int): The cache version the snapshot was built for.
+        names (Mapping[str, Mapping[int, str]]): id -> name per level.
+        ids_by_name (Mapping[str, Mapping[str, Tuple[int, ...]]]): lowercased
+            name -> ids per level. Names are not unique case-insensitively
+            (and not at all for subtopics and concepts), so each maps to a tuple.
+        children (Mapping[str, Adjacency]): parent id -> child ids, keyed by the
+            parent level (e.g. children["subjects"][3] are topic ids).
+        parents (Mapping[str, Adjacency]): child id -> parent ids, keyed by the
+            child level (e.g. parents["topics"][7] are subject ids).
+
+    Names confirmed missing from the database after the snapshot was built
+    are remembered with mark_missing(), so a repeated lookup of an unknown
+    name costs no query until the snapshot is replaced.
+    """
+
+    version: int
+    names: Mapping[str, Mapping[int, str]]
+    ids_by_name: Mapping[str, Mapping[str, Tuple[int, ...]]]
+    children: Mapping[str, Adjacency]
+    parents: Mapping[str, Adjacency]
+    _serialized: Dict[str, object] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _missing: Set[Tuple[str, str]] = field(
+        default_factory=set, repr=False, compare=False
+    )
+
+    def find_id(self, level: str, name: str) -> Optional[int]:
+        """Return the lowest id of the nodes with this name (case-insensitive), if any."""
+        ids = self.find_ids(level, name)
+        return ids[0] if ids else None
+
+    def is_missing(self, level: str, name: str) -> bool:
+        """Tell whether the name was confirmed missing since the snapshot was built."""
+        return (level, name.lower()) in self._missing
+
+    def mark_missing(self, level: str, name: str) -> None:
+        """Remember that no node of the level has this name (case-insensitive)."""
+        if len(self._missing) >= MAX_MISSING_NAMES:
+            # Bounds the memory a stream of made-up names can take
+            self._missing.clear()
+        self._missing.add((level, name.lower()))
+
+    def find_ids(self, level: str, name: str) -> Tuple[int, ...]:
+        """Return the ids of all nodes with this name (case-insensitive), ascending."""
+        return self.ids_by_name[level].get(name.lower(), ())
+
+    def child_level(self, level: str) -> Optional[str]:
+        index = TAXONOMY_LEVELS.index(level)
+        return TAXONOMY_LEVELS[index + 1] if index + 1 < len(TAXONOMY_LEVELS) else None
+
+    def _subtree(self, level: str, node_id: int) -> Dict:
+        node = {"id": node_id, "name": self.names[level][node_id]}
+        child_level = self.child_level(level)
+        if child_level:
+            node[child_level] = [
+                self._subtree(child_level, child_id)
+                for child_id in self.children[level].get(node_id, ())
+            ]
+        return node
+
+    def to_tree(self) -> Dict:
+        """
+        Return the hierarchy as nested dictionaries rooted at the domains.
+
+        Nodes with several parents appear under each of them. Nodes below the
+        domain level that have no parent are listed, with their subtrees,
+        under "unattached".
+        """
+        unattached = {}
+        for level in TAXONOMY_LEVELS[1:]:
+            orphans = [
+                node_id
+                for node_id in sorted(self.names[level])
+                if not self.parents[level].get(node_id)
+            ]
+            if orphans:
+                unattached[level] = [
+                    self._subtree(level, node_id) for node_id in orphans
+                ]
+        return {
+            "domains": [
+                self._subtree("domains", domain_id)
+                for domain_id in sorted(self.names["domains"])
+            ],
+            "unattached": unattached,
+        }
+
+    def tree_json(self) -> bytes:
+        """Return the tree serialized as JSON, computed once per snapshot."""
+        if "tree" not in self._serialized:
+            self._serialized["tree"] = json.dumps(
+                self.to_tree(), separators=(",", ":")
+            ).encode("utf-8")
+        return self._serialized["tree"]
+
+
+def build_taxonomy_graph(db: Session, version: int = 0) -> TaxonomyGraph:
+    """
+    Load a snapshot of the whole taxonomy.
+
+    Issues one query per level and one per association table.
+
+    Args:
+        db (Session): The database session.
+        version (int): The cache version to stamp on the snapshot.
+
+    Returns:
+        TaxonomyGraph: The snapshot.
+    """
+    names = {}
+    ids_by_name = {}
+    for level, model in TAXONOMY_MODELS.items():
+        rows = db.execute(select(model.id, model.name)).all()
+        names[level] = MappingProxyType({node_id: name for node_id, name in rows})
+        by_name: Dict[str, List[int]] = {}
+        for node_id, name in rows:
+            if name is not None:
+                by_name.setdefault(name.lower(), []).append(node_id)
+        ids_by_name[level] = _freeze(by_name)
+
+    children = {}
+    parents = {}
+    for parent_level, parent_column, child_column in TAXONOMY_EDGES:
+        child_level = TAXONOMY_LEVELS[TAXONOMY_LEVELS.index(parent_level) + 1]
+        down: Dict[int, List[int]] = {}
+        up: Dict[int, List[int]] = {}
+        for parent_id, child_id in db.execute(select(parent_column, child_column)):
+            down.setdefault(parent_id, []).append(child_id)
+            up.setdefault(child_id, []).append(parent_id)
+        children[parent_level] = _freeze(down)
+        parents[child_level] = _freeze(up)
+    children["concepts"] = MappingProxyType({})
+    parents["domains"] = MappingProxyType({})
+
+    return TaxonomyGraph(
+        version=version,
+        names=MappingProxyType(names),
+        ids_by_name=MappingProxyType(ids_by_name),
+        children=MappingProxyType(children),
+        parents=MappingProxyType(parents),
+    )
+
+
+class TaxonomyCache:
+    """Holds the current taxonomy snapshot and rebuilds it when the version moves."""
+
+    def __init__(self, ttl_seconds: float = TAXONOMY_CACHE_TTL_SECONDS):
+        self._lock = threading.Lock()
+        self._version_lock = threading.Lock()
+        self._version = 0
+        # (graph, resource version key it was built at, monotonic build time)
+        self._snapshot: Optional[Tuple[TaxonomyGraph, Optional[Tuple], float]] = None
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump_version(self) -> int:
+        """Mark the cached snapshot as outdated. Call after committing a taxonomy write."""
+        # Separate from the rebuild lock so writers never wait for a rebuild
+        with self._version_lock:
+            self._version += 1
+            return self._version
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next reader rebuilds it."""
+        self._snapshot = None
+
+    def _is_current(self, snapshot, data_version: Optional[Tuple]) -> bool:
+        if snapshot is None:
+            return False
+        graph, built_data_version, built_at = snapshot
+        if graph.version != self._version:
+            return False
+        if data_version is None:
+            return time.monotonic() - built_at < self.ttl_seconds
+        return built_data_version == data_version
+
+    def get_graph(self, db: Session) -> TaxonomyGraph:
+        """
+        Return the current snapshot, rebuilding it if the taxonomy has changed.
+
+        Costs one primary-key lookup of the taxonomy resource version.
+
+        Args:
+            db (Session): The database session used for the version lookup
+                and a rebuild.
+
+        Returns:
+            TaxonomyGraph: The current snapshot.
+        """
+        data_version = read_resource_version_key(db, "taxonomy")
+        snapshot = self._snapshot
+        if self._is_current(snapshot, data_version):
+            metrics.inc("cache_requests_total", ("taxonomy", "hit"))
+            return snapshot[0]
+
+        with self._lock:
+            snapshot = self._snapshot
+            if self._is_current(snapshot, data_version):
+                metrics.inc("cache_requests_total", ("taxonomy", "hit"))
+                return snapshot[0]
+            version = self._version
+            graph = build_taxonomy_graph(db, version)
+            # A write committed during the build moves the version key past
+            # the snapshot's, so the next reader rebuilds again
+            self._snapshot = (graph, data_version, time.monotonic())
+            logger.debug("Rebuilt taxonomy graph at version %s", version)
+            metrics.inc("cache_requests_total", ("taxonomy", "miss"))
+            return graph
+
+
+taxonomy_cache = TaxonomyCache()
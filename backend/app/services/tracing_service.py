@@ -0,0 +1,608 @@
+# filename: backend/app/services/tracing_service.py
+
+"""
+This module records request traces: timed, nested spans for one request.
+
+A trace starts at the tracing middleware, which decides once per request
+whether to record it (head-based sampling). Nested spans are created for
+each middleware, the matched route and its endpoint function, every CRUD
+function decorated with traced, and every SQL statement. The current span
+is held in a context variable, so spans nest across awaits and across the
+threadpool that runs sync endpoints. In a request that is not sampled there
+is no current span, and every span point costs one context variable read.
+
+Finished traces are kept in a ring buffer, read by the /admin/traces
+endpoints, and can also be appended to a file as OTLP JSON, one
+ExportTraceServiceRequest per line, for loading into other tools.
+
+Settings come from the [tool.app.tracing] table of pyproject.toml:
+- sample_rate_<environment>: The fraction of requests traced, e.g. 0.01
+- ring_size: How many finished traces each worker keeps
+- export_file: A file to append traces to, empty to disable
+
+An incoming W3C traceparent header links the request's trace to the
+caller's, and a caller that did not sample its trace is not traced here
+either. The header never forces tracing: any client can send it, so a
+request marked sampled is still subject to this worker's sample rate.
+
+Key dependencies:
+- contextvars: For propagating the current span
+- sqlalchemy.event: For the SQL statement spans
+
+Main functions:
+- tracer: The process-wide tracer holding the kept traces
+- span: Records a span around a block of code
+- traced: Decorator recording a span around each call of a function
+- traced_middleware: Class decorator recording a span around a middleware
+- instrument_routes: Records spans for every route of an application
+- configure_tracing: Applies the pyproject.toml settings
+
+Usage example:
+    from backend.app.services.tracing_service import span, traced
+
+    @traced
+    def read_thing_from_db(db, thing_id):
+        ...
+
+    with span("leaderboard.upsert_entries", {"entries": len(scores)}):
+        ...
+"""
+
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Deque, List, Optional
+
+import toml
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.app.services.logging_service import PROJECT_ROOT, logger
+
+DEFAULT_RING_SIZE = 100
+MAX_SPANS_PER_TRACE = 1000
+MAX_STATEMENT_LENGTH = 1000
+EXPORT_QUEUE_SIZE = 1000
+SERVICE_NAME = "quiz-app-backend"
+SCOPE_NAME = __name__
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits) or 1:0{bits // 4}x}"
+
+
+class Trace:
+    """The spans of one request; spans add themselves as they end."""
+
+    __slots__ = ("trace_id", "spans", "dropped_spans", "root")
+
+    def __init__(self, trace_id: Optional[str] = None):
+        self.trace_id = trace_id or _new_id(128)
+        self.spans: List["Span"] = []
+        self.dropped_spans = 0
+        self.root: Optional["Span"] = None
+
+    def summary(self) -> dict:
+        root = self.root
+        return {
+            "trace_id": self.trace_id,
+            "name": root.name,
+            "start_time": root.start_ns / 1e9,
+            "duration_ms": root.duration_ms,
+            "status_code": root.attributes.get("http.status_code"),
+            "error": root.status == STATUS_ERROR,
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+        }
+
+    def to_otlp(self) -> dict:
+        """Return the trace as an OTLP JSON ExportTraceServiceRequest."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {"service.name": SERVICE_NAME, "process.pid": os.getpid()}
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": SCOPE_NAME},
+                            "spans": [span.to_otlp() for span in list(self.spans)],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+class Span:
+    """A named, timed operation within a trace."""
+
+    __slots__ = (
+        "trace",
+        "span_id",
+        "parent_span_id",
+        "name",
+        "kind",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "status",
+        "status_message",
+    )
+
+    def __init__(
+        self,
+        trace: Trace,
+        name: str,
+        parent_span_id: Optional[str] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[dict] = None,
+    ):
+        self.trace = trace
+        self.span_id = _new_id(64)
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.attributes = dict(attributes) if attributes else {}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = STATUS_UNSET
+        self.status_message = ""
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return round((self.end_ns - self.start_ns) / 1e6, 3)
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = str(error)
+        self.attributes["exception.type"] = type(error).__name__
+
+    def end(self) -> None:
+        self.end_ns = time.time_ns()
+        trace = self.trace
+        if len(trace.spans) < MAX_SPANS_PER_TRACE or self is trace.root:
+            trace.spans.append(self)
+        else:
+            trace.dropped_spans += 1
+
+    def to_otlp(self) -> dict:
+        otlp_span = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status},
+        }
+        if self.status_message:
+            otlp_span["status"]["message"] = self.status_message
+        return otlp_span
+
+
+def _otlp_attributes(attributes: dict) -> List[dict]:
+    otlp_attributes = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            otlp_value = {"boolValue": value}
+        elif isinstance(value, int):
+            otlp_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            otlp_value = {"doubleValue": value}
+        else:
+            otlp_value = {"stringValue": str(value)}
+        otlp_attributes.append({"key": key, "value": otlp_value})
+    return otlp_attributes
+
+
+class FileTraceExporter:
+    """
+    Appends finished traces to a file as OTLP JSON lines from a background thread.
+
+    Exporting never blocks a request: traces that arrive while the queue is
+    full are dropped and counted. Each trace is written with a single write
+    to a file opened for appending, so several workers can share the file.
+    """
+
+    def __init__(self, path: str, queue_size: int = EXPORT_QUEUE_SIZE):
+        self.path = path
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, trace: Trace) -> None:
+        try:
+            self.queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            trace = self.queue.get()
+            if trace is None:
+                return
+            try:
+                line = json.dumps(trace.to_otlp(), separators=(",", ":")) + "\n"
+                with open(self.path, "a") as export_file:
+                    export_file.write(line)
+            except OSError as e:
+                logger.error("Failed to export trace to %s: %s", self.path, e)
+
+    def close(self) -> None:
+        """Write the queued traces and stop the thread."""
+        self.queue.put(None)
+        self._thread.join()
+
+
+class Tracer:
+    """
+    Makes the sampling decision for new traces and keeps the finished ones.
+
+    Usage example:
+        trace = tracer.start_trace()
+        if trace is not None:
+            ...
+    """
+
+    def __init__(self, sample_rate: float = 0.0, ring_size: int = DEFAULT_RING_SIZE):
+        self.sample_rate = sample_rate
+        self.traces: Deque[Trace] = deque(maxlen=ring_size)
+        self.exporter: Optional[FileTraceExporter] = None
+
+    def start_trace(self, traceparent: Optional[str] = None) -> Optional[tuple]:
+        """
+        Decide whether to trace a request.
+
+        Args:
+            traceparent (Optional[str]): The request's W3C traceparent header, if any.
+
+        Returns:
+            Optional[tuple]: (Trace, remote parent span ID or None) if the
+            request is sampled, None otherwise.
+        """
+        trace_id = parent_span_id = None
+        if traceparent:
+            match = TRACEPARENT_PATTERN.match(traceparent.strip().lower())
+            if match:
+                trace_id, parent_span_id, flags = match.groups()
+                if not int(flags, 16) & 1:
+                    return None
+        sample_rate = self.sample_rate
+        if sample_rate <= 0 or (sample_rate < 1 and random.random() >= sample_rate):
+            return None
+        return Trace(trace_id), parent_span_id
+
+    def finish_trace(self, trace: Trace) -> None:
+        self.traces.append(trace)
+        if self.exporter is not None:
+            self.exporter.export(trace)
+
+    def resize(self, ring_size: int) -> None:
+        self.traces = deque(self.traces, maxlen=ring_size)
+
+    def list_traces(
+        self, limit: int, name: Optional[str] = None, min_duration_ms: float = 0
+    ) -> List[dict]:
+        """Return summaries of the kept traces, newest first."""
+        summaries = []
+        for trace in reversed(list(self.traces)):
+            summary = trace.summary()
+            if name is not None and name not in summary["name"]:
+                continue
+            if summary["duration_ms"] < min_duration_ms:
+                continue
+            summaries.append(summary)
+            if len(summaries) >= limit:
+                break
+        return summaries
+
+    def get_trace(self, trace_id: str) -> Optional[Trace]:
+        for trace in list(self.traces):
+            if trace.trace_id == trace_id:
+                return trace
+        return None
+
+    def clear(self) -> None:
+        self.traces.clear()
+
+
+tracer = Tracer()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost open span of the current request, or None if it is not traced."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, attributes: Optional[dict] = None, kind: int = SPAN_KIND_INTERNAL):
+    """
+    Record a span around a block, as a child of the current span.
+
+    Outside a traced request nothing is recorded and None is yielded.
+
+    Args:
+        name (str): The span's name.
+        attributes (Optional[dict]): Attributes to record on the span.
+        kind (int, optional): The OTLP span kind.
+
+    Yields:
+        Optional[Span]: The span, to which more attributes can be added.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    child = Span(parent.trace, name, parent.span_id, kind, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.record_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+
+def _span_name(func) -> str:
+    return f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+
+def traced(func=None, *, name: Optional[str] = None):
+    """
+    Decorate a function so each call in a traced request records a span.
+
+    The span is named module.function unless a name is given. Works for
+    sync and async functions.
+
+    Usage example:
+        @traced
+        def read_user_from_db(db, user_id):
+            ...
+    """
+
+    def decorate(func):
+        span_name = name or _span_name(func)
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await func(*args, **kwargs)
+                with span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    if func is not None:
+        return decorate(func)
+    return decorate
+
+
+def traced_middleware(cls):
+    """
+    Class decorator recording a span named after an ASGI middleware around each HTTP call.
+
+    The span covers the layers inside the middleware too, so a middleware's
+    own time is its span's duration less its child span's.
+    """
+    call = cls.__call__
+    span_name = cls.__name__
+
+    @wraps(call)
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or _current_span.get() is None:
+            await call(self, scope, receive, send)
+            return
+        with span(span_name):
+            await call(self, scope, receive, send)
+
+    cls.__call__ = __call__
+    return cls
+
+
+def _traced_route_app(route_app, span_name: str, path: str):
+    async def app(scope, receive, send):
+        if _current_span.get() is None:
+            await route_app(scope, receive, send)
+            return
+        with span(span_name, {"http.route": path}):
+            await route_app(scope, receive, send)
+
+    return app
+
+
+def instrument_routes(app) -> None:
+    """
+    Record spans for the API routes of an application.
+
+    Each route gets a span covering request parsing, dependencies, the
+    endpoint and response serialization, and a child span for the endpoint
+    function alone. Call once after every router is included.
+    """
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or getattr(route, "_traced", False):
+            continue
+        route.app = _traced_route_app(route.app, f"route {route.name}", route.path)
+        # The endpoint's sync or async nature is kept, so FastAPI calls it as before
+        route.dependant.call = traced(route.dependant.call, name=f"endpoint {route.name}")
+        route._traced = True
+
+
+class TracingMiddleware:
+    """
+    Starts the trace of each sampled HTTP request and keeps it when the request ends.
+
+    A plain ASGI middleware, added last so that it is the outermost layer
+    and the root span covers every other middleware. In requests that are
+    not sampled it only makes the sampling decision.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for header_name, header_value in scope["headers"]:
+            if header_name == b"traceparent":
+                traceparent = header_value.decode("latin-1")
+                break
+        started = tracer.start_trace(traceparent)
+        if started is None:
+            await self.app(scope, receive, send)
+            return
+
+        trace, remote_parent_id = started
+        root = Span(
+            trace,
+            f"{scope['method']} {scope['path']}",
+            remote_parent_id,
+            SPAN_KIND_SERVER,
+            {"http.method": scope["method"], "http.target": scope["path"]},
+        )
+        trace.root = root
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        token = _current_span.set(root)
+        try:
+            await self.app(scope, receive, send_with_status)
+        except BaseException as e:
+            root.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            route = scope.get("route")
+            if route is not None:
+                root.name = f"{scope['method']} {route.path}"
+                root.attributes["http.route"] = route.path
+            root.attributes["http.status_code"] = status_code
+            if status_code >= 500:
+                root.status = STATUS_ERROR
+            root.end()
+            tracer.finish_trace(trace)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_span(conn, cursor, statement, parameters, context, executemany):
+    parent = _current_span.get()
+    if parent is None:
+        return
+    conn.info["trace_span"] = Span(
+        parent.trace,
+        statement.split(None, 1)[0].upper() if statement else "SQL",
+        parent.span_id,
+        SPAN_KIND_CLIENT,
+        {
+            "db.system": conn.dialect.name,
+            "db.statement": statement[:MAX_STATEMENT_LENGTH],
+            "db.executemany": bool(executemany),
+        },
+    )
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_statement_span(conn, cursor, statement, parameters, context, executemany):
+    statement_span = conn.info.pop("trace_span", None)
+    if statement_span is not None:
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            statement_span.attributes["db.rowcount"] = cursor.rowcount
+        statement_span.end()
+
+
+@event.listens_for(Engine, "handle_error")
+def _fail_statement_span(exception_context):
+    connection = exception_context.connection
+    if connection is None:
+        return
+    statement_span = connection.info.pop("trace_span", None)
+    if statement_span is not None:
+        statement_span.record_error(exception_context.original_exception)
+        statement_span.end()
+
+
+def load_tracing_config() -> dict:
+    """Read the [tool.app.tracing] table of pyproject.toml, or {} if absent."""
+    try:
+        return toml.load(os.path.join(PROJECT_ROOT, "pyproject.toml"))["tool"][
+            "app"
+        ].get("tracing", {})
+    except (FileNotFoundError, KeyError):
+        return {}
+
+
+def configure_tracing() -> None:
+    """
+    Apply the [tool.app.tracing] settings to the tracer and start the file exporter.
+
+    Called from the application's lifespan in every worker.
+    """
+    config = load_tracing_config()
+    environment = os.getenv("ENVIRONMENT", "dev")
+    tracer.sample_rate = float(config.get(f"sample_rate_{environment}", 0.0))
+    tracer.resize(int(config.get("ring_size", DEFAULT_RING_SIZE)))
+    export_file = config.get("export_file", "")
+    if export_file and tracer.exporter is None:
+        tracer.exporter = FileTraceExporter(export_file)
+
+
+def shutdown_tracing() -> None:
+    """Write the traces still queued for the file exporter, if there is one."""
+    if tracer.exporter is not None:
+        tracer.exporter.close()
+        tracer.exporter = None
@@ -6,7 +6,7 @@ import time
 
 import pytest
 
-from backend.app.services.logging_service import logger
+from backend.app.services.logging_service import get_logger, logger
 from backend.tests.helpers.performance import PerformanceTracker, categorize_test_name
 from backend.tests.helpers.fixture_performance import get_fixture_performance_tracker
 
@@ -19,6 +19,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"
 # Set the environment to test for pytest
 os.environ["ENVIRONMENT"] = "test"
 
+# The app attaches log handlers in its lifespan; tests log outside of it
+get_logger()
+
 # Register all fixture modules as pytest plugins
 pytest_plugins = [
     "backend.tests.fixtures.database.session_fixtures",
@@ -2,7 +2,9 @@
 
 import pytest
 
+from backend.app.core.config import settings_core
 from backend.app.core.jwt import create_access_token
+from backend.app.core.security import build_password_context, set_password_rounds
 from backend.app.services.logging_service import logger
 
 
@@ -13,6 +15,22 @@ def test_token(test_model_user, db_session):
     return access_token
 
 
+@pytest.fixture(scope="function")
+def outdated_password_context():
+    """
+    Raise the bcrypt cost by one and return a context hashing with the old cost.
+
+    Only hashes below the configured cost are upgraded, and the test cost is
+    already bcrypt's minimum, so outdated hashes need a raised cost.
+    """
+    rounds = settings_core.BCRYPT_ROUNDS
+    set_password_rounds(rounds + 1)
+    try:
+        yield build_password_context(rounds)
+    finally:
+        set_password_rounds(rounds)
+
+
 @pytest.fixture(scope="function")
 def logged_in_client(client, test_model_user_with_group, db_session):
     """
@@ -16,6 +16,8 @@ from backend.app.models.roles import RoleModel
 from backend.app.models.domains import DomainModel
 from backend.app.models.disciplines import DisciplineModel
 from backend.app.models.subjects import SubjectModel
+from backend.app.services.question_filter_index_service import question_filter_index
+from backend.app.services.taxonomy_service import taxonomy_cache
 from backend.tests.helpers.fixture_performance import track_fixture_performance
 
 # Load the test database URL from pyproject.toml for compatibility
@@ -378,6 +380,9 @@ def db_session(test_engine, session_factory, base_reference_data):
         if transaction.is_active:
             transaction.rollback()  # FAST: Just rollback transaction
         connection.close()
+        # Process-wide caches may hold data from the rolled back transaction
+        question_filter_index.invalidate()
+        taxonomy_cache.invalidate()
 
 
 class NoCloseSessionWrapper:
@@ -470,6 +475,7 @@ def client(db_session, test_engine):
     from backend.app.db.session import get_db
     from backend.app.middleware.blacklist_middleware import BlacklistMiddleware
     from backend.app.middleware.authorization_middleware import AuthorizationMiddleware
+    from backend.app.middleware.conditional_get_middleware import ConditionalGetMiddleware
     from backend.app.services.logging_service import logger
     
     # Create a wrapper that ignores close() calls
@@ -497,7 +503,11 @@ def client(db_session, test_engine):
     for middleware_item in app.user_middleware:
         if hasattr(middleware_item, 'cls'):
             middleware_cls = middleware_item.cls
-            if middleware_cls in (BlacklistMiddleware, AuthorizationMiddleware):
+            if middleware_cls in (
+                BlacklistMiddleware,
+                AuthorizationMiddleware,
+                ConditionalGetMiddleware,
+            ):
                 # Check if middleware has get_db_func parameter
                 if hasattr(middleware_item, 'kwargs') and 'get_db_func' in middleware_item.kwargs:
                     # Check current function and override if needed
@@ -78,4 +78,17 @@ def test_model_concept(db_session, test_model_subtopic):
     concept.subtopics.append(test_model_subtopic)
     db_session.add(concept)
     db_session.flush()  # Use flush instead of commit for transaction rollback
-    return concept
\ No newline at end of file
+    return concept
+
+@pytest.fixture(scope="function")
+def test_model_taxonomy_chain(db_session, test_model_subject, test_model_concept):
+    """Create a unique domain and discipline above the test subject, topic, subtopic and concept."""
+    import uuid
+    suffix = str(uuid.uuid4())[:8]
+    discipline = DisciplineModel(name=f"test_discipline_{suffix}")
+    discipline.subjects.append(db_session.merge(test_model_subject))
+    domain = DomainModel(name=f"test_domain_{suffix}")
+    domain.disciplines.append(discipline)
+    db_session.add(domain)
+    db_session.flush()  # Use flush instead of commit for transaction rollback
+    return domain
@@ -1,5 +1,7 @@
 # filename: backend/tests/fixtures/models/quiz_fixtures.py
 
+import uuid
+
 import pytest
 
 from backend.app.models.questions import QuestionModel
@@ -84,4 +86,39 @@ def test_model_questions(
         questions.append(question)
 
     db_session.commit()
-    return questions
\ No newline at end of file
+    return questions
+
+@pytest.fixture(scope="function")
+def test_model_quiz_question_pool(
+    db_session,
+    test_model_user_with_group,
+    test_model_subject,
+    test_model_topic,
+    test_model_subtopic,
+    test_model_concept,
+):
+    """Create a uniquely named question set with 6 easy, 3 medium and 1 hard question."""
+    question_set = QuestionSetModel(
+        name=f"Quiz Pool {uuid.uuid4().hex[:8]}",
+        is_public=True,
+        creator_id=test_model_user_with_group.id,
+    )
+    difficulties = ["EASY"] * 6 + ["MEDIUM"] * 3 + ["HARD"]
+    for i, difficulty in enumerate(difficulties):
+        question = QuestionModel(
+            text=f"Quiz Pool Question {i+1}",
+            difficulty=difficulty,
+            subjects=[test_model_subject],
+            topics=[test_model_topic],
+            subtopics=[test_model_subtopic],
+            concepts=[test_model_concept],
+            answer_choices=[
+                AnswerChoiceModel(text=f"Choice {j} for Q{i+1}", is_correct=j == 0)
+                for j in range(4)
+            ],
+        )
+        question_set.questions.append(question)
+    db_session.add(question_set)
+    db_session.commit()
+    db_session.refresh(question_set)
+    return question_set
@@ -7,7 +7,11 @@ import pytest
 from fastapi import HTTPException, status
 
 from backend.app.core.jwt import create_access_token, decode_access_token
-from backend.app.core.security import get_password_hash
+from backend.app.core.security import (
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
 from backend.app.crud.crud_user import create_user_in_db, read_user_by_username_from_db
 from backend.app.services.logging_service import logger
 
@@ -20,6 +24,25 @@ def test_login_success(client, test_model_user):
     assert response.json()["token_type"] == "bearer"
 
 
+def test_login_upgrades_outdated_password_hash(
+    client, db_session, test_model_user, outdated_password_context
+):
+    outdated_hash = outdated_password_context.hash("TestPassword123!")
+    test_model_user.hashed_password = outdated_hash
+    db_session.commit()
+
+    login_data = {"username": test_model_user.username, "password": "TestPassword123!"}
+    response = client.post("/login", json=login_data)
+    assert response.status_code == 200
+
+    # The upgrade runs as a background task, which completes before the
+    # test client returns
+    db_session.refresh(test_model_user)
+    assert test_model_user.hashed_password != outdated_hash
+    assert not password_needs_rehash(test_model_user.hashed_password)
+    assert verify_password("TestPassword123!", test_model_user.hashed_password)
+
+
 def test_login_invalid_credentials(client):
     login_data = {"username": "nonexistent_user", "password": "WrongPassword123!"}
     response = client.post("/login", json=login_data)
@@ -432,3 +432,31 @@ async def test_filter_questions_endpoint_invalid_params_direct(db_session):
         # pylint: disable=unexpected-keyword-arg
         await filter_questions(db=db_session, **invalid_params)
     assert "got an unexpected keyword argument" in str(exc_info.value)
+
+
+def test_question_facets(logged_in_client, test_model_questions, test_model_topic):
+    response = logged_in_client.get(
+        "/questions/facets", params={"topic": test_model_topic.name}
+    )
+    assert response.status_code == 200, f"Failed with response: {response.json()}"
+    facets = response.json()
+    assert facets["total"] == len(test_model_questions)
+    assert facets["difficulty"] == [
+        {"difficulty": "Easy", "count": len(test_model_questions)}
+    ]
+    assert facets["topics"] == [
+        {
+            "id": test_model_topic.id,
+            "name": test_model_topic.name,
+            "count": len(test_model_questions),
+        }
+    ]
+
+
+def test_question_facets_invalid_params(logged_in_client):
+    response = logged_in_client.get("/questions/facets", params={"skip": 10})
+    assert response.status_code == 422
+    assert "Unexpected parameters provided" in response.json()["detail"]
+
+    response = logged_in_client.get("/questions/facets", params={"difficulty": "Trivial"})
+    assert response.status_code == 400
@@ -0,0 +1,49 @@
+# filename: backend/tests/integration/api/test_metrics.py
+
+import re
+
+from backend.app.services.metrics_service import metrics
+
+
+def _sample(body: str, name: str, labels: str) -> float:
+    match = re.search(rf"^{name}\{{{re.escape(labels)}\}} (\S+)$", body, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+def test_metrics_is_unprotected(client):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+
+
+def test_metrics_count_requests_by_route_template(logged_in_client, test_model_taxonomy_chain):
+    before = logged_in_client.get("/metrics").text
+    domain_id = test_model_taxonomy_chain.id
+
+    assert logged_in_client.get(f"/domains/{domain_id}").status_code == 200
+    assert logged_in_client.get("/domains/999999999").status_code == 404
+    body = logged_in_client.get("/metrics").text
+
+    ok_labels = 'route="/domains/{domain_id}",method="GET",status="200"'
+    missing_labels = 'route="/domains/{domain_id}",method="GET",status="404"'
+    assert _sample(body, "http_requests_total", ok_labels) == _sample(
+        before, "http_requests_total", ok_labels
+    ) + 1
+    assert _sample(body, "http_requests_total", missing_labels) == _sample(
+        before, "http_requests_total", missing_labels
+    ) + 1
+    assert f"/domains/{domain_id}" not in body
+
+    count_labels = 'route="/domains/{domain_id}",method="GET"'
+    assert _sample(body, "http_request_db_seconds_count", count_labels) >= 2
+    assert _sample(body, "http_request_db_seconds_sum", count_labels) > 0
+
+
+def test_metrics_record_cache_lookups(logged_in_client):
+    logged_in_client.get("/taxonomy/tree")
+    logged_in_client.get("/taxonomy/tree")
+
+    lookups = metrics.counters["cache_requests_total"]
+    assert lookups.get(("taxonomy", "hit"), 0) + lookups.get(("taxonomy", "miss"), 0) >= 2
@@ -0,0 +1,69 @@
+# filename: backend/tests/integration/api/test_profiling.py
+
+import pytest
+
+from backend.app.services.profiler_service import request_profiler
+
+
+@pytest.fixture
+def disarmed_request_profiler():
+    yield request_profiler
+    request_profiler.disarm()
+
+
+def test_profile_worker(logged_in_client):
+    response = logged_in_client.post("/admin/profile", params={"seconds": 0.1})
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].startswith("attachment; filename=")
+    assert response.headers["content-disposition"].endswith('.collapsed"')
+    for line in response.text.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack and int(count) > 0
+
+
+def test_profile_worker_requires_admin(logged_in_client, test_model_user, db_session):
+    test_model_user.is_admin = False
+    db_session.flush()
+
+    response = logged_in_client.post("/admin/profile", params={"seconds": 0.1})
+
+    assert response.status_code == 403
+
+
+def test_profile_worker_rejects_long_profiles(logged_in_client):
+    response = logged_in_client.post("/admin/profile", params={"seconds": 3600})
+
+    assert response.status_code == 422
+
+
+def test_request_profiles(logged_in_client, disarmed_request_profiler):
+    armed = logged_in_client.post(
+        "/admin/profile/requests", params={"pattern": "^/time-periods/$", "max_requests": 1}
+    )
+    assert armed.status_code == 200
+    assert armed.json()["remaining"] == 1
+
+    assert logged_in_client.get("/time-periods/").status_code == 200
+
+    state = logged_in_client.get("/admin/profile/requests").json()
+    assert state["pattern"] is None
+    capture = state["captures"][0]
+    assert capture["path"] == "/time-periods/"
+    assert capture["status_code"] == 200
+
+    response = logged_in_client.get(f"/admin/profile/requests/{capture['id']}")
+    assert response.status_code == 200
+    assert "attachment" in response.headers["content-disposition"]
+
+
+def test_request_profiles_invalid_pattern(logged_in_client, disarmed_request_profiler):
+    response = logged_in_client.post("/admin/profile/requests", params={"pattern": "("})
+
+    assert response.status_code == 400
+
+
+def test_request_profile_not_found(logged_in_client):
+    response = logged_in_client.get("/admin/profile/requests/999999")
+
+    assert response.status_code == 404
@@ -4,6 +4,7 @@ import json
 import tempfile
 
 from backend.app.services.logging_service import logger
+from backend.app.services.question_similarity_service import question_similarity_index
 
 
 def test_create_question_set_endpoint(logged_in_client):
@@ -68,27 +69,40 @@ def test_upload_question_set_success(logged_in_client, test_model_questions):
         }
     ]
 
-    # Create a temporary file with the JSON data
-    with tempfile.NamedTemporaryFile(
-        mode="w", delete=False, suffix=".json"
-    ) as temp_file:
-        json.dump(json_data, temp_file)
-        temp_file.flush()  # Ensure the contents are written to the file
-        response = logged_in_client.post(
-            "/upload-questions/",
-            data={"question_set_name": "Test Uploaded Question Set"},
-            files={
-                "file": (
-                    "question_set.json",
-                    open(temp_file.name, "rb"),
-                    "application/json",
-                )
-            },
-        )
+    # Fixture questions bypass the CRUD hooks, so start from a fresh index
+    question_similarity_index.invalidate()
+    try:
+        # Create a temporary file with the JSON data
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, suffix=".json"
+        ) as temp_file:
+            json.dump(json_data, temp_file)
+            temp_file.flush()  # Ensure the contents are written to the file
+            response = logged_in_client.post(
+                "/upload-questions/",
+                data={"question_set_name": "Test Uploaded Question Set"},
+                files={
+                    "file": (
+                        "question_set.json",
+                        open(temp_file.name, "rb"),
+                        "application/json",
+                    )
+                },
+            )
+    finally:
+        question_similarity_index.invalidate()
 
     print(response.json())
     assert response.status_code == 200
-    assert response.json() == {"message": "Question set uploaded successfully"}
+    body = response.json()
+    assert body["message"] == "Question set uploaded successfully"
+    # The uploaded question is a copy of an existing one
+    assert [duplicate["index"] for duplicate in body["duplicates"]] == [0]
+    assert {
+        "question_id": test_model_questions[0].id,
+        "similarity": 1.0,
+    } in body["duplicates"][0]["existing"]
+    assert body["skipped"] == []
 
 
 def test_upload_question_set_invalid_json(logged_in_client):
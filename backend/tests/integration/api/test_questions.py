@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from fastapi import HTTPException
 
@@ -6,6 +8,7 @@ from backend.app.crud.crud_questions import create_question_in_db
 from backend.app.models.questions import QuestionModel
 from backend.app.schemas.questions import QuestionCreateSchema
 from backend.app.services.logging_service import logger
+from backend.app.services.question_similarity_service import question_similarity_index
 
 
 def test_create_question(
@@ -352,3 +355,89 @@ def test_delete_question_unauthorized(client, test_model_questions):
         client.delete(f"/questions/{test_model_questions[0].id}")
     assert exc.value.status_code == 401
     assert exc.value.detail == "Not authenticated"
+
+
+def test_create_questions_bulk(
+    logged_in_client,
+    test_model_subject,
+    test_model_topic,
+    test_model_subtopic,
+    test_model_concept,
+):
+    base_data = {
+        "difficulty": DifficultyLevel.EASY.value,
+        "subject_ids": [test_model_subject.id],
+        "topic_ids": [test_model_topic.id],
+        "subtopic_ids": [test_model_subtopic.id],
+        "concept_ids": [test_model_concept.id],
+        "answer_choices": [{"text": "Yes", "is_correct": True}],
+    }
+    questions_data = [
+        {**base_data, "text": "Bulk API question 1"},
+        {**base_data, "text": "Bulk API question 2"},
+    ]
+
+    response = logged_in_client.post("/questions/bulk", json=questions_data)
+    assert response.status_code == 201
+    result = response.json()
+    assert result["errors"] == []
+    assert [q["text"] for q in result["questions"]] == [
+        "Bulk API question 1",
+        "Bulk API question 2",
+    ]
+    assert all(len(q["answer_choices"]) == 1 for q in result["questions"])
+
+
+def test_update_questions_bulk_lenient(logged_in_client, test_model_questions):
+    updates = [
+        {"id": test_model_questions[0].id, "text": "Bulk PATCH question"},
+        {"id": 999999, "text": "Does not exist"},
+    ]
+
+    response = logged_in_client.patch("/questions/bulk?lenient=true", json=updates)
+    assert response.status_code == 200
+    result = response.json()
+    assert [q["text"] for q in result["questions"]] == ["Bulk PATCH question"]
+    assert result["errors"][0]["index"] == 1
+
+    strict_response = logged_in_client.patch("/questions/bulk", json=updates)
+    assert strict_response.status_code == 422
+
+
+def test_get_similar_questions(logged_in_client, db_session):
+    text = f"Which gas do plants absorb during {uuid.uuid4().hex[:8]} photosynthesis?"
+    original = QuestionModel(text=text, difficulty="EASY")
+    copy = QuestionModel(text=text.upper().rstrip("?"), difficulty="EASY")
+    unrelated = QuestionModel(text="Who wrote the Odyssey?", difficulty="EASY")
+    db_session.add_all([original, copy, unrelated])
+    db_session.commit()
+
+    # These questions bypass the CRUD hooks, so start from a fresh index
+    question_similarity_index.invalidate()
+    try:
+        response = logged_in_client.get(f"/questions/{original.id}/similar")
+    finally:
+        question_similarity_index.invalidate()
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["question"]["id"] for result in results] == [copy.id]
+    assert results[0]["similarity"] == 1.0
+
+
+def test_get_similar_questions_not_found(logged_in_client):
+    response = logged_in_client.get("/questions/99999/similar")
+    assert response.status_code == 404
+
+
+def test_get_similar_questions_invalid_threshold(logged_in_client, test_model_questions):
+    response = logged_in_client.get(
+        f"/questions/{test_model_questions[0].id}/similar", params={"threshold": 0.1}
+    )
+    assert response.status_code == 422
+
+
+def test_get_similar_questions_unauthorized(client):
+    with pytest.raises(HTTPException) as exc:
+        client.get("/questions/1/similar")
+    assert exc.value.status_code == 401
+    assert exc.value.detail == "Not authenticated"
@@ -0,0 +1,88 @@
+# filename: backend/tests/integration/api/test_quiz_sessions.py
+
+
+def test_create_quiz_session(logged_in_client, test_model_quiz_question_pool):
+    response = logged_in_client.post(
+        "/quiz-sessions/",
+        json={
+            "question_set_id": test_model_quiz_question_pool.id,
+            "question_count": 4,
+            "seed": 42,
+        },
+    )
+
+    assert response.status_code == 201
+    quiz_session = response.json()
+    assert quiz_session["question_count"] == 4
+    assert quiz_session["seed"] == 42
+    assert quiz_session["question_set_id"] == test_model_quiz_question_pool.id
+
+
+def test_create_quiz_session_unknown_question_set(logged_in_client):
+    response = logged_in_client.post(
+        "/quiz-sessions/", json={"question_set_id": 999999, "question_count": 4}
+    )
+
+    assert response.status_code == 404
+
+
+def test_create_quiz_session_without_matches(
+    logged_in_client, test_model_quiz_question_pool
+):
+    response = logged_in_client.post(
+        "/quiz-sessions/",
+        json={
+            "question_set_id": test_model_quiz_question_pool.id,
+            "difficulties": ["Expert"],
+            "question_count": 4,
+        },
+    )
+
+    assert response.status_code == 422
+
+
+def test_get_quiz_session_questions_pages(
+    logged_in_client, test_model_quiz_question_pool
+):
+    quiz_session = logged_in_client.post(
+        "/quiz-sessions/",
+        json={
+            "question_set_id": test_model_quiz_question_pool.id,
+            "question_count": 5,
+            "seed": 7,
+        },
+    ).json()
+    url = f"/quiz-sessions/{quiz_session['id']}/questions"
+
+    first_page = logged_in_client.get(url, params={"page": 1, "page_size": 3})
+    second_page = logged_in_client.get(url, params={"page": 2, "page_size": 3})
+    first_page_again = logged_in_client.get(url, params={"page": 1, "page_size": 3})
+
+    assert first_page.status_code == 200
+    assert first_page.json()["total"] == 5
+    assert len(first_page.json()["questions"]) == 3
+    assert len(second_page.json()["questions"]) == 2
+    ids = [q["id"] for q in first_page.json()["questions"]] + [
+        q["id"] for q in second_page.json()["questions"]
+    ]
+    assert len(set(ids)) == 5
+    # Answer choices are shuffled the same way on every delivery
+    assert first_page.json()["questions"] == first_page_again.json()["questions"]
+
+
+def test_get_quiz_session_not_found(logged_in_client):
+    response = logged_in_client.get("/quiz-sessions/999999")
+
+    assert response.status_code == 404
+
+
+def test_delete_quiz_session(logged_in_client, test_model_quiz_question_pool):
+    quiz_session = logged_in_client.post(
+        "/quiz-sessions/",
+        json={"question_set_id": test_model_quiz_question_pool.id, "question_count": 2},
+    ).json()
+
+    response = logged_in_client.delete(f"/quiz-sessions/{quiz_session['id']}")
+    assert response.status_code == 204
+    response = logged_in_client.get(f"/quiz-sessions/{quiz_session['id']}")
+    assert response.status_code == 404
@@ -0,0 +1,58 @@
+# filename: backend/tests/integration/api/test_search.py
+
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from backend.app.models.questions import QuestionModel
+
+
+def test_search_questions(logged_in_client, db_session, test_model_topic):
+    word = f"galaxy{uuid.uuid4().hex[:8]}"
+    question = QuestionModel(
+        text=f"How old is the {word}?", difficulty="MEDIUM", topics=[test_model_topic]
+    )
+    db_session.add(question)
+    db_session.commit()
+
+    response = logged_in_client.get(
+        "/questions/search", params={"q": word, "topic": test_model_topic.name}
+    )
+
+    assert response.status_code == 200, response.json()
+    body = response.json()
+    assert body["query"] == word
+    assert [result["question"]["id"] for result in body["results"]] == [question.id]
+    assert body["results"][0]["highlighted_text"] == f"How old is the <mark>{word}</mark>?"
+
+
+def test_search_questions_requires_words(logged_in_client):
+    response = logged_in_client.get("/questions/search", params={"q": "?!"})
+
+    assert response.status_code == 422
+    assert "at least one word" in response.json()["detail"]
+
+
+def test_search_questions_invalid_difficulty(logged_in_client):
+    response = logged_in_client.get(
+        "/questions/search", params={"q": "anything", "difficulty": "Impossible"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_search_questions_unpaired_ancestor(logged_in_client):
+    response = logged_in_client.get(
+        "/questions/search", params={"q": "anything", "ancestor_level": "topics"}
+    )
+
+    assert response.status_code == 422
+    assert "must be provided together" in response.json()["detail"]
+
+
+def test_search_questions_unauthorized(client):
+    with pytest.raises(HTTPException) as exc:
+        client.get("/questions/search", params={"q": "anything"})
+    assert exc.value.status_code == 401
+    assert exc.value.detail == "Not authenticated"
@@ -0,0 +1,50 @@
+# filename: backend/tests/integration/api/test_taxonomy.py
+
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+
+def test_get_taxonomy_tree(logged_in_client, test_model_taxonomy_chain):
+    response = logged_in_client.get("/taxonomy/tree")
+
+    assert response.status_code == 200
+    assert response.headers["etag"]
+    tree = response.json()
+    assert test_model_taxonomy_chain.id in [domain["id"] for domain in tree["domains"]]
+    assert "unattached" in tree
+
+
+def test_get_taxonomy_tree_not_modified(logged_in_client):
+    etag = logged_in_client.get("/taxonomy/tree").headers["etag"]
+
+    response = logged_in_client.get("/taxonomy/tree", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_get_taxonomy_tree_changed_etag(logged_in_client, test_model_taxonomy_chain):
+    etag = logged_in_client.get("/taxonomy/tree").headers["etag"]
+    created = logged_in_client.post(
+        "/subjects/",
+        json={
+            "name": f"Taxonomy Subject {uuid.uuid4().hex[:8]}",
+            "discipline_ids": [test_model_taxonomy_chain.disciplines[0].id],
+        },
+    )
+    assert created.status_code == 201
+
+    response = logged_in_client.get("/taxonomy/tree", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_get_taxonomy_tree_unauthorized(client):
+    with pytest.raises(HTTPException) as exc:
+        client.get("/taxonomy/tree")
+    assert exc.value.status_code == 401
+    assert exc.value.detail == "Not authenticated"
@@ -0,0 +1,86 @@
+# filename: backend/tests/integration/api/test_traces.py
+
+import pytest
+
+from backend.app.services.tracing_service import tracer
+
+
+@pytest.fixture
+def traced_client(logged_in_client):
+    # The lifespan applies the test environment's sample rate of 0
+    tracer.sample_rate = 1.0
+    tracer.clear()
+    yield logged_in_client
+    tracer.sample_rate = 0.0
+    tracer.clear()
+
+
+def test_leaderboard_trace_breakdown(traced_client, time_period_daily):
+    response = traced_client.get(f"/leaderboard/?time_period={time_period_daily.id}")
+    assert response.status_code == 200
+
+    listing = traced_client.get("/admin/traces", params={"name": "/leaderboard/"}).json()
+    assert listing["sample_rate"] == 1.0
+    summary = listing["traces"][0]
+    assert summary["name"] == "GET /leaderboard/"
+    assert summary["status_code"] == 200
+
+    detail = traced_client.get(f"/admin/traces/{summary['trace_id']}")
+    assert detail.status_code == 200
+    spans = detail.json()["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    by_name = {span["name"]: span for span in spans}
+    for name in (
+        "MetricsMiddleware",
+        "BlacklistMiddleware",
+        "AuthorizationMiddleware",
+        "route get_leaderboard",
+        "endpoint get_leaderboard",
+        "scoring_service.calculate_leaderboard_scores",
+        "leaderboard.upsert_entries",
+        "crud_leaderboard.read_leaderboard_entries_from_db",
+        "leaderboard.build_response",
+        "SELECT",
+    ):
+        assert name in by_name, name
+
+    endpoint = by_name["endpoint get_leaderboard"]
+    assert by_name["leaderboard.upsert_entries"]["parentSpanId"] == endpoint["spanId"]
+    assert endpoint["parentSpanId"] == by_name["route get_leaderboard"]["spanId"]
+    root = by_name["GET /leaderboard/"]
+    assert root["parentSpanId"] == ""
+    assert by_name["MetricsMiddleware"]["parentSpanId"] == root["spanId"]
+
+
+def test_unsampled_requests_are_not_kept(traced_client):
+    traceparent = f"00-{'ab' * 16}-{'cd' * 8}-00"
+    assert traced_client.get("/time-periods/", headers={"traceparent": traceparent}).status_code == 200
+
+    assert tracer.get_trace("ab" * 16) is None
+
+
+def test_caller_trace_is_continued(traced_client):
+    traceparent = f"00-{'ef' * 16}-{'cd' * 8}-01"
+    assert traced_client.get("/time-periods/", headers={"traceparent": traceparent}).status_code == 200
+
+    trace = tracer.get_trace("ef" * 16)
+    assert trace is not None
+    assert trace.root.parent_span_id == "cd" * 8
+
+
+def test_sampled_caller_cannot_force_tracing(logged_in_client):
+    # The lifespan applies the test environment's sample rate of 0
+    traceparent = f"00-{'ef' * 16}-{'cd' * 8}-01"
+    assert logged_in_client.get("/time-periods/", headers={"traceparent": traceparent}).status_code == 200
+
+    assert tracer.get_trace("ef" * 16) is None
+
+
+def test_traces_require_admin(logged_in_client, test_model_user, db_session):
+    test_model_user.is_admin = False
+    db_session.flush()
+
+    assert logged_in_client.get("/admin/traces").status_code == 403
+
+
+def test_trace_not_found(logged_in_client):
+    assert logged_in_client.get(f"/admin/traces/{'0' * 32}").status_code == 404
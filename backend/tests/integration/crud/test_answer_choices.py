@@ -2,12 +2,14 @@
 
 from backend.app.crud.crud_answer_choices import (
     create_answer_choice_in_db,
+    create_answer_choices_in_db,
     create_question_to_answer_association_in_db,
     delete_answer_choice_from_db,
     delete_question_to_answer_association_from_db,
     read_answer_choice_from_db,
     read_answer_choices_for_question_from_db,
     read_answer_choices_from_db,
+    read_list_of_answer_choices_from_db,
     read_questions_for_answer_choice_from_db,
     update_answer_choice_in_db,
 )
@@ -118,3 +120,45 @@ def test_read_questions_for_answer_choice(
     questions = read_questions_for_answer_choice_from_db(db_session, answer_choice.id)
     assert len(questions) == 1
     assert questions[0].id == question.id
+
+
+def test_create_answer_choices_in_batch(db_session, test_model_questions):
+    question = test_model_questions[0]
+    initial_ids = {
+        ac.id for ac in read_answer_choices_for_question_from_db(db_session, question.id)
+    }
+    answer_choices_data = [
+        {"text": "Batch answer 1", "is_correct": True, "explanation": "Because"},
+        {"text": "Batch answer 2", "is_correct": False},
+        {"text": "Batch answer 3", "is_correct": False},
+    ]
+
+    answer_choice_ids = create_answer_choices_in_db(
+        db_session, answer_choices_data, question.id
+    )
+    db_session.commit()
+
+    assert len(answer_choice_ids) == 3
+    created = read_list_of_answer_choices_from_db(db_session, answer_choice_ids)
+    created_by_id = {ac.id: ac for ac in created}
+    assert [created_by_id[i].text for i in answer_choice_ids] == [
+        "Batch answer 1",
+        "Batch answer 2",
+        "Batch answer 3",
+    ]
+    assert created_by_id[answer_choice_ids[0]].explanation == "Because"
+    question_choice_ids = {
+        ac.id for ac in read_answer_choices_for_question_from_db(db_session, question.id)
+    }
+    assert question_choice_ids == initial_ids | set(answer_choice_ids)
+
+
+def test_create_answer_choices_without_question(db_session):
+    answer_choice_ids = create_answer_choices_in_db(
+        db_session, [{"text": "Standalone batch answer", "is_correct": True}]
+    )
+    db_session.commit()
+
+    answer_choice = read_answer_choice_from_db(db_session, answer_choice_ids[0])
+    assert answer_choice.text == "Standalone batch answer"
+    assert answer_choice.questions == []
@@ -0,0 +1,193 @@
+# filename: backend/tests/integration/crud/test_associations.py
+
+import uuid
+import warnings
+
+import pytest
+
+from backend.app.crud import crud_associations
+from backend.app.crud.crud_associations import (
+    create_associations_in_db,
+    delete_associations_from_db,
+    get_association_columns,
+    read_association_pairs_from_db,
+    replace_associations_in_db,
+)
+from backend.app.models.associations import (
+    DomainToDisciplineAssociation,
+    QuestionSetToQuestionAssociation,
+    QuestionToTagAssociation,
+)
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.models.questions import QuestionModel
+
+
+@pytest.fixture(scope="function")
+def bulk_tags(db_session):
+    tags = [
+        QuestionTagModel(tag=f"bulk-tag-{i}-{str(uuid.uuid4())[:8]}") for i in range(3)
+    ]
+    db_session.add_all(tags)
+    db_session.commit()
+    return tags
+
+
+def test_get_association_columns_resolves_question_side():
+    source, target = get_association_columns(QuestionSetToQuestionAssociation)
+    assert source.key == "question_id"
+    assert target.key == "question_set_id"
+
+
+def test_get_association_columns_defaults_to_declared_order():
+    source, target = get_association_columns(DomainToDisciplineAssociation)
+    assert source.key == "domain_id"
+    assert target.key == "discipline_id"
+
+
+def test_create_associations_cross_product(db_session, test_model_questions, bulk_tags):
+    question_ids = [q.id for q in test_model_questions]
+    tag_ids = [t.id for t in bulk_tags]
+
+    inserted = create_associations_in_db(
+        db_session, QuestionToTagAssociation, question_ids, tag_ids
+    )
+    db_session.commit()
+
+    assert inserted == len(question_ids) * len(tag_ids)
+    pairs = read_association_pairs_from_db(
+        db_session, QuestionToTagAssociation, question_ids
+    )
+    assert len(pairs) == len(question_ids) * len(tag_ids)
+
+
+def test_create_associations_is_idempotent(db_session, test_model_questions, bulk_tags):
+    question_ids = [q.id for q in test_model_questions]
+    tag_ids = [t.id for t in bulk_tags]
+    create_associations_in_db(db_session, QuestionToTagAssociation, question_ids, tag_ids)
+
+    inserted_again = create_associations_in_db(
+        db_session, QuestionToTagAssociation, question_ids, tag_ids
+    )
+    db_session.commit()
+
+    assert inserted_again == 0
+
+
+def test_create_associations_skips_unknown_ids(
+    db_session, test_model_questions, bulk_tags
+):
+    question_ids = [q.id for q in test_model_questions] + [999999]
+    tag_ids = [bulk_tags[0].id, 999999]
+
+    inserted = create_associations_in_db(
+        db_session, QuestionToTagAssociation, question_ids, tag_ids
+    )
+    db_session.commit()
+
+    assert inserted == len(test_model_questions)
+
+
+def test_replace_associations(db_session, test_model_questions, bulk_tags):
+    question_ids = [q.id for q in test_model_questions]
+    create_associations_in_db(
+        db_session,
+        QuestionToTagAssociation,
+        question_ids,
+        [bulk_tags[0].id, bulk_tags[1].id],
+    )
+
+    deleted, inserted = replace_associations_in_db(
+        db_session,
+        QuestionToTagAssociation,
+        question_ids,
+        [bulk_tags[1].id, bulk_tags[2].id],
+    )
+    db_session.commit()
+
+    assert deleted == len(question_ids)
+    assert inserted == len(question_ids)
+    question = db_session.get(QuestionModel, question_ids[0])
+    assert sorted(tag.id for tag in question.question_tags) == [
+        bulk_tags[1].id,
+        bulk_tags[2].id,
+    ]
+
+
+def test_delete_associations(db_session, test_model_questions, bulk_tags):
+    question_ids = [q.id for q in test_model_questions]
+    tag_ids = [t.id for t in bulk_tags]
+    create_associations_in_db(db_session, QuestionToTagAssociation, question_ids, tag_ids)
+
+    deleted = delete_associations_from_db(
+        db_session, QuestionToTagAssociation, question_ids, [bulk_tags[0].id]
+    )
+    assert deleted == len(question_ids)
+
+    deleted_rest = delete_associations_from_db(
+        db_session, QuestionToTagAssociation, question_ids
+    )
+    db_session.commit()
+    assert deleted_rest == len(question_ids) * (len(tag_ids) - 1)
+    assert (
+        read_association_pairs_from_db(db_session, QuestionToTagAssociation, question_ids)
+        == []
+    )
+
+
+def test_create_associations_emits_no_cartesian_warning(
+    db_session, test_model_questions, bulk_tags
+):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        create_associations_in_db(
+            db_session,
+            QuestionToTagAssociation,
+            [q.id for q in test_model_questions],
+            [t.id for t in bulk_tags],
+        )
+
+
+def test_delete_associations_with_generator_targets_across_chunks(
+    db_session, test_model_questions, bulk_tags, monkeypatch
+):
+    monkeypatch.setattr(crud_associations, "BULK_CHUNK_SIZE", 1)
+    question_ids = [q.id for q in test_model_questions]
+    create_associations_in_db(
+        db_session, QuestionToTagAssociation, question_ids, [t.id for t in bulk_tags]
+    )
+
+    deleted = delete_associations_from_db(
+        db_session,
+        QuestionToTagAssociation,
+        question_ids,
+        (tag.id for tag in bulk_tags[:2]),
+    )
+
+    assert len(question_ids) > 1
+    assert deleted == len(question_ids) * 2
+
+
+def test_replace_associations_with_targets_across_chunks(
+    db_session, test_model_questions, bulk_tags, monkeypatch
+):
+    monkeypatch.setattr(crud_associations, "BULK_CHUNK_SIZE", 1)
+    question_ids = [q.id for q in test_model_questions]
+    create_associations_in_db(
+        db_session, QuestionToTagAssociation, question_ids, [bulk_tags[0].id]
+    )
+
+    # Two targets no longer fit one NOT IN list
+    deleted, inserted = replace_associations_in_db(
+        db_session,
+        QuestionToTagAssociation,
+        question_ids,
+        [bulk_tags[1].id, bulk_tags[2].id],
+    )
+
+    assert deleted == len(question_ids)
+    assert inserted == len(question_ids) * 2
+    assert read_association_pairs_from_db(
+        db_session, QuestionToTagAssociation, question_ids
+    ) == sorted(
+        (question_id, tag.id) for question_id in question_ids for tag in bulk_tags[1:]
+    )
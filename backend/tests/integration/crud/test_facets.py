@@ -0,0 +1,103 @@
+# filename: backend/tests/integration/crud/test_facets.py
+
+import uuid
+
+import pytest
+
+from backend.app.crud.crud_facets import read_question_facets_from_db
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.models.questions import DifficultyLevel, QuestionModel
+from backend.app.services.question_change_service import (
+    has_uncommitted_question_changes,
+)
+
+
+@pytest.fixture(scope="function")
+def facet_test_data(db_session, test_model_subject, test_model_topic):
+    suffix = uuid.uuid4().hex[:8]
+    common_tag = QuestionTagModel(tag=f"facet-common-{suffix}")
+    rare_tag = QuestionTagModel(tag=f"facet-rare-{suffix}")
+    questions = [
+        QuestionModel(
+            text=f"Facet question {suffix} {i}",
+            difficulty=difficulty,
+            subjects=[test_model_subject],
+            topics=[test_model_topic],
+            question_tags=tags,
+        )
+        for i, (difficulty, tags) in enumerate(
+            [
+                ("EASY", [common_tag]),
+                ("EASY", [common_tag, rare_tag]),
+                ("HARD", []),
+            ]
+        )
+    ]
+    db_session.add_all(questions)
+    db_session.commit()
+    return {"questions": questions, "common_tag": common_tag, "rare_tag": rare_tag}
+
+
+def test_read_question_facets(db_session, facet_test_data, test_model_subject, test_model_topic):
+    facets = read_question_facets_from_db(db_session, {"topic": test_model_topic.name})
+
+    assert facets["total"] == 3
+    assert facets["difficulty"] == [
+        {"difficulty": DifficultyLevel.EASY, "count": 2},
+        {"difficulty": DifficultyLevel.HARD, "count": 1},
+    ]
+    assert facets["subjects"] == [
+        {"id": test_model_subject.id, "name": test_model_subject.name, "count": 3}
+    ]
+    assert facets["topics"] == [
+        {"id": test_model_topic.id, "name": test_model_topic.name, "count": 3}
+    ]
+    common_tag, rare_tag = facet_test_data["common_tag"], facet_test_data["rare_tag"]
+    assert facets["question_tags"] == [
+        {"id": common_tag.id, "name": common_tag.tag, "count": 2},
+        {"id": rare_tag.id, "name": rare_tag.tag, "count": 1},
+    ]
+
+
+def test_read_question_facets_combines_filters(
+    db_session, facet_test_data, test_model_topic
+):
+    facets = read_question_facets_from_db(
+        db_session,
+        {
+            "topic": test_model_topic.name,
+            "question_tags": [facet_test_data["rare_tag"].tag],
+        },
+        facet_limit=1,
+    )
+
+    assert facets["total"] == 1
+    assert facets["difficulty"] == [{"difficulty": DifficultyLevel.EASY, "count": 1}]
+    # Only the largest value of each facet is kept
+    assert [tag["name"] for tag in facets["question_tags"]] == [
+        facet_test_data["common_tag"].tag
+    ]
+
+
+def test_read_question_facets_no_matches(db_session, facet_test_data):
+    facets = read_question_facets_from_db(db_session, {"topic": "No such topic"})
+
+    assert facets == {
+        "total": 0,
+        "difficulty": [],
+        "subjects": [],
+        "topics": [],
+        "question_tags": [],
+    }
+
+
+def test_read_question_facets_from_index_matches_sql(
+    db_session, facet_test_data, test_model_topic
+):
+    filters = {"topic": test_model_topic.name}
+    from_index = read_question_facets_from_db(db_session, filters, facet_limit=1)
+
+    # Uncommitted question writes are answered by the grouped queries instead
+    facet_test_data["questions"][2].text = "Edited, not committed"
+    assert has_uncommitted_question_changes(db_session)
+    assert read_question_facets_from_db(db_session, filters, facet_limit=1) == from_index
@@ -1,15 +1,24 @@
 # filename: backend/tests/test_crud/test_crud_filters.py
 
+import uuid
+
 import pytest
+from sqlalchemy import event
 
-from backend.app.crud.crud_filters import read_filtered_questions_from_db
+from backend.app.crud.crud_filters import (
+    read_filtered_question_ids_from_db,
+    read_filtered_questions_from_db,
+    resolve_filter_ids_from_db,
+)
 from backend.app.crud.crud_question_tags import (
     create_question_tag_in_db,
     create_question_to_tag_association_in_db,
 )
 from backend.app.crud.crud_questions import create_question_in_db
 from backend.app.crud.crud_subjects import create_question_to_subject_association_in_db
-from backend.app.models.questions import DifficultyLevel
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.models.questions import DifficultyLevel, QuestionModel
+from backend.app.models.topics import TopicModel
 from backend.app.services.logging_service import logger
 
 
@@ -191,3 +200,79 @@ def test_read_filtered_questions_empty_tag_list(db_session, filter_test_data):
     # Should include our test question
     question_ids = [q.id for q in results]
     assert filter_test_data["question"].id in question_ids
+
+
+def test_read_filtered_questions_multiple_tags_paginate_without_duplicates(
+    db_session, test_model_topic
+):
+    suffix = str(uuid.uuid4())[:8]
+    tags = [QuestionTagModel(tag=f"pagetag-{suffix}-{i}") for i in range(2)]
+    questions = [
+        QuestionModel(
+            text=f"Tagged question {suffix} {i}",
+            difficulty="EASY",
+            topics=[test_model_topic],
+            question_tags=tags,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(questions)
+    db_session.flush()
+    filters = {"question_tags": [tag.tag.upper() for tag in tags]}
+
+    page1 = read_filtered_questions_from_db(db_session, filters, skip=0, limit=2)
+    page2 = read_filtered_questions_from_db(db_session, filters, skip=2, limit=2)
+
+    assert [q.id for q in page1 + page2] == sorted(q.id for q in questions)
+    assert {tag.id for tag in page1[0].question_tags} == {tag.id for tag in tags}
+
+
+def test_read_filtered_questions_resolves_names_case_insensitively(
+    db_session, test_model_questions, test_model_topic
+):
+    expected_ids = sorted(q.id for q in test_model_questions)
+
+    # The topic was added without a CRUD call, so the cached graph misses it
+    # and the name is confirmed against the database
+    question_ids = read_filtered_question_ids_from_db(
+        db_session, {"topic": test_model_topic.name.upper()}
+    )
+    assert question_ids == expected_ids
+
+    resolved = resolve_filter_ids_from_db(
+        db_session, {"topic": test_model_topic.name, "question_tags": []}
+    )
+    assert resolved == {"topic": (test_model_topic.id,)}
+
+
+def test_read_filtered_questions_unknown_name_short_circuits(
+    db_session, test_model_questions
+):
+    assert resolve_filter_ids_from_db(db_session, {"subtopic": "No such subtopic"}) is None
+    assert read_filtered_questions_from_db(db_session, {"topic": "No such topic"}) == []
+
+
+def test_unknown_name_is_confirmed_once_per_taxonomy_version(db_session):
+    name = f"Unknown topic {uuid.uuid4()}"
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    try:
+        assert resolve_filter_ids_from_db(db_session, {"topic": name}) is None
+        assert any("lower(" in statement for statement in statements)
+        statements.clear()
+        assert resolve_filter_ids_from_db(db_session, {"topic": name.upper()}) is None
+        assert not any("lower(" in statement for statement in statements)
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", record)
+
+    # Creating the node moves the taxonomy version, which forgets the miss
+    topic = TopicModel(name=name)
+    db_session.add(topic)
+    db_session.commit()
+    assert resolve_filter_ids_from_db(db_session, {"topic": name}) == {
+        "topic": (topic.id,)
+    }
@@ -0,0 +1,44 @@
+# filename: backend/tests/integration/crud/test_question_projections.py
+
+from backend.app.crud.crud_question_projections import (
+    read_question_projection_page_from_db,
+    read_question_projections_from_db,
+)
+from backend.app.crud.crud_questions import read_full_question_from_db
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.schemas.questions import DetailedQuestionSchema
+
+
+def test_projection_matches_orm_serialization(db_session, test_model_questions):
+    question = test_model_questions[0]
+    question.question_tags.append(QuestionTagModel(tag="projection-tag", description="d"))
+    db_session.commit()
+
+    projected = read_question_projections_from_db(db_session, [question.id])[0]
+    expected = DetailedQuestionSchema.model_validate(
+        read_full_question_from_db(db_session, question.id)
+    ).model_dump()
+
+    assert DetailedQuestionSchema.model_validate(projected).model_dump() == expected
+    assert projected["question_tags"] == [
+        {"id": question.question_tags[0].id, "tag": "projection-tag", "description": "d"}
+    ]
+    assert set(projected["subjects"][0]) == {"id", "name"}
+
+
+def test_projection_order_and_missing_ids(db_session, test_model_questions):
+    first, second = test_model_questions
+    projected = read_question_projections_from_db(db_session, [second.id, 99999, first.id])
+
+    assert [question["id"] for question in projected] == [second.id, first.id]
+    assert read_question_projections_from_db(db_session, []) == []
+    assert read_question_projections_from_db(db_session, [99999]) == []
+
+
+def test_projection_page(db_session, test_model_questions):
+    page = read_question_projection_page_from_db(db_session, skip=0, limit=1000)
+    ids = [question["id"] for question in page]
+
+    assert ids == sorted(ids)
+    assert {question.id for question in test_model_questions} <= set(ids)
+    assert len(read_question_projection_page_from_db(db_session, skip=0, limit=1)) == 1
@@ -12,12 +12,14 @@ from backend.app.crud.crud_answer_choices import (
 from backend.app.crud.crud_question_tags import create_question_tag_in_db
 from backend.app.crud.crud_questions import (
     create_question_in_db,
+    create_questions_in_db,
     delete_question_from_db,
     read_full_question_from_db,
     read_question_from_db,
     read_questions_from_db,
     replace_question_in_db,
     update_question_in_db,
+    update_questions_in_db,
 )
 from backend.app.crud.crud_subjects import create_subject_in_db
 from backend.app.models.associations import QuestionToAnswerAssociation
@@ -346,6 +348,26 @@ def test_replace_question_with_new_answer_choices(
     assert replaced_question.answer_choices[0].text == new_answer_choice_data["text"]
 
 
+def test_new_answer_choices_are_associated_with_listed_questions(
+    db_session, test_schema_question, test_model_questions
+):
+    other_question = test_model_questions[0]
+    question_data = test_schema_question.model_dump()
+    question_data["new_answer_choices"] = [
+        {
+            "text": "Shared answer",
+            "is_correct": True,
+            "question_ids": [other_question.id, 999999],
+        }
+    ]
+
+    question = create_question_in_db(db_session, question_data)
+
+    shared = [ac for ac in question.answer_choices if ac.text == "Shared answer"]
+    assert len(shared) == 1
+    other_choices = read_answer_choices_for_question_from_db(db_session, other_question.id)
+    assert shared[0].id in {ac.id for ac in other_choices}
+
 def test_replace_nonexistent_question(db_session):
     nonexistent_id = 9999
     replace_data = {
@@ -479,3 +501,101 @@ def test_update_question_with_invalid_data(db_session, test_schema_question):
     assert "INVALID_DIFFICULTY" in str(exc_info.value)
     assert "difficultylevel" in str(exc_info.value)
     assert "Beginner, Easy, Medium, Hard, Expert" in str(exc_info.value)
+
+
+def test_create_questions_in_bulk(db_session, test_schema_question):
+    base_data = test_schema_question.model_dump()
+    questions_data = [
+        {
+            **base_data,
+            "text": f"{base_data['text']} bulk {i}",
+            "answer_choices": [
+                {"text": f"Bulk answer {i}a", "is_correct": True},
+                {"text": f"Bulk answer {i}b", "is_correct": False},
+            ],
+        }
+        for i in range(3)
+    ]
+
+    created, errors = create_questions_in_db(db_session, questions_data)
+
+    assert errors == []
+    assert [q.text for q in created] == [q["text"] for q in questions_data]
+    for question in created:
+        assert len(question.answer_choices) == 2
+        assert [s.id for s in question.subjects] == base_data["subject_ids"]
+        assert [c.id for c in question.concepts] == base_data["concept_ids"]
+
+
+def test_create_questions_in_bulk_strict_rejects_whole_batch(
+    db_session, test_schema_question
+):
+    base_data = test_schema_question.model_dump()
+    initial_count = len(read_questions_from_db(db_session, limit=10000))
+    questions_data = [base_data, {**base_data, "text": ""}]
+
+    with pytest.raises(ValueError) as exc_info:
+        create_questions_in_db(db_session, questions_data)
+
+    assert "index 1" in str(exc_info.value)
+    assert len(read_questions_from_db(db_session, limit=10000)) == initial_count
+
+
+def test_create_questions_in_bulk_lenient_keeps_valid_items(
+    db_session, test_schema_question
+):
+    base_data = test_schema_question.model_dump()
+    questions_data = [
+        base_data,
+        {**base_data, "difficulty": "INVALID_DIFFICULTY"},
+        {**base_data, "text": f"{base_data['text']} second"},
+    ]
+
+    created, errors = create_questions_in_db(db_session, questions_data, lenient=True)
+
+    assert len(created) == 2
+    assert [error["index"] for error in errors] == [1]
+    assert "INVALID_DIFFICULTY" in errors[0]["detail"]
+
+
+def test_update_questions_in_bulk(
+    db_session, test_model_questions, test_schema_question_tag
+):
+    test_model_tag = create_question_tag_in_db(
+        db_session, test_schema_question_tag.model_dump()
+    )
+    updates = [
+        {"id": test_model_questions[0].id, "difficulty": "Hard"},
+        {
+            "id": test_model_questions[1].id,
+            "text": "Bulk updated text",
+            "question_tag_ids": [test_model_tag.id],
+            "new_answer_choices": [{"text": "Bulk new answer", "is_correct": True}],
+        },
+    ]
+
+    updated, errors = update_questions_in_db(db_session, updates)
+
+    assert errors == []
+    assert updated[0].difficulty == DifficultyLevel.HARD
+    assert updated[1].text == "Bulk updated text"
+    assert [tag.id for tag in updated[1].question_tags] == [test_model_tag.id]
+    assert "Bulk new answer" in [ac.text for ac in updated[1].answer_choices]
+    assert len(updated[1].answer_choices) == 3
+
+
+def test_update_questions_in_bulk_lenient_reports_missing(
+    db_session, test_model_questions
+):
+    updates = [
+        {"id": 999999, "text": "Missing question"},
+        {"id": test_model_questions[0].id, "text": "Lenient bulk update"},
+    ]
+
+    with pytest.raises(ValueError):
+        update_questions_in_db(db_session, updates)
+
+    updated, errors = update_questions_in_db(db_session, updates, lenient=True)
+
+    assert [q.text for q in updated] == ["Lenient bulk update"]
+    assert errors == [{"index": 0, "detail": "Question with ID 999999 not found"}]
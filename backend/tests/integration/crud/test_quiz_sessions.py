@@ -0,0 +1,233 @@
+# filename: backend/tests/integration/crud/test_quiz_sessions.py
+
+from collections import Counter
+
+import pytest
+
+from backend.app.crud.crud_quiz_sessions import (
+    create_quiz_session_in_db,
+    delete_quiz_session_from_db,
+    read_candidate_question_ids_from_db,
+    read_quiz_session_from_db,
+    read_quiz_session_questions_from_db,
+)
+from backend.app.models.quiz_sessions import QuizSessionQuestionModel
+from backend.app.services.question_sampling_service import question_sampling_index
+
+
+def _session_data(user, question_set, **overrides):
+    data = {
+        "user_id": user.id,
+        "question_set_id": question_set.id,
+        "question_count": 5,
+        "seed": 1234,
+    }
+    data.update(overrides)
+    return data
+
+
+def test_read_candidate_question_ids(db_session, test_model_quiz_question_pool):
+    ids_by_difficulty = read_candidate_question_ids_from_db(
+        db_session, {"question_set_id": test_model_quiz_question_pool.id}
+    )
+
+    assert {key: len(ids) for key, ids in ids_by_difficulty.items()} == {
+        "Easy": 6,
+        "Medium": 3,
+        "Hard": 1,
+    }
+    assert all(ids == sorted(ids) for ids in ids_by_difficulty.values())
+
+
+def test_read_candidate_question_ids_with_difficulties(
+    db_session, test_model_quiz_question_pool
+):
+    ids_by_difficulty = read_candidate_question_ids_from_db(
+        db_session,
+        {
+            "question_set_id": test_model_quiz_question_pool.id,
+            "difficulties": ["Medium", "Hard"],
+        },
+    )
+
+    assert set(ids_by_difficulty) == {"Medium", "Hard"}
+
+
+def test_create_quiz_session_is_stratified(
+    db_session, test_model_user_with_group, test_model_quiz_question_pool
+):
+    quiz_session = create_quiz_session_in_db(
+        db_session,
+        _session_data(test_model_user_with_group, test_model_quiz_question_pool),
+    )
+
+    assert quiz_session.question_count == 5
+    assert [entry.position for entry in quiz_session.questions] == list(range(5))
+    questions, total = read_quiz_session_questions_from_db(
+        db_session, quiz_session.id, skip=0, limit=10
+    )
+    assert total == 5
+    assert Counter(q.difficulty.value for q in questions) == {"Easy": 3, "Medium": 2}
+
+
+def test_create_quiz_session_is_deterministic(
+    db_session, test_model_user_with_group, test_model_quiz_question_pool
+):
+    data = _session_data(test_model_user_with_group, test_model_quiz_question_pool)
+    first = create_quiz_session_in_db(db_session, data)
+    second = create_quiz_session_in_db(db_session, data)
+    other = create_quiz_session_in_db(db_session, {**data, "seed": 99})
+
+    def order(session):
+        return [entry.question_id for entry in session.questions]
+
+    assert order(first) == order(second)
+    assert order(first) != order(other) or set(order(first)) != set(order(other))
+
+
+def test_create_quiz_session_generates_seed(
+    db_session, test_model_user_with_group, test_model_quiz_question_pool
+):
+    quiz_session = create_quiz_session_in_db(
+        db_session,
+        _session_data(
+            test_model_user_with_group, test_model_quiz_question_pool, seed=None
+        ),
+    )
+
+    assert quiz_session.seed is not None
+
+
+def test_create_quiz_session_caps_at_pool_size(
+    db_session, test_model_user_with_group, test_model_quiz_question_pool
+):
+    quiz_session = create_quiz_session_in_db(
+        db_session,
+        _session_data(
+            test_model_user_with_group,
+            test_model_quiz_question_pool,
+            question_count=50,
+            stratify_by_difficulty=False,
+        ),
+    )
+
+    assert quiz_session.question_count == 10
+
+
+def test_create_quiz_session_without_matches(
+    db_session, test_model_user_with_group, test_model_quiz_question_pool
+):
+    with pytest.raises(ValueError, match="No questions match"):
+        create_quiz_session_in_db(
+            db_session,
+            _session_data(
+                test_model_user_with_group,
+                test_model_quiz_question_pool,
+                question_tag_ids=[999999],
+            ),
+        )
+
+
+def test_create_quiz_session_unknown_question_set(
+    db_session, test_model_user_with_group, test_model_quiz_question_pool
+):
+    data = _session_data(test_model_user_with_group, test_model_quiz_question_pool)
+    data["question_set_id"] = 999999
+    with pytest.raises(ValueError, match="not found"):
+        create_quiz_session_in_db(db_session, data)
+
+
+def test_read_quiz_session_questions_pages(
+    db_session, test_model_user_with_group, test_model_quiz_question_pool
+):
+    quiz_session = create_quiz_session_in_db(
+        db_session,
+        _session_data(test_model_user_with_group, test_model_quiz_question_pool),
+    )
+    stored_order = [entry.question_id for entry in quiz_session.questions]
+
+    first_page, _ = read_quiz_session_questions_from_db(
+        db_session, quiz_session.id, skip=0, limit=3
+    )
+    second_page, _ = read_quiz_session_questions_from_db(
+        db_session, quiz_session.id, skip=3, limit=3
+    )
+
+    assert [q.id for q in first_page + second_page] == stored_order
+
+
+def test_delete_quiz_session(
+    db_session, test_model_user_with_group, test_model_quiz_question_pool
+):
+    quiz_session = create_quiz_session_in_db(
+        db_session,
+        _session_data(test_model_user_with_group, test_model_quiz_question_pool),
+    )
+    quiz_session_id = quiz_session.id
+
+    assert delete_quiz_session_from_db(db_session, quiz_session_id) is True
+    assert read_quiz_session_from_db(db_session, quiz_session_id) is None
+    assert (
+        db_session.query(QuizSessionQuestionModel)
+        .filter_by(quiz_session_id=quiz_session_id)
+        .count()
+        == 0
+    )
+    assert delete_quiz_session_from_db(db_session, quiz_session_id) is False
+
+
+def test_create_quiz_session_from_sampling_index(
+    db_session,
+    test_model_user_with_group,
+    test_model_topic,
+    test_model_quiz_question_pool,
+):
+    question_sampling_index.invalidate()
+    try:
+        data = {
+            "user_id": test_model_user_with_group.id,
+            "topic_ids": [test_model_topic.id],
+            "question_count": 5,
+            "seed": 8,
+        }
+        first = create_quiz_session_in_db(db_session, data)
+        second = create_quiz_session_in_db(db_session, data)
+
+        assert question_sampling_index.is_built
+        first_ids = [entry.question_id for entry in first.questions]
+        assert first_ids == [entry.question_id for entry in second.questions]
+        questions, _ = read_quiz_session_questions_from_db(db_session, first.id)
+        assert Counter(q.difficulty.value for q in questions) == {"Easy": 3, "Medium": 2}
+    finally:
+        question_sampling_index.invalidate()
+
+
+def test_stale_sampling_index_falls_back_to_the_database(
+    db_session,
+    test_model_user_with_group,
+    test_model_topic,
+    test_model_quiz_question_pool,
+):
+    question_sampling_index.invalidate()
+    try:
+        question_sampling_index.build(db_session)
+        # Questions the index still holds but the database no longer has
+        for question_id in range(-10, 0):
+            question_sampling_index.add_question(
+                question_id, "Easy", [], [test_model_topic.id]
+            )
+        data = {
+            "user_id": test_model_user_with_group.id,
+            "topic_ids": [test_model_topic.id],
+            "question_count": 10,
+            "seed": 8,
+        }
+
+        quiz_session = create_quiz_session_in_db(db_session, data)
+
+        question_ids = [entry.question_id for entry in quiz_session.questions]
+        assert sorted(question_ids) == sorted(
+            question.id for question in test_model_quiz_question_pool.questions
+        )
+    finally:
+        question_sampling_index.invalidate()
@@ -0,0 +1,154 @@
+# filename: backend/tests/integration/crud/test_search.py
+
+import uuid
+
+import pytest
+
+from backend.app.crud.crud_search import (
+    build_search_terms,
+    highlight_terms,
+    rebuild_question_search_index_in_db,
+    search_questions_in_db,
+)
+from backend.app.models.answer_choices import AnswerChoiceModel
+from backend.app.models.questions import DifficultyLevel, QuestionModel
+
+
+@pytest.fixture
+def search_words():
+    suffix = uuid.uuid4().hex[:8]
+    return {"question": f"quasar{suffix}", "answer": f"nebula{suffix}"}
+
+
+@pytest.fixture
+def search_questions(db_session, test_model_topic, search_words):
+    in_text = QuestionModel(
+        text=f"Which {search_words['question']} emits the most light?",
+        difficulty="EASY",
+        topics=[test_model_topic],
+        answer_choices=[AnswerChoiceModel(text="A pulsar", is_correct=True)],
+    )
+    in_answer = QuestionModel(
+        text="Which object is described here?",
+        difficulty="HARD",
+        topics=[test_model_topic],
+        answer_choices=[
+            AnswerChoiceModel(
+                text="A cloud",
+                is_correct=True,
+                explanation=f"It is a {search_words['answer']} near {search_words['question']}",
+            )
+        ],
+    )
+    db_session.add_all([in_text, in_answer])
+    db_session.flush()
+    return {"in_text": in_text, "in_answer": in_answer}
+
+
+def test_search_ranks_and_highlights(db_session, search_questions, search_words):
+    results = search_questions_in_db(db_session, search_words["question"])
+
+    assert [result["question"].id for result in results] == [
+        search_questions["in_text"].id,
+        search_questions["in_answer"].id,
+    ]
+    assert results[0]["score"] > results[1]["score"]
+    assert f"<mark>{search_words['question']}</mark>" in results[0]["highlighted_text"]
+    assert results[0]["answer_snippet"] is None
+    assert f"<mark>{search_words['question']}</mark>" in results[1]["answer_snippet"]
+
+
+def test_search_escapes_highlighted_markup(db_session, test_model_topic, search_words):
+    word = search_words["question"]
+    payload = '<img src=x onerror="alert(1)">'
+    question = QuestionModel(
+        text=f"{payload} {word}?",
+        difficulty="EASY",
+        topics=[test_model_topic],
+        answer_choices=[
+            AnswerChoiceModel(text=f"{word} <script>x</script>", is_correct=True)
+        ],
+    )
+    db_session.add(question)
+    db_session.flush()
+
+    result = search_questions_in_db(db_session, word)[0]
+
+    assert result["highlighted_text"] == (
+        f"&lt;img src=x onerror=&quot;alert(1)&quot;&gt; <mark>{word}</mark>?"
+    )
+    assert "<script>" not in result["answer_snippet"]
+    assert f"<mark>{word}</mark> &lt;script&gt;" in result["answer_snippet"]
+
+
+def test_search_matches_prefix_of_last_term(db_session, search_questions, search_words):
+    results = search_questions_in_db(db_session, f"cloud {search_words['answer'][:-2]}")
+
+    assert [result["question"].id for result in results] == [
+        search_questions["in_answer"].id
+    ]
+
+
+def test_search_applies_filters(db_session, search_questions, search_words):
+    results = search_questions_in_db(
+        db_session, search_words["question"], {"difficulty": DifficultyLevel.HARD}
+    )
+    assert [result["question"].id for result in results] == [
+        search_questions["in_answer"].id
+    ]
+    assert search_questions_in_db(
+        db_session, search_words["question"], {"topic": "No such topic"}
+    ) == []
+
+
+def test_search_index_follows_writes(db_session, search_questions, search_words):
+    question = search_questions["in_text"]
+    question.text = "Renamed question"
+    db_session.flush()
+    assert [
+        result["question"].id
+        for result in search_questions_in_db(db_session, search_words["question"])
+    ] == [search_questions["in_answer"].id]
+
+    answer_choice = search_questions["in_answer"].answer_choices[0]
+    answer_choice.explanation = f"Still a {search_words['answer']}"
+    db_session.flush()
+    assert search_questions_in_db(db_session, search_words["question"]) == []
+
+    db_session.delete(search_questions["in_answer"])
+    db_session.flush()
+    assert search_questions_in_db(db_session, search_words["answer"]) == []
+
+
+def test_rebuild_question_search_index(db_session, search_questions, search_words):
+    rebuild_question_search_index_in_db(db_session)
+
+    results = search_questions_in_db(db_session, search_words["answer"])
+    assert [result["question"].id for result in results] == [
+        search_questions["in_answer"].id
+    ]
+
+
+def test_build_search_terms():
+    assert build_search_terms('Newton\'s "2nd" law OR NEAR(x)') == [
+        "newton",
+        "s",
+        "2nd",
+        "law",
+        "or",
+        "near",
+        "x",
+    ]
+    with pytest.raises(ValueError, match="at least one word"):
+        build_search_terms("?! --")
+
+
+def test_highlight_terms():
+    assert (
+        highlight_terms("Plants use photosynthesis", ["plant", "photo"])
+        == "<mark>Plants</mark> use <mark>photosynthesis</mark>"
+    )
+    assert (
+        highlight_terms("<b>Plants</b> & light", ["plant"])
+        == "&lt;b&gt;<mark>Plants</mark>&lt;/b&gt; &amp; light"
+    )
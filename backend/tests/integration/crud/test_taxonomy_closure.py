@@ -0,0 +1,131 @@
+# filename: backend/tests/integration/crud/test_taxonomy_closure.py
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from backend.app.crud.crud_disciplines import (
+    create_discipline_in_db,
+    delete_discipline_from_db,
+)
+from backend.app.crud.crud_domains import create_domain_in_db
+from backend.app.crud.crud_subjects import (
+    create_subject_in_db,
+    delete_subject_to_topic_association_from_db,
+)
+from backend.app.crud.crud_taxonomy_closure import (
+    question_ids_under_ancestor,
+    read_descendant_ids_from_db,
+    rebuild_taxonomy_closure_in_db,
+    refresh_taxonomy_closure_in_db,
+)
+from backend.app.crud.crud_topics import create_topic_in_db
+from backend.app.models.questions import QuestionModel
+from backend.app.models.taxonomy_closure import TaxonomyClosureModel
+
+
+def _unique(prefix):
+    return f"{prefix}_{str(uuid.uuid4())[:8]}"
+
+
+def _depth(db_session, ancestor_level, ancestor_id, descendant_level, descendant_id):
+    return db_session.scalar(
+        select(TaxonomyClosureModel.depth).where(
+            TaxonomyClosureModel.ancestor_level == ancestor_level,
+            TaxonomyClosureModel.ancestor_id == ancestor_id,
+            TaxonomyClosureModel.descendant_level == descendant_level,
+            TaxonomyClosureModel.descendant_id == descendant_id,
+        )
+    )
+
+
+def test_rebuild_taxonomy_closure(
+    db_session, test_model_taxonomy_chain, test_model_subject, test_model_concept
+):
+    domain = test_model_taxonomy_chain
+    discipline = domain.disciplines[0]
+
+    row_count = rebuild_taxonomy_closure_in_db(db_session)
+
+    assert row_count > 0
+    descendants = read_descendant_ids_from_db(db_session, "domains", domain.id)
+    assert descendants["disciplines"] == [discipline.id]
+    assert test_model_subject.id in descendants["subjects"]
+    assert test_model_concept.id in descendants["concepts"]
+    assert _depth(db_session, "domains", domain.id, "concepts", test_model_concept.id) == 5
+    assert _depth(db_session, "concepts", test_model_concept.id, "concepts", test_model_concept.id) == 0
+
+
+def test_crud_functions_maintain_closure(db_session):
+    domain = create_domain_in_db(db_session, {"name": _unique("domain")})
+    discipline = create_discipline_in_db(
+        db_session, {"name": _unique("discipline"), "domain_ids": [domain.id]}
+    )
+    subject = create_subject_in_db(
+        db_session, {"name": _unique("subject"), "discipline_ids": [discipline.id]}
+    )
+    topic = create_topic_in_db(
+        db_session, {"name": _unique("topic"), "subject_ids": [subject.id]}
+    )
+    db_session.commit()
+
+    assert _depth(db_session, "domains", domain.id, "topics", topic.id) == 3
+    assert read_descendant_ids_from_db(db_session, "disciplines", discipline.id) == {
+        "subjects": [subject.id],
+        "topics": [topic.id],
+    }
+
+    assert delete_subject_to_topic_association_from_db(db_session, subject.id, topic.id)
+    assert read_descendant_ids_from_db(db_session, "domains", domain.id, "topics") == {}
+    assert _depth(db_session, "topics", topic.id, "topics", topic.id) == 0
+
+    assert delete_discipline_from_db(db_session, discipline.id)
+    assert read_descendant_ids_from_db(db_session, "domains", domain.id) == {}
+    assert _depth(db_session, "disciplines", discipline.id, "subjects", subject.id) is None
+    assert _depth(db_session, "subjects", subject.id, "subjects", subject.id) == 0
+
+
+def test_refresh_picks_up_direct_association_changes(
+    db_session, test_model_taxonomy_chain, test_model_subject
+):
+    domain = test_model_taxonomy_chain
+    rebuild_taxonomy_closure_in_db(db_session)
+
+    discipline = domain.disciplines[0]
+    discipline.subjects.remove(test_model_subject)
+    refresh_taxonomy_closure_in_db(db_session, "disciplines", [discipline.id])
+
+    assert "subjects" not in read_descendant_ids_from_db(db_session, "domains", domain.id)
+
+
+def test_question_ids_under_ancestor(
+    db_session, test_model_taxonomy_chain, test_model_concept
+):
+    domain = test_model_taxonomy_chain
+    question = QuestionModel(
+        text=_unique("Closure question"), difficulty="EASY", concepts=[test_model_concept]
+    )
+    db_session.add(question)
+    rebuild_taxonomy_closure_in_db(db_session)
+
+    under_domain = set(
+        db_session.scalars(
+            select(QuestionModel.id).where(
+                QuestionModel.id.in_(question_ids_under_ancestor("domains", domain.id))
+            )
+        )
+    )
+    under_concept = set(
+        db_session.scalars(question_ids_under_ancestor("concepts", test_model_concept.id))
+    )
+
+    assert question.id in under_domain
+    assert question.id in under_concept
+
+
+def test_unknown_taxonomy_level(db_session):
+    with pytest.raises(ValueError, match="Unknown taxonomy level"):
+        refresh_taxonomy_closure_in_db(db_session, "galaxies", [1])
+    with pytest.raises(ValueError, match="Unknown taxonomy level"):
+        question_ids_under_ancestor("galaxies", 1)
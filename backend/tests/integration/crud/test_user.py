@@ -16,6 +16,7 @@ from backend.app.crud.crud_user import (
     read_user_from_db,
     read_users_from_db,
     update_user_in_db,
+    update_user_password_hash_in_db,
 )
 
 
@@ -46,6 +47,20 @@ def test_read_user_by_email(db_session, test_user_data):
     assert read_user.email == user.email
 
 
+def test_user_lookups_are_case_insensitive(db_session, test_user_data):
+    test_user_data["email"] = test_user_data["email"].replace("@", "_Mixed@")
+    user = create_user_in_db(db_session, test_user_data)
+    assert user.username_lower == user.username.lower()
+    assert user.email_lower == user.email.lower()
+
+    assert read_user_by_username_from_db(db_session, user.username.upper()).id == user.id
+    assert read_user_by_email_from_db(db_session, user.email.upper()).id == user.id
+
+    update_user_in_db(db_session, user.id, {"email": "Renamed_" + user.email})
+    assert user.email_lower == user.email.lower()
+    assert read_user_by_email_from_db(db_session, user.email.lower()).id == user.id
+
+
 def test_read_users(db_session, test_user_data):
     create_user_in_db(db_session, test_user_data)
     users = read_users_from_db(db_session)
@@ -108,3 +123,13 @@ def test_read_created_question_sets_for_user(
     created_sets = read_created_question_sets_for_user_from_db(db_session, user.id)
     assert len(created_sets) == 1
     assert created_sets[0].id == question_set.id
+
+
+def test_update_user_password_hash_only_replaces_the_old_hash(db_session, test_user_data):
+    user = create_user_in_db(db_session, test_user_data)
+    old_hash = user.hashed_password
+
+    assert not update_user_password_hash_in_db(db_session, user.id, "stale", "new")
+    assert update_user_password_hash_in_db(db_session, user.id, old_hash, "new")
+    db_session.refresh(user)
+    assert user.hashed_password == "new"
@@ -3,15 +3,25 @@
 import pytest
 import uuid
 
-from backend.app.core.security import get_password_hash
+from fastapi import BackgroundTasks
+from sqlalchemy.orm import Session
+
+from backend.app.core.security import (
+    PasswordHashingBusyError,
+    get_password_hash,
+    password_needs_rehash,
+)
 from backend.app.models.users import UserModel
+from backend.app.services import authentication_service
 from backend.app.services.authentication_service import (
     authenticate_user,
+    rehash_user_password,
     revoke_all_user_tokens,
 )
 
 
-def test_authenticate_user(db_session, test_model_role):
+@pytest.mark.asyncio
+async def test_authenticate_user(db_session, test_model_role):
     # Create a test user
     hashed_password = get_password_hash("testpassword")
     user = UserModel(
@@ -25,20 +35,103 @@ def test_authenticate_user(db_session, test_model_role):
     db_session.commit()
 
     # Test successful authentication
-    authenticated_user = authenticate_user(db_session, "testuser", "testpassword")
+    authenticated_user = await authenticate_user(db_session, "testuser", "testpassword")
     assert authenticated_user is not False
     assert authenticated_user.username == "testuser"
 
     # Test failed authentication with wrong password
-    assert authenticate_user(db_session, "testuser", "wrongpassword") is False
+    assert await authenticate_user(db_session, "testuser", "wrongpassword") is False
 
     # Test failed authentication with non-existent user
-    assert authenticate_user(db_session, "nonexistentuser", "testpassword") is False
+    assert await authenticate_user(db_session, "nonexistentuser", "testpassword") is False
 
     # Test failed authentication with inactive user
     user.is_active = False
     db_session.commit()
-    assert authenticate_user(db_session, "testuser", "testpassword") is False
+    assert await authenticate_user(db_session, "testuser", "testpassword") is False
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_rehashes_outdated_hash(
+    db_session, test_model_role, outdated_password_context
+):
+    outdated_hash = outdated_password_context.hash("testpassword")
+    user = UserModel(
+        username=f"rehash_{str(uuid.uuid4())[:8]}",
+        email=f"rehash_{str(uuid.uuid4())[:8]}@example.com",
+        hashed_password=outdated_hash,
+        role_id=test_model_role.id,
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    # With background tasks the upgrade waits until the tasks run
+    background_tasks = BackgroundTasks()
+    assert await authenticate_user(
+        db_session, user.username, "testpassword", background_tasks
+    )
+    assert len(background_tasks.tasks) == 1
+    db_session.refresh(user)
+    assert user.hashed_password == outdated_hash
+
+    await background_tasks()
+    db_session.refresh(user)
+    assert user.hashed_password != outdated_hash
+    assert not password_needs_rehash(user.hashed_password)
+
+    # A current hash is left alone
+    background_tasks = BackgroundTasks()
+    assert await authenticate_user(
+        db_session, user.username, "testpassword", background_tasks
+    )
+    assert background_tasks.tasks == []
+
+
+@pytest.fixture
+def user_with_outdated_hash(db_session, test_model_role, outdated_password_context):
+    user = UserModel(
+        username=f"rehash_{str(uuid.uuid4())[:8]}",
+        email=f"rehash_{str(uuid.uuid4())[:8]}@example.com",
+        hashed_password=outdated_password_context.hash("testpassword"),
+        role_id=test_model_role.id,
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_rehash_runs_after_the_request_session_is_closed(
+    db_session, user_with_outdated_hash
+):
+    user = user_with_outdated_hash
+    outdated_hash = user.hashed_password
+    request_db = Session(bind=db_session.connection())
+    background_tasks = BackgroundTasks()
+    assert await authenticate_user(
+        request_db, user.username, "testpassword", background_tasks
+    )
+    request_db.close()
+
+    await background_tasks()
+    db_session.refresh(user)
+    assert user.hashed_password != outdated_hash
+
+
+@pytest.mark.asyncio
+async def test_rehash_is_skipped_when_hash_pool_is_busy(
+    db_session, user_with_outdated_hash, monkeypatch
+):
+    async def busy(password):
+        raise PasswordHashingBusyError("Too many pending password hashes")
+
+    monkeypatch.setattr(authentication_service, "get_password_hash_async", busy)
+    user = user_with_outdated_hash
+    outdated_hash = user.hashed_password
+
+    await rehash_user_password(db_session, user.id, outdated_hash, "testpassword")
+    db_session.refresh(user)
+    assert user.hashed_password == outdated_hash
 
 
 def test_revoke_all_user_tokens(db_session, test_model_role):
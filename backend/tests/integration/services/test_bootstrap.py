@@ -0,0 +1,125 @@
+# filename: backend/tests/integration/services/test_bootstrap.py
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.config import TimePeriod
+from backend.app.db.base import Base
+from backend.app.models.bootstrap_markers import BootstrapMarkerModel
+from backend.app.models.permissions import PermissionModel
+from backend.app.models.time_period import TimePeriodModel
+from backend.app.services import bootstrap_service
+from backend.app.services.bootstrap_service import (
+    REFERENCE_DATA_MARKER,
+    bootstrap_lock,
+    bootstrap_reference_data_in_db,
+    reference_data_fingerprint,
+)
+
+PERMISSIONS = {"read_questions", "create_questions", "delete_questions"}
+
+
+@pytest.fixture
+def bootstrap_sessions(tmp_path):
+    # Separate connections per worker need a file database, not the shared in-memory one
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'bootstrap.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _counts(session):
+    return (
+        session.scalar(select(func.count()).select_from(PermissionModel)),
+        session.scalar(select(func.count()).select_from(TimePeriodModel)),
+    )
+
+
+def test_fingerprint_ignores_order_and_tracks_changes():
+    assert reference_data_fingerprint(["a", "b"]) == reference_data_fingerprint(["b", "a"])
+    assert reference_data_fingerprint(["a"]) != reference_data_fingerprint(["a", "b"])
+
+
+def test_bootstrap_seeds_once(bootstrap_sessions):
+    with bootstrap_sessions() as session:
+        assert bootstrap_reference_data_in_db(session, PERMISSIONS) is True
+        assert _counts(session) == (len(PERMISSIONS), len(TimePeriod))
+        marker = session.get(BootstrapMarkerModel, REFERENCE_DATA_MARKER)
+        assert marker.fingerprint == reference_data_fingerprint(PERMISSIONS)
+
+        assert bootstrap_reference_data_in_db(session, PERMISSIONS) is False
+        assert _counts(session) == (len(PERMISSIONS), len(TimePeriod))
+
+
+def test_bootstrap_adds_only_missing_rows(bootstrap_sessions):
+    with bootstrap_sessions() as session:
+        session.add(PermissionModel(name="read_questions"))
+        session.commit()
+
+        assert bootstrap_reference_data_in_db(session, PERMISSIONS) is True
+        assert _counts(session) == (len(PERMISSIONS), len(TimePeriod))
+
+        # New routes change the fingerprint, so the next start seeds again
+        assert bootstrap_reference_data_in_db(session, PERMISSIONS | {"read_users"}) is True
+        assert _counts(session) == (len(PERMISSIONS) + 1, len(TimePeriod))
+
+
+def test_concurrent_workers_seed_once(bootstrap_sessions):
+    def start_worker(_):
+        with bootstrap_sessions() as session:
+            return bootstrap_reference_data_in_db(session, PERMISSIONS)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(start_worker, range(8)))
+
+    assert results.count(True) == 1
+    with bootstrap_sessions() as session:
+        assert _counts(session) == (len(PERMISSIONS), len(TimePeriod))
+
+
+def test_bootstrap_without_marker_table_seeds_every_time(bootstrap_sessions):
+    with bootstrap_sessions() as session:
+        BootstrapMarkerModel.__table__.drop(bind=session.get_bind())
+
+        assert bootstrap_reference_data_in_db(session, PERMISSIONS) is True
+        assert bootstrap_reference_data_in_db(session, PERMISSIONS) is True
+        assert _counts(session) == (len(PERMISSIONS), len(TimePeriod))
+
+
+def test_bootstrap_commits_after_a_lock_statement(bootstrap_sessions, monkeypatch):
+    @contextmanager
+    def statement_lock(connection):
+        # Like pg_advisory_lock and GET_LOCK, begins a transaction on the connection
+        connection.execute(text("SELECT 1"))
+        yield
+
+    monkeypatch.setattr(bootstrap_service, "bootstrap_lock", statement_lock)
+    with bootstrap_sessions() as session:
+        assert bootstrap_reference_data_in_db(session, PERMISSIONS) is True
+
+    with bootstrap_sessions() as session:
+        assert _counts(session) == (len(PERMISSIONS), len(TimePeriod))
+        assert session.get(BootstrapMarkerModel, REFERENCE_DATA_MARKER) is not None
+
+
+def test_named_lock_timeout_is_not_released():
+    statements = []
+
+    def execute(statement, parameters=None):
+        statements.append(str(statement))
+        return SimpleNamespace(scalar=lambda: 0)
+
+    connection = SimpleNamespace(dialect=SimpleNamespace(name="mariadb"), execute=execute)
+    with bootstrap_lock(connection):
+        pass
+
+    # A lock that was never taken must not release another worker's lock
+    assert statements == ["SELECT GET_LOCK(:name, :timeout)"]
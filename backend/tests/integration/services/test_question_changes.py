@@ -0,0 +1,86 @@
+# filename: backend/tests/integration/services/test_question_changes.py
+
+from sqlalchemy import select
+
+from backend.app.crud.crud_associations import replace_associations_in_db
+from backend.app.models.associations import QuestionToTopicAssociation
+from backend.app.models.question_changes import QuestionChangeModel
+from backend.app.models.questions import QuestionModel
+from backend.app.services import question_change_service
+from backend.app.services.question_change_service import (
+    has_uncommitted_question_changes,
+    read_question_changes_since,
+)
+from backend.app.services.resource_version_service import read_resource_version_from_db
+
+
+def _questions_version(db_session):
+    return read_resource_version_from_db(db_session, "questions")[0]
+
+
+def test_commits_log_changed_questions_at_their_version(
+    db_session, test_model_questions, test_model_topic
+):
+    before = _questions_version(db_session)
+    question = test_model_questions[0]
+
+    question.text = "Reworded"
+    added = QuestionModel(text="Added", difficulty="EASY")
+    db_session.add(added)
+    assert has_uncommitted_question_changes(db_session)
+    db_session.commit()
+    assert not has_uncommitted_question_changes(db_session)
+
+    version = _questions_version(db_session)
+    assert version == before + 1
+    rows = db_session.execute(
+        select(QuestionChangeModel.version, QuestionChangeModel.question_id).where(
+            QuestionChangeModel.version > before
+        )
+    ).all()
+    assert sorted(rows) == sorted([(version, question.id), (version, added.id)])
+
+    # Core writes are logged by crud_associations
+    replace_associations_in_db(
+        db_session, QuestionToTopicAssociation, [question.id], [test_model_topic.id]
+    )
+    db_session.commit()
+    assert read_question_changes_since(db_session, version, version + 1) == {question.id}
+    assert read_question_changes_since(db_session, before, version + 1) == {
+        question.id,
+        added.id,
+    }
+
+
+def test_rolled_back_changes_are_not_logged(db_session, test_model_questions):
+    before = _questions_version(db_session)
+    test_model_questions[0].text = "Never committed"
+    db_session.flush()
+    db_session.rollback()
+
+    assert not has_uncommitted_question_changes(db_session)
+    db_session.add(QuestionModel(text="Committed", difficulty="EASY"))
+    db_session.commit()
+    assert test_model_questions[0].id not in read_question_changes_since(
+        db_session, before, _questions_version(db_session)
+    )
+
+
+def test_old_changes_are_pruned(db_session, test_model_questions, monkeypatch):
+    monkeypatch.setattr(question_change_service, "QUESTION_CHANGE_RETENTION", 1)
+    monkeypatch.setattr(question_change_service, "QUESTION_CHANGE_PRUNE_INTERVAL", 1)
+    before = _questions_version(db_session)
+
+    for question in test_model_questions[:2]:
+        question.text = f"{question.text} again"
+        db_session.commit()
+
+    assert read_question_changes_since(db_session, before, before + 2) is None
+    assert db_session.scalars(
+        select(QuestionChangeModel.question_id).where(
+            QuestionChangeModel.version <= before + 1
+        )
+    ).all() == []
+    assert read_question_changes_since(db_session, before + 1, before + 2) == {
+        test_model_questions[1].id
+    }
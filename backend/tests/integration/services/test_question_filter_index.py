@@ -0,0 +1,234 @@
+# filename: backend/tests/integration/services/test_question_filter_index.py
+
+import uuid
+
+import pytest
+
+from backend.app.crud.crud_question_tags import (
+    create_question_to_tag_association_in_db,
+    delete_question_to_tag_association_from_db,
+)
+from backend.app.crud.crud_associations import delete_associations_from_db
+from backend.app.crud.crud_filters import read_filtered_question_ids_from_db
+from backend.app.crud.crud_questions import create_question_in_db, delete_question_from_db
+from backend.app.models.associations import QuestionToTagAssociation
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.models.questions import QuestionModel
+from backend.app.services import question_change_service, question_filter_index_service
+from backend.app.services.question_filter_index_service import (
+    QuestionFilterIndex,
+    question_filter_index,
+)
+from backend.app.services.resource_version_service import read_resource_version_from_db
+
+
+@pytest.fixture(scope="function")
+def indexed_questions(db_session, test_model_topic):
+    tag = QuestionTagModel(tag=f"index-tag-{uuid.uuid4().hex[:8]}")
+    questions = [
+        QuestionModel(
+            text=f"Indexed question {i}",
+            difficulty=difficulty,
+            topics=[test_model_topic],
+            question_tags=[tag] if i < 2 else [],
+        )
+        for i, difficulty in enumerate(["EASY", "EASY", "HARD"])
+    ]
+    db_session.add_all(questions)
+    db_session.commit()
+    question_filter_index.build(db_session)
+    return {"questions": questions, "tag": tag}
+
+
+def _ids(questions):
+    return sorted(question.id for question in questions)
+
+
+def _count_builds(index, monkeypatch):
+    builds = []
+    build = index.build
+    monkeypatch.setattr(index, "build", lambda db: builds.append(1) or build(db))
+    return builds
+
+
+def test_select_page_and_count_by_value(
+    db_session, indexed_questions, test_model_topic
+):
+    questions, tag = indexed_questions["questions"], indexed_questions["tag"]
+    topic = [("topics", test_model_topic.id)]
+
+    assert question_filter_index.select_page(db_session, [topic]) == _ids(questions)
+    assert question_filter_index.select_page(
+        db_session, [topic, [("difficulty", "Easy")]], skip=1, limit=5
+    ) == _ids(questions[:2])[1:]
+    total, counts = question_filter_index.count_by_value(
+        db_session,
+        [topic, [("difficulty", "Hard"), ("question_tags", tag.id)]],
+        ["difficulty", "question_tags"],
+    )
+    assert total == 3
+    assert counts == {
+        "difficulty": {"Easy": 2, "Hard": 1},
+        "question_tags": {tag.id: 2},
+    }
+    assert question_filter_index.select_page(db_session, [topic, []]) == []
+    assert question_filter_index.select_page(db_session, [[("topics", -1)]]) == []
+
+
+def test_session_events_keep_index_current(
+    db_session, indexed_questions, test_model_topic
+):
+    questions, tag = indexed_questions["questions"], indexed_questions["tag"]
+    topic_clause = [("topics", test_model_topic.id)]
+    tag_clause = [("question_tags", tag.id)]
+
+    # Relationship changes on either side of the association
+    added = QuestionModel(text="Added later", difficulty="MEDIUM", topics=[test_model_topic])
+    db_session.add(added)
+    questions[2].difficulty = "EASY"
+    tag.questions.remove(questions[0])
+    db_session.commit()
+
+    assert question_filter_index.select_page(db_session, [topic_clause]) == _ids(
+        questions + [added]
+    )
+    assert len(
+        question_filter_index.select_page(
+            db_session, [[("difficulty", "Easy")], topic_clause]
+        )
+    ) == 3
+    assert question_filter_index.select_page(db_session, [tag_clause]) == [questions[1].id]
+
+    # Association models written through the CRUD helpers
+    create_question_to_tag_association_in_db(db_session, added.id, tag.id)
+    delete_question_to_tag_association_from_db(db_session, questions[1].id, tag.id)
+    assert question_filter_index.select_page(db_session, [tag_clause]) == [added.id]
+
+    db_session.delete(tag)
+    db_session.commit()
+    assert question_filter_index.select_page(db_session, [tag_clause]) == []
+
+
+def test_own_commits_do_not_rebuild(db_session, indexed_questions, monkeypatch):
+    question = indexed_questions["questions"][2]
+    builds = _count_builds(question_filter_index, monkeypatch)
+
+    question.difficulty = "EASY"
+    db_session.commit()
+    version, _ = read_resource_version_from_db(db_session, "questions")
+    assert question_filter_index._data_version == version
+    assert question_filter_index._stale == {question.id}
+
+    assert question.id in question_filter_index.select_page(
+        db_session, [[("difficulty", "Easy")]]
+    )
+    assert builds == []
+
+
+def test_rolled_back_changes_are_not_marked(db_session, indexed_questions):
+    question = indexed_questions["questions"][0]
+    question.difficulty = "EXPERT"
+    db_session.flush()
+    assert db_session.info["question_changes_pending"] == {question.id}
+
+    db_session.rollback()
+    assert not db_session.info.get("question_changes_pending")
+    assert question_filter_index._stale == set()
+
+
+def test_uncommitted_changes_are_read_from_the_database(
+    db_session, indexed_questions, test_model_topic
+):
+    filters = {"topic": test_model_topic.name}
+    added = QuestionModel(text="Not committed", difficulty="EASY", topics=[test_model_topic])
+    db_session.add(added)
+    db_session.flush()
+
+    assert added.id in read_filtered_question_ids_from_db(db_session, filters)
+    # The shared index never saw the uncommitted question
+    assert added.id not in question_filter_index._question_keys
+
+
+def test_crud_keeps_index_current(db_session, test_schema_question, test_model_topic):
+    question_filter_index.build(db_session)
+    topic_clause = [("topics", test_model_topic.id)]
+
+    created = create_question_in_db(db_session, test_schema_question.model_dump())
+    assert created.id in question_filter_index.select_page(db_session, [topic_clause])
+
+    delete_question_from_db(db_session, created.id)
+    assert created.id not in question_filter_index.select_page(db_session, [topic_clause])
+
+
+def test_catches_up_on_changes_logged_by_other_processes(
+    db_session, indexed_questions, test_model_topic, monkeypatch
+):
+    index = QuestionFilterIndex()
+    topic_clause = [("topics", test_model_topic.id)]
+    index.build(db_session)
+    builds = _count_builds(index, monkeypatch)
+
+    added = QuestionModel(text="Written by another process", difficulty="EASY")
+    db_session.add(added)
+    indexed_questions["questions"][0].topics = []
+    db_session.commit()
+    # Not told about the commit; the version moved and the log names the questions
+    assert added.id in index.select_page(db_session, [])
+    assert len(index.select_page(db_session, [topic_clause])) == 2
+    assert builds == []
+
+
+def test_rebuilds_when_the_change_log_cannot_tell(
+    db_session, indexed_questions, test_model_topic, monkeypatch
+):
+    index = QuestionFilterIndex()
+    index.build(db_session)
+    builds = _count_builds(index, monkeypatch)
+
+    monkeypatch.setattr(question_change_service, "QUESTION_CHANGE_RETENTION", 0)
+    db_session.add(QuestionModel(text="Written long ago", difficulty="EASY"))
+    db_session.commit()
+    index.select_page(db_session, [])
+    assert len(builds) == 1
+
+    # Detaching every question from a tag does not say which questions
+    monkeypatch.undo()
+    builds = _count_builds(index, monkeypatch)
+    tag = indexed_questions["tag"]
+    delete_associations_from_db(
+        db_session, QuestionToTagAssociation, [tag.id], source_table="question_tags"
+    )
+    db_session.commit()
+    assert len(index.select_page(db_session, [[("question_tags", tag.id)]])) == 0
+    assert len(builds) == 1
+
+
+def test_deleted_nodes_mark_their_questions(
+    db_session, indexed_questions, test_model_topic, monkeypatch
+):
+    index = QuestionFilterIndex()
+    index.build(db_session)
+    builds = _count_builds(index, monkeypatch)
+
+    db_session.delete(test_model_topic)
+    db_session.commit()
+    assert len(index.select_page(db_session, [[("topics", test_model_topic.id)]])) == 0
+    assert builds == []
+
+
+def test_rebuilds_after_ttl_without_version_table(
+    db_session, indexed_questions, test_model_topic, monkeypatch
+):
+    monkeypatch.setattr(
+        question_filter_index_service, "read_resource_version_key", lambda db, resource: None
+    )
+    index = QuestionFilterIndex(ttl_seconds=0)
+    topic_clause = [("topics", test_model_topic.id)]
+    index.build(db_session)
+
+    added = QuestionModel(text="Written elsewhere", difficulty="EASY")
+    db_session.add(added)
+    db_session.flush()
+    # Not marked stale by this index's events, but the expired index rebuilds
+    assert added.id in index.select_page(db_session, [])
+    assert len(index.select_page(db_session, [topic_clause])) == 3
@@ -0,0 +1,191 @@
+# filename: backend/tests/integration/services/test_question_sampling.py
+
+import pytest
+
+from backend.app.crud.crud_questions import create_question_in_db, delete_question_from_db
+from backend.app.services import question_sampling_service
+from backend.app.services.question_sampling_service import (
+    QuestionSamplingIndex,
+    question_sampling_index,
+)
+from backend.app.services.randomization_service import randomize_questions
+
+
+@pytest.fixture(scope="function")
+def sampling_index(db_session, test_model_quiz_question_pool):
+    index = QuestionSamplingIndex()
+    index.build(db_session)
+    return index
+
+
+def _pool_ids(question_set, difficulty=None):
+    return {
+        q.id
+        for q in question_set.questions
+        if difficulty is None or q.difficulty.value == difficulty
+    }
+
+
+def test_build_and_count(sampling_index, test_model_topic, test_model_quiz_question_pool):
+    topic_ids = [test_model_topic.id]
+
+    assert sampling_index.is_built
+    assert sampling_index.count(topic_ids=topic_ids) == 10
+    assert sampling_index.count(difficulties=["Easy"], topic_ids=topic_ids) == 6
+    assert set(sampling_index.candidate_ids(topic_ids=topic_ids)) == _pool_ids(
+        test_model_quiz_question_pool
+    )
+
+
+def test_sample_is_reproducible(
+    sampling_index, test_model_topic, test_model_quiz_question_pool
+):
+    topic_ids = [test_model_topic.id]
+    sample = sampling_index.sample(4, difficulties=["Easy"], topic_ids=topic_ids, seed=5)
+
+    assert len(set(sample)) == 4
+    assert set(sample) <= _pool_ids(test_model_quiz_question_pool, "Easy")
+    assert sample == sampling_index.sample(
+        4, difficulties=["Easy"], topic_ids=topic_ids, seed=5
+    )
+    assert len(sampling_index.sample(50, topic_ids=topic_ids, seed=5)) == 10
+
+
+def test_sample_across_overlapping_buckets(
+    sampling_index, test_model_subject, test_model_topic, test_model_quiz_question_pool
+):
+    # Put every pool question in a second bucket as well
+    for question in test_model_quiz_question_pool.questions:
+        sampling_index.add_question(
+            question.id,
+            question.difficulty,
+            [test_model_subject.id, -1],
+            [test_model_topic.id],
+        )
+
+    sample = sampling_index.sample(
+        3, subject_ids=[test_model_subject.id, -1], topic_ids=[test_model_topic.id], seed=1
+    )
+
+    assert len(sample) == len(set(sample)) == 3
+    assert sampling_index.count(topic_ids=[test_model_topic.id]) == 10
+
+
+def test_incremental_updates(
+    sampling_index, test_model_subject, test_model_topic, test_model_quiz_question_pool
+):
+    topic_ids = [test_model_topic.id]
+    question = test_model_quiz_question_pool.questions[0]
+
+    sampling_index.remove_question(question.id)
+    assert sampling_index.count(topic_ids=topic_ids) == 9
+
+    sampling_index.add_question(question.id, "Expert", [test_model_subject.id], topic_ids)
+    assert sampling_index.count(topic_ids=topic_ids) == 10
+    assert list(sampling_index.candidate_ids(["Expert"], topic_ids=topic_ids)) == [
+        question.id
+    ]
+
+
+def test_matching_keys_are_looked_up_by_part(
+    sampling_index, test_model_subject, test_model_topic, test_model_quiz_question_pool
+):
+    question = test_model_quiz_question_pool.questions[0]
+    sampling_index.add_question(question.id, "Expert", [-1], [test_model_topic.id])
+
+    assert sampling_index._matching_keys(["Expert"], [-1]) == [
+        ("Expert", -1, test_model_topic.id)
+    ]
+    assert sampling_index._matching_keys(subject_ids=[-2]) == []
+    assert ("Expert", -1, test_model_topic.id) in sampling_index._matching_keys()
+
+    sampling_index.remove_question(question.id)
+    assert sampling_index._matching_keys(subject_ids=[-1]) == []
+    assert -1 not in sampling_index._keys_by_part[1]
+
+
+def test_catches_up_on_changes_logged_by_other_processes(
+    db_session,
+    sampling_index,
+    test_model_topic,
+    test_model_quiz_question_pool,
+    monkeypatch,
+):
+    builds = []
+    monkeypatch.setattr(sampling_index, "build", lambda db: builds.append(db))
+    question = test_model_quiz_question_pool.questions[0]
+    # Not seen by this index's CRUD hooks, but the commit logs the question
+    question.topics = []
+    db_session.commit()
+    sampling_index.ensure_current(db_session)
+
+    assert sampling_index.count(topic_ids=[test_model_topic.id]) == 9
+    assert builds == []
+
+
+def test_own_commits_do_not_rebuild(
+    db_session, test_model_topic, test_model_quiz_question_pool, monkeypatch
+):
+    question_sampling_index.build(db_session)
+    try:
+        builds = []
+        monkeypatch.setattr(
+            question_sampling_index, "build", lambda db: builds.append(db)
+        )
+        question = test_model_quiz_question_pool.questions[0]
+        question.difficulty = "EXPERT"
+        db_session.commit()
+        question_sampling_index.ensure_current(db_session)
+
+        assert list(
+            question_sampling_index.candidate_ids(
+                ["Expert"], topic_ids=[test_model_topic.id]
+            )
+        ) == [question.id]
+        assert builds == []
+    finally:
+        monkeypatch.undo()
+        question_sampling_index.invalidate()
+
+
+def test_rebuilds_after_ttl_without_version_table(
+    db_session, test_model_topic, test_model_quiz_question_pool, monkeypatch
+):
+    monkeypatch.setattr(
+        question_sampling_service, "read_resource_version_key", lambda db, resource: None
+    )
+    index = QuestionSamplingIndex(ttl_seconds=0)
+    index.ensure_current(db_session)
+    test_model_quiz_question_pool.questions[0].topics = []
+    db_session.flush()
+    index.ensure_current(db_session)
+
+    assert index.count(topic_ids=[test_model_topic.id]) == 9
+
+
+def test_randomize_questions_over_index(sampling_index, test_model_topic):
+    candidates = sampling_index.candidate_ids(topic_ids=[test_model_topic.id])
+
+    drawn = randomize_questions(candidates, seed=3, count=4)
+
+    assert len(set(drawn)) == 4
+    assert set(drawn) <= set(candidates)
+
+
+def test_crud_keeps_shared_index_current(
+    db_session, test_schema_question, test_model_topic
+):
+    question_sampling_index.invalidate()
+    question_sampling_index.build(db_session)
+    try:
+        created = create_question_in_db(db_session, test_schema_question.model_dump())
+        assert created.id in question_sampling_index.candidate_ids(
+            ["Medium"], topic_ids=[test_model_topic.id]
+        )
+
+        delete_question_from_db(db_session, created.id)
+        assert created.id not in question_sampling_index.candidate_ids(
+            topic_ids=[test_model_topic.id]
+        )
+    finally:
+        question_sampling_index.invalidate()
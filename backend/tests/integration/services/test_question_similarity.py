@@ -0,0 +1,167 @@
+# filename: backend/tests/integration/services/test_question_similarity.py
+
+import uuid
+
+import pytest
+
+from backend.app.crud.crud_questions import (
+    create_question_in_db,
+    delete_question_from_db,
+    update_question_in_db,
+)
+from backend.app.crud.crud_similarity import (
+    build_duplicate_report,
+    read_similar_questions_from_db,
+)
+from backend.app.models.questions import QuestionModel
+from backend.app.services.question_similarity_service import (
+    SIGNATURE_SIZE,
+    QuestionSimilarityIndex,
+    minhash_signature,
+    normalize_question_text,
+    question_similarity_index,
+)
+
+RED_PLANET = "Which planet in the solar system is known as the red planet?"
+RED_PLANET_VARIANT = "Which planet of the solar system is known as the Red Planet"
+UNRELATED = "What is the boiling point of water at sea level in Celsius?"
+
+
+@pytest.fixture(scope="function")
+def similarity_index():
+    index = QuestionSimilarityIndex()
+    index.load([(1, RED_PLANET), (2, RED_PLANET_VARIANT), (3, UNRELATED), (4, "?!")])
+    return index
+
+
+def test_normalize_question_text():
+    assert normalize_question_text("  What's 2+2?\n") == "what s 2 2"
+    assert normalize_question_text(None) == ""
+
+
+def test_signature_is_stable_and_ignores_formatting():
+    assert minhash_signature(RED_PLANET) == minhash_signature(RED_PLANET.upper() + "!!")
+    assert minhash_signature("...") is None
+
+
+def test_find_similar(similarity_index):
+    assert len(similarity_index) == 3  # the text without words is not indexed
+
+    matches = similarity_index.find_similar(RED_PLANET, exclude_ids=[1])
+    assert [question_id for question_id, _ in matches] == [2]
+    assert 0.5 <= matches[0][1] < 1.0
+
+    assert similarity_index.find_similar(RED_PLANET, threshold=1.0) == [(1, 1.0)]
+    assert similarity_index.find_similar("Name the largest ocean on Earth") == []
+
+
+def test_incremental_updates(similarity_index):
+    similarity_index.remove_question(2)
+    assert similarity_index.find_similar(RED_PLANET, exclude_ids=[1]) == []
+
+    similarity_index.add_question(3, RED_PLANET)
+    assert similarity_index.find_similar(UNRELATED) == []
+    assert [match[0] for match in similarity_index.find_similar(RED_PLANET)] == [1, 3]
+
+
+def test_signatures_are_stored_compactly(similarity_index):
+    assert len(similarity_index._store) == 3 * SIGNATURE_SIZE
+    assert similarity_index.signature_of(1) == minhash_signature(RED_PLANET)
+
+    # A removed question's slot is reused, and single-id buckets hold bare ids
+    similarity_index.remove_question(3)
+    similarity_index.add_question(5, UNRELATED)
+    assert len(similarity_index._store) == 3 * SIGNATURE_SIZE
+    assert similarity_index.find_similar(UNRELATED) == [(5, 1.0)]
+    assert any(
+        bucket == 5 for buckets in similarity_index._bands for bucket in buckets.values()
+    )
+
+
+def test_catches_up_on_questions_written_by_other_processes(db_session, monkeypatch):
+    text = f"Which gas do plants absorb {uuid.uuid4().hex[:8]} from the air?"
+    index = QuestionSimilarityIndex()
+    index.build(db_session)
+    builds = []
+    monkeypatch.setattr(index, "build", lambda db: builds.append(db))
+
+    question = QuestionModel(text=text, difficulty="EASY")
+    db_session.add(question)
+    db_session.commit()
+    # Not told about the commit; the change log names the question
+    index.ensure_current(db_session)
+
+    assert index.find_similar(text, threshold=1.0) == [(question.id, 1.0)]
+    assert builds == []
+
+
+def test_crud_keeps_shared_index_current(db_session, test_schema_question):
+    text = f"Which element has the chemical symbol {uuid.uuid4().hex[:8]} here?"
+    question_similarity_index.invalidate()
+    question_similarity_index.build(db_session)
+    try:
+        created = create_question_in_db(
+            db_session, {**test_schema_question.model_dump(), "text": text}
+        )
+        assert question_similarity_index.find_similar(text, threshold=1.0) == [
+            (created.id, 1.0)
+        ]
+
+        update_question_in_db(db_session, created.id, {"text": UNRELATED + " Why?"})
+        assert question_similarity_index.find_similar(text, threshold=1.0) == []
+
+        delete_question_from_db(db_session, created.id)
+        assert question_similarity_index.signature_of(created.id) is None
+    finally:
+        question_similarity_index.invalidate()
+
+
+def test_read_similar_questions_from_db(db_session, test_schema_question):
+    marker = uuid.uuid4().hex[:8]
+    base = f"In which year did the {marker} treaty end the long war?"
+    question_similarity_index.invalidate()
+    try:
+        original = create_question_in_db(
+            db_session, {**test_schema_question.model_dump(), "text": base}
+        )
+        copy = create_question_in_db(
+            db_session, {**test_schema_question.model_dump(), "text": base.upper()}
+        )
+
+        similar = read_similar_questions_from_db(db_session, original.id)
+        assert [(question.id, similarity) for question, similarity in similar] == [
+            (copy.id, 1.0)
+        ]
+        assert read_similar_questions_from_db(db_session, 999999) is None
+    finally:
+        question_similarity_index.invalidate()
+
+
+def test_build_duplicate_report(db_session, test_schema_question):
+    marker = uuid.uuid4().hex[:8]
+    existing_text = f"Who painted the {marker} ceiling of the chapel?"
+    question_similarity_index.invalidate()
+    try:
+        existing = create_question_in_db(
+            db_session, {**test_schema_question.model_dump(), "text": existing_text}
+        )
+        batch_text = f"Which river flows through the {marker} valley?"
+
+        report = build_duplicate_report(
+            db_session, [batch_text, existing_text, batch_text + "!", "Unique question"]
+        )
+
+        assert report == [
+            {
+                "index": 1,
+                "existing": [{"question_id": existing.id, "similarity": 1.0}],
+                "in_upload": [],
+            },
+            {
+                "index": 2,
+                "existing": [],
+                "in_upload": [{"index": 0, "similarity": 1.0}],
+            },
+        ]
+    finally:
+        question_similarity_index.invalidate()
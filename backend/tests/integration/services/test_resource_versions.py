@@ -0,0 +1,132 @@
+# filename: backend/tests/integration/services/test_resource_versions.py
+
+import uuid
+
+from backend.app.crud.crud_answer_choices import create_answer_choices_in_db
+from backend.app.crud.crud_question_sets import update_question_set_questions
+from backend.app.crud.crud_questions import update_question_in_db
+from backend.app.models.groups import GroupModel
+from backend.app.models.question_tags import QuestionTagModel
+from backend.app.services.resource_version_service import (
+    bump_resource_versions_in_db,
+    read_resource_version_from_db,
+    read_resource_version_key,
+    resource_for_path,
+)
+
+
+def _versions(db_session):
+    return {
+        resource: read_resource_version_from_db(db_session, resource)[0]
+        for resource in ("questions", "question_sets", "question_tags", "taxonomy")
+    }
+
+
+def test_resource_for_path():
+    assert resource_for_path("/questions/") == "questions"
+    assert resource_for_path("/questions/12/similar") == "questions"
+    assert resource_for_path("/question-sets/3") == "question_sets"
+    assert resource_for_path("/subjects/4") == "taxonomy_nodes"
+    assert resource_for_path("/taxonomy/tree") == "taxonomy"
+    assert resource_for_path("/users/") is None
+
+
+def test_commits_bump_dependent_resources(db_session, test_model_subject, test_model_user):
+    before = _versions(db_session)
+
+    test_model_subject.name = f"{test_model_subject.name}-renamed"
+    db_session.commit()
+    after_rename = _versions(db_session)
+    assert after_rename["taxonomy"] == before["taxonomy"] + 1
+    assert after_rename["questions"] == before["questions"] + 1
+    assert after_rename["question_tags"] == before["question_tags"]
+
+    db_session.add(QuestionTagModel(tag=f"{test_model_subject.name}-tag"))
+    db_session.commit()
+    after_tag = _versions(db_session)
+    assert after_tag["question_tags"] == after_rename["question_tags"] + 1
+    assert after_tag["taxonomy"] == after_rename["taxonomy"]
+
+    # Groups only appear in question set responses
+    db_session.add(GroupModel(name="versioned group", creator_id=test_model_user.id))
+    db_session.commit()
+    after_group = _versions(db_session)
+    assert after_group["question_sets"] == after_tag["question_sets"] + 1
+    assert after_group["questions"] == after_tag["questions"]
+
+
+def test_bulk_association_writes_bump_dependent_resources(
+    db_session, test_model_questions, test_model_question_set
+):
+    question = test_model_questions[0]
+    tag = QuestionTagModel(tag=f"bulk-{uuid.uuid4().hex[:8]}")
+    db_session.add(tag)
+    db_session.flush()
+    before = _versions(db_session)
+
+    update_question_in_db(db_session, question.id, {"question_tag_ids": [tag.id]})
+    after_tagging = _versions(db_session)
+    assert tag in question.question_tags
+    assert after_tagging["questions"] > before["questions"]
+    assert after_tagging["taxonomy"] == before["taxonomy"]
+
+    create_answer_choices_in_db(
+        db_session, [{"text": "Core answer", "is_correct": True}], question.id
+    )
+    db_session.commit()
+    after_answers = _versions(db_session)
+    assert after_answers["questions"] > after_tagging["questions"]
+
+    # Query.delete() of every question in the set, with nothing re-added
+    update_question_set_questions(db_session, test_model_question_set.id, [])
+    db_session.commit()
+    assert _versions(db_session)["question_sets"] > after_answers["question_sets"]
+
+
+def test_versions_move_once_per_commit(db_session, test_model_questions):
+    before = _versions(db_session)
+
+    for question in test_model_questions:
+        question.text = f"{question.text} (edited)"
+        db_session.flush()
+    assert _versions(db_session) == before
+
+    db_session.commit()
+    after = _versions(db_session)
+    assert after["questions"] == before["questions"] + 1
+    # The taxonomy graph does not list questions
+    assert after["taxonomy"] == before["taxonomy"]
+
+
+def test_rolled_back_changes_are_not_bumped(db_session, test_model_questions):
+    before = _versions(db_session)
+
+    test_model_questions[0].text = "Never committed"
+    db_session.flush()
+    db_session.rollback()
+    db_session.commit()
+
+    assert _versions(db_session) == before
+
+
+def test_bump_creates_missing_rows(db_session):
+    resource = f"unseeded-{uuid.uuid4().hex[:8]}"
+    assert read_resource_version_from_db(db_session, resource) == (0, None)
+
+    bump_resource_versions_in_db(db_session, [resource, resource])
+    version, updated_at = read_resource_version_from_db(db_session, resource)
+    assert version == 1
+    assert updated_at.tzinfo is not None
+
+    bump_resource_versions_in_db(db_session, [resource])
+    assert read_resource_version_from_db(db_session, resource)[0] == 2
+
+
+def test_resource_version_key_moves_with_every_bump(db_session):
+    before = read_resource_version_key(db_session, "taxonomy")
+
+    bump_resource_versions_in_db(db_session, ["taxonomy"])
+
+    after = read_resource_version_key(db_session, "taxonomy")
+    assert after != before
+    assert after == read_resource_version_from_db(db_session, "taxonomy")
@@ -0,0 +1,97 @@
+# filename: backend/tests/integration/services/test_taxonomy.py
+
+import uuid
+
+from backend.app.crud.crud_subjects import create_subject_in_db, delete_subject_from_db
+from backend.app.services import taxonomy_service
+from backend.app.services.resource_version_service import bump_resource_versions_in_db
+from backend.app.services.taxonomy_service import (
+    TaxonomyCache,
+    build_taxonomy_graph,
+    taxonomy_cache,
+)
+
+
+def test_build_taxonomy_graph(
+    db_session, test_model_subject, test_model_topic, test_model_subtopic, test_model_concept
+):
+    graph = build_taxonomy_graph(db_session, version=3)
+
+    assert graph.version == 3
+    assert graph.names["topics"][test_model_topic.id] == test_model_topic.name
+    assert graph.find_id("concepts", test_model_concept.name.upper()) == test_model_concept.id
+    assert test_model_topic.id in graph.children["subjects"][test_model_subject.id]
+    assert graph.parents["concepts"][test_model_concept.id] == (test_model_subtopic.id,)
+    assert graph.find_id("subjects", "no such subject") is None
+
+
+def test_taxonomy_tree_nests_levels(
+    db_session, test_model_taxonomy_chain, test_model_concept
+):
+    tree = build_taxonomy_graph(db_session).to_tree()
+
+    domain = next(d for d in tree["domains"] if d["id"] == test_model_taxonomy_chain.id)
+    assert domain["name"] == test_model_taxonomy_chain.name
+    assert "disciplines" in domain
+    concept_ids = {
+        concept["id"]
+        for discipline in domain["disciplines"]
+        for subject in discipline["subjects"]
+        for topic in subject["topics"]
+        for subtopic in topic["subtopics"]
+        for concept in subtopic["concepts"]
+    }
+    assert test_model_concept.id in concept_ids
+
+
+def test_taxonomy_cache_rebuilds_on_version_bump(db_session):
+    cache = TaxonomyCache()
+    graph = cache.get_graph(db_session)
+    assert cache.get_graph(db_session) is graph
+
+    cache.bump_version()
+    rebuilt = cache.get_graph(db_session)
+    assert rebuilt is not graph
+    assert rebuilt.version == cache.version
+
+
+def test_taxonomy_cache_rebuilds_when_the_database_version_moves(db_session):
+    cache = TaxonomyCache()
+    graph = cache.get_graph(db_session)
+
+    # As a write committed by another worker process would
+    bump_resource_versions_in_db(db_session, ["taxonomy"])
+
+    assert cache.get_graph(db_session) is not graph
+
+
+def test_taxonomy_cache_expires_without_version_table(db_session, monkeypatch):
+    monkeypatch.setattr(taxonomy_service, "read_resource_version_key", lambda db, resource: None)
+    cache = TaxonomyCache(ttl_seconds=0)
+    graph = cache.get_graph(db_session)
+
+    assert cache.get_graph(db_session) is not graph
+
+
+def test_crud_writes_bump_version(db_session):
+    version = taxonomy_cache.version
+    subject = create_subject_in_db(
+        db_session, {"name": f"Taxonomy Subject {uuid.uuid4().hex[:8]}"}
+    )
+    assert taxonomy_cache.version > version
+    assert taxonomy_cache.get_graph(db_session).find_id("subjects", subject.name) == (
+        subject.id
+    )
+
+    version = taxonomy_cache.version
+    delete_subject_from_db(db_session, subject.id)
+    assert taxonomy_cache.version > version
+    assert subject.id not in taxonomy_cache.get_graph(db_session).names["subjects"]
+
+
+def test_tree_json_is_stable_and_cached(db_session):
+    graph = build_taxonomy_graph(db_session)
+    body = graph.tree_json()
+
+    assert graph.tree_json() is body
+    assert build_taxonomy_graph(db_session).tree_json() == body
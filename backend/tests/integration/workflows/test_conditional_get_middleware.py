@@ -0,0 +1,56 @@
+# filename: backend/tests/integration/workflows/test_conditional_get_middleware.py
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from backend.app.middleware.conditional_get_middleware import etag_matches
+
+
+def test_get_returns_validators_and_304(logged_in_client, test_model_questions):
+    url = f"/questions/{test_model_questions[0].id}"
+    response = logged_in_client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"questions-')
+    last_modified = response.headers["Last-Modified"]
+
+    not_modified = logged_in_client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+    since = logged_in_client.get(url, headers={"If-Modified-Since": last_modified})
+    assert since.status_code == 304
+
+    stale = logged_in_client.get(url, headers={"If-None-Match": 'W/"questions-0-0"'})
+    assert stale.status_code == 200
+
+
+def test_write_changes_the_etag(
+    logged_in_client, db_session, test_model_questions, test_model_subject
+):
+    url = f"/subjects/{test_model_subject.id}"
+    etag = logged_in_client.get(url).headers["ETag"]
+
+    test_model_questions[0].text = "A question whose subject listing changes"
+    db_session.commit()
+
+    response = logged_in_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    earlier = format_datetime(datetime.now(timezone.utc) - timedelta(days=1), usegmt=True)
+    assert logged_in_client.get(url, headers={"If-Modified-Since": earlier}).status_code == 200
+
+
+def test_unversioned_paths_and_errors_have_no_etag(logged_in_client):
+    assert "ETag" not in logged_in_client.get("/").headers
+    assert "ETag" not in logged_in_client.get("/questions/99999").headers
+
+
+def test_etag_matches():
+    etag = 'W/"questions-3-1f"'
+    assert etag_matches('"questions-3-1f"', etag)
+    assert etag_matches('W/"other", W/"questions-3-1f"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"questions-2-1f"', etag)
@@ -290,6 +290,8 @@ def test_question_creation_performance(db_session, test_model_user):
     iterations = 50
     durations = []
     query_counts = []
+    # Read once; every commit expires the user, and reloading it is not question creation
+    creator_id = test_model_user.id
     
     for i in range(iterations):
         question_text = f"Current question {i}?"
@@ -300,7 +302,7 @@ def test_question_creation_performance(db_session, test_model_user):
             question = QuestionModel(
                 text=question_text,
                 difficulty="EASY",
-                creator_id=test_model_user.id
+                creator_id=creator_id
             )
             db_session.add(question)
             db_session.commit()
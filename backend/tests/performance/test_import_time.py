@@ -0,0 +1,64 @@
+# filename: backend/tests/performance/test_import_time.py
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.performance
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+# Cold import of the app measured around 1.1-1.5 s; the budget leaves headroom
+IMPORT_BUDGET_MS = int(os.getenv("IMPORT_TIME_BUDGET_MS", "2500"))
+ATTEMPTS = 3
+# Timing cold imports takes several interpreter starts, so it only runs on request
+RUN_IMPORT_BENCHMARK = bool(os.getenv("IMPORT_TIME_BENCHMARK"))
+
+LAZY_STATE_SCRIPT = """
+import sys
+import backend.app.main
+from backend.app.core.config import get_settings
+from backend.app.db.session import get_engine
+from backend.app.services.logging_service import get_logger
+print(get_settings.cache_info().currsize, get_engine.cache_info().currsize,
+      get_logger.cache_info().currsize, "passlib.context" in sys.modules)
+"""
+
+
+def _run_python(*args):
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "ENVIRONMENT": "test"},
+        check=True,
+    )
+
+
+def _cold_import_ms():
+    stderr = _run_python("-X", "importtime", "-c", "import backend.app.main").stderr
+    match = re.search(r"\|\s*(\d+) \| backend\.app\.main$", stderr, re.MULTILINE)
+    return int(match.group(1)) / 1000
+
+
+def test_import_does_not_load_settings_engine_or_logging():
+    """Importing the app must defer settings, engine, log handlers and passlib to lifespan."""
+    assert _run_python("-c", LAZY_STATE_SCRIPT).stdout.split() == [
+        "0",
+        "0",
+        "0",
+        "False",
+    ]
+
+
+@pytest.mark.skipif(
+    not RUN_IMPORT_BENCHMARK, reason="set IMPORT_TIME_BENCHMARK=1 to time cold imports"
+)
+def test_cold_import_time_budget():
+    """Fail if a cold import of backend.app.main regresses past the budget."""
+    best_ms = min(_cold_import_ms() for _ in range(ATTEMPTS))
+    print(f"\nCold import of backend.app.main: {best_ms:.0f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    assert best_ms < IMPORT_BUDGET_MS
@@ -0,0 +1,125 @@
+# filename: backend/tests/performance/test_serialization_performance.py
+
+import time
+import uuid
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from backend.app.api.responses import validated_response
+from backend.app.crud.crud_question_projections import read_question_projections_from_db
+from backend.app.crud.crud_questions import read_full_question_from_db
+from backend.app.models.permissions import PermissionModel
+from backend.app.models.questions import QuestionModel
+from backend.app.models.roles import RoleModel
+from backend.app.schemas.questions import DetailedQuestionSchema
+
+pytestmark = pytest.mark.performance
+
+QUESTION_COUNT = 50
+ROUNDS = 3
+
+response_adapter = TypeAdapter(List[DetailedQuestionSchema])
+
+
+@pytest.fixture(scope="function")
+def serialization_questions(
+    db_session,
+    test_model_subject,
+    test_model_topic,
+    test_model_subtopic,
+    test_model_concept,
+):
+    suffix = uuid.uuid4().hex[:8]
+    questions = [
+        QuestionModel(
+            text=f"Serialization benchmark {suffix} {i}",
+            difficulty="MEDIUM",
+            subjects=[test_model_subject],
+            topics=[test_model_topic],
+            subtopics=[test_model_subtopic],
+            concepts=[test_model_concept],
+        )
+        for i in range(QUESTION_COUNT)
+    ]
+    db_session.add_all(questions)
+    db_session.commit()
+    return [question.id for question in questions]
+
+
+@pytest.fixture(scope="function")
+def question_reader(logged_in_client, db_session, test_model_user_with_group):
+    # Route permissions generated by earlier tests are not granted to the test role
+    permission = (
+        db_session.query(PermissionModel).filter_by(name="read_questions").first()
+    )
+    role = db_session.get(RoleModel, test_model_user_with_group.role_id)
+    if permission is not None and permission not in role.permissions:
+        role.permissions.append(permission)
+        db_session.commit()
+    return logged_in_client
+
+
+def _best_time(func):
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def test_question_list_route_benchmark(
+    question_reader, db_session, serialization_questions
+):
+    """Time GET /questions/ and check it matches the full ORM load's serialization."""
+    elapsed, response = _best_time(
+        lambda: question_reader.get(f"/questions/?limit={QUESTION_COUNT}")
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert len(body) == QUESTION_COUNT
+
+    db_session.expunge_all()
+    expected = [
+        DetailedQuestionSchema.model_validate(
+            read_full_question_from_db(db_session, item["id"])
+        ).model_dump(mode="json")
+        for item in body
+    ]
+    assert body == expected
+
+    print(f"\nGET /questions/ ({QUESTION_COUNT} questions):")
+    print(f"  {elapsed * 1000:.1f} ms, {elapsed / QUESTION_COUNT * 1000:.3f} ms/question")
+
+
+def test_response_encoding_benchmark(db_session, serialization_questions):
+    """Time FastAPI's response_model handling against validated_response."""
+    models = response_adapter.validate_python(
+        read_question_projections_from_db(db_session, serialization_questions)
+    )
+    app = FastAPI()
+
+    @app.get("/response-model", response_model=List[DetailedQuestionSchema])
+    def response_model_route():
+        return models
+
+    @app.get("/validated", response_model=List[DetailedQuestionSchema])
+    def validated_route():
+        return validated_response(response_adapter, models)
+
+    with TestClient(app) as client:
+        default_time, default_response = _best_time(
+            lambda: client.get("/response-model")
+        )
+        fast_time, fast_response = _best_time(lambda: client.get("/validated"))
+
+    assert fast_response.json() == default_response.json()
+
+    # Timings are reported, not asserted: they vary too much between runs
+    print(f"\nResponse Encoding Benchmark ({QUESTION_COUNT} questions):")
+    print(f"  response_model: {QUESTION_COUNT / default_time:,.0f} questions/s")
+    print(f"  validated_response: {QUESTION_COUNT / fast_time:,.0f} questions/s")
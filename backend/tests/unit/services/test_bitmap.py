@@ -0,0 +1,81 @@
+# filename: backend/tests/unit/services/test_bitmap.py
+
+import random
+
+from backend.app.services.bitmap_service import ARRAY_CONTAINER_MAX, RoaringBitmap
+
+
+def _random_ids(seed, count, upper):
+    return set(random.Random(seed).sample(range(upper), count))
+
+
+def test_iteration_is_sorted_across_containers():
+    ids = [70000, 3, 1, 200000, 65536, 65535]
+    bitmap = RoaringBitmap(ids)
+
+    assert list(bitmap) == sorted(ids)
+    assert len(bitmap) == 6
+    assert 65536 in bitmap and 4 not in bitmap
+
+
+def test_add_and_discard_switch_container_types():
+    bitmap = RoaringBitmap()
+    for value in range(ARRAY_CONTAINER_MAX + 10):
+        bitmap.add(value * 2)
+    bitmap.add(10**6)
+    bitmap.add(5)  # out of order, below the last container
+    assert len(bitmap) == ARRAY_CONTAINER_MAX + 12
+    assert list(bitmap)[:4] == [0, 2, 4, 5]
+
+    for value in range(ARRAY_CONTAINER_MAX + 10):
+        bitmap.discard(value * 2)
+    bitmap.discard(123456789)
+    assert list(bitmap) == [5, 10**6]
+
+
+def test_set_operations_match_python_sets():
+    dense = _random_ids(1, 20000, 70000)
+    sparse = _random_ids(2, 3000, 300000)
+    other_dense = _random_ids(3, 30000, 70000)
+
+    for first, second in [(dense, sparse), (dense, other_dense), (sparse, sparse)]:
+        a, b = RoaringBitmap(first), RoaringBitmap(second)
+        assert list(a & b) == sorted(first & second)
+        assert list(a | b) == sorted(first | second)
+        assert a.intersection_count(b) == len(first & second)
+
+    union = RoaringBitmap.union_all(RoaringBitmap(ids) for ids in (dense, sparse))
+    assert len(union) == len(dense | sparse)
+    assert not RoaringBitmap.union_all([])
+
+
+def test_page_skips_whole_containers():
+    ids = sorted(_random_ids(4, 10000, 500000))
+    bitmap = RoaringBitmap(ids)
+
+    assert bitmap.page(0, 5) == ids[:5]
+    assert bitmap.page(4321, 100) == ids[4321:4421]
+    assert bitmap.page(9990) == ids[9990:]
+    assert bitmap.page(20000, 5) == []
+    assert bitmap.page(0, 0) == []
+
+
+def test_copy_is_independent():
+    bitmap = RoaringBitmap([1, 2, 3])
+    copy = bitmap.copy()
+    copy.discard(2)
+
+    assert list(bitmap) == [1, 2, 3]
+    assert copy == RoaringBitmap([1, 3])
+
+
+def test_unions_do_not_share_containers_with_their_inputs():
+    first = RoaringBitmap([1, 2, 3])
+    second = RoaringBitmap([70000])
+
+    union = RoaringBitmap.union_all([first, second])
+    union.add(5)
+    (first | second).discard(70000)
+
+    assert list(first) == [1, 2, 3]
+    assert list(second) == [70000]
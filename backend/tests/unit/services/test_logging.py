@@ -0,0 +1,85 @@
+# filename: backend/tests/unit/services/test_logging.py
+
+import json
+import logging
+import os
+import queue
+
+from backend.app.services.logging_service import (
+    PROJECT_ROOT,
+    DebugSampleFilter,
+    JSONFormatter,
+    ModuleLevelFilter,
+    NonBlockingQueueHandler,
+    logger,
+    module_name_for_path,
+)
+
+
+def make_record(level=logging.DEBUG, module="backend.app.crud.crud_user", lineno=10):
+    pathname = os.path.join(PROJECT_ROOT, *module.split(".")) + ".py"
+    return logging.LogRecord(
+        "backend", level, pathname, lineno, "Loaded user %s", ("alice",), None
+    )
+
+
+def test_module_name_for_path():
+    assert module_name_for_path(make_record().pathname) == "backend.app.crud.crud_user"
+
+
+def test_json_formatter_emits_one_json_object():
+    record = make_record(level=logging.INFO)
+    record.request_id = "abc123"
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "backend"
+    assert entry["module"] == "backend.app.crud.crud_user"
+    assert entry["line"] == 10
+    assert entry["message"] == "Loaded user alice"
+    assert entry["request_id"] == "abc123"
+    assert entry["timestamp"].endswith("+00:00")
+
+
+def test_module_level_filter_uses_longest_prefix():
+    level_filter = ModuleLevelFilter(
+        logging.DEBUG,
+        {"backend.app.middleware": logging.WARNING, "backend.app.crud": logging.INFO},
+    )
+
+    assert level_filter.filter(make_record(logging.DEBUG, "backend.app.services.x"))
+    assert not level_filter.filter(make_record(logging.DEBUG, "backend.app.crud.crud_user"))
+    assert level_filter.filter(make_record(logging.INFO, "backend.app.crud.crud_user"))
+    assert not level_filter.filter(
+        make_record(logging.INFO, "backend.app.middleware.blacklist_middleware")
+    )
+
+
+def test_debug_sample_filter_keeps_one_in_n_per_call_site():
+    sample_filter = DebugSampleFilter(rate=5)
+
+    kept = [sample_filter.filter(make_record(lineno=10)) for _ in range(20)]
+    assert kept.count(True) == 4
+    assert kept[0]
+
+    # Other call sites and higher levels are counted separately or not at all
+    assert sample_filter.filter(make_record(lineno=11))
+    assert all(
+        sample_filter.filter(make_record(level=logging.INFO)) for _ in range(10)
+    )
+
+
+def test_queue_handler_drops_records_when_full():
+    log_queue = queue.Queue(maxsize=2)
+    handler = NonBlockingQueueHandler(log_queue)
+
+    for _ in range(5):
+        handler.handle(make_record(level=logging.INFO))
+
+    assert log_queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_logger_writes_through_queue():
+    assert any(isinstance(h, NonBlockingQueueHandler) for h in logger.handlers)
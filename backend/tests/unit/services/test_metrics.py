@@ -0,0 +1,125 @@
+# filename: backend/tests/unit/services/test_metrics.py
+
+import json
+import os
+import time
+
+import pytest
+
+from backend.app.services import metrics_service
+from backend.app.services.metrics_service import (
+    LATENCY_BUCKETS,
+    MetricsRegistry,
+    SnapshotWriter,
+    read_snapshots,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_counters_render_with_labels(registry):
+    registry.inc("http_requests_total", ("/items/{id}", "GET", "200"))
+    registry.inc("http_requests_total", ("/items/{id}", "GET", "200"))
+    registry.inc("cache_requests_total", ('odd"name', "hit"))
+
+    text = registry.render()
+
+    assert "# TYPE http_requests_total counter" in text
+    assert 'http_requests_total{route="/items/{id}",method="GET",status="200"} 2' in text
+    assert 'cache_requests_total{cache="odd\\"name",result="hit"} 1' in text
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    for value in (0.004, 0.005, 0.3, 60):
+        registry.observe("leaderboard_refresh_seconds", (), value)
+
+    lines = registry.render().splitlines()
+
+    assert 'leaderboard_refresh_seconds_bucket{le="0.005"} 2' in lines
+    assert 'leaderboard_refresh_seconds_bucket{le="0.25"} 2' in lines
+    assert 'leaderboard_refresh_seconds_bucket{le="0.5"} 3' in lines
+    assert 'leaderboard_refresh_seconds_bucket{le="10"} 3' in lines
+    assert 'leaderboard_refresh_seconds_bucket{le="+Inf"} 4' in lines
+    assert "leaderboard_refresh_seconds_count 4" in lines
+    assert "leaderboard_refresh_seconds_sum 60.309" in lines
+    assert len(registry.histograms["leaderboard_refresh_seconds"][()]) == len(LATENCY_BUCKETS) + 3
+
+
+def test_collectors_are_read_at_render_time(registry):
+    pending = [3]
+    registry.register_collector("pool", lambda: [("password_hash_pending", (), pending[0])])
+
+    assert "password_hash_pending 3" in registry.render()
+    pending[0] = 1
+    assert "password_hash_pending 1" in registry.render()
+
+
+def test_render_sums_snapshots(registry):
+    registry.inc("http_requests_total", ("/", "GET", "200"), 2)
+    registry.observe("leaderboard_refresh_seconds", (), 0.2)
+    snapshot = registry.snapshot()
+
+    text = registry.render([snapshot, snapshot])
+
+    assert 'http_requests_total{route="/",method="GET",status="200"} 4' in text
+    assert "leaderboard_refresh_seconds_count 2" in text
+    assert 'leaderboard_refresh_seconds_bucket{le="0.25"} 2' in text
+
+
+def test_read_snapshots_drops_gauges_of_exited_workers(registry, tmp_path):
+    registry.inc("http_requests_total", ("/", "GET", "200"), 2)
+    registry.register_collector("pool", lambda: [("password_hash_pending", (), 1)])
+    exited = registry.snapshot()
+    # A pid that is not running: its counters stay, its gauges go
+    exited["pid"] = 2**22 + 12345
+    (tmp_path / "metrics-exited.json").write_text(json.dumps(exited))
+
+    snapshots = read_snapshots(str(tmp_path))
+
+    assert snapshots[0]["pid"] == os.getpid()
+    [read_back] = [snapshot for snapshot in snapshots if snapshot["pid"] == exited["pid"]]
+    assert read_back["gauges"] == {}
+    assert read_back["counters"]["http_requests_total"] == [[["/", "GET", "200"], 2]]
+
+
+def test_snapshot_writer_round_trip(tmp_path):
+    registry = MetricsRegistry()
+    registry.inc("cache_requests_total", ("taxonomy", "miss"), 4)
+    writer = SnapshotWriter(registry, str(tmp_path))
+
+    writer.write()
+
+    with open(writer.path) as snapshot_file:
+        snapshot = json.load(snapshot_file)
+    assert snapshot["pid"] == os.getpid()
+    assert snapshot["counters"]["cache_requests_total"] == [[["taxonomy", "miss"], 4]]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_configure_metrics_registers_default_collectors(monkeypatch):
+    monkeypatch.delenv(metrics_service.MULTIPROC_DIR_ENV, raising=False)
+    metrics_service.configure_metrics()
+
+    text = metrics_service.render_metrics()
+
+    assert "# TYPE db_pool_connections gauge" in text
+    assert "password_hash_total{outcome=\"completed\"}" in text
+    assert "log_records_dropped_total" in text
+
+
+def test_recording_a_request_costs_microseconds(registry):
+    labels = ("/questions/{question_id}", "GET")
+    iterations = 20000
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        registry.inc("http_requests_total", (*labels, "200"))
+        registry.observe("http_request_duration_seconds", labels, 0.012)
+        registry.observe("http_request_db_seconds", labels, 0.003)
+    per_request_us = (time.perf_counter() - start) / iterations * 1_000_000
+
+    # Typically around 1-2 us; the bound leaves room for slow CI machines
+    assert per_request_us < 25
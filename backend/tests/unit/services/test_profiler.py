@@ -0,0 +1,96 @@
+# filename: backend/tests/unit/services/test_profiler.py
+
+import threading
+import time
+
+import pytest
+
+from backend.app.services import profiler_service
+from backend.app.services.profiler_service import (
+    ProfilerBusyError,
+    RequestProfiler,
+    StackSampler,
+    profile_process,
+)
+
+
+def spin_until(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(100))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=spin_until, args=(stop,), name="busy-thread")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def test_sampler_records_busy_threads_in_collapsed_format(busy_thread):
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    time.sleep(0.05)
+    sampler.stop()
+
+    lines = sampler.collapsed().splitlines()
+    busy_lines = [line for line in lines if line.startswith("busy-thread;")]
+    assert sampler.samples > 0
+    assert busy_lines
+    stack, count = busy_lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert "spin_until (backend.tests.unit.services.test_profiler:" in stack
+    assert not any(line.startswith("stack-sampler;") for line in lines)
+
+
+def test_sampler_skips_idle_threads():
+    stop = threading.Event()
+    idle = threading.Thread(target=stop.wait, name="idle-thread")
+    idle.start()
+    try:
+        sampler = StackSampler()
+        sampler.sample()
+        with_idle = StackSampler(include_idle=True)
+        with_idle.sample()
+    finally:
+        stop.set()
+        idle.join()
+
+    assert "idle-thread;" not in sampler.collapsed()
+    assert "idle-thread;" in with_idle.collapsed()
+
+
+def test_profile_process_excludes_caller_and_rejects_overlap(busy_thread):
+    collapsed = profile_process(0.05, interval=0.001)
+    assert "busy-thread;" in collapsed
+    assert "profile_process" not in collapsed
+
+    with pytest.raises(ValueError):
+        profile_process(0)
+
+    assert profiler_service._sampler_lock.acquire(blocking=False)
+    try:
+        with pytest.raises(ProfilerBusyError):
+            profile_process(0.01)
+    finally:
+        profiler_service._sampler_lock.release()
+
+
+def test_request_profiler_captures_matching_requests_within_budget():
+    profiler = RequestProfiler(max_captures=5)
+    assert profiler.begin("/questions/") is None
+
+    profiler.arm(r"^/questions", max_requests=1)
+    assert profiler.begin("/users/") is None
+    sampler = profiler.begin("/questions/12")
+    assert sampler is not None
+    capture = profiler.finish(sampler, "GET", "/questions/12", 200, 0.01)
+
+    assert profiler.pattern is None
+    assert profiler.begin("/questions/13") is None
+    assert profiler.get_capture(capture["id"])["path"] == "/questions/12"
+    assert "collapsed" not in profiler.list_captures()[0]
+    assert profiler_service._sampler_lock.acquire(blocking=False)
+    profiler_service._sampler_lock.release()
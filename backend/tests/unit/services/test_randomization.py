@@ -3,8 +3,10 @@
 import pytest
 
 from backend.app.services.randomization_service import (
+    allocate_stratified_counts,
     randomize_answer_choices,
     randomize_questions,
+    stratified_sample,
 )
 
 
@@ -50,5 +52,38 @@ def test_randomize_empty_list():
     assert randomize_answer_choices(empty_list) == empty_list
 
 
+def test_randomize_with_seed_is_reproducible():
+    questions = list(range(20))
+    assert randomize_questions(questions, seed=3) == randomize_questions(
+        questions, seed=3
+    )
+    assert randomize_answer_choices(questions, seed="3:1") == randomize_answer_choices(
+        questions, seed="3:1"
+    )
+
+
+def test_randomize_questions_with_count():
+    drawn = randomize_questions(list(range(1000)), seed=1, count=10)
+    assert len(set(drawn)) == 10
+    assert randomize_questions([1, 2], count=5) in ([1, 2], [2, 1])
+
+
+def test_allocate_stratified_counts():
+    allocation = allocate_stratified_counts({"Easy": 6, "Medium": 3, "Hard": 1}, 5)
+    assert allocation == {"Easy": 3, "Medium": 2, "Hard": 0}
+    assert sum(allocate_stratified_counts({"a": 1, "b": 1, "c": 1}, 2).values()) == 2
+    assert allocate_stratified_counts({"a": 2, "b": 1}, 10) == {"a": 2, "b": 1}
+
+
+def test_stratified_sample():
+    ids_by_stratum = {"Easy": list(range(100)), "Hard": list(range(100, 150))}
+    sample = stratified_sample(ids_by_stratum, 30, seed=11)
+
+    assert len(sample) == len(set(sample)) == 30
+    assert sum(1 for i in sample if i < 100) == 20
+    assert sample == stratified_sample(ids_by_stratum, 30, seed=11)
+    assert sample != stratified_sample(ids_by_stratum, 30, seed=12)
+
+
 # Add more tests if needed, such as testing with a large number of elements
 # or testing the distribution of randomizations over many iterations
@@ -0,0 +1,162 @@
+# filename: backend/tests/unit/services/test_tracing.py
+
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from backend.app.services import tracing_service
+from backend.app.services.tracing_service import (
+    FileTraceExporter,
+    Span,
+    Trace,
+    Tracer,
+    span,
+    traced,
+)
+
+
+@pytest.fixture
+def root_span():
+    trace = Trace()
+    root = trace.root = Span(trace, "GET /things/")
+    token = tracing_service._current_span.set(root)
+    yield root
+    tracing_service._current_span.reset(token)
+
+
+def spans_by_name(trace):
+    return {recorded.name: recorded for recorded in trace.spans}
+
+
+@traced
+def read_thing_from_db(db, thing_id):
+    with span("inner", {"thing.id": thing_id}):
+        return thing_id
+
+
+@traced(name="async thing")
+async def read_thing_async(thing_id):
+    return thing_id
+
+
+def test_spans_nest_under_the_current_span(root_span):
+    assert read_thing_from_db(None, 7) == 7
+    assert asyncio.run(read_thing_async(8)) == 8
+    root_span.end()
+
+    spans = spans_by_name(root_span.trace)
+    outer = spans["test_tracing.read_thing_from_db"]
+    assert outer.parent_span_id == root_span.span_id
+    assert spans["inner"].parent_span_id == outer.span_id
+    assert spans["inner"].attributes == {"thing.id": 7}
+    assert spans["async thing"].parent_span_id == root_span.span_id
+    assert tracing_service.current_span() is root_span
+
+
+def test_nothing_is_recorded_outside_a_traced_request():
+    assert tracing_service.current_span() is None
+    assert read_thing_from_db(None, 7) == 7
+    with span("untraced") as untraced:
+        assert untraced is None
+
+
+def test_errors_are_recorded_and_reraised(root_span):
+    with pytest.raises(ValueError):
+        with span("failing"):
+            raise ValueError("bad thing")
+
+    failing = spans_by_name(root_span.trace)["failing"]
+    assert failing.status == tracing_service.STATUS_ERROR
+    assert failing.status_message == "bad thing"
+    assert failing.attributes["exception.type"] == "ValueError"
+
+
+def test_sql_statements_are_recorded(root_span):
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with pytest.raises(Exception):
+            connection.execute(text("SELECT * FROM missing_table"))
+
+    statements = [recorded for recorded in root_span.trace.spans if recorded.name == "SELECT"]
+    assert len(statements) == 2
+    assert statements[0].kind == tracing_service.SPAN_KIND_CLIENT
+    assert statements[0].attributes["db.statement"] == "SELECT 1"
+    assert statements[0].attributes["db.system"] == "sqlite"
+    assert statements[1].status == tracing_service.STATUS_ERROR
+
+
+def test_spans_beyond_the_limit_are_counted(root_span, monkeypatch):
+    monkeypatch.setattr(tracing_service, "MAX_SPANS_PER_TRACE", 2)
+    for _ in range(5):
+        with span("step"):
+            pass
+    root_span.end()
+
+    assert len(root_span.trace.spans) == 3
+    assert root_span.trace.dropped_spans == 3
+
+
+def test_sampling_decision():
+    assert Tracer(sample_rate=0).start_trace() is None
+    trace, parent_span_id = Tracer(sample_rate=1).start_trace()
+    assert len(trace.trace_id) == 32 and parent_span_id is None
+
+    trace_id, caller_span_id = "ab" * 16, "cd" * 8
+    unsampled = Tracer(sample_rate=1)
+    assert unsampled.start_trace(f"00-{trace_id}-{caller_span_id}-00") is None
+    # A sampled caller's trace is continued, but cannot force tracing
+    assert Tracer(sample_rate=0).start_trace(f"00-{trace_id}-{caller_span_id}-01") is None
+    trace, parent_span_id = Tracer(sample_rate=1).start_trace(
+        f"00-{trace_id}-{caller_span_id}-01"
+    )
+    assert (trace.trace_id, parent_span_id) == (trace_id, caller_span_id)
+    assert Tracer(sample_rate=0).start_trace("garbage") is None
+    trace, parent_span_id = Tracer(sample_rate=1).start_trace("garbage")
+    assert trace.trace_id != trace_id and parent_span_id is None
+
+
+def test_tracer_keeps_the_latest_traces(root_span):
+    tracer = Tracer(ring_size=2)
+    root_span.attributes["http.status_code"] = 200
+    root_span.end()
+    for _ in range(3):
+        tracer.finish_trace(root_span.trace)
+    tracer.resize(1)
+
+    assert len(tracer.traces) == 1
+    summaries = tracer.list_traces(10, name="/things/")
+    assert summaries[0]["trace_id"] == root_span.trace.trace_id
+    assert summaries[0]["status_code"] == 200
+    assert tracer.list_traces(10, name="/other/") == []
+    assert tracer.list_traces(10, min_duration_ms=60_000) == []
+    assert tracer.get_trace(root_span.trace.trace_id) is root_span.trace
+
+
+def test_otlp_export(root_span, tmp_path):
+    with span("child", {"count": 3, "ratio": 0.5, "cached": True, "label": "x"}):
+        pass
+    root_span.end()
+
+    exporter = FileTraceExporter(str(tmp_path / "traces.jsonl"))
+    exporter.export(root_span.trace)
+    exporter.close()
+
+    lines = (tmp_path / "traces.jsonl").read_text().splitlines()
+    assert len(lines) == 1
+    resource_spans = json.loads(lines[0])["resourceSpans"][0]
+    assert {"key": "service.name", "value": {"stringValue": "quiz-app-backend"}} in (
+        resource_spans["resource"]["attributes"]
+    )
+    child, root = resource_spans["scopeSpans"][0]["spans"]
+    assert child["parentSpanId"] == root["spanId"]
+    assert root["parentSpanId"] == ""
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+    assert child["attributes"] == [
+        {"key": "count", "value": {"intValue": "3"}},
+        {"key": "ratio", "value": {"doubleValue": 0.5}},
+        {"key": "cached", "value": {"boolValue": True}},
+        {"key": "label", "value": {"stringValue": "x"}},
+    ]
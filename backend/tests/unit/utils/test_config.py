@@ -94,6 +94,14 @@ def test_load_settings_invalid_environment(mock_getenv):
         load_settings()
 
 
+@patch("backend.app.core.config.os.getenv")
+def test_load_settings_prod_environment(mock_getenv):
+    mock_getenv.return_value = "prod"
+    settings = load_settings()
+    assert settings.ENVIRONMENT == "prod"
+    assert settings.DATABASE_URL == load_config_from_toml()["database_url_prod"]
+
+
 @patch("backend.app.core.config.load_config_from_toml")
 def test_load_settings_missing_required_setting(mock_load_config):
     mock_load_config.return_value = {}
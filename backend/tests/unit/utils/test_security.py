@@ -1,9 +1,27 @@
 # filename: backend/tests/test_core/test_core_security.py
 
+import asyncio
+import threading
+import time
+
 import pytest
 from pydantic import SecretStr
 
-from backend.app.core.security import get_password_hash, verify_password
+from backend.app.core.config import settings_core
+from backend.app.core.security import (
+    MAX_CALIBRATED_ROUNDS,
+    MIN_CALIBRATED_ROUNDS,
+    PasswordHashingBusyError,
+    PasswordHashPool,
+    build_password_context,
+    calibrate_password_rounds,
+    get_password_hash,
+    get_password_hash_async,
+    password_needs_rehash,
+    set_password_rounds,
+    verify_password,
+    verify_password_async,
+)
 
 
 def test_password_hashing():
@@ -51,3 +69,95 @@ def test_verify_password_with_incorrect_hash():
 def test_password_hashing_various_inputs(password):
     hashed_password = get_password_hash(password)
     assert verify_password(password, hashed_password)
+
+
+def test_password_hash_uses_configured_rounds():
+    hashed_password = get_password_hash("testpassword123")
+    assert hashed_password.startswith(f"$2b${settings_core.BCRYPT_ROUNDS:02d}$")
+
+
+def test_password_needs_rehash_flags_only_lower_costs():
+    rounds = settings_core.BCRYPT_ROUNDS
+    assert not password_needs_rehash(get_password_hash("testpassword123"))
+    # Hashes from a worker calibrated to a higher cost are kept
+    assert not password_needs_rehash(build_password_context(rounds + 1).hash("x"))
+    if rounds > 4:
+        assert password_needs_rehash(build_password_context(rounds - 1).hash("x"))
+
+
+def test_set_password_rounds_changes_cost_of_new_hashes():
+    try:
+        set_password_rounds(5)
+        assert get_password_hash("testpassword123").startswith("$2b$05$")
+    finally:
+        set_password_rounds(settings_core.BCRYPT_ROUNDS)
+
+
+def test_calibrate_password_rounds_clamps_to_bounds():
+    assert calibrate_password_rounds(0.001) == MIN_CALIBRATED_ROUNDS
+    assert calibrate_password_rounds(10**9) == MAX_CALIBRATED_ROUNDS
+    assert calibrate_password_rounds(0.001, min_rounds=4, max_rounds=6) == 4
+
+
+def test_calibrate_password_rounds_grows_with_target():
+    low = calibrate_password_rounds(5, min_rounds=4, max_rounds=31)
+    high = calibrate_password_rounds(500, min_rounds=4, max_rounds=31)
+    # A 100x longer target is about 6.6 doublings of bcrypt work
+    assert 5 <= high - low <= 8
+
+
+@pytest.mark.asyncio
+async def test_async_password_hashing():
+    hashed_password = await get_password_hash_async("testpassword123")
+
+    assert await verify_password_async("testpassword123", hashed_password)
+    assert not await verify_password_async("wrongpassword123", hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_keeps_event_loop_responsive():
+    pool = PasswordHashPool(workers=1, max_pending=4)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    def blocking_call():
+        # Only returns once the event loop has run while this call blocks
+        deadline = time.monotonic() + 5
+        while ticks < 5 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return ticks
+
+    ticker = asyncio.create_task(tick())
+    try:
+        assert await pool.run(blocking_call) >= 5
+    finally:
+        ticker.cancel()
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_rejects_when_full():
+    pool = PasswordHashPool(workers=1, max_pending=1)
+    release = threading.Event()
+    try:
+        blocked = asyncio.create_task(pool.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        with pytest.raises(PasswordHashingBusyError):
+            await pool.run(verify_password, "password", "hash")
+        release.set()
+        assert await blocked is True
+    finally:
+        release.set()
+        pool.shutdown()
+
+    metrics = pool.metrics()
+    assert metrics["pending"] == 0
+    assert metrics["completed"] == 1
+    assert metrics["rejected"] == 1
+    assert metrics["queue_seconds_max"] >= 0
+    assert metrics["hash_seconds_total"] > 0
@@ -0,0 +1,66 @@
+# filename: backend/tests/unit/utils/test_server.py
+
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app import server
+
+
+def test_parse_args_defaults():
+    args = server.parse_args([])
+
+    assert args.workers == server.default_worker_count() >= 1
+    assert args.keep_alive == server.DEFAULT_KEEP_ALIVE_SECONDS
+    assert args.backlog == server.DEFAULT_BACKLOG
+    assert args.graceful_timeout == server.DEFAULT_GRACEFUL_TIMEOUT_SECONDS
+
+
+def test_build_config_applies_options():
+    args = server.parse_args(
+        ["--port", "9000", "--keep-alive", "20", "--backlog", "512", "--graceful-timeout", "7"]
+    )
+    config = server.build_config(args, app=FastAPI())
+
+    assert config.port == 9000
+    assert config.timeout_keep_alive == 20
+    assert config.backlog == 512
+    assert config.timeout_graceful_shutdown == 7
+
+
+def test_build_config_prefers_uvloop_and_httptools(monkeypatch):
+    args = server.parse_args([])
+
+    monkeypatch.setattr(server.importlib.util, "find_spec", lambda name: None)
+    config = server.build_config(args, app=FastAPI())
+    assert (config.loop, config.http) == ("asyncio", "h11")
+
+    monkeypatch.setattr(server.importlib.util, "find_spec", lambda name: object())
+    config = server.build_config(args, app=FastAPI())
+    assert (config.loop, config.http) == ("uvloop", "httptools")
+
+
+def test_cache_warmup_runs_after_startup_and_before_requests(monkeypatch):
+    events = []
+
+    @asynccontextmanager
+    async def lifespan(app):
+        events.append("startup")
+        yield
+        events.append("shutdown")
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/ping")
+    def ping():
+        events.append("request")
+        return {}
+
+    monkeypatch.setattr(server, "warm_caches", lambda: events.append("warmup"))
+    server.add_cache_warmup(app)
+
+    with TestClient(app) as client:
+        client.get("/ping")
+
+    assert events == ["startup", "warmup", "request", "shutdown"]
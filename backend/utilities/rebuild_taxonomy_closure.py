@@ -0,0 +1,31 @@
+# filename: backend/utilities/rebuild_taxonomy_closure.py
+
+"""
+Rebuild the taxonomy closure table from the taxonomy association tables.
+
+Run this after bulk imports that bypass the CRUD functions, or whenever the
+closure looks out of sync (the migration that adds the table fills it once):
+
+    python -m backend.utilities.rebuild_taxonomy_closure
+"""
+
+from backend.app.crud.crud_taxonomy_closure import rebuild_taxonomy_closure_in_db
+from backend.app.db.session import SessionLocal, get_engine
+
+
+def main():
+    get_engine()
+    db = SessionLocal()
+    try:
+        row_count = rebuild_taxonomy_closure_in_db(db)
+        db.commit()
+        print(f"Rebuilt taxonomy closure table with {row_count} rows")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()